@@ -14,18 +14,24 @@ Supported formats:
 Features:
 - Auto-detection of delimiter (comma, tab, semicolon, pipe)
 - Auto-detection of encoding (UTF-8, Latin-1, etc.)
+- Previously detected encoding/delimiter accepted via ReadOptions.extra
 - Streaming support for files > 10MB
 - Column type inference
 """
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
+from apps.data_aggregator.backend.adapters.streaming import (
+    iter_record_blocks,
+    stream_chunks,
+    widen_batch,
+)
 from shared.contracts.dat.adapter import (
     AdapterCapabilities,
     AdapterError,
@@ -41,11 +47,15 @@ from shared.contracts.dat.adapter import (
     SchemaProbeResult,
     StreamChunk,
     StreamOptions,
+    TableShape,
     ValidationIssue,
     ValidationSeverity,
 )
 
-__version__ = "1.0.0"
+__version__ = "1.3.0"
+
+# Rows used to infer the stream schema from the first record block
+_STREAM_INFER_SCHEMA_ROWS = 1000
 
 
 def _polars_dtype_to_inferred(dtype: pl.DataType) -> InferredDataType:
@@ -118,6 +128,11 @@ def _detect_delimiter(file_path: Path, encoding: str = "utf-8") -> str:
     return ","
 
 
+def _scan_encoding(encoding: str) -> str:
+    """Map a detected encoding to one scan_csv accepts ('utf8' or 'utf8-lossy')."""
+    return "utf8" if encoding.lower().replace("-", "") == "utf8" else "utf8-lossy"
+
+
 def _detect_encoding(file_path: Path) -> str:
     """Detect file encoding by reading BOM or trying common encodings.
 
@@ -242,7 +257,9 @@ class CSVAdapter(BaseFileAdapter):
             file_size = path.stat().st_size
 
             # Detect encoding and delimiter
-            encoding = await asyncio.to_thread(_detect_encoding, path)
+            encoding = options.extra.get("encoding") or await asyncio.to_thread(
+                _detect_encoding, path
+            )
             delimiter = await asyncio.to_thread(_detect_delimiter, path, encoding)
 
             # Read sample for schema inference
@@ -351,6 +368,67 @@ class CSVAdapter(BaseFileAdapter):
                 details={"error": str(e)},
             ) from e
 
+    async def probe_shape(
+        self,
+        file_path: str,
+        options: ReadOptions | None = None,
+    ) -> TableShape:
+        """Count rows and read the header without materializing any columns.
+
+        Rows are counted by scan_csv with an empty projection, so no field
+        is parsed into a column.
+
+        Args:
+            file_path: Relative path to the CSV file.
+            options: Optional read options (``extra["delimiter"]`` and
+                ``extra["encoding"]`` honored).
+
+        Returns:
+            TableShape with the exact row count.
+
+        Raises:
+            AdapterError: If file cannot be scanned.
+        """
+        options = options or ReadOptions()
+        path = Path(file_path)
+        if not path.exists():
+            raise AdapterError(
+                code=AdapterErrorCode.FILE_NOT_FOUND,
+                message=f"File not found: {file_path}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+            )
+
+        try:
+            encoding = options.extra.get("encoding") or await asyncio.to_thread(
+                _detect_encoding, path
+            )
+            delimiter = options.extra.get("delimiter") or await asyncio.to_thread(
+                _detect_delimiter, path, encoding
+            )
+
+            def _scan_shape() -> TableShape:
+                lf = pl.scan_csv(
+                    path,
+                    separator=delimiter,
+                    encoding=_scan_encoding(encoding),
+                    infer_schema=False,
+                )
+                return TableShape(
+                    row_count=lf.select(pl.len()).collect().item(),
+                    columns=lf.collect_schema().names(),
+                )
+
+            return await asyncio.to_thread(_scan_shape)
+        except Exception as e:
+            raise AdapterError(
+                code=AdapterErrorCode.PARSE_ERROR,
+                message=f"Failed to count CSV rows: {e}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+                details={"error": str(e)},
+            ) from e
+
     async def read_dataframe(
         self,
         file_path: str,
@@ -387,7 +465,9 @@ class CSVAdapter(BaseFileAdapter):
             file_size = path.stat().st_size
 
             # Detect encoding and delimiter
-            encoding = await asyncio.to_thread(_detect_encoding, path)
+            encoding = options.extra.get("encoding") or await asyncio.to_thread(
+                _detect_encoding, path
+            )
             delimiter_from_options = options.extra.get("delimiter")
             delimiter = delimiter_from_options or await asyncio.to_thread(
                 _detect_delimiter, path, encoding
@@ -483,6 +563,10 @@ class CSVAdapter(BaseFileAdapter):
 
         Per ADR-0041: This is the preferred method for files > 10MB.
 
+        Reads the file once in whole-record blocks (quoted newlines are kept
+        intact) instead of re-scanning it per chunk. Progress is reported in
+        bytes; set ``options.count_total_rows`` to also pre-count rows.
+
         Args:
             file_path: Relative path to the CSV file.
             options: Stream options (chunk_size, columns, etc.).
@@ -506,72 +590,76 @@ class CSVAdapter(BaseFileAdapter):
                 )
 
             # Detect encoding and delimiter
-            encoding = await asyncio.to_thread(_detect_encoding, path)
+            encoding = options.extra.get("encoding") or await asyncio.to_thread(
+                _detect_encoding, path
+            )
             delimiter = options.extra.get("delimiter") or await asyncio.to_thread(
                 _detect_delimiter, path, encoding
             )
 
-            # Use Polars lazy API for streaming
-            # Note: scan_csv only accepts 'utf8' or 'utf8-lossy', not 'utf-8'
-            def _create_lazy_frame() -> pl.LazyFrame:
-                # Polars scan_csv only supports utf8/utf8-lossy
-                enc_normalized = encoding.lower().replace("-", "")
-                polars_encoding = "utf8" if enc_normalized == "utf8" else "utf8-lossy"
-                lf = pl.scan_csv(
-                    path,
-                    separator=delimiter,
-                    encoding=polars_encoding,
-                )
-                if options.columns:
-                    lf = lf.select(options.columns)
-                return lf
-
-            lf = await asyncio.to_thread(_create_lazy_frame)
-
-            # Get total row count for progress
-            def _get_row_count() -> int:
-                return lf.select(pl.len()).collect().item()
-
-            total_rows = await asyncio.to_thread(_get_row_count)
-
-            # Stream in chunks
-            chunk_size = options.chunk_size_rows
-            total_rows_so_far = 0
-            chunk_index = 0
-
-            while total_rows_so_far < total_rows:
-                start_time = datetime.now(UTC)
-
-                def _read_chunk(offset: int, limit: int) -> pl.DataFrame:
-                    return lf.slice(offset, limit).collect()
-
-                chunk_df = await asyncio.to_thread(
-                    _read_chunk, total_rows_so_far, chunk_size
-                )
-
-                end_time = datetime.now(UTC)
-                duration_ms = (end_time - start_time).total_seconds() * 1000
+            file_size = path.stat().st_size
 
-                rows_in_chunk = len(chunk_df)
-                total_rows_so_far += rows_in_chunk
-                is_last = total_rows_so_far >= total_rows
+            # Optional pre-count costs an extra pass; progress is byte-based otherwise
+            total_rows: int | None = None
+            if options.count_total_rows:
+                # Note: scan_csv only accepts 'utf8' or 'utf8-lossy', not 'utf-8'
+                def _count_rows() -> int:
+                    return pl.scan_csv(
+                        path,
+                        separator=delimiter,
+                        encoding=_scan_encoding(encoding),
+                    ).select(pl.len()).collect().item()
 
-                chunk_meta = StreamChunk(
-                    chunk_index=chunk_index,
-                    rows_in_chunk=rows_in_chunk,
-                    total_rows_so_far=total_rows_so_far,
-                    is_last_chunk=is_last,
-                    chunk_duration_ms=duration_ms,
-                )
+                total_rows = await asyncio.to_thread(_count_rows)
 
+            def _read_block(block: bytes, schema: pl.Schema | None) -> pl.DataFrame:
+                if schema is None:
+                    try:
+                        return pl.read_csv(
+                            block,
+                            separator=delimiter,
+                            infer_schema_length=_STREAM_INFER_SCHEMA_ROWS,
+                        )
+                    except pl.exceptions.ComputeError:
+                        # A type change past the sample rows: infer over the block
+                        return pl.read_csv(block, separator=delimiter, infer_schema_length=None)
+                try:
+                    return pl.read_csv(
+                        block,
+                        separator=delimiter,
+                        has_header=False,
+                        schema=schema,
+                    )
+                except pl.exceptions.ComputeError:
+                    # Values that don't fit the schema so far: widen, never null them
+                    df = pl.read_csv(
+                        block,
+                        separator=delimiter,
+                        has_header=False,
+                        new_columns=list(schema),
+                        infer_schema_length=None,
+                    )
+                    return widen_batch(df, schema)
+
+            def _iter_batches() -> Iterator[tuple[pl.DataFrame, int]]:
+                # Single pass: whole-record blocks, schema inferred from the first
+                # block and widened when a later block does not fit it
+                schema: pl.Schema | None = None
+                for block, bytes_read in iter_record_blocks(path, encoding, quote_char=b'"'):
+                    df = _read_block(block, schema)
+                    schema = df.schema
+                    if options.columns:
+                        df = df.select(options.columns)
+                    yield df, bytes_read
+
+            async for chunk_df, chunk_meta in stream_chunks(
+                _iter_batches(),
+                options.chunk_size_rows,
+                total_bytes=file_size,
+                total_rows=total_rows,
+            ):
                 yield chunk_df, chunk_meta
 
-                chunk_index += 1
-
-                if rows_in_chunk < chunk_size:
-                    # No more data
-                    break
-
         except AdapterError:
             raise
         except Exception as e:
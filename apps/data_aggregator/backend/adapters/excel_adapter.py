@@ -14,19 +14,21 @@ Features:
 - Multi-sheet support with sheet selection
 - Column type inference
 - Header row detection
+- Row-chunked streaming for .xlsx via read-only worksheet iteration
 
-Note: Excel adapter does NOT support streaming due to file format limitations.
-For large Excel files, consider converting to CSV first.
+Note: Legacy .xls files do NOT support streaming (the format has no
+incremental reader); convert them to .xlsx or CSV first.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Generator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
+from apps.data_aggregator.backend.adapters.streaming import stream_chunks, widen_batch
 from shared.contracts.dat.adapter import (
     AdapterCapabilities,
     AdapterError,
@@ -42,11 +44,192 @@ from shared.contracts.dat.adapter import (
     SheetInfo,
     StreamChunk,
     StreamOptions,
+    TableShape,
     ValidationIssue,
     ValidationSeverity,
 )
 
-__version__ = "1.0.0"
+__version__ = "1.2.0"
+
+
+def _unique_headers(header_row: tuple[Any, ...]) -> list[str]:
+    """Build unique column names from a worksheet header row.
+
+    Mirrors ``pl.read_excel`` naming: blank headers become ``__UNNAMED__<i>``
+    and repeats get a ``_duplicated_<n>`` suffix.
+
+    Args:
+        header_row: Raw cell values of the first worksheet row.
+
+    Returns:
+        List of unique column names.
+    """
+    headers: list[str] = []
+    seen: dict[str, int] = {}
+    for i, value in enumerate(header_row):
+        name = str(value) if value not in (None, "") else f"__UNNAMED__{i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_duplicated_{seen[name] - 1}"
+        else:
+            seen[name] = 0
+        headers.append(name)
+    return headers
+
+
+def _apply_read_options(df: pl.DataFrame, options: ReadOptions) -> pl.DataFrame:
+    """Apply skip/limit and column selection from ReadOptions.
+
+    Args:
+        df: Sheet DataFrame as read.
+        options: Read options.
+
+    Returns:
+        DataFrame with options applied.
+    """
+    # Apply skip_rows
+    if options.skip_rows > 0:
+        df = df.slice(options.skip_rows)
+
+    # Apply row_limit
+    if options.row_limit and len(df) > options.row_limit:
+        df = df.head(options.row_limit)
+
+    # Select columns if specified
+    if options.columns:
+        available = set(df.columns)
+        selected = [c for c in options.columns if c in available]
+        if selected:
+            df = df.select(selected)
+
+    # Exclude columns if specified
+    if options.exclude_columns:
+        cols_to_keep = [c for c in df.columns if c not in options.exclude_columns]
+        df = df.select(cols_to_keep)
+
+    return df
+
+
+def iter_xlsx_batches(
+    path: Path,
+    sheet_name: str | None = None,
+    sheet_index: int = 0,
+    batch_rows: int = 50000,
+    columns: list[str] | None = None,
+) -> Generator[tuple[pl.DataFrame, int], None, None]:
+    """Read an .xlsx worksheet as row batches with bounded memory.
+
+    Uses openpyxl read-only mode, which parses the sheet XML incrementally
+    instead of materializing the whole worksheet. The first row is the
+    header. Each batch infers its own dtypes and is widened against the
+    batches before it (see ``widen_batch``), so a later value that does not
+    fit an earlier dtype widens the column instead of becoming null.
+
+    Args:
+        path: Path to the .xlsx file.
+        sheet_name: Sheet to read (takes precedence over sheet_index).
+        sheet_index: Zero-based sheet index when no name is given.
+        batch_rows: Rows per yielded batch.
+        columns: Columns to keep (None = all).
+
+    Yields:
+        Tuple of (DataFrame batch, estimated source bytes consumed).
+    """
+    from openpyxl import load_workbook
+
+    file_size = path.stat().st_size
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.worksheets[sheet_index]
+        # Sheet dimension (when present) lets us pro-rate byte progress by row
+        max_row = ws.max_row if isinstance(ws.max_row, int) and ws.max_row > 0 else None
+
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+        headers = _unique_headers(header_row)
+        width = len(headers)
+
+        schema: pl.Schema | None = None
+        rows_read = 1
+        batch: list[tuple[Any, ...]] = []
+
+        def _to_frame() -> pl.DataFrame:
+            nonlocal schema
+            df = pl.DataFrame(
+                batch,
+                schema=headers,
+                orient="row",
+                infer_schema_length=None,
+                strict=False,
+            )
+            df = widen_batch(df, schema)
+            schema = df.schema
+            return df.select(columns) if columns else df
+
+        def _progress() -> int:
+            return min(file_size, file_size * rows_read // max_row) if max_row else 0
+
+        for row in rows:
+            rows_read += 1
+            if all(value is None for value in row):
+                continue
+            batch.append(tuple(row[:width]) + (None,) * (width - len(row)))
+            if len(batch) >= batch_rows:
+                yield _to_frame(), _progress()
+                batch = []
+
+        if batch:
+            yield _to_frame(), _progress()
+        # Empty marker so the final chunk reports the whole file as consumed
+        yield pl.DataFrame(), file_size
+    finally:
+        wb.close()
+
+
+def xlsx_sheet_shape(
+    path: Path,
+    sheet_name: str | None = None,
+    sheet_index: int = 0,
+) -> TableShape:
+    """Get an .xlsx worksheet's shape from its dimension record.
+
+    Only the header row is parsed. Writers record the used range as the
+    sheet dimension; trailing formatted-but-empty rows are included in it,
+    so the count is marked inexact. Sheets without a dimension record are
+    counted by iterating rows (still without building a DataFrame).
+
+    Args:
+        path: Path to the .xlsx file.
+        sheet_name: Sheet to inspect (takes precedence over sheet_index).
+        sheet_index: Zero-based sheet index when no name is given.
+
+    Returns:
+        TableShape with data rows excluding the header.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.worksheets[sheet_index]
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, None)
+        if header_row is None:
+            return TableShape(row_count=0, columns=[])
+        columns = _unique_headers(header_row)
+
+        if isinstance(ws.max_row, int) and ws.max_row > 1:
+            return TableShape(
+                row_count=ws.max_row - 1,
+                columns=columns,
+                row_count_exact=False,
+            )
+
+        row_count = sum(1 for row in rows if any(value is not None for value in row))
+        return TableShape(row_count=row_count, columns=columns)
+    finally:
+        wb.close()
 
 
 def _polars_dtype_to_inferred(dtype: pl.DataType) -> InferredDataType:
@@ -88,8 +271,8 @@ class ExcelAdapter(BaseFileAdapter):
     Uses Polars for efficient data processing. Supports multi-sheet files
     with explicit sheet selection.
 
-    Note: Streaming is NOT supported for Excel files due to format limitations.
-    For large Excel files (> 100MB), consider converting to CSV first.
+    Streaming reads .xlsx worksheets row by row with bounded memory. Legacy
+    .xls files cannot be streamed.
 
     Attributes:
         _metadata: Cached adapter metadata.
@@ -115,11 +298,11 @@ class ExcelAdapter(BaseFileAdapter):
                 "application/vnd.ms-excel",
             ],
             capabilities=AdapterCapabilities(
-                supports_streaming=False,  # Excel doesn't support streaming
+                supports_streaming=True,  # .xlsx only; legacy .xls cannot stream
                 supports_schema_inference=True,
                 supports_random_access=False,
                 supports_column_selection=True,
-                max_recommended_file_size_mb=100,  # Large Excel files are slow
+                max_recommended_file_size_mb=None,  # No limit for .xlsx with streaming
                 supported_compressions=[],  # Excel has its own compression
                 supports_multiple_sheets=True,
             ),
@@ -292,6 +475,54 @@ class ExcelAdapter(BaseFileAdapter):
                 details={"error": str(e)},
             ) from e
 
+    async def probe_shape(
+        self,
+        file_path: str,
+        options: ReadOptions | None = None,
+    ) -> TableShape:
+        """Get a sheet's shape from the xlsx dimension record.
+
+        Legacy .xls files have no cheap equivalent and fall back to a full
+        read.
+
+        Args:
+            file_path: Relative path to the Excel file.
+            options: Optional read options (extra.sheet_name / extra.sheet_index).
+
+        Returns:
+            TableShape for the selected sheet.
+
+        Raises:
+            AdapterError: If file cannot be read.
+        """
+        options = options or ReadOptions()
+        path = Path(file_path)
+        if not path.exists():
+            raise AdapterError(
+                code=AdapterErrorCode.FILE_NOT_FOUND,
+                message=f"File not found: {file_path}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+            )
+        if path.suffix.lower() != ".xlsx":
+            return await super().probe_shape(file_path, options)
+
+        try:
+            return await asyncio.to_thread(
+                xlsx_sheet_shape,
+                path,
+                options.extra.get("sheet_name"),
+                options.extra.get("sheet_index", 0),
+            )
+        except Exception as e:
+            raise AdapterError(
+                code=AdapterErrorCode.PARSE_ERROR,
+                message=f"Failed to read sheet dimensions: {e}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+                details={"error": str(e)},
+            ) from e
+
     async def read_dataframe(
         self,
         file_path: str,
@@ -334,6 +565,20 @@ class ExcelAdapter(BaseFileAdapter):
             sheet_index = options.extra.get("sheet_index", 0)
 
             def _read_excel() -> pl.DataFrame:
+                if options.row_limit and path.suffix.lower() == ".xlsx":
+                    # Bounded read: stop parsing the sheet once row_limit is reached
+                    wanted = options.row_limit + options.skip_rows
+                    batches = iter_xlsx_batches(
+                        path,
+                        sheet_name=sheet_name,
+                        sheet_index=sheet_index,
+                        batch_rows=wanted,
+                    )
+                    first = next(batches, None)
+                    batches.close()
+                    df = first[0] if first else pl.DataFrame()
+                    return _apply_read_options(df, options)
+
                 read_kwargs: dict[str, Any] = {
                     "source": path,
                 }
@@ -352,30 +597,7 @@ class ExcelAdapter(BaseFileAdapter):
                     read_kwargs["read_options"] = read_opts
 
                 df = pl.read_excel(**read_kwargs)
-
-                # Apply skip_rows
-                if options.skip_rows > 0:
-                    df = df.slice(options.skip_rows)
-
-                # Apply row_limit
-                if options.row_limit and len(df) > options.row_limit:
-                    df = df.head(options.row_limit)
-
-                # Select columns if specified
-                if options.columns:
-                    available = set(df.columns)
-                    selected = [c for c in options.columns if c in available]
-                    if selected:
-                        df = df.select(selected)
-
-                # Exclude columns if specified
-                if options.exclude_columns:
-                    cols_to_keep = [
-                        c for c in df.columns if c not in options.exclude_columns
-                    ]
-                    df = df.select(cols_to_keep)
-
-                return df
+                return _apply_read_options(df, options)
 
             df = await asyncio.to_thread(_read_excel)
 
@@ -413,30 +635,75 @@ class ExcelAdapter(BaseFileAdapter):
         file_path: str,
         options: StreamOptions | None = None,
     ) -> AsyncIterator[tuple[pl.DataFrame, StreamChunk]]:
-        """Stream is NOT supported for Excel files.
+        """Stream an .xlsx worksheet as row chunks for large file processing.
 
-        Excel files cannot be efficiently streamed due to their binary format.
-        For large Excel files, consider converting to CSV first.
+        Per ADR-0041: Reads the sheet XML incrementally through openpyxl
+        read-only mode, so memory stays bounded by ``chunk_size_rows``.
 
         Args:
-            file_path: Path to the file.
-            options: Stream options (ignored).
+            file_path: Relative path to the Excel file.
+            options: Stream options. Supports:
+                - extra.sheet_name: Sheet name to read
+                - extra.sheet_index: Sheet index to read (default: 0)
+                - columns: Columns to include
+                - chunk_size_rows: Rows per chunk
+
+        Yields:
+            Tuple of (DataFrame chunk, StreamChunk metadata).
 
         Raises:
-            AdapterError: Always raises with STREAMING_NOT_SUPPORTED code.
+            AdapterError: STREAMING_NOT_SUPPORTED for legacy .xls files, or
+                if the file cannot be streamed.
         """
-        raise AdapterError(
-            code=AdapterErrorCode.STREAMING_NOT_SUPPORTED,
-            message=(
-                "Excel files do not support streaming due to binary format limitations. "
-                "For large Excel files (> 100MB), consider converting to CSV first."
-            ),
-            file_path=file_path,
-            adapter_id=self._metadata.adapter_id,
-            recoverable=False,
-        )
-        # Yield statement to make this a generator (never reached)
-        yield  # type: ignore[misc]
+        options = options or StreamOptions()
+
+        if Path(file_path).suffix.lower() == ".xls":
+            raise AdapterError(
+                code=AdapterErrorCode.STREAMING_NOT_SUPPORTED,
+                message=(
+                    "Legacy .xls Excel files do not support streaming. "
+                    "Convert the workbook to .xlsx or CSV first."
+                ),
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+                recoverable=False,
+            )
+
+        try:
+            path = Path(file_path)
+            if not path.exists():
+                raise AdapterError(
+                    code=AdapterErrorCode.FILE_NOT_FOUND,
+                    message=f"File not found: {file_path}",
+                    file_path=file_path,
+                    adapter_id=self._metadata.adapter_id,
+                )
+
+            batches = iter_xlsx_batches(
+                path,
+                sheet_name=options.extra.get("sheet_name"),
+                sheet_index=options.extra.get("sheet_index", 0),
+                batch_rows=options.chunk_size_rows,
+                columns=options.columns,
+            )
+
+            async for chunk_df, chunk_meta in stream_chunks(
+                batches,
+                options.chunk_size_rows,
+                total_bytes=path.stat().st_size,
+            ):
+                yield chunk_df, chunk_meta
+
+        except AdapterError:
+            raise
+        except Exception as e:
+            raise AdapterError(
+                code=AdapterErrorCode.PARSE_ERROR,
+                message=f"Failed to stream Excel file: {e}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+                details={"error": str(e)},
+            ) from e
 
     async def validate_file(
         self,
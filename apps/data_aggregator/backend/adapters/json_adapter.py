@@ -19,13 +19,18 @@ Features:
 
 import asyncio
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
+from apps.data_aggregator.backend.adapters.streaming import (
+    iter_record_blocks,
+    stream_chunks,
+    widen_batch,
+)
 from shared.contracts.dat.adapter import (
     AdapterCapabilities,
     AdapterError,
@@ -41,11 +46,12 @@ from shared.contracts.dat.adapter import (
     SchemaProbeResult,
     StreamChunk,
     StreamOptions,
+    TableShape,
     ValidationIssue,
     ValidationSeverity,
 )
 
-__version__ = "1.0.0"
+__version__ = "1.2.0"
 
 
 def _polars_dtype_to_inferred(dtype: pl.DataType) -> InferredDataType:
@@ -126,6 +132,20 @@ def _is_jsonl_file(file_path: Path) -> bool:
     return False
 
 
+def _count_ndjson_records(file_path: Path, block_size: int = 1024 * 1024) -> int:
+    """Count non-blank lines of a JSON Lines file without parsing them."""
+    count = 0
+    carry = b""
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            lines = (carry + block).split(b"\n")
+            carry = lines.pop()
+            count += sum(1 for line in lines if line.strip())
+    if carry.strip():
+        count += 1
+    return count
+
+
 class JSONAdapter(BaseFileAdapter):
     """Adapter for JSON and JSON Lines files.
 
@@ -315,6 +335,59 @@ class JSONAdapter(BaseFileAdapter):
                 details={"error": str(e)},
             ) from e
 
+    async def probe_shape(
+        self,
+        file_path: str,
+        options: ReadOptions | None = None,
+    ) -> TableShape:
+        """Count JSON Lines records by newline counting.
+
+        Column names come from the schema-inference sample. Regular JSON
+        has no cheaper count than parsing, so it falls back to a full read.
+
+        Args:
+            file_path: Relative path to the JSON file.
+            options: Optional read options (infer_schema_length honored).
+
+        Returns:
+            TableShape with the exact row count.
+
+        Raises:
+            AdapterError: If file cannot be read.
+        """
+        options = options or ReadOptions()
+        path = Path(file_path)
+        if not path.exists():
+            raise AdapterError(
+                code=AdapterErrorCode.FILE_NOT_FOUND,
+                message=f"File not found: {file_path}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+            )
+
+        is_jsonl = await asyncio.to_thread(_is_jsonl_file, path)
+        if not is_jsonl:
+            return await super().probe_shape(file_path, options)
+
+        def _scan_shape() -> TableShape:
+            sample_rows = min(options.infer_schema_length, 1000)
+            sample = pl.read_ndjson(path, n_rows=sample_rows, infer_schema_length=sample_rows)
+            return TableShape(
+                row_count=_count_ndjson_records(path),
+                columns=sample.columns,
+            )
+
+        try:
+            return await asyncio.to_thread(_scan_shape)
+        except Exception as e:
+            raise AdapterError(
+                code=AdapterErrorCode.PARSE_ERROR,
+                message=f"Failed to count JSON Lines records: {e}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+                details={"error": str(e)},
+            ) from e
+
     async def read_dataframe(
         self,
         file_path: str,
@@ -432,7 +505,9 @@ class JSONAdapter(BaseFileAdapter):
         """Stream JSON Lines file as chunks for large file processing.
 
         Only JSON Lines format supports streaming. Regular JSON files
-        will be read as a single chunk.
+        will be read as a single chunk. JSON Lines files are read once in
+        line-buffered blocks; set ``options.count_total_rows`` to also
+        pre-count rows.
 
         Args:
             file_path: Relative path to the JSON file.
@@ -488,58 +563,35 @@ class JSONAdapter(BaseFileAdapter):
                 yield df, chunk_meta
                 return
 
-            # JSON Lines - use lazy streaming
-            def _create_lazy_frame() -> pl.LazyFrame:
-                lf = pl.scan_ndjson(path)
-                if options.columns:
-                    lf = lf.select(options.columns)
-                return lf
-
-            lf = await asyncio.to_thread(_create_lazy_frame)
-
-            # Get total row count
-            def _get_row_count() -> int:
-                return lf.select(pl.len()).collect().item()
-
-            total_rows = await asyncio.to_thread(_get_row_count)
-
-            # Stream in chunks
-            chunk_size = options.chunk_size_rows
-            total_rows_so_far = 0
-            chunk_index = 0
-
-            while total_rows_so_far < total_rows:
-                start_time = datetime.now(UTC)
-
-                def _read_chunk(offset: int, limit: int) -> pl.DataFrame:
-                    return lf.slice(offset, limit).collect()
-
-                chunk_df = await asyncio.to_thread(
-                    _read_chunk, total_rows_so_far, chunk_size
-                )
-
-                end_time = datetime.now(UTC)
-                duration_ms = (end_time - start_time).total_seconds() * 1000
-
-                rows_in_chunk = len(chunk_df)
-                total_rows_so_far += rows_in_chunk
-                is_last = total_rows_so_far >= total_rows
-
-                chunk_meta = StreamChunk(
-                    chunk_index=chunk_index,
-                    rows_in_chunk=rows_in_chunk,
-                    total_rows_so_far=total_rows_so_far,
-                    is_last_chunk=is_last,
-                    chunk_duration_ms=duration_ms,
-                )
+            file_size = path.stat().st_size
 
+            # Optional pre-count costs an extra pass; progress is byte-based otherwise
+            total_rows: int | None = None
+            if options.count_total_rows:
+                def _count_rows() -> int:
+                    return pl.scan_ndjson(path).select(pl.len()).collect().item()
+
+                total_rows = await asyncio.to_thread(_count_rows)
+
+            def _iter_batches() -> Iterator[tuple[pl.DataFrame, int]]:
+                # Single pass over line-buffered blocks; each block's schema is
+                # inferred in full and widened against the blocks before it
+                schema: pl.Schema | None = None
+                for block, bytes_read in iter_record_blocks(path):
+                    df = widen_batch(pl.read_ndjson(block, infer_schema_length=None), schema)
+                    schema = df.schema
+                    if options.columns:
+                        df = df.select(options.columns)
+                    yield df, bytes_read
+
+            async for chunk_df, chunk_meta in stream_chunks(
+                _iter_batches(),
+                options.chunk_size_rows,
+                total_bytes=file_size,
+                total_rows=total_rows,
+            ):
                 yield chunk_df, chunk_meta
 
-                chunk_index += 1
-
-                if rows_in_chunk < chunk_size:
-                    break
-
         except AdapterError:
             raise
         except Exception as e:
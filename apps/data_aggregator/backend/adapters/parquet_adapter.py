@@ -18,13 +18,15 @@ Features:
 """
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import polars as pl
+import pyarrow.parquet as pq
 
+from apps.data_aggregator.backend.adapters.streaming import stream_chunks
 from shared.contracts.dat.adapter import (
     AdapterCapabilities,
     AdapterError,
@@ -40,11 +42,12 @@ from shared.contracts.dat.adapter import (
     SchemaProbeResult,
     StreamChunk,
     StreamOptions,
+    TableShape,
     ValidationIssue,
     ValidationSeverity,
 )
 
-__version__ = "1.0.0"
+__version__ = "1.2.0"
 
 
 def _polars_dtype_to_inferred(dtype: pl.DataType) -> InferredDataType:
@@ -232,6 +235,50 @@ class ParquetAdapter(BaseFileAdapter):
                 details={"error": str(e)},
             ) from e
 
+    async def probe_shape(
+        self,
+        file_path: str,
+        options: ReadOptions | None = None,
+    ) -> TableShape:
+        """Get row count and column names from the Parquet footer.
+
+        Args:
+            file_path: Relative path to the Parquet file.
+            options: Unused; Parquet files hold a single table.
+
+        Returns:
+            TableShape with the exact row count.
+
+        Raises:
+            AdapterError: If the footer cannot be read.
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise AdapterError(
+                code=AdapterErrorCode.FILE_NOT_FOUND,
+                message=f"File not found: {file_path}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+            )
+
+        def _read_footer() -> TableShape:
+            metadata = pq.read_metadata(path)
+            return TableShape(
+                row_count=metadata.num_rows,
+                columns=list(metadata.schema.to_arrow_schema().names),
+            )
+
+        try:
+            return await asyncio.to_thread(_read_footer)
+        except Exception as e:
+            raise AdapterError(
+                code=AdapterErrorCode.INVALID_FORMAT,
+                message=f"Failed to read Parquet footer: {e}",
+                file_path=file_path,
+                adapter_id=self._metadata.adapter_id,
+                details={"error": str(e)},
+            ) from e
+
     async def read_dataframe(
         self,
         file_path: str,
@@ -331,7 +378,8 @@ class ParquetAdapter(BaseFileAdapter):
     ) -> AsyncIterator[tuple[pl.DataFrame, StreamChunk]]:
         """Stream Parquet file as chunks for large file processing.
 
-        Uses Polars lazy API to efficiently stream data in chunks.
+        Iterates record batches row group by row group in a single pass.
+        The total row count comes from the Parquet footer.
 
         Args:
             file_path: Relative path to the Parquet file.
@@ -355,58 +403,33 @@ class ParquetAdapter(BaseFileAdapter):
                     adapter_id=self._metadata.adapter_id,
                 )
 
-            # Create lazy frame
-            def _create_lazy_frame() -> pl.LazyFrame:
-                lf = pl.scan_parquet(path)
-                if options.columns:
-                    lf = lf.select(options.columns)
-                return lf
-
-            lf = await asyncio.to_thread(_create_lazy_frame)
-
-            # Get total row count
-            def _get_row_count() -> int:
-                return lf.select(pl.len()).collect().item()
-
-            total_rows = await asyncio.to_thread(_get_row_count)
-
-            # Stream in chunks
-            chunk_size = options.chunk_size_rows
-            total_rows_so_far = 0
-            chunk_index = 0
-
-            while total_rows_so_far < total_rows:
-                start_time = datetime.now(UTC)
-
-                def _read_chunk(offset: int, limit: int) -> pl.DataFrame:
-                    return lf.slice(offset, limit).collect()
-
-                chunk_df = await asyncio.to_thread(
-                    _read_chunk, total_rows_so_far, chunk_size
-                )
-
-                end_time = datetime.now(UTC)
-                duration_ms = (end_time - start_time).total_seconds() * 1000
-
-                rows_in_chunk = len(chunk_df)
-                total_rows_so_far += rows_in_chunk
-                is_last = total_rows_so_far >= total_rows
-
-                chunk_meta = StreamChunk(
-                    chunk_index=chunk_index,
-                    rows_in_chunk=rows_in_chunk,
-                    total_rows_so_far=total_rows_so_far,
-                    is_last_chunk=is_last,
-                    chunk_duration_ms=duration_ms,
-                )
+            file_size = path.stat().st_size
+            parquet_file = await asyncio.to_thread(pq.ParquetFile, path)
+            # Parquet footer carries the exact row count, no pre-count pass needed
+            total_rows = parquet_file.metadata.num_rows
 
+            def _iter_batches() -> Iterator[tuple[pl.DataFrame, int]]:
+                # Single pass over record batches; byte progress is pro-rated by rows
+                rows_read = 0
+                try:
+                    for batch in parquet_file.iter_batches(
+                        batch_size=options.chunk_size_rows,
+                        columns=options.columns,
+                    ):
+                        df = pl.DataFrame(batch)
+                        rows_read += df.height
+                        yield df, file_size * rows_read // max(total_rows, 1)
+                finally:
+                    parquet_file.close()
+
+            async for chunk_df, chunk_meta in stream_chunks(
+                _iter_batches(),
+                options.chunk_size_rows,
+                total_bytes=file_size,
+                total_rows=total_rows,
+            ):
                 yield chunk_df, chunk_meta
 
-                chunk_index += 1
-
-                if rows_in_chunk < chunk_size:
-                    break
-
         except AdapterError:
             raise
         except Exception as e:
@@ -0,0 +1,257 @@
+"""Single-pass streaming helpers for DAT file adapters.
+
+Per ADR-0041: Large File Streaming Strategy (10MB threshold).
+
+Adapters turn a file into a synchronous iterator of ``(DataFrame, bytes_read)``
+batches that reads the source exactly once (record blocks, row groups,
+worksheet rows). ``stream_chunks`` re-slices those batches to
+``chunk_size_rows``, runs the blocking reads in a worker thread and attaches
+``StreamChunk`` progress metadata. One batch of look-ahead keeps
+``is_last_chunk`` exact without pre-counting rows.
+
+Text formats infer the schema from their first block. Later blocks that
+disagree (a column that turns from int to float or string, new NDJSON
+keys) are widened with ``widen_batch`` rather than coerced to nulls, so
+chunks may grow wider over the stream; they are combined with relaxed
+diagonal concatenation.
+"""
+
+import asyncio
+import codecs
+import contextlib
+from collections.abc import AsyncIterator, Generator, Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import polars as pl
+
+from shared.contracts.dat.adapter import StreamChunk
+
+__version__ = "1.0.0"
+
+# Raw bytes read per block by the text-format block reader
+BLOCK_SIZE_BYTES = 8 * 1024 * 1024
+
+
+def _last_record_boundary(block: bytes, quote_char: bytes | None) -> int:
+    """Find the offset just past the last newline that ends a complete record.
+
+    When ``quote_char`` is set, newlines inside quoted fields are skipped by
+    requiring an even number of quote characters before the boundary (escaped
+    quotes are doubled in RFC 4180, so parity is preserved).
+
+    Args:
+        block: Decoded UTF-8 bytes.
+        quote_char: Quote byte, or None if records never span lines.
+
+    Returns:
+        Offset of the boundary, or 0 if the block holds no complete record.
+    """
+    end = len(block)
+    if quote_char is None:
+        return block.rfind(b"\n") + 1
+
+    quotes = block.count(quote_char)
+    while True:
+        newline = block.rfind(b"\n", 0, end)
+        if newline == -1:
+            return 0
+        quotes -= block.count(quote_char, newline, end)
+        if quotes % 2 == 0:
+            return newline + 1
+        end = newline
+
+
+def iter_record_blocks(
+    path: Path,
+    encoding: str = "utf-8",
+    quote_char: bytes | None = None,
+    block_size: int = BLOCK_SIZE_BYTES,
+) -> Generator[tuple[bytes, int], None, None]:
+    """Read a line-oriented text file as UTF-8 blocks of whole records.
+
+    Non UTF-8 encodings are transcoded incrementally so downstream parsers
+    only ever see UTF-8.
+
+    Args:
+        path: Path to the text file.
+        encoding: Source encoding (as returned by encoding detection).
+        quote_char: Quote byte for formats whose fields may contain newlines.
+        block_size: Raw bytes to read per block.
+
+    Yields:
+        Tuple of (UTF-8 block ending on a record boundary, raw bytes consumed).
+    """
+    enc_normalized = encoding.lower().replace("_", "-")
+    decoder = None
+    if enc_normalized not in ("utf-8", "utf8", "utf-8-sig"):
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    carry = b""
+    at_start = True
+    with open(path, "rb") as f:
+        if enc_normalized == "utf-8-sig" and f.read(3) != codecs.BOM_UTF8:
+            f.seek(0)
+        consumed = f.tell()
+
+        while True:
+            raw = f.read(block_size)
+            consumed += len(raw)
+            if decoder is not None:
+                text = decoder.decode(raw, final=not raw)
+                if at_start and text:
+                    # UTF-16/32 decoders with explicit endianness keep the BOM
+                    text = text.removeprefix("\ufeff")
+                    at_start = False
+                data = text.encode("utf-8")
+            else:
+                data = raw
+
+            buffer = carry + data
+            if not raw:
+                if buffer.strip():
+                    yield buffer, consumed
+                return
+
+            cut = _last_record_boundary(buffer, quote_char)
+            if cut == 0:
+                carry = buffer
+                continue
+            yield buffer[:cut], consumed
+            carry = buffer[cut:]
+
+
+def widen_batch(df: pl.DataFrame, schema: pl.Schema | None) -> pl.DataFrame:
+    """Align a batch with the schema of earlier batches without losing values.
+
+    Columns that are entirely null in the batch take the earlier dtype.
+    Otherwise each column is cast to the supertype of both dtypes (e.g.
+    Int64 + Float64 -> Float64, Int64 + String -> String); columns missing
+    from the batch are added as nulls and new columns are appended. The
+    returned frame's schema is the schema for the next batch.
+
+    Args:
+        df: Batch read with its own inferred schema.
+        schema: Schema of the batches read so far (None for the first).
+
+    Returns:
+        The batch with a schema that every earlier batch can be relaxed to.
+    """
+    if schema is None:
+        return df
+    df = df.with_columns(
+        pl.col(name).cast(dtype)
+        for name, dtype in schema.items()
+        if name in df.schema
+        and df.schema[name] != dtype
+        and df[name].null_count() == df.height
+    )
+    if df.schema == schema:
+        return df
+    return pl.concat([pl.DataFrame(schema=schema), df], how="diagonal_relaxed")
+
+
+def rebatch(
+    batches: Iterable[tuple[pl.DataFrame, int]],
+    chunk_size: int,
+) -> Generator[tuple[pl.DataFrame, int], None, None]:
+    """Re-slice arbitrary-sized batches into chunks of exactly ``chunk_size`` rows.
+
+    The final chunk may be shorter. Empty batches are dropped.
+
+    Args:
+        batches: Iterable of (DataFrame, bytes_read) pairs.
+        chunk_size: Target rows per chunk.
+
+    Yields:
+        Tuple of (DataFrame chunk, bytes_read after the chunk's last batch).
+    """
+    pending: list[pl.DataFrame] = []
+    pending_rows = 0
+    bytes_read = 0
+
+    for df, bytes_read in batches:
+        if df.height == 0:
+            continue
+        pending.append(df)
+        pending_rows += df.height
+
+        while pending_rows >= chunk_size:
+            buffer = pending[0] if len(pending) == 1 else pl.concat(pending, how="diagonal_relaxed")
+            yield buffer.head(chunk_size), bytes_read
+            rest = buffer.slice(chunk_size)
+            pending = [rest] if rest.height else []
+            pending_rows = rest.height
+
+    if pending_rows:
+        buffer = pending[0] if len(pending) == 1 else pl.concat(pending, how="diagonal_relaxed")
+        yield buffer, bytes_read
+
+
+async def stream_chunks(
+    batches: Iterator[tuple[pl.DataFrame, int]],
+    chunk_size: int,
+    total_bytes: int | None = None,
+    total_rows: int | None = None,
+) -> AsyncIterator[tuple[pl.DataFrame, StreamChunk]]:
+    """Drive a single-pass batch iterator and attach StreamChunk metadata.
+
+    Blocking reads run via ``asyncio.to_thread``. The underlying iterator is
+    closed when the consumer stops early, releasing any open file handles.
+    If the consumer is cancelled during a read, the read is allowed to
+    finish first, since a generator cannot be closed while a thread is
+    still running it.
+
+    Args:
+        batches: Synchronous iterator of (DataFrame, bytes_read) pairs.
+        chunk_size: Rows per yielded chunk.
+        total_bytes: Source size in bytes, for progress reporting.
+        total_rows: Total row count if already known.
+
+    Yields:
+        Tuple of (DataFrame chunk, StreamChunk metadata).
+    """
+    chunks = rebatch(batches, chunk_size)
+    total_rows_so_far = 0
+    chunk_index = 0
+    pending: asyncio.Future[tuple[pl.DataFrame, int] | None] | None = None
+
+    try:
+        start_time = datetime.now(UTC)
+        # Shielded so cancelling the consumer does not orphan the running read
+        pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+        current = await asyncio.shield(pending)
+
+        while current is not None:
+            chunk_df, bytes_read = current
+            end_time = datetime.now(UTC)
+            duration_ms = (end_time - start_time).total_seconds() * 1000
+
+            # Look ahead one chunk so is_last_chunk is exact in a single pass
+            start_time = datetime.now(UTC)
+            pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+            current = await asyncio.shield(pending)
+
+            total_rows_so_far += chunk_df.height
+            chunk_meta = StreamChunk(
+                chunk_index=chunk_index,
+                rows_in_chunk=chunk_df.height,
+                total_rows_so_far=total_rows_so_far,
+                is_last_chunk=current is None,
+                chunk_duration_ms=duration_ms,
+                bytes_read=bytes_read,
+                total_bytes=total_bytes,
+                total_rows=total_rows,
+            )
+
+            yield chunk_df, chunk_meta
+
+            chunk_index += 1
+    finally:
+        if pending is not None and not pending.done():
+            with contextlib.suppress(Exception):
+                await asyncio.shield(pending)
+        chunks.close()
+        close = getattr(batches, "close", None)
+        if close is not None:
+            close()
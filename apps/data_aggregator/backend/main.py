@@ -15,6 +15,9 @@ sys.path.insert(0, str(project_root))
 
 from apps.data_aggregator.backend.routers.jobs import router as jobs_router
 from apps.data_aggregator.backend.src.dat_aggregation.api.routes import router
+from apps.data_aggregator.backend.src.dat_aggregation.api.websocket import (
+    websocket_progress_endpoint,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -73,6 +76,9 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(router, tags=["dat"])
 app.include_router(jobs_router, tags=["jobs"])
 
+# Per SPEC-0027: progress events (including streamed discovery results)
+app.add_api_websocket_route("/ws/dat/runs/{run_id}/progress", websocket_progress_endpoint)
+
 
 @app.get("/health")
 async def health_check():
@@ -1,90 +1,138 @@
 """Fast table probing service.
 
 Per ADR-0008: Probe must complete in <1s per table.
-Per SPEC-0008: Use adapter.probe_schema(), not full reads.
+Per SPEC-0008: Use adapter metadata probes, not full reads.
+
+Row and column counts come from ``adapter.probe_shape()``, which reads
+Parquet footers, xlsx dimension records or counts lines instead of loading
+the table. Files are probed concurrently, and with a workspace ProbeCache
+unchanged files are not opened again at all.
 """
 
 import asyncio
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from apps.data_aggregator.backend.src.dat_aggregation.core.probe_cache import (
+    ProbeCache,
+    probe_schema_cached,
+    probe_shape_cached,
+)
+from shared.contracts.core.concurrency import ConcurrencyConfig
+from shared.contracts.dat.adapter import AdapterError, ReadOptions, TableShape
 from shared.contracts.dat.table_status import (
     TableAvailability,
     TableAvailabilityStatus,
+    TableParseError,
 )
 
 if TYPE_CHECKING:
+    from apps.data_aggregator.backend.adapters.registry import AdapterRegistry
     from shared.contracts.dat.adapter import BaseFileAdapter
 
-__version__ = "1.0.0"
+__version__ = "1.2.0"
 
 PROBE_TIMEOUT_SECONDS = 1.0
 
 
+@dataclass
+class FileTableShape:
+    """Shape of one table of a probed file.
+
+    Attributes:
+        file_path: Source file as given.
+        table_name: Sheet name, or the file name for single-table formats;
+            None if the file itself could not be probed.
+        shape: Row/column counts, or None if the table could not be probed.
+        error: Failure message when shape is None.
+    """
+
+    file_path: str
+    table_name: str | None
+    shape: TableShape | None = None
+    error: str | None = None
+
+
+def _table_options(file_path: Path, table_name: str | None) -> ReadOptions | None:
+    """Read options selecting a sheet, or None for single-table files."""
+    if table_name and table_name != file_path.name:
+        return ReadOptions(extra={"sheet_name": table_name})
+    return None
+
+
 async def probe_table(
     adapter: "BaseFileAdapter",
     file_path: str | Path,
     table_name: str | None = None,
+    job_id: str = "",
+    stage_id: str = "",
 ) -> TableAvailability:
     """Probe a single table for availability status.
 
-    Per ADR-0008: Fast probe without loading full data.
+    Per ADR-0008: Fast probe without loading full data; empty tables are
+    FAILED.
 
     Args:
         adapter: File adapter instance.
         file_path: Path to the file.
         table_name: Optional table/sheet name.
+        job_id: DAT job the probe belongs to.
+        stage_id: Stage the probe belongs to.
 
     Returns:
         TableAvailability: Status of the table.
     """
     file_path = Path(file_path) if isinstance(file_path, str) else file_path
     table_id = f"{file_path}::{table_name}" if table_name else str(file_path)
+    now = datetime.now(UTC)
+    availability = TableAvailability(
+        table_id=table_id,
+        table_name=table_name or file_path.name,
+        job_id=job_id,
+        stage_id=stage_id,
+        created_at=now,
+        source_files=[str(file_path)],
+        source_file_count=1,
+    )
 
     try:
-        result = await asyncio.wait_for(
-            adapter.probe_schema(str(file_path), table_name),
+        shape = await asyncio.wait_for(
+            adapter.probe_shape(str(file_path), _table_options(file_path, table_name)),
             timeout=PROBE_TIMEOUT_SECONDS,
         )
-
-        if result.row_count == 0:
-            status = TableAvailabilityStatus.EMPTY
-        elif result.error:
-            status = TableAvailabilityStatus.PARTIAL
-        else:
-            status = TableAvailabilityStatus.AVAILABLE
-
-        return TableAvailability(
-            table_id=table_id,
-            status=status,
-            column_count=len(result.columns) if result.columns else 0,
-            row_estimate=result.row_count,
-            probed_at=datetime.now(UTC),
-        )
-
     except TimeoutError:
-        return TableAvailability(
-            table_id=table_id,
-            status=TableAvailabilityStatus.ERROR,
-            error_message="Probe timeout exceeded",
-            probed_at=datetime.now(UTC),
-        )
-
-    except FileNotFoundError:
-        return TableAvailability(
-            table_id=table_id,
-            status=TableAvailabilityStatus.MISSING,
-            probed_at=datetime.now(UTC),
-        )
-
+        return _failed(availability, "timeout", "Probe timeout exceeded")
+    except AdapterError as e:
+        return _failed(availability, e.code.value, e.message)
     except Exception as e:
-        return TableAvailability(
-            table_id=table_id,
-            status=TableAvailabilityStatus.ERROR,
-            error_message=str(e),
-            probed_at=datetime.now(UTC),
-        )
+        return _failed(availability, "unknown", str(e))
+
+    return availability.model_copy(update={
+        "status": (
+            TableAvailabilityStatus.AVAILABLE
+            if shape.row_count > 0
+            else TableAvailabilityStatus.FAILED
+        ),
+        "completed_at": datetime.now(UTC),
+        "row_count": shape.row_count,
+        "column_count": shape.column_count,
+        "columns": shape.columns,
+    })
+
+
+def _failed(availability: TableAvailability, code: str, message: str) -> TableAvailability:
+    return availability.model_copy(update={
+        "status": TableAvailabilityStatus.FAILED,
+        "completed_at": datetime.now(UTC),
+        "errors": [TableParseError(
+            error_code=code,
+            message=message,
+            source_file=availability.source_files[0],
+        )],
+        "error_count": 1,
+    })
 
 
 async def probe_tables_batch(
@@ -107,3 +155,58 @@ async def probe_tables_batch(
         for table_name in table_names
     ]
     return await asyncio.gather(*tasks)
+
+
+async def probe_file_shapes(
+    registry: "AdapterRegistry",
+    file_paths: list[str],
+    max_concurrency: int | None = None,
+    probe_cache: ProbeCache | None = None,
+) -> list[FileTableShape]:
+    """Get row/column counts of every table in a set of files.
+
+    Files are probed concurrently (per ADR-0013, at most ET_MAX_THREADS at
+    once by default); sheets of one file are probed in turn.
+
+    Args:
+        registry: Adapter registry used to pick each file's adapter.
+        file_paths: Files to probe.
+        max_concurrency: Files probed at once (None = ET_MAX_THREADS).
+        probe_cache: Workspace probe cache; sheet lists and counts of
+            unchanged files are served from it.
+
+    Returns:
+        One entry per table, grouped by file in input order. A file that
+        could not be probed at all yields a single entry with table_name None.
+    """
+    limit = max_concurrency or ConcurrencyConfig.from_env().max_threads
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _probe_file(file_path: str) -> list[FileTableShape]:
+        async with semaphore:
+            try:
+                adapter = registry.get_adapter_for_file(file_path)
+                if adapter.metadata.capabilities.supports_multiple_sheets:
+                    probe_result = await probe_schema_cached(probe_cache, adapter, file_path)
+                    table_names = (
+                        [s.sheet_name for s in probe_result.sheets]
+                        if probe_result.sheets
+                        else [Path(file_path).name]
+                    )
+                else:
+                    table_names = [Path(file_path).name]
+            except Exception as e:
+                return [FileTableShape(file_path=file_path, table_name=None, error=str(e))]
+
+            results: list[FileTableShape] = []
+            for table_name in table_names:
+                options = _table_options(Path(file_path), table_name)
+                try:
+                    shape = await probe_shape_cached(probe_cache, adapter, file_path, options)
+                    results.append(FileTableShape(file_path, table_name, shape=shape))
+                except Exception as e:
+                    results.append(FileTableShape(file_path, table_name, error=str(e)))
+            return results
+
+    per_file = await asyncio.gather(*(_probe_file(f) for f in file_paths))
+    return [entry for entries in per_file for entry in entries]
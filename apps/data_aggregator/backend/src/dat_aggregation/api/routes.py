@@ -3,13 +3,17 @@
 Per ADR-0030: All routes use /api/{tool}/{resource} pattern (no version prefix).
 Per ADR-0014: Cancellation events are logged for audit.
 """
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Body, HTTPException
+import polars as pl
+from fastapi import APIRouter, BackgroundTasks, Body, HTTPException, Query
 
 from apps.data_aggregator.backend.services.cleanup import cleanup
 from apps.data_aggregator.backend.services.profile_service import ProfileService
+from apps.data_aggregator.backend.services.table_probe import probe_file_shapes
 from shared.contracts.core.error_response import (
     ErrorCategory,
     create_error_response,
@@ -20,10 +24,22 @@ from shared.contracts.dat.cancellation import (
     CleanupTarget,
 )
 
+from ..core.file_cache import release_run_file_cache
+from ..core.preview_query import (
+    MAX_PREVIEW_PAGE_ROWS,
+    PreviewFilter,
+    query_parse_output,
+)
+from ..core.probe_cache import get_probe_cache
 from ..core.run_manager import RunManager
 from ..core.state_machine import Stage, StageState, StageStatus
 from ..stages.export import execute_export
-from ..stages.parse import CancellationToken, ParseConfig, execute_parse
+from ..stages.parse import (
+    OUTPUT_MODE_COMBINED,
+    CancellationToken,
+    ParseConfig,
+    execute_parse,
+)
 from ..stages.selection import execute_selection
 from .schemas import (
     ContextInfo,
@@ -33,6 +49,7 @@ from .schemas import (
     ExtractionResponse,
     FileInfoResponse,
     ParseRequest,
+    PreviewPageResponse,
     PreviewResponse,
     RunResponse,
     ScanRequest,
@@ -41,6 +58,7 @@ from .schemas import (
     StageStatusResponse,
     TableSelectionRequest,
 )
+from .websocket import ProgressEventType, ProgressUpdate, progress_manager
 
 # Per ADR-0030: Tool-specific routes use no version prefix (mounted at /api/dat by gateway)
 router = APIRouter()
@@ -182,6 +200,7 @@ async def get_run(run_id: str):
 async def delete_run(run_id: str):
     """Delete a DAT run and all its artifacts."""
     deleted = await run_manager.delete_run(run_id)
+    release_run_file_cache(run_id)
     if not deleted:
         _raise_error(
             status_code=404,
@@ -246,13 +265,42 @@ async def lock_discovery(run_id: str, request: ScanRequest):
         )
 
     # Discover files
-    from ..stages.discovery import DiscoveryConfig, execute_discovery
+    from ..stages.discovery import DiscoveryConfig, execute_discovery, snapshot_path_for
 
     try:
-        config = DiscoveryConfig(root_path=source_path)
+        config = DiscoveryConfig(
+            root_path=source_path,
+            recursive=request.recursive,
+            snapshot_path=snapshot_path_for(
+                run_manager.store.dat_workspace, source_path, recursive=request.recursive
+            ),
+            only_changes=request.incremental,
+        )
+        found = 0
+
+        async def on_files(batch):
+            # Stream each directory's files to progress subscribers as found
+            nonlocal found
+            found += len(batch)
+            await progress_manager.broadcast(run_id, ProgressUpdate(
+                stage_id=Stage.DISCOVERY.value,
+                event_type=ProgressEventType.FILES_DISCOVERED,
+                rows_processed=found,
+                current_file=str(Path(batch[0].path).parent),
+                files=[
+                    {
+                        "path": f.path,
+                        "name": f.name,
+                        "extension": f.extension,
+                        "size_bytes": f.size_bytes,
+                    }
+                    for f in batch
+                ],
+            ))
 
         async def execute():
-            result = await execute_discovery(run_id, config)
+            result = await execute_discovery(run_id, config, on_files=on_files)
+            changes = result.changes
             return {
                 "discovery_id": result.discovery_id,
                 "root_path": result.root_path,
@@ -268,11 +316,20 @@ async def lock_discovery(run_id: str, request: ScanRequest):
                 "total_files": result.total_files,
                 "supported_files": result.supported_files,
                 "completed": result.completed,
+                "changes": {
+                    "new_files": changes.new_files,
+                    "changed_files": changes.changed_files,
+                    "removed_files": changes.removed_files,
+                } if changes and changes.had_snapshot else None,
             }
 
         # Per ADR-0008: Use relative paths for deterministic IDs
         workspace_root = Path(run.get("workspace", source_path.parent))
-        inputs = {"root_path": make_relative(source_path, workspace_root).path}
+        inputs = {
+            "root_path": make_relative(source_path, workspace_root).path,
+            "recursive": request.recursive,
+            "incremental": request.incremental,
+        }
         status = await sm.lock_stage(Stage.DISCOVERY, inputs=inputs, execute_fn=execute)
 
         artifact = await sm.store.get_artifact(run_id, Stage.DISCOVERY, status.stage_id)
@@ -282,6 +339,7 @@ async def lock_discovery(run_id: str, request: ScanRequest):
             "files": artifact.get("files", []),
             "total_files": artifact.get("total_files", 0),
             "supported_files": artifact.get("supported_files", 0),
+            "changes": artifact.get("changes"),
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -369,7 +427,12 @@ async def lock_selection(run_id: str, request: SelectionRequest):
         source_paths = list(set(p.parent for p in selected))
 
     async def execute():
-        result = await execute_selection(source_paths, selected, request.recursive)
+        result = await execute_selection(
+            source_paths,
+            selected,
+            request.recursive,
+            probe_cache=get_probe_cache(run_manager.store.workspace),
+        )
         return {
             "discovered_files": [
                 {
@@ -499,6 +562,8 @@ async def lock_parse(run_id: str, request: ParseRequest | None = None, backgroun
         selected_tables=selected_tables,
         column_mappings=column_mappings,
         profile_id=profile_id,
+        output_mode=request.output_mode if request else OUTPUT_MODE_COMBINED,
+        partition_by=request.partition_by if request else None,
     )
 
     # Create cancellation token
@@ -527,6 +592,8 @@ async def lock_parse(run_id: str, request: ParseRequest | None = None, backgroun
             "tables": selected_tables,
             "mappings": column_mappings,
             "profile_id": profile_id,
+            "output_mode": config.output_mode,
+            "partition_by": config.partition_by,
         }
         status = await sm.lock_stage(Stage.PARSE, inputs=inputs, execute_fn=execute)
 
@@ -597,22 +664,9 @@ async def export_dataset(run_id: str, request: ExportRequest):
     if not parse_artifact:
         raise HTTPException(status_code=400, detail="Parse artifact not found")
 
-    # Load the parsed data
-    import polars as pl
-    output_path = Path(parse_artifact["output_path"])
-    data = pl.read_parquet(output_path)
-
-    # Create a ParseResult-like object for export
-    from ..stages.parse import ParseResult
-    parse_result = ParseResult(
-        data=data,
-        row_count=parse_artifact["row_count"],
-        column_count=parse_artifact["column_count"],
-        source_files=parse_artifact["source_files"],
-        completed=True,
-        parse_id=parse_artifact["parse_id"],
-        output_path=str(output_path),
-    )
+    # Per ADR-0041: export reads the parse output lazily
+    from ..stages.parse import parse_result_from_artifact
+    parse_result = parse_result_from_artifact(parse_artifact)
 
     manifest = await execute_export(
         run_id=run_id,
@@ -979,6 +1033,44 @@ async def apply_context_to_tables(
     }
 
 
+async def _discover_file_tables(selected_files: list[str]) -> list[dict[str, Any]]:
+    """List each selected file's tables with row/column counts.
+
+    Per ADR-0008: Table availability shows actual row/column counts. Counts
+    come from adapter metadata probes (no full reads), files in parallel, and
+    are reused from the workspace probe cache for unchanged files.
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+
+    from apps.data_aggregator.backend.adapters import create_default_registry
+
+    tables = []
+    shapes = await probe_file_shapes(
+        create_default_registry(),
+        selected_files,
+        probe_cache=get_probe_cache(run_manager.store.workspace),
+    )
+    for entry in shapes:
+        if entry.table_name is None:
+            logger.warning(f"Could not get tables from {entry.file_path}: {entry.error}")
+            continue
+        if entry.shape is None:
+            logger.warning(
+                f"Could not get counts for table {entry.table_name} in {entry.file_path}: "
+                f"{entry.error}"
+            )
+        row_count = entry.shape.row_count if entry.shape else 0
+        column_count = entry.shape.column_count if entry.shape else 0
+        tables.append({
+            "name": entry.table_name,
+            "file": entry.file_path,
+            "available": row_count > 0 or column_count > 0,
+            "row_count": row_count,
+            "column_count": column_count,
+        })
+    return tables
+
 @router.get("/runs/{run_id}/stages/table_availability/scan")
 async def scan_table_availability(run_id: str):
     """Scan for available tables from selected files.
@@ -988,9 +1080,6 @@ async def scan_table_availability(run_id: str):
     When a profile is selected (via context stage), returns profile-defined tables.
     Otherwise, returns file-based tables (legacy behavior).
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
     sm = run_manager.get_state_machine(run_id)
 
     # Get selection result
@@ -1030,44 +1119,7 @@ async def scan_table_availability(run_id: str):
         return tables
 
     # Fallback: Get tables from selected files (legacy file-based mode)
-    from apps.data_aggregator.backend.adapters import create_default_registry
-    from shared.contracts.dat.adapter import ReadOptions
-
-    registry = create_default_registry()
-    tables = []
-    for file_path in selected_files:
-        try:
-            adapter = registry.get_adapter_for_file(file_path)
-            # Get table names using async probe_schema
-            if adapter.metadata.capabilities.supports_multiple_sheets:
-                probe_result = await adapter.probe_schema(file_path)
-                file_tables = [s.sheet_name for s in probe_result.sheets] if probe_result.sheets else [Path(file_path).name]
-            else:
-                file_tables = [Path(file_path).name]
-
-            for table in file_tables:
-                # Get actual row and column counts using async adapter
-                try:
-                    options = ReadOptions(extra={"sheet_name": table} if table != Path(file_path).name else {})
-                    full_df, _ = await adapter.read_dataframe(file_path, options)
-                    row_count = len(full_df)
-                    column_count = len(full_df.columns)
-                except Exception as e:
-                    logger.warning(f"Could not get counts for table {table} in {file_path}: {e}")
-                    row_count = 0
-                    column_count = 0
-
-                tables.append({
-                    "name": table,
-                    "file": file_path,
-                    "available": row_count > 0 or column_count > 0,
-                    "row_count": row_count,
-                    "column_count": column_count,
-                })
-        except Exception as e:
-            logger.warning(f"Could not get tables from {file_path}: {e}")
-
-    return tables
+    return await _discover_file_tables(selected_files)
 
 
 @router.post("/runs/{run_id}/stages/table_availability/lock")
@@ -1079,9 +1131,6 @@ async def lock_table_availability(run_id: str):
     When a profile is selected, stores profile table definitions.
     Otherwise, discovers tables from files (legacy behavior).
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
     sm = run_manager.get_state_machine(run_id)
 
     # Get selection result
@@ -1132,42 +1181,7 @@ async def lock_table_availability(run_id: str):
             raise HTTPException(status_code=400, detail=str(e))
 
     # Fallback: Discover tables from selected files (legacy file-based mode)
-    from apps.data_aggregator.backend.adapters import create_default_registry
-    from shared.contracts.dat.adapter import ReadOptions
-
-    registry = create_default_registry()
-    tables = []
-    for file_path in selected_files:
-        try:
-            adapter = registry.get_adapter_for_file(file_path)
-            # Get table names using async probe_schema
-            if adapter.metadata.capabilities.supports_multiple_sheets:
-                probe_result = await adapter.probe_schema(file_path)
-                file_tables = [s.sheet_name for s in probe_result.sheets] if probe_result.sheets else [Path(file_path).name]
-            else:
-                file_tables = [Path(file_path).name]
-
-            for table in file_tables:
-                # Get actual row and column counts using async adapter
-                try:
-                    options = ReadOptions(extra={"sheet_name": table} if table != Path(file_path).name else {})
-                    full_df, _ = await adapter.read_dataframe(file_path, options)
-                    row_count = len(full_df)
-                    column_count = len(full_df.columns)
-                except Exception as e:
-                    logger.warning(f"Could not get counts for table {table}: {e}")
-                    row_count = 0
-                    column_count = 0
-
-                tables.append({
-                    "name": table,
-                    "file": file_path,
-                    "available": row_count > 0 or column_count > 0,
-                    "row_count": row_count,
-                    "column_count": column_count,
-                })
-        except Exception as e:
-            logger.warning(f"Could not get tables from {file_path}: {e}")
+    tables = await _discover_file_tables(selected_files)
 
     async def execute():
         return {
@@ -1247,6 +1261,8 @@ async def unlock_stage(run_id: str, stage: str):
     try:
         # Unlock with cascade - preserves artifacts per ADR-0002
         unlocked = await sm.unlock_stage(stage_enum, cascade=True)
+        # Unlocked stages re-read their inputs; don't pin the old parses in memory
+        release_run_file_cache(run_id)
         primary_status = unlocked[0] if unlocked else None
         return {
             "status": "unlocked",
@@ -1349,7 +1365,11 @@ async def lock_preview(run_id: str):
                     adapter = registry.get_adapter_for_file(file_path)
                     for table_name in tables[:5]:  # Limit tables per file
                         try:
-                            options = ReadOptions(extra={"sheet_name": table_name} if table_name != Path(file_path).name else {})
+                            # Only the preview rows are read, not the whole table
+                            options = ReadOptions(
+                                extra={"sheet_name": table_name} if table_name != Path(file_path).name else {},
+                                row_limit=preview_rows_per_table,
+                            )
                             df, _ = await adapter.read_dataframe(file_path, options)
 
                             if len(df) > 0:
@@ -1415,17 +1435,67 @@ async def get_preview(run_id: str, rows: int = 100):
     if not parse_artifact:
         raise HTTPException(status_code=400, detail="Parse artifact not found")
 
-    import polars as pl
-    output_path = Path(parse_artifact["output_path"])
-    data = pl.read_parquet(output_path)
-
-    preview = data.head(rows)
+    # Per ADR-0041: only the first rows are decoded, counts come from footers
+    page = await asyncio.to_thread(query_parse_output, parse_artifact["output_path"], limit=rows)
 
     return PreviewResponse(
-        columns=preview.columns,
-        rows=preview.to_dicts(),
-        row_count=len(preview),
-        total_rows=len(data),
+        columns=page.columns,
+        rows=page.rows,
+        row_count=len(page.rows),
+        total_rows=page.total_rows,
+    )
+
+
+@router.get("/runs/{run_id}/stages/parse/data", response_model=PreviewPageResponse)
+async def get_parse_data_page(
+    run_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=0, le=MAX_PREVIEW_PAGE_ROWS),
+    columns: str | None = Query(None, description="Comma-separated columns to return"),
+    sort_by: str | None = None,
+    descending: bool = False,
+    filters: list[str] | None = Query(
+        None,
+        alias="filter",
+        description="Filters as column:op[:value], e.g. wafer_id:eq:W01",
+    ),
+):
+    """Get one page of parsed data.
+
+    Per ADR-0041: Filters, sort, projection and the page slice are pushed
+    into a lazy scan of the parse output, so a page of a very large parse is
+    served without loading it.
+    """
+    sm = run_manager.get_state_machine(run_id)
+    parse_status = await sm.store.get_stage_status(run_id, Stage.PARSE)
+    if parse_status.state != StageState.LOCKED or not parse_status.stage_id:
+        raise HTTPException(status_code=400, detail="Parse stage must be locked first")
+
+    parse_artifact = await sm.store.get_artifact(run_id, Stage.PARSE, parse_status.stage_id)
+    if not parse_artifact or not parse_artifact.get("output_path"):
+        raise HTTPException(status_code=400, detail="Parse artifact not found")
+
+    try:
+        page = await asyncio.to_thread(
+            query_parse_output,
+            parse_artifact["output_path"],
+            offset=offset,
+            limit=limit,
+            columns=[c.strip() for c in columns.split(",") if c.strip()] if columns else None,
+            sort_by=sort_by,
+            descending=descending,
+            filters=[PreviewFilter.parse(spec) for spec in filters or []],
+        )
+    except (ValueError, pl.exceptions.PolarsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return PreviewPageResponse(
+        columns=page.columns,
+        rows=page.rows,
+        row_count=len(page.rows),
+        total_rows=page.total_rows,
+        offset=page.offset,
+        filtered_rows=page.filtered_rows,
     )
 
 
@@ -1453,24 +1523,10 @@ async def lock_export(run_id: str, request: ExportRequest):
         logger.info(f"Export lock: output_path = {parse_artifact.get('output_path')}")
 
         async def execute():
-            # Load the parsed data
-            import polars as pl
-            output_path = Path(parse_artifact["output_path"])
-            logger.info(f"Loading parquet from: {output_path}")
-            data = pl.read_parquet(output_path)
-            logger.info(f"Loaded data: {len(data)} rows, {len(data.columns)} columns")
-
-            # Create a ParseResult-like object for export
-            from ..stages.parse import ParseResult
-            parse_result = ParseResult(
-                data=data,
-                row_count=parse_artifact["row_count"],
-                column_count=parse_artifact["column_count"],
-                source_files=parse_artifact["source_files"],
-                completed=True,
-                parse_id=parse_artifact["parse_id"],
-                output_path=str(output_path),
-            )
+            # Per ADR-0041: export reads the parse output lazily
+            from ..stages.parse import parse_result_from_artifact
+            logger.info(f"Scanning parse output: {parse_artifact['output_path']}")
+            parse_result = parse_result_from_artifact(parse_artifact)
 
             logger.info(f"Calling execute_export with name={request.name}")
             manifest = await execute_export(
@@ -1538,9 +1594,8 @@ async def get_export_summary(run_id: str):
     output_path = parse_artifact.get("output_path")
     if output_path:
         try:
-            import polars as pl
-            df = pl.read_parquet(output_path)
-            columns = df.columns
+            from ..core.parquet_dataset import scan_parse_output
+            columns = scan_parse_output(output_path).collect_schema().names()
         except Exception:
             pass
 
@@ -1584,22 +1639,9 @@ async def execute_export_stage(run_id: str, request: ExportRequest):
 
     logger.info(f"Executing export for run {run_id}")
 
-    # Load the parsed data
-    import polars as pl
-    output_path = Path(parse_artifact["output_path"])
-    data = pl.read_parquet(output_path)
-
-    # Create a ParseResult-like object for export
-    from ..stages.parse import ParseResult
-    parse_result = ParseResult(
-        data=data,
-        row_count=parse_artifact["row_count"],
-        column_count=parse_artifact["column_count"],
-        source_files=parse_artifact["source_files"],
-        completed=True,
-        parse_id=parse_artifact["parse_id"],
-        output_path=str(output_path),
-    )
+    # Per ADR-0041: export reads the parse output lazily
+    from ..stages.parse import parse_result_from_artifact
+    parse_result = parse_result_from_artifact(parse_artifact)
 
     manifest = await execute_export(
         run_id=run_id,
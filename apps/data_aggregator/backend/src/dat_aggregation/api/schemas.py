@@ -1,5 +1,6 @@
 """API request/response schemas for DAT."""
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -43,6 +44,10 @@ class ScanRequest(BaseModel):
     """Request to scan a folder for files."""
     folder_path: str
     recursive: bool = True
+    incremental: bool = Field(
+        False,
+        description="Report only files that are new or changed since the last scan of this folder",
+    )
 
 
 class SelectionRequest(BaseModel):
@@ -96,6 +101,15 @@ class ParseRequest(BaseModel):
         default=None,
         description="Context application options for output"
     )
+    output_mode: Literal["combined", "dataset"] = Field(
+        default="combined",
+        description="'combined' writes one Parquet file; 'dataset' writes a partitioned "
+        "Parquet directory without building the combined frame"
+    )
+    partition_by: list[str] | None = Field(
+        default=None,
+        description="Dataset partition columns (None = lot_id, wafer_id)"
+    )
 
 
 class ExportRequest(BaseModel):
@@ -128,6 +142,12 @@ class PreviewResponse(BaseModel):
     total_rows: int
 
 
+class PreviewPageResponse(PreviewResponse):
+    """One page of parse output with paging/filter metadata."""
+    offset: int = 0
+    filtered_rows: int
+
+
 class ContextInfo(BaseModel):
     """Information about extracted context."""
     run_context: dict[str, str | int | float | None] = Field(
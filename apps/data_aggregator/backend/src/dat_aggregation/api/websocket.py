@@ -2,7 +2,7 @@
 
 This module implements real-time progress updates for long-running DAT operations
 per SPEC-0027. It provides WebSocket connections for streaming progress
-during Parse and Export stages.
+during Discovery, Parse and Export stages.
 
 Endpoint: /ws/dat/runs/{run_id}/progress
 """
@@ -18,7 +18,7 @@ from enum import Enum
 
 from fastapi import WebSocket, WebSocketDisconnect
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 
 
 class ProgressEventType(str, Enum):
@@ -27,6 +27,7 @@ class ProgressEventType(str, Enum):
     STARTED = "started"
     PROGRESS = "progress"
     CHUNK_COMPLETE = "chunk_complete"
+    FILES_DISCOVERED = "files_discovered"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
     ERROR = "error"
@@ -46,6 +47,7 @@ class ProgressUpdate:
         estimated_remaining_ms: Estimated time remaining in milliseconds.
         message: Optional status message.
         timestamp: ISO-8601 UTC timestamp.
+        files: Files found since the last update (files_discovered events only).
     """
 
     stage_id: str
@@ -57,10 +59,11 @@ class ProgressUpdate:
     estimated_remaining_ms: int | None = None
     message: str | None = None
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    files: list[dict] | None = None
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
-        return {
+        data = {
             "stage_id": self.stage_id,
             "event_type": self.event_type.value,
             "progress_pct": round(self.progress_pct, 1),
@@ -71,6 +74,9 @@ class ProgressUpdate:
             "message": self.message,
             "timestamp": self.timestamp.isoformat(),
         }
+        if self.files is not None:
+            data["files"] = self.files
+        return data
 
     def to_json(self) -> str:
         """Convert to JSON string."""
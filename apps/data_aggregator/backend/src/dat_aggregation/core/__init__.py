@@ -1,5 +1,12 @@
-"""DAT core - state machine, run management, and memory management."""
+"""DAT core - state machine, run management, memory management, file and probe
+caching, Parquet dataset output and paged previews."""
 
+from .file_cache import (
+    ParsedFileCache,
+    get_run_file_cache,
+    read_dataframe_cached,
+    release_run_file_cache,
+)
 from .memory_manager import (
     FILE_SIZE_STRATEGIES,
     STREAMING_THRESHOLD_BYTES,
@@ -11,6 +18,22 @@ from .memory_manager import (
     get_memory_manager,
     reset_memory_manager,
 )
+from .parquet_dataset import (
+    DatasetInfo,
+    PartitionedParquetWriter,
+    scan_parse_output,
+)
+from .preview_query import (
+    PreviewFilter,
+    PreviewPage,
+    query_parse_output,
+)
+from .probe_cache import (
+    ProbeCache,
+    get_probe_cache,
+    probe_schema_cached,
+    probe_shape_cached,
+)
 
 __all__ = [
     "MemoryConfig",
@@ -22,4 +45,18 @@ __all__ = [
     "STREAMING_THRESHOLD_BYTES",
     "get_memory_manager",
     "reset_memory_manager",
+    "ParsedFileCache",
+    "get_run_file_cache",
+    "read_dataframe_cached",
+    "release_run_file_cache",
+    "DatasetInfo",
+    "PartitionedParquetWriter",
+    "scan_parse_output",
+    "PreviewFilter",
+    "PreviewPage",
+    "query_parse_output",
+    "ProbeCache",
+    "get_probe_cache",
+    "probe_schema_cached",
+    "probe_shape_cached",
 ]
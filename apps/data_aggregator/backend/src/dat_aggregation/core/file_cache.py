@@ -0,0 +1,342 @@
+"""Run-scoped cache of parsed source files.
+
+Several DAT stages read the same source files within one run: table
+availability and preview read each table, and profile-driven parse loads every
+file again to extract its context and tables. The ParsedFileCache lets them
+share one parse per file.
+
+Entries are keyed by resolved path, modification time and size (so an edited
+file is never served stale) plus a ``kind`` string naming what was parsed
+(e.g. a profile load or an adapter read with given options). The cache is an
+LRU bounded by the estimated in-memory size of its entries, per ADR-0041
+memory limits.
+
+Caches are scoped to a DAT run via get_run_file_cache / release_run_file_cache.
+Run caches are released when parse completes or the run is unlocked or
+deleted. Caches of abandoned runs are bounded as well: they expire after
+RUN_CACHE_TTL_SECONDS without use, and the caches of all runs together are
+kept within MAX_TOTAL_CACHE_MB by dropping the least recently used runs.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from shared.contracts.dat.adapter import BaseFileAdapter, ReadOptions, ReadResult
+
+__version__ = "1.0.0"
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default in-memory budget per run cache
+DEFAULT_CACHE_BUDGET_MB = 256
+
+# Parsed JSON/Python objects take several times their on-disk size
+PARSED_OBJECT_SIZE_FACTOR = 4
+
+# Runs whose caches are retained at once; the least recently used is evicted
+MAX_CACHED_RUNS = 8
+
+# Budget for the caches of all runs together
+MAX_TOTAL_CACHE_MB = 512
+
+# Run caches unused for this long are dropped (e.g. preview-only runs)
+RUN_CACHE_TTL_SECONDS = 30 * 60
+
+CacheKey = tuple[str, int, int, str]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a ParsedFileCache.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups that invoked the loader.
+        evictions: Entries dropped to stay within budget.
+        size_bytes: Current estimated size of cached entries.
+        entries: Current number of cached entries.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size_bytes: int = 0
+    entries: int = 0
+
+
+def _estimate_size(value: Any, file_size: int) -> int:
+    """Estimate the in-memory size of a cached value."""
+    if isinstance(value, pl.DataFrame) or callable(getattr(value, "estimated_size", None)):
+        return value.estimated_size()
+    if isinstance(value, tuple):
+        return sum(_estimate_size(item, 0) for item in value) or file_size
+    if isinstance(value, dict) and isinstance(value.get("_dataframe"), pl.DataFrame):
+        return value["_dataframe"].estimated_size()
+    return file_size * PARSED_OBJECT_SIZE_FACTOR
+
+
+class ParsedFileCache:
+    """Memory-bounded LRU cache of parsed file contents.
+
+    Cached values are shared between callers and must be treated as
+    read-only. Values that grow in place (a TabularSource building its
+    records) report it through their ``on_resize`` hook so the cache can
+    re-estimate them.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CACHE_BUDGET_MB * 1024 * 1024,
+        on_grow: Callable[[], None] | None = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            max_bytes: Upper bound on the estimated size of cached entries.
+            on_grow: Called (outside the cache lock) after an entry is stored.
+        """
+        self.max_bytes = max_bytes
+        self.on_grow = on_grow
+        self._entries: OrderedDict[CacheKey, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(file_path: Path | str, kind: str) -> CacheKey | None:
+        """Build a cache key from file identity, or None if the file is missing."""
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (str(path.resolve()), stat.st_mtime_ns, stat.st_size, kind)
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Look up a key.
+
+        Returns:
+            Tuple of (found, value).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, entry[0]
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store a value, evicting least recently used entries over budget.
+
+        None values (failed loads) and values larger than the whole budget
+        are not cached.
+        """
+        if value is None:
+            return
+        size = _estimate_size(value, key[2])
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key[0]} ({size} bytes exceeds cache budget)")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.stats.size_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.stats.size_bytes += size
+            self._evict_over_budget()
+
+        if hasattr(value, "on_resize"):
+            value.on_resize = lambda: self.resize(key)
+        if self.on_grow is not None:
+            self.on_grow()
+
+    def resize(self, key: CacheKey) -> None:
+        """Re-estimate an entry whose value grew in place, evicting over budget."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            value, previous_size = entry
+            size = _estimate_size(value, key[2])
+            self._entries[key] = (value, size)
+            self.stats.size_bytes += size - previous_size
+            self._evict_over_budget()
+
+        if self.on_grow is not None:
+            self.on_grow()
+
+    def _evict_over_budget(self) -> None:
+        """Drop least recently used entries until within budget (lock held)."""
+        while self.stats.size_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.stats.size_bytes -= evicted_size
+            self.stats.evictions += 1
+        self.stats.entries = len(self._entries)
+
+    def get_or_load(
+        self,
+        file_path: Path | str,
+        kind: str,
+        loader: Callable[[], T],
+    ) -> T:
+        """Return the cached value for a file, loading it on a miss.
+
+        Args:
+            file_path: Source file.
+            kind: What was parsed and how (distinguishes reads of one file).
+            loader: Called on a miss to parse the file.
+
+        Returns:
+            Cached or freshly loaded value.
+        """
+        key = self.make_key(file_path, kind)
+        if key is None:
+            return loader()
+        found, value = self.get(key)
+        if found:
+            return value
+        value = loader()
+        self.put(key, value)
+        return value
+
+    async def aget_or_load(
+        self,
+        file_path: Path | str,
+        kind: str,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Async variant of get_or_load for coroutine loaders."""
+        key = self.make_key(file_path, kind)
+        if key is None:
+            return await loader()
+        found, value = self.get(key)
+        if found:
+            return value
+        value = await loader()
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self.stats.size_bytes = 0
+            self.stats.entries = 0
+
+
+_run_caches: OrderedDict[str, ParsedFileCache] = OrderedDict()
+_run_cache_used: dict[str, float] = {}
+_run_caches_lock = threading.Lock()
+
+
+def _drop_run_cache(run_id: str) -> ParsedFileCache | None:
+    """Unregister a run cache (caller holds _run_caches_lock)."""
+    _run_cache_used.pop(run_id, None)
+    return _run_caches.pop(run_id, None)
+
+
+def _enforce_run_cache_limits(keep: str | None = None) -> None:
+    """Drop expired run caches, then least recently used ones over the total budget.
+
+    Args:
+        keep: Run whose cache is never dropped for the total budget (the
+            one in use); it only has its own per-run bound.
+    """
+    now = time.monotonic()
+    dropped: list[ParsedFileCache] = []
+    with _run_caches_lock:
+        if keep in _run_cache_used:
+            _run_cache_used[keep] = now
+        for run_id, used in list(_run_cache_used.items()):
+            if run_id != keep and now - used > RUN_CACHE_TTL_SECONDS:
+                dropped.append(_drop_run_cache(run_id))
+
+        total = sum(cache.stats.size_bytes for cache in _run_caches.values())
+        for run_id in list(_run_caches):
+            if total <= MAX_TOTAL_CACHE_MB * 1024 * 1024:
+                break
+            if run_id != keep:
+                cache = _drop_run_cache(run_id)
+                total -= cache.stats.size_bytes
+                dropped.append(cache)
+
+    for cache in dropped:
+        cache.clear()
+
+
+def get_run_file_cache(run_id: str) -> ParsedFileCache:
+    """Get (or create) the parsed-file cache for a DAT run.
+
+    Args:
+        run_id: DAT run ID.
+
+    Returns:
+        The run's ParsedFileCache.
+    """
+    evicted: list[ParsedFileCache] = []
+    with _run_caches_lock:
+        cache = _run_caches.get(run_id)
+        if cache is None:
+            cache = ParsedFileCache(on_grow=lambda: _enforce_run_cache_limits(keep=run_id))
+            _run_caches[run_id] = cache
+            while len(_run_caches) > MAX_CACHED_RUNS:
+                evicted.append(_drop_run_cache(next(iter(_run_caches))))
+        else:
+            _run_caches.move_to_end(run_id)
+        _run_cache_used[run_id] = time.monotonic()
+
+    for stale in evicted:
+        stale.clear()
+    _enforce_run_cache_limits(keep=run_id)
+    return cache
+
+
+def release_run_file_cache(run_id: str) -> None:
+    """Drop a run's parsed-file cache, e.g. once parse has completed."""
+    with _run_caches_lock:
+        cache = _drop_run_cache(run_id)
+    if cache is not None:
+        cache.clear()
+
+
+async def read_dataframe_cached(
+    cache: ParsedFileCache | None,
+    adapter: BaseFileAdapter,
+    file_path: Path | str,
+    options: ReadOptions | None = None,
+) -> tuple[pl.DataFrame, ReadResult]:
+    """Read a table through an adapter, sharing the result within a run.
+
+    Args:
+        cache: Run cache, or None to read directly.
+        adapter: Adapter selected for the file.
+        file_path: Source file.
+        options: Read options (part of the cache key).
+
+    Returns:
+        Tuple of (DataFrame, ReadResult) as returned by the adapter.
+    """
+    if cache is None:
+        return await adapter.read_dataframe(str(file_path), options)
+
+    options_key = options.model_dump_json() if options is not None else "{}"
+    return await cache.aget_or_load(
+        file_path,
+        f"read:{adapter.metadata.adapter_id}:{options_key}",
+        lambda: adapter.read_dataframe(str(file_path), options),
+    )
@@ -0,0 +1,262 @@
+"""Partitioned Parquet datasets for out-of-core parse output.
+
+Per ADR-0015: Parse output is saved as Parquet.
+Per ADR-0041: Large inputs must not be held in memory as a whole.
+
+The default parse output is one combined Parquet file built from a single
+in-memory frame. In dataset mode, parse instead appends chunks to a
+directory of Parquet part files laid out by partition column values (e.g.
+``lot_id=L1/wafer_id=W01/``), so the combined frame is never built. Rows
+are buffered per partition and written out once a partition reaches the
+target part file size, so small chunks do not become small files; the
+buffers together are capped, so on the adapter path memory stays bounded.
+Profile-driven parse still extracts, validates and transforms whole tables
+in memory; there dataset mode only saves the combined copy.
+
+Partition columns are kept inside each part file as well, so a dataset can
+be read back without hive path parsing; the directory layout lets readers
+prune by lot/wafer and keeps related rows together. Downstream stages read
+either layout lazily through scan_parse_output.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import quote
+
+import polars as pl
+
+__version__ = "1.0.0"
+
+logger = logging.getLogger(__name__)
+
+# Directory name used for rows whose partition value is null
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# Partition columns used when a parse config does not name any
+DEFAULT_PARTITION_COLUMNS = ("lot_id", "wafer_id")
+
+# A partition's buffered rows are written out once either target is reached
+DEFAULT_ROWS_PER_FILE = 1_000_000
+DEFAULT_BYTES_PER_FILE = 128 * 1024 * 1024
+
+# Budget for rows buffered across all partitions; the largest buffer is
+# written out early when it is exceeded
+DEFAULT_MAX_BUFFER_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class DatasetInfo:
+    """Summary of a written Parquet dataset.
+
+    Attributes:
+        path: Dataset root directory.
+        row_count: Total rows written.
+        columns: Union of column names in first-seen order.
+        files: Part files written, in write order.
+    """
+
+    path: Path
+    row_count: int = 0
+    columns: list[str] = field(default_factory=list)
+    files: list[Path] = field(default_factory=list)
+
+
+@dataclass
+class _PartitionBuffer:
+    """Rows of one partition not yet written, and its part file count."""
+
+    chunks: list[pl.DataFrame] = field(default_factory=list)
+    rows: int = 0
+    size_bytes: int = 0
+    files: int = 0
+
+
+class PartitionedParquetWriter:
+    """Append DataFrame chunks to a partitioned Parquet dataset.
+
+    Rows are buffered per partition and written as a new part file whenever
+    a partition reaches ``rows_per_file`` rows or ``bytes_per_file`` bytes,
+    and by close() for the remainder. Part files are numbered per partition
+    directory; reading them back in dataset_files order yields rows grouped
+    by partition, in write order within each partition.
+
+    Example:
+        >>> writer = PartitionedParquetWriter(root, partition_by=["lot_id"])
+        >>> writer.write(chunk)
+        >>> info = writer.close()
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        partition_by: list[str] | tuple[str, ...] = DEFAULT_PARTITION_COLUMNS,
+        rows_per_file: int = DEFAULT_ROWS_PER_FILE,
+        bytes_per_file: int = DEFAULT_BYTES_PER_FILE,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+    ) -> None:
+        """Initialize writer.
+
+        Args:
+            root: Dataset directory (created if missing).
+            partition_by: Columns whose values form the directory layout.
+                Columns absent from a chunk are skipped for that chunk.
+            rows_per_file: Rows per part file (larger buffers are split).
+            bytes_per_file: Estimated in-memory size at which a partition's
+                buffer is written out.
+            max_buffer_bytes: Estimated size of all buffered rows above which
+                the largest buffer is written out early.
+        """
+        self.root = Path(root)
+        self.partition_by = list(partition_by)
+        self.rows_per_file = max(1, rows_per_file)
+        self.bytes_per_file = bytes_per_file
+        self.max_buffer_bytes = max_buffer_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._info = DatasetInfo(path=self.root)
+        self._seen_columns: set[str] = set()
+        self._empty_schema: pl.Schema | None = None
+        self._buffers: dict[Path, _PartitionBuffer] = {}
+        self._buffered_bytes = 0
+
+    @property
+    def row_count(self) -> int:
+        """Rows written so far."""
+        return self._info.row_count
+
+    def write(self, df: pl.DataFrame) -> None:
+        """Write one chunk to the dataset.
+
+        Args:
+            df: Rows to append. Empty chunks only contribute their schema.
+        """
+        for col in df.columns:
+            if col not in self._seen_columns:
+                self._seen_columns.add(col)
+                self._info.columns.append(col)
+
+        if df.is_empty():
+            if self._empty_schema is None and df.width:
+                self._empty_schema = df.schema
+            return
+
+        keys = [col for col in self.partition_by if col in df.columns]
+        if not keys:
+            self._buffer(self.root, df)
+        else:
+            for values, part in df.partition_by(keys, as_dict=True, maintain_order=True).items():
+                self._buffer(self.root.joinpath(*_partition_dirs(keys, values)), part)
+
+        while self._buffered_bytes > self.max_buffer_bytes:
+            directory = max(self._buffers, key=lambda d: self._buffers[d].size_bytes)
+            self._flush(directory)
+
+        self._info.row_count += df.height
+
+    def close(self) -> DatasetInfo:
+        """Finish the dataset.
+
+        A dataset that received no rows gets one empty part file (with the
+        first non-empty schema seen, if any) so it can still be scanned.
+
+        Returns:
+            DatasetInfo for the written dataset
+        """
+        for directory in sorted(self._buffers):
+            self._flush(directory)
+        if not self._info.files:
+            empty = pl.DataFrame(schema=self._empty_schema)
+            self._write_part(self.root / "part-00000.parquet", empty)
+        return self._info
+
+    def abort(self) -> None:
+        """Remove everything written so far (e.g. on cancellation)."""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._info = DatasetInfo(path=self.root)
+        self._buffers.clear()
+        self._buffered_bytes = 0
+
+    def _buffer(self, directory: Path, df: pl.DataFrame) -> None:
+        """Add rows to a partition's buffer, writing it out once it is full."""
+        buffer = self._buffers.setdefault(directory, _PartitionBuffer())
+        size = df.estimated_size()
+        buffer.chunks.append(df)
+        buffer.rows += df.height
+        buffer.size_bytes += size
+        self._buffered_bytes += size
+        if buffer.rows >= self.rows_per_file or buffer.size_bytes >= self.bytes_per_file:
+            self._flush(directory)
+
+    def _flush(self, directory: Path) -> None:
+        """Write a partition's buffered rows as part files of at most rows_per_file rows."""
+        buffer = self._buffers[directory]
+        if not buffer.chunks:
+            return
+        df = (
+            buffer.chunks[0]
+            if len(buffer.chunks) == 1
+            else pl.concat(buffer.chunks, how="diagonal_relaxed")
+        )
+        self._buffered_bytes -= buffer.size_bytes
+        buffer.chunks = []
+        buffer.rows = 0
+        buffer.size_bytes = 0
+        for offset in range(0, df.height, self.rows_per_file):
+            part_path = directory / f"part-{buffer.files:05d}.parquet"
+            self._write_part(part_path, df.slice(offset, self.rows_per_file))
+            buffer.files += 1
+
+    def _write_part(self, part_path: Path, df: pl.DataFrame) -> None:
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        df.write_parquet(part_path)
+        self._info.files.append(part_path)
+
+
+def _partition_dirs(keys: list[str], values: tuple[object, ...]) -> list[str]:
+    """Directory names for one partition, e.g. ["lot_id=L1", "wafer_id=W01"]."""
+    return [
+        f"{key}={NULL_PARTITION if value is None else quote(str(value), safe='')}"
+        for key, value in zip(keys, values, strict=True)
+    ]
+
+
+def dataset_files(root: Path) -> list[Path]:
+    """Part files of a dataset by partition directory, then in write order."""
+    return sorted(Path(root).rglob("part-*.parquet"), key=_part_sort_key)
+
+
+def _part_sort_key(path: Path) -> tuple[tuple[str, ...], int]:
+    """Sort key for a part file: its directory, then its number."""
+    number = path.stem.rpartition("-")[2]
+    return path.parent.parts, int(number) if number.isdigit() else -1
+
+
+def scan_parse_output(path: Path | str) -> pl.LazyFrame:
+    """Lazily read parse output written as a single file or a dataset.
+
+    Part files may have different columns (tables and chunks are not
+    required to share a schema); they are unified the same way the combined
+    output is, with missing columns filled with nulls.
+
+    Args:
+        path: Parquet file or dataset directory.
+
+    Returns:
+        LazyFrame over all rows in write order
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return pl.scan_parquet(path)
+
+    files = dataset_files(path)
+    if not files:
+        return pl.LazyFrame()
+    if len(files) == 1:
+        return pl.scan_parquet(files[0])
+    return pl.concat(
+        [pl.scan_parquet(f) for f in files],
+        how="diagonal_relaxed",
+    )
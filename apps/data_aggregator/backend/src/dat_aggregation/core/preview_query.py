@@ -0,0 +1,174 @@
+"""Paged, lazily evaluated previews of parse output.
+
+Per ADR-0041: Large outputs must not be loaded as a whole.
+
+A preview page is answered with one lazy Polars query over the parse output
+(single Parquet file or partitioned dataset): filters, sort, column
+projection and the offset/limit slice are pushed into the scan, so only the
+row groups and columns needed for the page are decoded. The total row count
+comes from Parquet footers; a filtered count is only computed when filters
+are given.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from .parquet_dataset import dataset_files, scan_parse_output
+
+__version__ = "1.0.0"
+
+# Upper bound on rows returned in one page
+MAX_PREVIEW_PAGE_ROWS = 10_000
+
+# Operators accepted by PreviewFilter; null checks take no value
+FILTER_OPERATORS = ("eq", "ne", "gt", "ge", "lt", "le", "contains", "is_null", "not_null")
+_NULL_OPERATORS = ("is_null", "not_null")
+
+
+@dataclass
+class PreviewFilter:
+    """One column filter of a preview query.
+
+    Attributes:
+        column: Column to filter on.
+        op: One of FILTER_OPERATORS.
+        value: Comparison value as text; cast to the column type. Unused for
+            is_null/not_null.
+    """
+
+    column: str
+    op: str
+    value: str | None = None
+
+    @classmethod
+    def parse(cls, spec: str) -> PreviewFilter:
+        """Parse a ``column:op[:value]`` filter string.
+
+        Raises:
+            ValueError: If the string is malformed or the operator is unknown.
+        """
+        column, sep, rest = spec.partition(":")
+        op, _, value = rest.partition(":")
+        if not column or not sep or op not in FILTER_OPERATORS:
+            raise ValueError(
+                f"Invalid filter '{spec}': expected column:op[:value] with op in "
+                f"{', '.join(FILTER_OPERATORS)}"
+            )
+        if op in _NULL_OPERATORS:
+            return cls(column=column, op=op)
+        return cls(column=column, op=op, value=value)
+
+    def to_expr(self, dtype: pl.DataType) -> pl.Expr:
+        """Build the filter expression for a column of the given type."""
+        col = pl.col(self.column)
+        if self.op == "is_null":
+            return col.is_null()
+        if self.op == "not_null":
+            return col.is_not_null()
+        if self.op == "contains":
+            return col.cast(pl.String).str.contains(self.value or "", literal=True)
+
+        value = pl.lit(self.value, dtype=pl.String)
+        if dtype != pl.String:
+            value = value.cast(dtype)
+        return {
+            "eq": col == value,
+            "ne": col != value,
+            "gt": col > value,
+            "ge": col >= value,
+            "lt": col < value,
+            "le": col <= value,
+        }[self.op]
+
+
+@dataclass
+class PreviewPage:
+    """One page of parse output.
+
+    Attributes:
+        columns: Columns of the returned rows, in output order.
+        rows: Row dicts of the page.
+        offset: Index of the first returned row within the filtered rows.
+        total_rows: Rows in the whole output (from Parquet footers).
+        filtered_rows: Rows matching the filters (total_rows without filters).
+    """
+
+    columns: list[str]
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    offset: int = 0
+    total_rows: int = 0
+    filtered_rows: int = 0
+
+
+def parse_output_row_count(path: Path | str) -> int:
+    """Count rows of a parse output from Parquet footers only."""
+    path = Path(path)
+    files = dataset_files(path) if path.is_dir() else [path]
+    return sum(pq.read_metadata(f).num_rows for f in files)
+
+
+def query_parse_output(
+    path: Path | str,
+    offset: int = 0,
+    limit: int = 100,
+    columns: list[str] | None = None,
+    sort_by: str | None = None,
+    descending: bool = False,
+    filters: list[PreviewFilter] | None = None,
+) -> PreviewPage:
+    """Return one page of a parse output.
+
+    Args:
+        path: Parquet file or dataset directory written by parse.
+        offset: Rows to skip (after filtering and sorting).
+        limit: Rows to return (capped at MAX_PREVIEW_PAGE_ROWS).
+        columns: Columns to return (None = all).
+        sort_by: Column to sort by before paging (None = storage order).
+        descending: Sort descending.
+        filters: Filters applied before sorting; all must match.
+
+    Returns:
+        PreviewPage for the requested window.
+
+    Raises:
+        ValueError: If a column, filter or paging argument is invalid.
+    """
+    if offset < 0 or limit < 0:
+        raise ValueError("offset and limit must be non-negative")
+    limit = min(limit, MAX_PREVIEW_PAGE_ROWS)
+
+    lf = scan_parse_output(path)
+    schema = lf.collect_schema()
+    referenced = list(columns or []) + [f.column for f in filters or []]
+    if sort_by:
+        referenced.append(sort_by)
+    unknown = sorted({col for col in referenced if col not in schema})
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+
+    total_rows = parse_output_row_count(path)
+    filtered_rows = total_rows
+    if filters:
+        lf = lf.filter([f.to_expr(schema[f.column]) for f in filters])
+        filtered_rows = lf.select(pl.len()).collect().item()
+
+    if sort_by:
+        lf = lf.sort(sort_by, descending=descending, nulls_last=True, maintain_order=True)
+    lf = lf.slice(offset, limit)
+    if columns:
+        lf = lf.select(columns)
+
+    page = lf.collect()
+    return PreviewPage(
+        columns=page.columns,
+        rows=page.to_dicts(),
+        offset=offset,
+        total_rows=total_rows,
+        filtered_rows=filtered_rows,
+    )
@@ -0,0 +1,363 @@
+"""Persistent cache of adapter probe results.
+
+Per ADR-0041: Schema probing must stay fast regardless of file size.
+
+Selection, table availability and parse all probe the same source files:
+sheet lists, detected CSV encoding/delimiter and row/column counts. Those
+probes are repeated whenever a run is reopened or a stage is re-locked,
+although the files have usually not changed. The ProbeCache keeps probe
+results on disk in the workspace so that only a ``stat()`` of each file is
+needed to reuse them.
+
+Each entry is one JSON file named after the resolved path, adapter and probe
+kind. The entry records the file's size and modification time and the
+adapter version that produced it; any mismatch on lookup invalidates the
+entry (an edited file or an upgraded adapter is never served stale). The
+number of entries is bounded, evicting the least recently used.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from shared.contracts.dat.adapter import ReadOptions, SchemaProbeResult, TableShape
+
+if TYPE_CHECKING:
+    from shared.contracts.dat.adapter import BaseFileAdapter
+
+__version__ = "1.0.0"
+
+logger = logging.getLogger(__name__)
+
+# Entries kept on disk per workspace; the least recently used are evicted
+DEFAULT_MAX_PROBE_ENTRIES = 10_000
+
+# Cache directory under the DAT workspace (workspace/tools/dat/)
+PROBE_CACHE_DIRNAME = "probe_cache"
+
+
+@dataclass
+class ProbeCacheStats:
+    """Hit/miss counters for a ProbeCache.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups with no usable entry.
+        invalidations: Entries dropped because the file or adapter changed.
+        evictions: Entries dropped to stay within max_entries.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+
+@dataclass(frozen=True)
+class ProbeKey:
+    """Identity of one probe of one file version.
+
+    Attributes:
+        name: Entry name (hash of path, adapter and probe kind).
+        path: Resolved file path.
+        size: File size in bytes.
+        mtime_ns: File modification time.
+        adapter_version: Version of the adapter that probes the file.
+    """
+
+    name: str
+    path: str
+    size: int
+    mtime_ns: int
+    adapter_version: str
+
+
+class ProbeCache:
+    """Disk-backed LRU cache of probe results.
+
+    Values are JSON-serializable dicts. Entries read from disk are also kept
+    in memory so repeated lookups within a process do not re-read them.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = DEFAULT_MAX_PROBE_ENTRIES):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding the entry files (created if missing).
+            max_entries: Upper bound on the number of entries kept.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.stats = ProbeCacheStats()
+        self._lock = threading.Lock()
+        self._loaded: dict[str, dict[str, Any]] = {}
+
+        # Recency order survives restarts through entry file mtimes
+        entries = sorted(self.cache_dir.glob("*.json"), key=_mtime_ns)
+        self._order: OrderedDict[str, None] = OrderedDict((p.stem, None) for p in entries)
+
+    @staticmethod
+    def make_key(
+        file_path: Path | str,
+        adapter: BaseFileAdapter,
+        kind: str,
+    ) -> ProbeKey | None:
+        """Build a key from file identity, or None if the file is missing."""
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        resolved = str(path.resolve())
+        metadata = adapter.metadata
+        digest = hashlib.sha256(
+            f"{resolved}\0{metadata.adapter_id}\0{kind}".encode()
+        ).hexdigest()
+        return ProbeKey(
+            name=digest[:32],
+            path=resolved,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            adapter_version=metadata.version,
+        )
+
+    def get(self, key: ProbeKey) -> dict[str, Any] | None:
+        """Look up a key.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._loaded.get(key.name)
+            if entry is None and key.name in self._order:
+                entry = self._read_entry(key.name)
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            if (
+                entry.get("size") != key.size
+                or entry.get("mtime_ns") != key.mtime_ns
+                or entry.get("adapter_version") != key.adapter_version
+            ):
+                self._remove(key.name)
+                self.stats.invalidations += 1
+                self.stats.misses += 1
+                return None
+
+            self._touch(key.name)
+            self.stats.hits += 1
+            return entry["value"]
+
+    def put(self, key: ProbeKey, value: dict[str, Any]) -> None:
+        """Store a value, evicting least recently used entries over max_entries."""
+        entry = {
+            "path": key.path,
+            "size": key.size,
+            "mtime_ns": key.mtime_ns,
+            "adapter_version": key.adapter_version,
+            "value": value,
+        }
+        with self._lock:
+            entry_path = self._entry_path(key.name)
+            tmp_path = entry_path.with_suffix(".tmp")
+            try:
+                tmp_path.write_text(json.dumps(entry))
+                os.replace(tmp_path, entry_path)
+            except OSError as e:
+                logger.debug(f"Could not persist probe cache entry for {key.path}: {e}")
+                return
+
+            self._loaded[key.name] = entry
+            self._order[key.name] = None
+            self._order.move_to_end(key.name)
+            while len(self._order) > self.max_entries:
+                evicted, _ = self._order.popitem(last=False)
+                self._loaded.pop(evicted, None)
+                self._entry_path(evicted).unlink(missing_ok=True)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries, on disk and in memory."""
+        with self._lock:
+            for name in list(self._order):
+                self._remove(name)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _entry_path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.json"
+
+    def _read_entry(self, name: str) -> dict[str, Any] | None:
+        try:
+            entry = json.loads(self._entry_path(name).read_text())
+        except (OSError, ValueError):
+            self._remove(name)
+            return None
+        self._loaded[name] = entry
+        return entry
+
+    def _touch(self, name: str) -> None:
+        self._order.move_to_end(name)
+        with contextlib.suppress(OSError):
+            os.utime(self._entry_path(name))
+
+    def _remove(self, name: str) -> None:
+        self._order.pop(name, None)
+        self._loaded.pop(name, None)
+        self._entry_path(name).unlink(missing_ok=True)
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+_probe_caches: dict[Path, ProbeCache] = {}
+_probe_caches_lock = threading.Lock()
+
+
+def get_probe_cache(workspace_path: Path) -> ProbeCache:
+    """Get the shared probe cache of a workspace.
+
+    Args:
+        workspace_path: Workspace root (the cache lives under tools/dat/).
+
+    Returns:
+        The workspace's ProbeCache.
+    """
+    cache_dir = (Path(workspace_path) / "tools" / "dat" / PROBE_CACHE_DIRNAME).resolve()
+    with _probe_caches_lock:
+        cache = _probe_caches.get(cache_dir)
+        if cache is None:
+            cache = ProbeCache(cache_dir)
+            _probe_caches[cache_dir] = cache
+        return cache
+
+
+def _options_key(options: ReadOptions | None) -> str:
+    return options.model_dump_json() if options is not None else "{}"
+
+
+async def probe_schema_cached(
+    cache: ProbeCache | None,
+    adapter: BaseFileAdapter,
+    file_path: Path | str,
+    options: ReadOptions | None = None,
+) -> SchemaProbeResult:
+    """Probe a file's schema, reusing the result while the file is unchanged.
+
+    Args:
+        cache: Probe cache, or None to probe directly.
+        adapter: Adapter selected for the file.
+        file_path: Source file.
+        options: Probe options (part of the cache key).
+
+    Returns:
+        SchemaProbeResult as returned by the adapter.
+    """
+    key = None
+    if cache is not None:
+        key = cache.make_key(file_path, adapter, f"schema:{_options_key(options)}")
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return SchemaProbeResult.model_validate(cached)
+
+    result = await adapter.probe_schema(str(file_path), options)
+    if key is not None:
+        cache.put(key, result.model_dump(mode="json"))
+    return result
+
+
+async def probe_shape_cached(
+    cache: ProbeCache | None,
+    adapter: BaseFileAdapter,
+    file_path: Path | str,
+    options: ReadOptions | None = None,
+) -> TableShape:
+    """Get a table's row/column counts, reusing them while the file is unchanged.
+
+    On a miss, a cached schema probe of the file supplies the detected
+    encoding and delimiter so the adapter does not sniff them again.
+
+    Args:
+        cache: Probe cache, or None to probe directly.
+        adapter: Adapter selected for the file.
+        file_path: Source file.
+        options: Table selection options (part of the cache key).
+
+    Returns:
+        TableShape as returned by the adapter.
+    """
+    key = None
+    if cache is not None:
+        key = cache.make_key(file_path, adapter, f"shape:{_options_key(options)}")
+    if key is None:
+        return await adapter.probe_shape(str(file_path), options)
+
+    cached = cache.get(key)
+    if cached is not None:
+        return TableShape.model_validate(cached)
+
+    shape = await adapter.probe_shape(
+        str(file_path), with_detected_format(cache, adapter, file_path, options)
+    )
+    cache.put(key, shape.model_dump(mode="json"))
+    return shape
+
+
+def with_detected_format(
+    cache: ProbeCache | None,
+    adapter: BaseFileAdapter,
+    file_path: Path | str,
+    options: ReadOptions | None = None,
+) -> ReadOptions | None:
+    """Add a cached probe's detected encoding/delimiter to read options.
+
+    Only an existing cache entry is consulted; the file is never probed.
+    Explicit ``extra`` values in ``options`` take precedence.
+
+    Args:
+        cache: Probe cache, or None.
+        adapter: Adapter selected for the file.
+        file_path: Source file.
+        options: Read options to extend.
+
+    Returns:
+        Options with ``extra["encoding"]``/``extra["delimiter"]`` filled in
+        where known, or ``options`` unchanged.
+    """
+    if cache is None:
+        return options
+    key = cache.make_key(file_path, adapter, f"schema:{_options_key(None)}")
+    cached = cache.get(key) if key is not None else None
+    if not cached:
+        return options
+
+    detected = {
+        name: value
+        for name, value in (
+            ("encoding", cached.get("encoding_detected")),
+            ("delimiter", cached.get("delimiter_detected")),
+        )
+        if value
+    }
+    if not detected:
+        return options
+    options = options or ReadOptions()
+    return options.model_copy(update={"extra": {**detected, **options.extra}})
@@ -13,14 +13,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from jsonpath_ng import parse as jsonpath_parse
-
 from shared.contracts.dat.profile import (
     ContentPattern,
     DATProfile,
     RegexPattern,
 )
 
+from .strategies.path_cache import find_values
+
 
 class SkipFileException(Exception):
     """Signal that current file should be skipped due to required pattern failure."""
@@ -203,10 +203,9 @@ class ContextExtractor:
             path = f"$.{path}"
 
         try:
-            expr = jsonpath_parse(path)
-            matches = expr.find(data)
+            matches = find_values(data, path)
             if matches:
-                return matches[0].value
+                return matches[0]
         except Exception:
             pass
 
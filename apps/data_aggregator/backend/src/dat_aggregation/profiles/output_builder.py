@@ -12,6 +12,7 @@ Context Application (DESIGN §4, §9):
 """
 
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -220,9 +221,11 @@ class OutputBuilder:
         # Apply run-level context if user opted in
         if options.include_run_context:
             context_keys = options.run_context_keys or list(run_context.keys())
-            for key in context_keys:
-                if key in run_context and key not in combined.columns:
-                    combined = combined.with_columns(pl.lit(run_context[key]).alias(key))
+            combined = combined.with_columns(
+                pl.lit(run_context[key]).alias(key)
+                for key in dict.fromkeys(context_keys)
+                if key in run_context and key not in combined.columns
+            )
 
         # Apply image-level context if user opted in and table has image_id
         if options.include_image_context and "image_id" in combined.columns:
@@ -233,9 +236,11 @@ class OutputBuilder:
         # Legacy: Also apply context if output config says include_context=True
         # This maintains backward compatibility with existing profiles
         if config.include_context and run_context and not options.include_run_context:
-            for key, value in run_context.items():
-                if key not in combined.columns:
-                    combined = combined.with_columns(pl.lit(value).alias(key))
+            combined = combined.with_columns(
+                pl.lit(value).alias(key)
+                for key, value in run_context.items()
+                if key not in combined.columns
+            )
 
         return combined
 
@@ -397,30 +402,43 @@ class OutputBuilder:
         Returns:
             Combined DataFrame with table_id column
         """
-        if not extracted_tables:
+        dfs = list(self.iter_combined_chunks(extracted_tables, context))
+        if not dfs:
             return pl.DataFrame()
 
-        dfs: list[pl.DataFrame] = []
+        return pl.concat(dfs, how="diagonal")
 
+    def iter_combined_chunks(
+        self,
+        extracted_tables: dict[str, pl.DataFrame],
+        context: dict[str, Any] | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        """Yield each table as it appears in the combined output.
+        
+        Lets callers write the combined output table by table instead of
+        concatenating it in memory.
+        
+        Args:
+            extracted_tables: Dict of table_id to DataFrame
+            context: Optional context to add as columns
+            
+        Yields:
+            Non-empty tables with table_id and context columns added
+        """
         for table_id, df in extracted_tables.items():
             if df.is_empty():
                 continue
 
-            # Add table_id column
-            df = df.with_columns(pl.lit(table_id).alias("__table_id__"))
-
-            # Add context columns if provided
+            # Add table_id column plus any context columns in one projection
+            new_columns = [pl.lit(table_id).alias("__table_id__")]
             if context:
-                for key, value in context.items():
-                    if key not in df.columns:
-                        df = df.with_columns(pl.lit(value).alias(key))
+                new_columns.extend(
+                    pl.lit(value).alias(key)
+                    for key, value in context.items()
+                    if key not in df.columns
+                )
 
-            dfs.append(df)
-
-        if not dfs:
-            return pl.DataFrame()
-
-        return pl.concat(dfs, how="diagonal")
+            yield df.with_columns(new_columns)
 
     def generate_output_filename(
         self,
@@ -12,11 +12,16 @@ Context Separation (DESIGN §4, §9):
 - When enabled, context columns are joined to selected output tables
 """
 
+import asyncio
 import json
 import logging
+import multiprocessing
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import polars as pl
 
@@ -25,10 +30,15 @@ from shared.contracts.dat.profile import (
     TableConfig,
 )
 
+from ..core.file_cache import ParsedFileCache
 from .file_filter import filter_files
-from .strategies import get_strategy
+from .strategies import TabularSource, get_strategy
+from .table_accumulator import TableAccumulator
 from .transform_pipeline import ColumnTransform, TransformPipeline
 
+if TYPE_CHECKING:
+    from ..stages.parse import CancellationToken
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,12 +55,14 @@ class ExtractionResult:
         image_contexts: Dict mapping image_id to image-level context values
         file_contexts: Dict mapping file path to per-file context values
         validation_warnings: List of non-fatal validation warnings
+        cancelled: True if extraction stopped early at a file boundary
     """
     tables: dict[str, pl.DataFrame] = field(default_factory=dict)
     run_context: dict[str, Any] = field(default_factory=dict)
     image_contexts: dict[str, dict[str, Any]] = field(default_factory=dict)
     file_contexts: dict[str, dict[str, Any]] = field(default_factory=dict)
     validation_warnings: list[str] = field(default_factory=list)
+    cancelled: bool = False
 
     def apply_run_context(self, table_ids: list[str] | None = None) -> dict[str, pl.DataFrame]:
         """Apply run-level context to specified tables.
@@ -144,6 +156,50 @@ class ExtractionResult:
         return result
 
 
+@dataclass
+class FileExtraction:
+    """Extraction output for a single source file.
+
+    Produced by ProfileExecutor._extract_file (in-process or in a worker
+    process) and merged into ExtractionResult in file order.
+
+    Attributes:
+        file_context: Context values extracted from the file
+        image_contexts: Image-level context values keyed by image_id
+        tables: Dict mapping table_id to the file's extracted rows
+        warnings: Non-fatal per-table extraction errors
+    """
+    file_context: dict[str, Any] = field(default_factory=dict)
+    image_contexts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    tables: dict[str, pl.DataFrame] = field(default_factory=dict)
+    warnings: list[str] = field(default_factory=list)
+
+
+def _extract_file_in_worker(
+    jsonpath_engine: str,
+    profile: DATProfile,
+    file_path: Path,
+    context: dict[str, Any],
+    selected_tables: list[str] | None,
+    apply_context: bool,
+    context_overrides: dict[str, Any] | None,
+) -> FileExtraction | None:
+    """Load and extract one file inside a worker process.
+
+    Module-level so it can be pickled for the spawn start method (ADR-0013).
+
+    Returns:
+        FileExtraction, or None if the file could not be loaded
+    """
+    executor = ProfileExecutor(jsonpath_engine)
+    data = executor._load_file_sync(file_path, profile)
+    if data is None:
+        return None
+    return executor._extract_file(
+        profile, file_path, data, context, selected_tables, apply_context, context_overrides
+    )
+
+
 class ProfileExecutor:
     """Interprets profiles and executes extraction per ADR-0012.
     
@@ -154,13 +210,27 @@ class ProfileExecutor:
     4. Returns Dict[table_id, DataFrame]
     """
 
-    def __init__(self, jsonpath_engine: str = "jsonpath-ng"):
+    def __init__(
+        self,
+        jsonpath_engine: str = "jsonpath-ng",
+        max_workers: int = 1,
+        memory_budget_mb: float | None = None,
+        file_cache: ParsedFileCache | None = None,
+    ):
         """Initialize ProfileExecutor.
         
         Args:
             jsonpath_engine: JSONPath engine to use ('jsonpath-ng' or 'jmespath')
+            max_workers: Worker processes for multi-file extraction (1 = serial)
+            memory_budget_mb: In-memory budget for accumulated table chunks;
+                              beyond it chunks spill to Parquet (None = no spill)
+            file_cache: Optional run-scoped cache so a file parsed once (e.g. for
+                        context extraction) is not parsed again for tables
         """
         self.jsonpath_engine = jsonpath_engine
+        self.max_workers = max(1, max_workers)
+        self.memory_budget_mb = memory_budget_mb
+        self.file_cache = file_cache
 
     def _check_governance_limits(
         self,
@@ -268,11 +338,16 @@ class ProfileExecutor:
         context: dict[str, Any] | None = None,
         selected_tables: list[str] | None = None,
         apply_context: bool = False,
+        cancel_token: "CancellationToken | None" = None,
+        context_overrides: dict[str, Any] | None = None,
     ) -> ExtractionResult:
         """Execute full profile extraction with separated tables and contexts.
         
         Per DESIGN §4, §9: Returns ExtractionResult with tables and contexts
         stored separately. User can then choose to apply context at output time.
+
+        With ``max_workers > 1`` files are loaded and extracted in a process
+        pool; results are still merged in file order.
         
         Args:
             profile: Loaded DATProfile
@@ -281,6 +356,11 @@ class ProfileExecutor:
             selected_tables: Optional filter for specific tables
             apply_context: If True, applies context to tables (legacy behavior).
                           If False (default), keeps tables and context separate.
+            cancel_token: Optional token checked at file boundaries (ADR-0014).
+                          On cancel, tables from completed files are kept and
+                          ``cancelled`` is set on the result.
+            context_overrides: Optional user context overrides, applied to each
+                          file's context as it is extracted alongside its tables.
             
         Returns:
             ExtractionResult with separate tables and contexts
@@ -320,63 +400,58 @@ class ProfileExecutor:
                 f"File filter applied: {len(files)} -> {len(filtered_files)} files"
             )
 
-        for file_path in filtered_files:
-            # Load file content
-            data = await self._load_file(file_path, profile)
-            if data is None:
-                logger.warning(f"Could not load file: {file_path}")
-                continue
-
-            # Extract file-level context and store separately
-            file_context = self._extract_file_context(profile, file_path, data)
-            result.file_contexts[str(file_path)] = file_context
-            result.run_context.update(file_context)  # Merge into run context
+        if self.max_workers > 1 and len(filtered_files) > 1:
+            file_results = self._iter_file_extractions_parallel(
+                profile,
+                filtered_files,
+                context,
+                selected_tables,
+                apply_context,
+                context_overrides,
+                cancel_token,
+            )
+        else:
+            file_results = self._iter_file_extractions_serial(
+                profile,
+                filtered_files,
+                result,
+                selected_tables,
+                apply_context,
+                context_overrides,
+                cancel_token,
+            )
 
-            # Extract image-level contexts if this is image-level data
-            image_contexts = self._extract_image_contexts(profile, data)
-            result.image_contexts.update(image_contexts)
+        # Collect per-file chunks and concatenate once per table at the end,
+        # so merging stays linear in the number of files
+        budget_bytes = (
+            int(self.memory_budget_mb * 1024 * 1024)
+            if self.memory_budget_mb is not None
+            else None
+        )
+        accumulator = TableAccumulator(memory_budget_bytes=budget_bytes)
 
-            # Extract each table
-            for level_name, table_config in profile.get_all_tables():
-                if selected_tables and table_config.id not in selected_tables:
+        # Merge in file order; cancellation is honoured at file boundaries
+        try:
+            async for file_path, extraction in file_results:
+                if extraction is None:
+                    logger.warning(f"Could not load file: {file_path}")
                     continue
 
-                try:
-                    df = self.extract_table(table_config, data, result.run_context)
-
-                    if df.is_empty():
-                        continue
-
-                    # Per DESIGN §6: Apply table-level column_transforms if defined
-                    if table_config.column_transforms:
-                        pipeline = TransformPipeline()
-                        transforms = [
-                            ColumnTransform(
-                                source=t.get("source", ""),
-                                target=t.get("target", t.get("source", "")),
-                                transform=t.get("transform", ""),
-                                args=t.get("args"),
-                            )
-                            for t in table_config.column_transforms
-                        ]
-                        df = pipeline.apply_column_transforms(df, transforms)
-
-                    # Only apply context if legacy mode requested
-                    if apply_context:
-                        df = self._apply_context(df, result.run_context, level_name, profile)
-
-                    # Accumulate results
-                    if table_config.id in result.tables:
-                        result.tables[table_config.id] = pl.concat([
-                            result.tables[table_config.id], df
-                        ], how="diagonal")
-                    else:
-                        result.tables[table_config.id] = df
-
-                except Exception as e:
-                    logger.error(f"Error extracting table {table_config.id}: {e}")
-                    result.validation_warnings.append(f"Table {table_config.id}: {e}")
-                    continue
+                result.file_contexts[str(file_path)] = extraction.file_context
+                result.run_context.update(extraction.file_context)  # Merge into run context
+                result.image_contexts.update(extraction.image_contexts)
+                result.validation_warnings.extend(extraction.warnings)
+
+                for table_id, df in extraction.tables.items():
+                    accumulator.add(table_id, df)
+
+            result.tables = accumulator.finish()
+        finally:
+            accumulator.cleanup()
+
+        if cancel_token and cancel_token.is_cancelled:
+            result.cancelled = True
+            logger.info("Profile extraction cancelled at a file boundary")
 
         # Per DESIGN §10: Audit logging for extraction completion
         if profile.governance and profile.governance.audit:
@@ -390,11 +465,172 @@ class ProfileExecutor:
 
         return result
 
+    async def _iter_file_extractions_serial(
+        self,
+        profile: DATProfile,
+        files: list[Path],
+        result: ExtractionResult,
+        selected_tables: list[str] | None,
+        apply_context: bool,
+        context_overrides: dict[str, Any] | None,
+        cancel_token: "CancellationToken | None",
+    ) -> AsyncIterator[tuple[Path, FileExtraction | None]]:
+        """Extract files one at a time in the current process.
+
+        Each file sees the run context accumulated from the files before it.
+        """
+        for file_path in files:
+            if cancel_token and cancel_token.is_cancelled:
+                return
+            data = await self._load_file(file_path, profile)
+            if data is None:
+                yield file_path, None
+                continue
+            yield file_path, self._extract_file(
+                profile,
+                file_path,
+                data,
+                result.run_context,
+                selected_tables,
+                apply_context,
+                context_overrides,
+            )
+
+    async def _iter_file_extractions_parallel(
+        self,
+        profile: DATProfile,
+        files: list[Path],
+        context: dict[str, Any],
+        selected_tables: list[str] | None,
+        apply_context: bool,
+        context_overrides: dict[str, Any] | None,
+        cancel_token: "CancellationToken | None",
+    ) -> AsyncIterator[tuple[Path, FileExtraction | None]]:
+        """Extract files in a spawn process pool, yielding results in file order.
+
+        Per ADR-0013: Tier 3 ProcessPoolExecutor with the spawn start method.
+        At most ``2 * max_workers`` files are in flight so memory stays bounded
+        and cancellation takes effect within a window. Each file sees the base
+        context plus its own file context.
+        """
+        loop = asyncio.get_running_loop()
+        pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        pending: deque[tuple[Path, asyncio.Future[FileExtraction | None]]] = deque()
+        remaining = iter(files)
+
+        def _submit_next() -> None:
+            file_path = next(remaining, None)
+            if file_path is not None:
+                future = loop.run_in_executor(
+                    pool,
+                    _extract_file_in_worker,
+                    self.jsonpath_engine,
+                    profile,
+                    file_path,
+                    context,
+                    selected_tables,
+                    apply_context,
+                    context_overrides,
+                )
+                pending.append((file_path, future))
+
+        try:
+            for _ in range(self.max_workers * 2):
+                _submit_next()
+            while pending:
+                if cancel_token and cancel_token.is_cancelled:
+                    return
+                file_path, future = pending.popleft()
+                extraction = await future
+                _submit_next()
+                yield file_path, extraction
+        finally:
+            for _, future in pending:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _extract_file(
+        self,
+        profile: DATProfile,
+        file_path: Path,
+        data: Any,
+        run_context: dict[str, Any],
+        selected_tables: list[str] | None,
+        apply_context: bool,
+        context_overrides: dict[str, Any] | None = None,
+    ) -> FileExtraction:
+        """Extract contexts and all selected tables from one loaded file.
+
+        Args:
+            profile: DATProfile with table and context configuration
+            file_path: Path to file
+            data: Parsed file content
+            run_context: Run context accumulated before this file
+            selected_tables: Optional table filter
+            apply_context: Whether to apply context to tables (legacy behavior)
+            context_overrides: Optional user context overrides
+
+        Returns:
+            FileExtraction with contexts, tables and warnings for the file
+        """
+        extraction = FileExtraction()
+
+        # Extract file-level context and store separately
+        extraction.file_context = self._extract_file_context(
+            profile, file_path, data, context_overrides
+        )
+        file_run_context = {**run_context, **extraction.file_context}
+
+        # Extract image-level contexts if this is image-level data
+        extraction.image_contexts = self._extract_image_contexts(profile, data)
+
+        # Extract each table
+        for level_name, table_config in profile.get_all_tables():
+            if selected_tables and table_config.id not in selected_tables:
+                continue
+
+            try:
+                df = self.extract_table(table_config, data, file_run_context)
+
+                if df.is_empty():
+                    continue
+
+                # Per DESIGN §6: Apply table-level column_transforms if defined
+                if table_config.column_transforms:
+                    pipeline = TransformPipeline()
+                    transforms = [
+                        ColumnTransform(
+                            source=t.get("source", ""),
+                            target=t.get("target", t.get("source", "")),
+                            transform=t.get("transform", ""),
+                            args=t.get("args"),
+                        )
+                        for t in table_config.column_transforms
+                    ]
+                    df = pipeline.apply_column_transforms(df, transforms)
+
+                # Only apply context if legacy mode requested
+                if apply_context:
+                    df = self._apply_context(df, file_run_context, level_name, profile)
+
+                extraction.tables[table_config.id] = df
+
+            except Exception as e:
+                logger.error(f"Error extracting table {table_config.id}: {e}")
+                extraction.warnings.append(f"Table {table_config.id}: {e}")
+                continue
+
+        return extraction
+
     def _extract_file_context(
         self,
         profile: DATProfile,
         file_path: Path,
         data: Any,
+        context_overrides: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Extract context values from a single file.
         
@@ -402,6 +638,7 @@ class ProfileExecutor:
             profile: DATProfile with context configuration
             file_path: Path to file
             data: Parsed file content
+            context_overrides: Optional user context overrides
             
         Returns:
             Dict of context key-value pairs
@@ -413,6 +650,7 @@ class ProfileExecutor:
             profile=profile,
             file_path=file_path,
             file_content=data if isinstance(data, dict) else None,
+            user_overrides=context_overrides,
         )
 
     def _extract_image_contexts(
@@ -578,6 +816,22 @@ class ProfileExecutor:
         Returns:
             Parsed file content (dict for JSON, DataFrame for tabular)
         """
+        if self.file_cache is None:
+            return self._load_file_sync(file_path, profile)
+
+        options_key = json.dumps(profile.datasource_options, sort_keys=True, default=str)
+        return self.file_cache.get_or_load(
+            file_path,
+            f"profile:{profile.datasource_format}:{options_key}",
+            lambda: self._load_file_sync(file_path, profile),
+        )
+
+    def _load_file_sync(
+        self,
+        file_path: Path,
+        profile: DATProfile,
+    ) -> Any:
+        """Synchronous body of _load_file, usable from worker processes."""
         fmt = profile.datasource_format.lower()
 
         if fmt == "json":
@@ -614,10 +868,11 @@ class ProfileExecutor:
 
     def _load_csv(
         self, file_path: Path, options: dict[str, Any]
-    ) -> dict[str, Any] | None:
-        """Load CSV file as dict with 'data' key containing records.
+    ) -> TabularSource | None:
+        """Load CSV file as a columnar TabularSource.
         
-        Per DESIGN §2: Supports CSV format options.
+        Per DESIGN §2: Supports CSV format options. Records under 'data' are
+        only materialized if a JSONPath strategy reads them.
         """
         try:
             csv_opts = options.get("csv", {})
@@ -631,16 +886,15 @@ class ProfileExecutor:
                 encoding=encoding,
                 skip_rows=skip_rows,
             )
-            # Return as dict with records for strategy compatibility
-            return {"data": df.to_dicts(), "_dataframe": df}
+            return TabularSource(df)
         except Exception as e:
             logger.error(f"Error loading CSV {file_path}: {e}")
             return None
 
     def _load_excel(
         self, file_path: Path, options: dict[str, Any]
-    ) -> dict[str, Any] | None:
-        """Load Excel file as dict with sheet data.
+    ) -> TabularSource | None:
+        """Load Excel file as a columnar TabularSource.
         
         Per DESIGN §2: Supports Excel format options.
         """
@@ -650,24 +904,24 @@ class ProfileExecutor:
 
             if sheet_selection == "all":
                 # Load all sheets
-                sheets_data = {}
-                df_dict = pl.read_excel(file_path, sheet_id=0)
+                # sheet_id=0 returns {sheet_name: DataFrame}
+                sheets = pl.read_excel(file_path, sheet_id=0)
                 # For now, load first sheet - full multi-sheet support later
-                sheets_data["Sheet1"] = df_dict.to_dicts()
-                return {"sheets": sheets_data, "_dataframe": df_dict}
+                first_sheet = next(iter(sheets.values()), pl.DataFrame())
+                return TabularSource(first_sheet, sheet_name="Sheet1")
             else:
                 # Load first or specific sheet
                 df = pl.read_excel(file_path)
-                return {"data": df.to_dicts(), "_dataframe": df}
+                return TabularSource(df)
         except Exception as e:
             logger.error(f"Error loading Excel {file_path}: {e}")
             return None
 
-    def _load_parquet(self, file_path: Path) -> dict[str, Any] | None:
-        """Load Parquet file as dict with records."""
+    def _load_parquet(self, file_path: Path) -> TabularSource | None:
+        """Load Parquet file as a columnar TabularSource."""
         try:
             df = pl.read_parquet(file_path)
-            return {"data": df.to_dicts(), "_dataframe": df}
+            return TabularSource(df)
         except Exception as e:
             logger.error(f"Error loading Parquet {file_path}: {e}")
             return None
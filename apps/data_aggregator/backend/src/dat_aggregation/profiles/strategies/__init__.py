@@ -5,7 +5,7 @@ Each strategy transforms nested JSON/data structures into flat DataFrames.
 """
 
 from .array_of_objects import ArrayOfObjectsStrategy
-from .base import ExtractionStrategy, SelectConfig
+from .base import ExtractionStrategy, SelectConfig, TabularSource, tabular_frame, tabular_row
 from .flat_object import FlatObjectStrategy
 from .headers_data import HeadersDataStrategy
 from .join import JoinStrategy
@@ -15,6 +15,9 @@ from .unpivot import UnpivotStrategy
 __all__ = [
     "ExtractionStrategy",
     "SelectConfig",
+    "TabularSource",
+    "tabular_frame",
+    "tabular_row",
     "FlatObjectStrategy",
     "HeadersDataStrategy",
     "ArrayOfObjectsStrategy",
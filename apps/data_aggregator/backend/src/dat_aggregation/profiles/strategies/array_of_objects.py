@@ -8,9 +8,9 @@ import logging
 from typing import Any
 
 import polars as pl
-from jsonpath_ng import parse as jsonpath_parse
 
-from .base import ExtractionStrategy, SelectConfig
+from .base import ExtractionStrategy, SelectConfig, tabular_frame
+from .path_cache import find_values
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,15 @@ class ArrayOfObjectsStrategy(ExtractionStrategy):
         Returns:
             Multi-row DataFrame with union of all object keys as columns
         """
+        # Columnar fast path: rows of a tabular source are already a DataFrame
+        frame = tabular_frame(data, config.path)
+        if frame is not None:
+            if frame.is_empty():
+                return pl.DataFrame()
+            if config.fields:
+                return frame.select([c for c in frame.columns if c in config.fields])
+            return frame
+
         # Navigate to path - handle [*] suffix
         path = config.path.rstrip("[*]") if config.path.endswith("[*]") else config.path
         arr = self._get_at_path(data, path)
@@ -82,13 +91,12 @@ class ArrayOfObjectsStrategy(ExtractionStrategy):
             return data
 
         try:
-            expr = jsonpath_parse(path)
-            matches = expr.find(data)
+            matches = find_values(data, path)
             if matches:
                 # If multiple matches, return all as list
                 if len(matches) > 1:
-                    return [m.value for m in matches]
-                return matches[0].value
+                    return matches
+                return matches[0]
             return None
         except Exception as e:
             logger.error(f"JSONPath error for '{path}': {e}")
@@ -6,13 +6,120 @@ strategies must implement.
 All contract types imported from Tier-0 shared.contracts.dat.profile.
 """
 
+import re
+from collections.abc import Callable, KeysView
 from typing import Any, Protocol
 
 import polars as pl
 
 from shared.contracts.dat.profile import SelectConfig
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
+
+# JSONPaths that address every row of a TabularSource ("$.data", "$.data[*]")
+_ALL_ROWS_PATH = re.compile(r"^\$\.data(\[\*\])?$")
+
+# JSONPath that addresses a single row of a TabularSource ("$.data[3]")
+_ROW_PATH = re.compile(r"^\$\.data\[(\d+)\]$")
+
+# Materialized record dicts take several times the columnar size
+_RECORDS_SIZE_FACTOR = 4
+
+
+class TabularSource(dict[str, Any]):
+    """Parsed tabular file (CSV, Excel, Parquet) in columnar form.
+
+    Behaves like the JSON-shaped ``{"data": [records...], "_dataframe": df}``
+    dict that JSONPath strategies expect, but the record list is only built
+    (and then kept) the first time something actually reads ``data`` (or
+    ``sheets`` for multi-sheet sources). Strategies with a columnar fast path
+    use ``tabular_frame`` / ``tabular_row`` and never trigger it.
+    """
+
+    def __init__(self, dataframe: pl.DataFrame, sheet_name: str | None = None):
+        """Wrap a DataFrame.
+
+        Args:
+            dataframe: Parsed table.
+            sheet_name: If set, records are exposed as ``sheets[sheet_name]``
+                        instead of ``data``.
+        """
+        super().__init__(_dataframe=dataframe)
+        self.dataframe = dataframe
+        self._lazy_key = "sheets" if sheet_name is not None else "data"
+        self._sheet_name = sheet_name
+        # Set by ParsedFileCache so materialized records count toward its budget
+        self.on_resize: Callable[[], None] | None = None
+
+    def estimated_size(self) -> int:
+        """Estimate the in-memory size, including records once built."""
+        size = self.dataframe.estimated_size()
+        if super().__contains__(self._lazy_key):
+            size += size * _RECORDS_SIZE_FACTOR
+        return size
+
+    def _materialize(self) -> None:
+        records = self.dataframe.to_dicts()
+        if self._sheet_name is not None:
+            self[self._lazy_key] = {self._sheet_name: records}
+        else:
+            self[self._lazy_key] = records
+        if self.on_resize is not None:
+            self.on_resize()
+
+    def __missing__(self, key: str) -> Any:
+        if key != self._lazy_key:
+            raise KeyError(key)
+        self._materialize()
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key == self._lazy_key or super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def keys(self) -> KeysView[str]:
+        if not super().__contains__(self._lazy_key):
+            self._materialize()
+        return super().keys()
+
+
+def tabular_frame(data: Any, path: str) -> pl.DataFrame | None:
+    """Return the source DataFrame when ``path`` selects all its rows.
+
+    Args:
+        data: Source data passed to a strategy.
+        path: Strategy JSONPath.
+
+    Returns:
+        DataFrame for a TabularSource addressed as ``$.data`` or ``$.data[*]``,
+        otherwise None (caller falls back to the JSON path).
+    """
+    if (
+        isinstance(data, TabularSource)
+        and data._sheet_name is None
+        and _ALL_ROWS_PATH.match(path)
+    ):
+        return data.dataframe
+    return None
+
+
+def tabular_row(data: Any, path: str) -> pl.DataFrame | None:
+    """Return one row of the source DataFrame for paths like ``$.data[3]``.
+
+    Returns:
+        Single-row (or empty, if out of range) DataFrame, or None when the
+        fast path does not apply.
+    """
+    if not isinstance(data, TabularSource) or data._sheet_name is not None:
+        return None
+    match = _ROW_PATH.match(path)
+    if match is None:
+        return None
+    return data.dataframe.slice(int(match.group(1)), 1)
 
 
 class ExtractionStrategy(Protocol):
@@ -8,9 +8,9 @@ import logging
 from typing import Any
 
 import polars as pl
-from jsonpath_ng import parse as jsonpath_parse
 
-from .base import ExtractionStrategy, SelectConfig
+from .base import ExtractionStrategy, SelectConfig, tabular_row
+from .path_cache import find_values
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +42,14 @@ class FlatObjectStrategy(ExtractionStrategy):
         Returns:
             Single-row DataFrame with object keys as columns
         """
+        # Columnar fast path: a single row of a tabular source
+        row = tabular_row(data, config.path)
+        if row is not None:
+            if row.is_empty():
+                logger.warning(f"No data found at path: {config.path}")
+                return pl.DataFrame()
+            return row
+
         # Navigate to path using JSONPath
         obj = self._get_at_path(data, config.path)
 
@@ -76,10 +84,9 @@ class FlatObjectStrategy(ExtractionStrategy):
             return data
 
         try:
-            expr = jsonpath_parse(path)
-            matches = expr.find(data)
+            matches = find_values(data, path)
             if matches:
-                return matches[0].value
+                return matches[0]
             return None
         except Exception as e:
             logger.error(f"JSONPath error for '{path}': {e}")
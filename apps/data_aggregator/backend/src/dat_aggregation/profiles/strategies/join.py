@@ -8,9 +8,9 @@ import logging
 from typing import Any
 
 import polars as pl
-from jsonpath_ng import parse as jsonpath_parse
 
 from .base import ExtractionStrategy, SelectConfig
+from .path_cache import find_values
 
 logger = logging.getLogger(__name__)
 
@@ -121,12 +121,11 @@ class JoinStrategy(ExtractionStrategy):
             return data
 
         try:
-            expr = jsonpath_parse(path)
-            matches = expr.find(data)
+            matches = find_values(data, path)
             if matches:
                 if len(matches) > 1:
-                    return [m.value for m in matches]
-                return matches[0].value
+                    return matches
+                return matches[0]
             return None
         except Exception as e:
             logger.error(f"JSONPath error for '{path}': {e}")
@@ -0,0 +1,96 @@
+"""Compiled JSONPath cache shared by extraction strategies.
+
+Per SPEC-0009: Strategies and context extraction address data with JSONPath.
+Parsing a path with jsonpath-ng is far more expensive than evaluating it, and
+the same handful of paths (or per-element variants from repeat_over) are
+resolved for every file. This module keeps a process-wide LRU of compiled
+expressions and resolves simple dotted/indexed paths (``$.a.b[0].c``) by
+direct dict/list traversal without jsonpath-ng at all.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any
+
+from jsonpath_ng import JSONPath
+from jsonpath_ng import parse as jsonpath_parse
+
+__version__ = "1.0.0"
+
+# Distinct compiled expressions kept per process
+JSONPATH_CACHE_SIZE = 1024
+
+# Distinct simple paths whose traversal steps are kept per process
+SIMPLE_PATH_CACHE_SIZE = 8192
+
+# "$", "$.a", "$.a.b[0]", "$[2].c" - plain field names and non-negative indices
+_SIMPLE_PATH = re.compile(r"^\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])*$")
+_STEP = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]")
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=JSONPATH_CACHE_SIZE)
+def compile_path(path: str) -> JSONPath:
+    """Parse a JSONPath expression once per process.
+
+    Raises:
+        Exception: Whatever jsonpath-ng raises for an invalid expression.
+    """
+    return jsonpath_parse(path)
+
+
+@lru_cache(maxsize=SIMPLE_PATH_CACHE_SIZE)
+def _simple_steps(path: str) -> tuple[str | int, ...] | None:
+    """Split a simple path into field/index steps, or None if not simple."""
+    if not _SIMPLE_PATH.match(path):
+        return None
+    return tuple(
+        field if field else int(index)
+        for field, index in _STEP.findall(path)
+    )
+
+
+def find_values(data: Any, path: str) -> list[Any]:
+    """Return all values matched by ``path`` in ``data``.
+
+    Simple paths are resolved by direct traversal (at most one match), all
+    others by a cached compiled jsonpath-ng expression.
+
+    Args:
+        data: Parsed JSON-like data.
+        path: JSONPath expression.
+
+    Returns:
+        Matched values in document order (empty if nothing matches).
+
+    Raises:
+        Exception: Whatever jsonpath-ng raises for an invalid expression.
+    """
+    steps = _simple_steps(path)
+    if steps is None:
+        return [match.value for match in compile_path(path).find(data)]
+
+    current = data
+    for step in steps:
+        if isinstance(step, int):
+            if not isinstance(current, (list, str)) or step >= len(current):
+                return []
+            current = current[step]
+        else:
+            if not isinstance(current, dict):
+                return []
+            current = current.get(step, _MISSING)
+            if current is _MISSING:
+                return []
+    return [current]
+
+
+def find_first(data: Any, path: str) -> Any:
+    """Return the first value matched by ``path``, or None.
+
+    Raises:
+        Exception: Whatever jsonpath-ng raises for an invalid expression.
+    """
+    values = find_values(data, path)
+    return values[0] if values else None
@@ -5,13 +5,12 @@ Wraps a base strategy and applies it at each iteration.
 """
 
 import logging
-import re
 from typing import Any
 
 import polars as pl
-from jsonpath_ng import parse as jsonpath_parse
 
 from .base import ExtractionStrategy, SelectConfig
+from .path_cache import find_values
 
 logger = logging.getLogger(__name__)
 
@@ -74,9 +73,13 @@ class RepeatOverStrategy(ExtractionStrategy):
         all_dfs: list[pl.DataFrame] = []
         index_var = config.repeat_over.as_var
 
+        # Split the path around the index placeholder once; each element's
+        # path is then a plain join instead of a regex substitution
+        path_parts = self._split_on_index(config.path, index_var)
+
         for i, element in enumerate(arr):
             # Substitute index in path
-            element_path = self._substitute_index(config.path, index_var, i)
+            element_path = str(i).join(path_parts)
 
             # Create modified config for this iteration
             element_config = SelectConfig(
@@ -97,17 +100,18 @@ class RepeatOverStrategy(ExtractionStrategy):
 
             # Inject fields from parent element
             if config.repeat_over.inject_fields and isinstance(element, dict):
-                for target_col, source_path in config.repeat_over.inject_fields.items():
-                    value = self._get_nested_value(element, source_path)
-                    df = df.with_columns(pl.lit(value).alias(target_col))
+                df = df.with_columns(
+                    pl.lit(self._get_nested_value(element, source_path)).alias(target_col)
+                    for target_col, source_path in config.repeat_over.inject_fields.items()
+                )
 
             all_dfs.append(df)
 
-        # Concatenate all DataFrames
+        # Concatenate all DataFrames once, unifying schemas across elements
         if not all_dfs:
             return pl.DataFrame()
 
-        return pl.concat(all_dfs, how="diagonal")
+        return pl.concat(all_dfs, how="diagonal_relaxed")
 
     def validate_config(self, config: SelectConfig) -> list[str]:
         """Validate repeat_over configuration."""
@@ -150,22 +154,20 @@ class RepeatOverStrategy(ExtractionStrategy):
             return data
 
         try:
-            expr = jsonpath_parse(path)
-            matches = expr.find(data)
+            matches = find_values(data, path)
             if matches:
-                return matches[0].value
+                return matches[0]
             return None
         except Exception as e:
             logger.error(f"JSONPath error for '{path}': {e}")
             return None
 
-    def _substitute_index(self, path: str, var_name: str, index: int) -> str:
-        """Substitute index variable in path.
-        
-        Example: $.sites[{site_index}].data -> $.sites[0].data
+    def _split_on_index(self, path: str, var_name: str) -> list[str]:
+        """Split path around every {var_name} placeholder.
+
+        Example: $.sites[{site_index}].data -> ["$.sites[", "].data"]
         """
-        pattern = r"\{" + re.escape(var_name) + r"\}"
-        return re.sub(pattern, str(index), path)
+        return path.split("{" + var_name + "}")
 
     def _get_nested_value(self, obj: dict, path: str) -> Any:
         """Get nested value from dict using simple path (e.g., $.field or field)."""
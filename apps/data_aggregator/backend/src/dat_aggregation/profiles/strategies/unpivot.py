@@ -8,9 +8,9 @@ import logging
 from typing import Any
 
 import polars as pl
-from jsonpath_ng import parse as jsonpath_parse
 
-from .base import ExtractionStrategy, SelectConfig
+from .base import ExtractionStrategy, SelectConfig, tabular_frame
+from .path_cache import find_values
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +43,18 @@ class UnpivotStrategy(ExtractionStrategy):
         Returns:
             Long-format DataFrame with parameter/value columns
         """
-        # First get the data as a DataFrame
-        arr = self._get_at_path(data, config.path)
+        # First get the data as a DataFrame (columnar sources already are one)
+        frame = tabular_frame(data, config.path)
+        arr = self._get_at_path(data, config.path) if frame is None else None
 
-        if arr is None:
+        if frame is None and arr is None:
             logger.warning(f"No data found at path: {config.path}")
             return pl.DataFrame()
 
         # Convert to DataFrame
-        if isinstance(arr, list):
+        if frame is not None:
+            df = frame
+        elif isinstance(arr, list):
             df = pl.DataFrame(arr)
         elif isinstance(arr, dict):
             df = pl.DataFrame([arr])
@@ -97,10 +100,9 @@ class UnpivotStrategy(ExtractionStrategy):
             return data
 
         try:
-            expr = jsonpath_parse(path)
-            matches = expr.find(data)
+            matches = find_values(data, path)
             if matches:
-                return matches[0].value
+                return matches[0]
             return None
         except Exception as e:
             logger.error(f"JSONPath error for '{path}': {e}")
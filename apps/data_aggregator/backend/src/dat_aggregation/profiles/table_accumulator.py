@@ -0,0 +1,146 @@
+"""Per-table chunk accumulator for multi-file extraction.
+
+Per ADR-0012: ProfileExecutor merges per-file tables into one DataFrame per
+table_id. Concatenating the growing table with every new file re-copies it
+each time (quadratic in file count). TableAccumulator instead collects the
+per-file frames and concatenates once per table when extraction finishes,
+unifying schemas in that single pass.
+
+An optional memory budget bounds the frames held in memory: when exceeded,
+the pending frames of the largest table are compacted into a Parquet part
+file in a scratch directory and read back at finish time.
+"""
+
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+
+class TableAccumulator:
+    """Collect DataFrame chunks per table_id and concatenate once.
+
+    Chunks keep their insertion order, so the finished table has the same
+    rows in the same order as repeated diagonal concatenation would give.
+
+    Example:
+        >>> acc = TableAccumulator()
+        >>> acc.add("t", pl.DataFrame({"a": [1]}))
+        >>> acc.add("t", pl.DataFrame({"b": ["x"]}))
+        >>> acc.finish()["t"].columns
+        ['a', 'b']
+    """
+
+    def __init__(self, memory_budget_bytes: int | None = None):
+        """Initialize accumulator.
+
+        Args:
+            memory_budget_bytes: Spill pending chunks to Parquet once their
+                estimated in-memory size exceeds this. None disables spilling.
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self._chunks: dict[str, list[pl.DataFrame]] = {}
+        self._chunk_bytes: dict[str, int] = {}
+        self._spilled: dict[str, list[Path]] = {}
+        self._in_memory_bytes = 0
+        self._spill_dir: Path | None = None
+
+    def __contains__(self, table_id: str) -> bool:
+        return table_id in self._chunks
+
+    @property
+    def table_ids(self) -> list[str]:
+        """Table IDs in first-seen order."""
+        return list(self._chunks)
+
+    @property
+    def spilled_parts(self) -> int:
+        """Number of Parquet part files written so far."""
+        return sum(len(parts) for parts in self._spilled.values())
+
+    def add(self, table_id: str, df: pl.DataFrame) -> None:
+        """Append a chunk for a table.
+
+        Args:
+            table_id: Table the chunk belongs to
+            df: Extracted rows (may be empty; an empty table is still recorded)
+        """
+        self._chunks.setdefault(table_id, [])
+        self._chunk_bytes.setdefault(table_id, 0)
+        if df.width == 0 and self._chunks[table_id]:
+            return
+
+        size = df.estimated_size()
+        self._chunks[table_id].append(df)
+        self._chunk_bytes[table_id] += size
+        self._in_memory_bytes += size
+
+        if self.memory_budget_bytes is not None:
+            while self._in_memory_bytes > self.memory_budget_bytes:
+                if not self._spill_largest():
+                    break
+
+    def finish(self) -> dict[str, pl.DataFrame]:
+        """Concatenate each table's chunks in a single pass.
+
+        Schemas are unified once with ``diagonal_relaxed`` (union of columns,
+        common supertype for conflicting dtypes). Scratch files are removed.
+
+        Returns:
+            Dict mapping table_id to its combined DataFrame
+        """
+        try:
+            tables: dict[str, pl.DataFrame] = {}
+            for table_id, chunks in self._chunks.items():
+                parts = self._spilled.get(table_id, [])
+                if parts:
+                    frames = [pl.scan_parquet(p) for p in parts]
+                    frames.extend(df.lazy() for df in chunks)
+                    tables[table_id] = pl.concat(frames, how="diagonal_relaxed").collect()
+                elif len(chunks) == 1:
+                    tables[table_id] = chunks[0]
+                else:
+                    tables[table_id] = pl.concat(chunks, how="diagonal_relaxed")
+            return tables
+        finally:
+            self.cleanup()
+
+    def cleanup(self) -> None:
+        """Drop held chunks and remove any spilled part files."""
+        self._chunks.clear()
+        self._chunk_bytes.clear()
+        self._spilled.clear()
+        self._in_memory_bytes = 0
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def _spill_largest(self) -> bool:
+        """Write the largest table's pending chunks to one Parquet part.
+
+        Returns:
+            True if anything was spilled
+        """
+        table_id = max(self._chunk_bytes, key=self._chunk_bytes.__getitem__, default=None)
+        if table_id is None or not self._chunks[table_id]:
+            return False
+
+        chunks = self._chunks[table_id]
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="dat_accumulator_"))
+
+        part_path = self._spill_dir / f"part-{self.spilled_parts:05d}.parquet"
+        pl.concat(chunks, how="diagonal_relaxed").write_parquet(part_path)
+        self._spilled.setdefault(table_id, []).append(part_path)
+        logger.debug(
+            f"Spilled {len(chunks)} chunks of table {table_id} to {part_path.name}"
+        )
+
+        self._in_memory_bytes -= self._chunk_bytes[table_id]
+        self._chunk_bytes[table_id] = 0
+        self._chunks[table_id] = []
+        return True
@@ -2,6 +2,10 @@
 
 Per ADR-0012: Profiles define normalization rules and transforms.
 Applies NaN handling, type coercion, renames, and calculated columns.
+
+The full profile chain can also be compiled into a single Polars LazyFrame
+plan (``compile_profile_plan``) so that every step is fused into one
+optimized pass with a single ``collect()``.
 """
 
 import logging
@@ -91,6 +95,146 @@ class TransformPipeline:
 
         return df
 
+    def apply_profile_transforms(
+        self,
+        df: pl.DataFrame,
+        profile: DATProfile,
+        lazy: bool = True,
+    ) -> pl.DataFrame:
+        """Apply the full profile transform chain per DESIGN §6.
+
+        Order: normalization (NaN replacement, numeric coercion, row filters,
+        units), column renames, calculated columns, type coercion.
+
+        Args:
+            df: DataFrame to transform
+            profile: Profile with normalization and transform rules
+            lazy: If True, run the chain as one compiled LazyFrame plan.
+                  If the plan fails at collect time, falls back to the eager
+                  step-by-step path, which skips failing steps with a log.
+
+        Returns:
+            Transformed DataFrame
+        """
+        if lazy:
+            try:
+                return self.compile_profile_plan(df, profile).collect()
+            except Exception as e:
+                logger.warning(f"Compiled transform plan failed, applying eagerly: {e}")
+
+        df = self.apply_normalization(df, profile)
+        if profile.column_renames:
+            df = self.apply_column_renames(df, profile.column_renames)
+        if profile.calculated_columns:
+            df = self.apply_calculated_columns(df, profile.calculated_columns)
+        if profile.type_coercion:
+            df = self.apply_type_coercion(df, profile.type_coercion)
+        return df
+
+    def compile_profile_plan(
+        self,
+        df: pl.DataFrame,
+        profile: DATProfile,
+    ) -> pl.LazyFrame:
+        """Compile the profile transform chain into a single LazyFrame plan.
+
+        Each step becomes one combined projection or predicate, so Polars can
+        fuse projections and push row filters down before the derived
+        columns are computed. Numeric coercion is decided from a 10-row
+        sample, as in the eager path.
+
+        Args:
+            df: DataFrame the plan will run on
+            profile: Profile with normalization and transform rules
+
+        Returns:
+            LazyFrame; call ``collect()`` to execute
+        """
+        lf = df.lazy()
+
+        if not df.is_empty():
+            # 1. Replace NaN values with null
+            if profile.nan_values:
+                nan_exprs = self._nan_replacement_exprs(df.schema, profile.nan_values)
+                if nan_exprs:
+                    lf = lf.with_columns(nan_exprs)
+
+            # 2. Numeric coercion, decided on the NaN-cleaned sample
+            if profile.numeric_coercion:
+                sample = lf.head(10).collect()
+                numeric = self._numeric_columns(sample)
+                if numeric:
+                    lf = lf.with_columns(
+                        pl.col(col).cast(pl.Float64, strict=False).alias(col)
+                        for col in numeric
+                    )
+
+            # 3. Row filters combined into a single predicate
+            predicates = [
+                predicate
+                for filter_def in profile.row_filters
+                if (predicate := self._row_filter_expr(filter_def, df.columns)) is not None
+            ]
+            if predicates:
+                lf = lf.filter(pl.all_horizontal(predicates))
+
+            # 4. Units: policy without column units is a no-op (see normalize_units_by_policy)
+
+        columns = list(df.columns)
+
+        # 5. Column renames
+        valid_renames = {k: v for k, v in profile.column_renames.items() if k in columns}
+        if valid_renames:
+            lf = lf.rename(valid_renames)
+            columns = [valid_renames.get(c, c) for c in columns]
+
+        # 6. Calculated columns; each may reference the ones before it
+        for calc in profile.calculated_columns:
+            name = calc.get("name")
+            calc_expr = self._calculated_column_expr(calc, columns)
+            if calc_expr is not None:
+                lf = lf.with_columns(calc_expr)
+                if name not in columns:
+                    columns.append(name)
+            elif name in columns and calc.get("round_to") is not None:
+                lf = lf.with_columns(pl.col(name).round(calc["round_to"]))
+
+        # 7. Type coercion batched into projections; a repeated column starts
+        # a new projection so chained coercions compose as in the eager path
+        coercions: dict[str, pl.Expr] = {}
+        for coercion in profile.type_coercion:
+            col = coercion.get("column")
+            if col and col in columns:
+                coercion_expr = self._type_coercion_expr(coercion)
+                if coercion_expr is None:
+                    continue
+                if col in coercions:
+                    lf = lf.with_columns(list(coercions.values()))
+                    coercions = {}
+                coercions[col] = coercion_expr
+        if coercions:
+            lf = lf.with_columns(list(coercions.values()))
+
+        return lf
+
+    def explain(
+        self,
+        df: pl.DataFrame,
+        profile: DATProfile,
+        optimized: bool = True,
+    ) -> str:
+        """Return the query plan of the compiled profile transform chain.
+
+        Args:
+            df: DataFrame the plan would run on
+            profile: Profile with normalization and transform rules
+            optimized: Show the optimized plan (default) or the naive one
+
+        Returns:
+            Polars plan description for debugging
+        """
+        return self.compile_profile_plan(df, profile).explain(optimized=optimized)
+
     def apply_unit_normalization(
         self,
         df: pl.DataFrame,
@@ -264,32 +408,9 @@ class TransformPipeline:
                 continue
 
             try:
-                if to_type == "datetime":
-                    fmt = coercion.get("format", "%Y-%m-%d %H:%M:%S")
-                    df = df.with_columns(
-                        pl.col(col).str.strptime(pl.Datetime, fmt).alias(col)
-                    )
-                elif to_type == "date":
-                    fmt = coercion.get("format", "%Y-%m-%d")
-                    df = df.with_columns(
-                        pl.col(col).str.strptime(pl.Date, fmt).alias(col)
-                    )
-                elif to_type == "string":
-                    df = df.with_columns(pl.col(col).cast(pl.Utf8).alias(col))
-                    if coercion.get("strip"):
-                        df = df.with_columns(pl.col(col).str.strip_chars().alias(col))
-                    if coercion.get("uppercase"):
-                        df = df.with_columns(pl.col(col).str.to_uppercase().alias(col))
-                    if coercion.get("lowercase"):
-                        df = df.with_columns(pl.col(col).str.to_lowercase().alias(col))
-                elif to_type == "float":
-                    df = df.with_columns(pl.col(col).cast(pl.Float64).alias(col))
-                elif to_type == "int":
-                    df = df.with_columns(pl.col(col).cast(pl.Int64).alias(col))
-                elif to_type == "bool":
-                    df = df.with_columns(pl.col(col).cast(pl.Boolean).alias(col))
-                else:
-                    logger.warning(f"Unknown type coercion target: {to_type}")
+                coercion_expr = self._type_coercion_expr(coercion)
+                if coercion_expr is not None:
+                    df = df.with_columns(coercion_expr)
             except Exception as e:
                 logger.error(f"Type coercion error for {col} to {to_type}: {e}")
 
@@ -340,50 +461,10 @@ class TransformPipeline:
 
         for filter_def in filters:
             col = filter_def.get("column")
-            if not col or col not in df.columns:
-                continue
-
-            op = filter_def.get("op", "equals")
-            value = filter_def.get("value")
-
             try:
-                if op == "equals":
-                    df = df.filter(pl.col(col) == value)
-                elif op == "not_equals":
-                    df = df.filter(pl.col(col) != value)
-                elif op == "gt":
-                    df = df.filter(pl.col(col) > value)
-                elif op == "gte":
-                    df = df.filter(pl.col(col) >= value)
-                elif op == "lt":
-                    df = df.filter(pl.col(col) < value)
-                elif op == "lte":
-                    df = df.filter(pl.col(col) <= value)
-                elif op == "between":
-                    min_val = filter_def.get("min")
-                    max_val = filter_def.get("max")
-                    if min_val is not None and max_val is not None:
-                        df = df.filter(
-                            (pl.col(col) >= min_val) & (pl.col(col) <= max_val)
-                        )
-                elif op == "in":
-                    values = filter_def.get("values", [])
-                    df = df.filter(pl.col(col).is_in(values))
-                elif op == "not_in":
-                    values = filter_def.get("values", [])
-                    df = df.filter(~pl.col(col).is_in(values))
-                elif op == "is_null":
-                    df = df.filter(pl.col(col).is_null())
-                elif op == "is_not_null":
-                    df = df.filter(pl.col(col).is_not_null())
-                elif op == "contains":
-                    df = df.filter(pl.col(col).cast(pl.Utf8).str.contains(str(value)))
-                elif op == "startswith":
-                    df = df.filter(pl.col(col).cast(pl.Utf8).str.starts_with(str(value)))
-                elif op == "endswith":
-                    df = df.filter(pl.col(col).cast(pl.Utf8).str.ends_with(str(value)))
-                else:
-                    logger.warning(f"Unknown filter op: {op}")
+                predicate = self._row_filter_expr(filter_def, df.columns)
+                if predicate is not None:
+                    df = df.filter(predicate)
             except Exception as e:
                 logger.error(f"Row filter error for {col}: {e}")
 
@@ -411,39 +492,35 @@ class TransformPipeline:
                 continue
 
             try:
-                # Parse simple arithmetic expressions
-                # Format: "col1 + col2", "col1 * 100", etc.
-                df = self._evaluate_expression(df, name, expression)
-
-                # Apply rounding if specified
-                round_to = calc.get("round_to")
-                if round_to is not None and name in df.columns:
-                    df = df.with_columns(
-                        pl.col(name).round(round_to).alias(name)
-                    )
+                calc_expr = self._calculated_column_expr(calc, df.columns)
+                if calc_expr is not None:
+                    df = df.with_columns(calc_expr)
+                elif name in df.columns and calc.get("round_to") is not None:
+                    # Unparseable expression: still round an existing column
+                    df = df.with_columns(pl.col(name).round(calc["round_to"]))
             except Exception as e:
                 logger.error(f"Calculated column error for {name}: {e}")
 
         return df
 
-    def _replace_nan_values(
+    def _nan_replacement_exprs(
         self,
-        df: pl.DataFrame,
+        schema: pl.Schema,
         nan_values: list[str],
-    ) -> pl.DataFrame:
-        """Replace NaN string values with null."""
-        for col in df.columns:
-            if df[col].dtype == pl.Utf8:
-                df = df.with_columns(
-                    pl.when(pl.col(col).is_in(nan_values))
-                    .then(None)
-                    .otherwise(pl.col(col))
-                    .alias(col)
-                )
-        return df
-
-    def _coerce_numeric(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Attempt to coerce string columns to numeric."""
+    ) -> list[pl.Expr]:
+        """Expressions replacing NaN markers with null in every string column."""
+        return [
+            pl.when(pl.col(col).is_in(nan_values))
+            .then(None)
+            .otherwise(pl.col(col))
+            .alias(col)
+            for col, dtype in schema.items()
+            if dtype == pl.Utf8
+        ]
+
+    def _numeric_columns(self, df: pl.DataFrame) -> list[str]:
+        """String columns whose leading values mostly parse as numbers."""
+        columns = []
         for col in df.columns:
             if df[col].dtype == pl.Utf8:
                 # Check if column looks numeric
@@ -451,20 +528,131 @@ class TransformPipeline:
                 if len(sample) == 0:
                     continue
 
-                # Try to cast
                 try:
                     test_cast = sample.cast(pl.Float64, strict=False)
-                    null_count = test_cast.null_count()
-
                     # If most values convert successfully, apply
-                    if null_count < len(sample) * 0.5:
-                        df = df.with_columns(
-                            pl.col(col).cast(pl.Float64, strict=False).alias(col)
-                        )
+                    if test_cast.null_count() < len(sample) * 0.5:
+                        columns.append(col)
                 except Exception:
                     pass  # Keep as string
+        return columns
 
-        return df
+    def _row_filter_expr(
+        self,
+        filter_def: dict[str, Any],
+        columns: list[str],
+    ) -> pl.Expr | None:
+        """Build the predicate for one row filter definition."""
+        col = filter_def.get("column")
+        if not col or col not in columns:
+            return None
+
+        op = filter_def.get("op", "equals")
+        value = filter_def.get("value")
+
+        if op == "equals":
+            return pl.col(col) == value
+        elif op == "not_equals":
+            return pl.col(col) != value
+        elif op == "gt":
+            return pl.col(col) > value
+        elif op == "gte":
+            return pl.col(col) >= value
+        elif op == "lt":
+            return pl.col(col) < value
+        elif op == "lte":
+            return pl.col(col) <= value
+        elif op == "between":
+            min_val = filter_def.get("min")
+            max_val = filter_def.get("max")
+            if min_val is not None and max_val is not None:
+                return (pl.col(col) >= min_val) & (pl.col(col) <= max_val)
+            return None
+        elif op == "in":
+            return pl.col(col).is_in(filter_def.get("values", []))
+        elif op == "not_in":
+            return ~pl.col(col).is_in(filter_def.get("values", []))
+        elif op == "is_null":
+            return pl.col(col).is_null()
+        elif op == "is_not_null":
+            return pl.col(col).is_not_null()
+        elif op == "contains":
+            return pl.col(col).cast(pl.Utf8).str.contains(str(value))
+        elif op == "startswith":
+            return pl.col(col).cast(pl.Utf8).str.starts_with(str(value))
+        elif op == "endswith":
+            return pl.col(col).cast(pl.Utf8).str.ends_with(str(value))
+
+        logger.warning(f"Unknown filter op: {op}")
+        return None
+
+    def _calculated_column_expr(
+        self,
+        calc: dict[str, Any],
+        columns: list[str],
+    ) -> pl.Expr | None:
+        """Build the (optionally rounded) expression for a calculated column."""
+        name = calc.get("name")
+        expression = calc.get("expression")
+        if not name or not expression:
+            return None
+
+        result = self._arithmetic_expr(expression, columns)
+        if result is None:
+            return None
+
+        round_to = calc.get("round_to")
+        if round_to is not None:
+            result = result.round(round_to)
+        return result.alias(name)
+
+    def _type_coercion_expr(self, coercion: dict[str, Any]) -> pl.Expr | None:
+        """Build the expression for one type coercion definition."""
+        col = coercion["column"]
+        to_type = coercion.get("to_type")
+
+        if to_type == "datetime":
+            fmt = coercion.get("format", "%Y-%m-%d %H:%M:%S")
+            return pl.col(col).str.strptime(pl.Datetime, fmt).alias(col)
+        elif to_type == "date":
+            fmt = coercion.get("format", "%Y-%m-%d")
+            return pl.col(col).str.strptime(pl.Date, fmt).alias(col)
+        elif to_type == "string":
+            expr = pl.col(col).cast(pl.Utf8)
+            if coercion.get("strip"):
+                expr = expr.str.strip_chars()
+            if coercion.get("uppercase"):
+                expr = expr.str.to_uppercase()
+            if coercion.get("lowercase"):
+                expr = expr.str.to_lowercase()
+            return expr.alias(col)
+        elif to_type == "float":
+            return pl.col(col).cast(pl.Float64).alias(col)
+        elif to_type == "int":
+            return pl.col(col).cast(pl.Int64).alias(col)
+        elif to_type == "bool":
+            return pl.col(col).cast(pl.Boolean).alias(col)
+
+        logger.warning(f"Unknown type coercion target: {to_type}")
+        return None
+
+    def _replace_nan_values(
+        self,
+        df: pl.DataFrame,
+        nan_values: list[str],
+    ) -> pl.DataFrame:
+        """Replace NaN string values with null."""
+        exprs = self._nan_replacement_exprs(df.schema, nan_values)
+        return df.with_columns(exprs) if exprs else df
+
+    def _coerce_numeric(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Attempt to coerce string columns to numeric."""
+        columns = self._numeric_columns(df)
+        if not columns:
+            return df
+        return df.with_columns(
+            pl.col(col).cast(pl.Float64, strict=False).alias(col) for col in columns
+        )
 
     def _apply_single_transform(
         self,
@@ -508,53 +696,34 @@ class TransformPipeline:
             logger.warning(f"Unknown transform type: {transform.transform}")
             return df
 
-    def _evaluate_expression(
-        self,
-        df: pl.DataFrame,
-        name: str,
-        expression: str,
-    ) -> pl.DataFrame:
-        """Evaluate simple arithmetic expression.
-        
-        Supports: +, -, *, /, column references
-        """
-
-        # Parse expression: "col1 + col2", "col1 * 100", etc.
-        # This is a simple parser - extend as needed
+    def _arithmetic_expr(self, expression: str, columns: list[str]) -> pl.Expr | None:
+        """Build expression for "col1 + col2", "col1 * 100", etc.
 
-        # Check for binary operations
-        for op, pl_method in [("+", "__add__"), ("-", "__sub__"),
-                               ("*", "__mul__"), ("/", "__truediv__")]:
+        This is a simple parser - extend as needed.
+        """
+        for op in ("+", "-", "*", "/"):
             if op in expression:
                 parts = expression.split(op)
                 if len(parts) == 2:
-                    left = parts[0].strip()
-                    right = parts[1].strip()
-
                     # Determine if operands are columns or literals
-                    left_expr = self._get_operand_expr(left, df)
-                    right_expr = self._get_operand_expr(right, df)
+                    left_expr = self._get_operand_expr(parts[0].strip(), columns)
+                    right_expr = self._get_operand_expr(parts[1].strip(), columns)
 
                     if left_expr is not None and right_expr is not None:
                         if op == "+":
-                            result = left_expr + right_expr
+                            return left_expr + right_expr
                         elif op == "-":
-                            result = left_expr - right_expr
+                            return left_expr - right_expr
                         elif op == "*":
-                            result = left_expr * right_expr
-                        elif op == "/":
-                            result = left_expr / right_expr
-                        else:
-                            return df
+                            return left_expr * right_expr
+                        return left_expr / right_expr
 
-                        return df.with_columns(result.alias(name))
-
-        return df
+        return None
 
-    def _get_operand_expr(self, operand: str, df: pl.DataFrame) -> pl.Expr | None:
+    def _get_operand_expr(self, operand: str, columns: list[str]) -> pl.Expr | None:
         """Get polars expression for operand (column or literal)."""
         # Check if it's a column reference
-        if operand in df.columns:
+        if operand in columns:
             return pl.col(operand)
 
         # Try to parse as number
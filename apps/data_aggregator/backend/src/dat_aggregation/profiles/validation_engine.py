@@ -2,18 +2,35 @@
 
 Per ADR-0012: Stable column policies enforce schema expectations.
 Validates extracted DataFrames against profile-defined rules.
+
+All value constraints, row rules, aggregate rules and uniqueness checks for
+a table are compiled into one batch of Polars aggregate expressions and
+evaluated in a single ``select`` (one scan per table, not one per rule).
+Offending rows are sampled, capped per check, only for checks that fail.
+Tables are validated concurrently (Polars releases the GIL while scanning).
 """
 
 import logging
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
 import polars as pl
 
+from shared.contracts.core.concurrency import ConcurrencyConfig
+
 from .profile_loader import DATProfile, TableConfig
 
 logger = logging.getLogger(__name__)
 
+# Offending rows kept per failing check for reporting
+MAX_VIOLATION_SAMPLES = 5
+
+# Comparison operators for row rule expressions, longest first
+_ROW_RULE_OPS = [" >= ", " <= ", " > ", " < ", " == ", " != "]
+
 
 @dataclass
 class ValidationResult:
@@ -24,6 +41,8 @@ class ValidationResult:
     warnings: list[str] = field(default_factory=list)
     missing_columns: list[str] = field(default_factory=list)
     extra_columns: list[str] = field(default_factory=list)
+    # Message -> up to MAX_VIOLATION_SAMPLES offending rows
+    violation_samples: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
 
 
 @dataclass
@@ -34,6 +53,8 @@ class ProfileValidationSummary:
     total_tables: int
     valid_tables: int
     table_results: list[ValidationResult] = field(default_factory=list)
+    # "[table_id] message" -> offending rows for profile-level row rules
+    violation_samples: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
 
     @property
     def error_count(self) -> int:
@@ -44,12 +65,54 @@ class ProfileValidationSummary:
         return sum(len(r.warnings) for r in self.table_results)
 
 
+@dataclass
+class _Check:
+    """One compiled validation check.
+
+    Attributes:
+        stat: Scalar aggregate expression evaluated in the table's batch
+        report: Turns the evaluated stat into messages (empty = passed)
+        mask: Row-level violation mask, used to sample offending rows
+        on_error: Turns an evaluation error into messages; None re-raises
+    """
+    stat: pl.Expr
+    report: Callable[[Any], list[str]]
+    mask: pl.Expr | None = None
+    on_error: Callable[[Exception], list[str]] | None = None
+
+
+@dataclass
+class _CheckOutcome:
+    """Messages and sampled rows produced by one check."""
+    messages: list[str] = field(default_factory=list)
+    samples: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _prefixed(on_fail: str, msg: str) -> str:
+    return f"{'ERROR' if on_fail == 'error' else 'WARN'}: {msg}"
+
+
 class ValidationEngine:
     """Validates extracted DataFrames against profile rules.
     
     Per ADR-0012: Enforces stable column policies and schema constraints.
     """
 
+    def __init__(
+        self,
+        max_violation_samples: int = MAX_VIOLATION_SAMPLES,
+        max_workers: int | None = None,
+    ):
+        """Initialize ValidationEngine.
+        
+        Args:
+            max_violation_samples: Offending rows kept per failing check
+            max_workers: Threads for validating tables concurrently
+                         (None = ET_MAX_THREADS per ADR-0013)
+        """
+        self.max_violation_samples = max_violation_samples
+        self.max_workers = max_workers
+
     def validate_table(
         self,
         df: pl.DataFrame,
@@ -64,6 +127,17 @@ class ValidationEngine:
         Returns:
             ValidationResult with errors/warnings
         """
+        checks = self._value_constraint_checks(df, table_config.validation_constraints)
+        outcomes = self._run_checks(df, checks) if table_config.stable_columns else []
+        return self._table_result(df, table_config, outcomes)
+
+    def _table_result(
+        self,
+        df: pl.DataFrame,
+        table_config: TableConfig,
+        constraint_outcomes: list[_CheckOutcome],
+    ) -> ValidationResult:
+        """Build a table's ValidationResult from evaluated constraint checks."""
         errors: list[str] = []
         warnings: list[str] = []
         missing: list[str] = []
@@ -102,16 +176,16 @@ class ValidationEngine:
             elif mode == "warn":
                 warnings.append(msg)
 
-        # Per DESIGN §7: Validate value constraints if defined
-        if table_config.validation_constraints:
-            constraint_errors = self.validate_value_constraints(
-                df, table_config.validation_constraints
-            )
-            for err in constraint_errors:
+        # Per DESIGN §7: Value constraints (evaluated in the table's batch)
+        samples: dict[str, list[dict[str, Any]]] = {}
+        for outcome in constraint_outcomes:
+            for err in outcome.messages:
                 if mode == "error":
                     errors.append(err)
                 elif mode == "warn":
                     warnings.append(err)
+                if outcome.samples:
+                    samples[err] = outcome.samples
 
         return ValidationResult(
             table_id=table_config.id,
@@ -120,6 +194,7 @@ class ValidationEngine:
             warnings=warnings,
             missing_columns=missing,
             extra_columns=extra,
+            violation_samples=samples,
         )
 
     def validate_extraction(
@@ -129,6 +204,9 @@ class ValidationEngine:
     ) -> ProfileValidationSummary:
         """Validate all extracted tables against profile.
         
+        Each table's table-level and profile-level checks run as one batch;
+        tables are validated concurrently.
+        
         Args:
             results: Dict of table_id to DataFrame
             profile: DATProfile with validation rules
@@ -136,9 +214,26 @@ class ValidationEngine:
         Returns:
             ProfileValidationSummary with all results
         """
-        table_results: list[ValidationResult] = []
+        table_configs = {tc.id: tc for _, tc in profile.get_all_tables()}
+
+        table_ids = list(results)
+        workers = self.max_workers or ConcurrencyConfig.from_env().max_threads
+        workers = max(1, min(workers, len(table_ids)))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(
+                    lambda tid: self._validate_one(results[tid], table_configs.get(tid), profile),
+                    table_ids,
+                ))
+        else:
+            outcomes = [
+                self._validate_one(results[tid], table_configs.get(tid), profile)
+                for tid in table_ids
+            ]
+        by_table = dict(zip(table_ids, outcomes, strict=True))
 
-        for level_name, table_config in profile.get_all_tables():
+        table_results: list[ValidationResult] = []
+        for _level_name, table_config in profile.get_all_tables():
             if table_config.id not in results:
                 # Table not extracted - check if required
                 table_results.append(ValidationResult(
@@ -148,8 +243,10 @@ class ValidationEngine:
                 ))
                 continue
 
-            df = results[table_config.id]
-            result = self.validate_table(df, table_config)
+            result = by_table[table_config.id][0]
+            if result is None:
+                # _validate_one only returns None for tables without a config
+                raise RuntimeError(f"No validation result for configured table {table_config.id}")
             table_results.append(result)
 
             # Log warnings
@@ -158,35 +255,21 @@ class ValidationEngine:
             for error in result.errors:
                 logger.error(f"[{table_config.id}] {error}")
 
-        # Per DESIGN §7: Apply profile-level validation rules
+        # Per DESIGN §7: Profile-level validation rules
         profile_errors: list[str] = []
         profile_warnings: list[str] = []
-
-        # Schema rules validation
-        if profile.schema_rules:
-            for table_id, df in results.items():
-                schema_errors = self.validate_schema_rules(df, profile.schema_rules)
-                profile_errors.extend(schema_errors)
-
-        # Row rules validation
-        if profile.row_rules:
-            for table_id, df in results.items():
-                row_errors = self.validate_row_rules(df, profile.row_rules)
-                for err in row_errors:
-                    if err.startswith("ERROR:"):
-                        profile_errors.append(err)
-                    else:
-                        profile_warnings.append(err)
-
-        # Aggregate rules validation
-        if profile.aggregate_rules:
-            for table_id, df in results.items():
-                agg_errors = self.validate_aggregate_rules(df, profile.aggregate_rules)
-                for err in agg_errors:
+        violation_samples: dict[str, list[dict[str, Any]]] = {}
+        for table_id in table_ids:
+            _, schema_errors, rule_outcomes = by_table[table_id]
+            profile_errors.extend(schema_errors)
+            for outcome in rule_outcomes:
+                for err in outcome.messages:
                     if err.startswith("ERROR:"):
                         profile_errors.append(err)
                     else:
                         profile_warnings.append(err)
+                    if outcome.samples:
+                        violation_samples[f"[{table_id}] {err}"] = outcome.samples
 
         # Log profile-level validation results
         for err in profile_errors:
@@ -202,8 +285,115 @@ class ValidationEngine:
             total_tables=len(table_results),
             valid_tables=sum(1 for r in table_results if r.valid),
             table_results=table_results,
+            violation_samples=violation_samples,
         )
 
+    def _validate_one(
+        self,
+        df: pl.DataFrame,
+        table_config: TableConfig | None,
+        profile: DATProfile,
+    ) -> tuple[ValidationResult | None, list[str], list[_CheckOutcome]]:
+        """Validate one table with all of its checks in a single batch.
+
+        Returns:
+            Tuple of (table result or None if the table has no config,
+            schema rule errors, row/aggregate rule outcomes)
+        """
+        constraint_checks: list[_Check] = []
+        if table_config is not None and table_config.stable_columns:
+            constraint_checks = self._value_constraint_checks(
+                df, table_config.validation_constraints
+            )
+
+        schema_errors: list[str] = []
+        unique_checks: list[_Check] = []
+        if profile.schema_rules:
+            schema_errors = self._schema_errors(df, profile.schema_rules)
+            unique_checks = self._unique_checks(df, profile.schema_rules)
+
+        rule_checks = (
+            self._row_rule_checks(df, profile.row_rules)
+            + self._aggregate_rule_checks(df, profile.aggregate_rules)
+        )
+
+        outcomes = self._run_checks(df, constraint_checks + unique_checks + rule_checks)
+        n_constraints = len(constraint_checks)
+        n_unique = len(unique_checks)
+
+        for outcome in outcomes[n_constraints:n_constraints + n_unique]:
+            schema_errors.extend(outcome.messages)
+
+        result = None
+        if table_config is not None:
+            result = self._table_result(df, table_config, outcomes[:n_constraints])
+        return result, schema_errors, outcomes[n_constraints + n_unique:]
+
+    def _run_checks(self, df: pl.DataFrame, checks: list[_Check]) -> list[_CheckOutcome]:
+        """Evaluate checks in one select, then sample rows of failing checks.
+
+        If the batch fails (e.g. an invalid regex or a type error in one
+        rule), checks are evaluated one at a time so each failure is
+        reported against its own check.
+        """
+        if not checks:
+            return []
+
+        try:
+            row = df.select(
+                check.stat.alias(f"__check_{i}") for i, check in enumerate(checks)
+            ).row(0)
+            outcomes = [
+                _CheckOutcome(messages=check.report(value))
+                for check, value in zip(checks, row, strict=True)
+            ]
+        except Exception:
+            outcomes = [self._run_check_alone(df, check) for check in checks]
+
+        self._sample_violations(df, checks, outcomes)
+        return outcomes
+
+    def _run_check_alone(self, df: pl.DataFrame, check: _Check) -> _CheckOutcome:
+        try:
+            value = df.select(check.stat).item()
+        except Exception as e:
+            if check.on_error is None:
+                raise
+            return _CheckOutcome(messages=check.on_error(e))
+        return _CheckOutcome(messages=check.report(value))
+
+    def _sample_violations(
+        self,
+        df: pl.DataFrame,
+        checks: list[_Check],
+        outcomes: list[_CheckOutcome],
+    ) -> None:
+        """Attach up to max_violation_samples offending rows to failing checks."""
+        if self.max_violation_samples <= 0:
+            return
+
+        failing = [
+            (check, outcome)
+            for check, outcome in zip(checks, outcomes, strict=True)
+            if outcome.messages and check.mask is not None
+        ]
+        if not failing:
+            return
+
+        lazy = df.lazy()
+        try:
+            frames = pl.collect_all([
+                lazy.filter(check.mask).head(self.max_violation_samples)
+                for check, _ in failing
+                if check.mask is not None
+            ])
+        except Exception as e:
+            logger.debug(f"Could not sample violating rows: {e}")
+            return
+
+        for (_, outcome), sample in zip(failing, frames, strict=True):
+            outcome.samples = sample.to_dicts()
+
     def validate_value_constraints(
         self,
         df: pl.DataFrame,
@@ -218,7 +408,16 @@ class ValidationEngine:
         Returns:
             List of validation error messages
         """
-        errors: list[str] = []
+        checks = self._value_constraint_checks(df, constraints)
+        return [msg for outcome in self._run_checks(df, checks) for msg in outcome.messages]
+
+    def _value_constraint_checks(
+        self,
+        df: pl.DataFrame,
+        constraints: list[dict[str, Any]],
+    ) -> list[_Check]:
+        """Compile value constraints into checks."""
+        checks: list[_Check] = []
 
         for constraint in constraints:
             col = constraint.get("column")
@@ -232,41 +431,50 @@ class ValidationEngine:
                 max_val = constraint.get("max")
 
                 if min_val is not None:
-                    violations = df.filter(pl.col(col) < min_val)
-                    if len(violations) > 0:
-                        errors.append(
-                            f"Column {col} has {len(violations)} values below {min_val}"
-                        )
+                    below = (pl.col(col) < min_val).fill_null(False)
+                    checks.append(_Check(
+                        stat=below.sum(),
+                        mask=below,
+                        report=lambda n, col=col, v=min_val: (
+                            [f"Column {col} has {n} values below {v}"] if n else []
+                        ),
+                    ))
 
                 if max_val is not None:
-                    violations = df.filter(pl.col(col) > max_val)
-                    if len(violations) > 0:
-                        errors.append(
-                            f"Column {col} has {len(violations)} values above {max_val}"
-                        )
+                    above = (pl.col(col) > max_val).fill_null(False)
+                    checks.append(_Check(
+                        stat=above.sum(),
+                        mask=above,
+                        report=lambda n, col=col, v=max_val: (
+                            [f"Column {col} has {n} values above {v}"] if n else []
+                        ),
+                    ))
 
             elif constraint_type == "not_null":
-                null_count = df.filter(pl.col(col).is_null()).height
-                if null_count > 0:
-                    errors.append(f"Column {col} has {null_count} null values")
+                checks.append(_Check(
+                    stat=pl.col(col).null_count(),
+                    mask=pl.col(col).is_null(),
+                    report=lambda n, col=col: (
+                        [f"Column {col} has {n} null values"] if n else []
+                    ),
+                ))
 
             elif constraint_type == "regex":
                 pattern = constraint.get("pattern")
                 if pattern:
-                    try:
-                        # Check string column matches pattern
-                        non_matches = df.filter(
-                            ~pl.col(col).cast(pl.Utf8).str.contains(pattern)
-                        )
-                        if len(non_matches) > 0:
-                            errors.append(
-                                f"Column {col} has {len(non_matches)} values "
-                                f"not matching pattern {pattern}"
-                            )
-                    except Exception as e:
-                        errors.append(f"Regex validation error for {col}: {e}")
-
-        return errors
+                    # Check string column matches pattern
+                    mismatch = (~pl.col(col).cast(pl.Utf8).str.contains(pattern)).fill_null(False)
+                    checks.append(_Check(
+                        stat=mismatch.sum(),
+                        mask=mismatch,
+                        report=lambda n, col=col, p=pattern: (
+                            [f"Column {col} has {n} values not matching pattern {p}"]
+                            if n else []
+                        ),
+                        on_error=lambda e, col=col: [f"Regex validation error for {col}: {e}"],
+                    ))
+
+        return checks
 
     def validate_schema_rules(
         self,
@@ -282,6 +490,17 @@ class ValidationEngine:
         Returns:
             List of validation error messages
         """
+        errors = self._schema_errors(df, schema_rules)
+        outcomes = self._run_checks(df, self._unique_checks(df, schema_rules))
+        errors.extend(msg for outcome in outcomes for msg in outcome.messages)
+        return errors
+
+    def _schema_errors(
+        self,
+        df: pl.DataFrame,
+        schema_rules: dict[str, Any],
+    ) -> list[str]:
+        """Schema-only checks: required columns and column types."""
         errors: list[str] = []
 
         # Check required columns
@@ -296,7 +515,7 @@ class ValidationEngine:
             if col not in df.columns:
                 continue
 
-            actual_type = str(df[col].dtype).lower()
+            actual_type = str(df.schema[col]).lower()
             expected_lower = expected_type.lower()
 
             # Map common type names
@@ -315,20 +534,26 @@ class ValidationEngine:
                     f"got {actual_type}"
                 )
 
-        # Check unique columns
-        unique_cols = schema_rules.get("unique_columns", [])
-        for col in unique_cols:
+        return errors
+
+    def _unique_checks(
+        self,
+        df: pl.DataFrame,
+        schema_rules: dict[str, Any],
+    ) -> list[_Check]:
+        """Compile unique_columns schema rules into checks."""
+        checks: list[_Check] = []
+        for col in schema_rules.get("unique_columns", []):
             if col not in df.columns:
                 continue
-
-            total = len(df)
-            unique = df[col].n_unique()
-            if unique < total:
-                errors.append(
-                    f"Column {col} has {total - unique} duplicate values"
-                )
-
-        return errors
+            checks.append(_Check(
+                stat=pl.len() - pl.col(col).n_unique(),
+                mask=pl.col(col).is_duplicated(),
+                report=lambda dupes, col=col: (
+                    [f"Column {col} has {dupes} duplicate values"] if dupes > 0 else []
+                ),
+            ))
+        return checks
 
     def validate_row_rules(
         self,
@@ -344,7 +569,16 @@ class ValidationEngine:
         Returns:
             List of validation error/warning messages
         """
-        errors: list[str] = []
+        checks = self._row_rule_checks(df, row_rules)
+        return [msg for outcome in self._run_checks(df, checks) for msg in outcome.messages]
+
+    def _row_rule_checks(
+        self,
+        df: pl.DataFrame,
+        row_rules: list[dict[str, Any]],
+    ) -> list[_Check]:
+        """Compile row rules into checks counting rows that fail the rule."""
+        checks: list[_Check] = []
 
         for rule in row_rules:
             name = rule.get("name", "unnamed")
@@ -355,78 +589,71 @@ class ValidationEngine:
             if not expression:
                 continue
 
-            try:
-                # Parse simple boolean expressions
-                # Format: "col1 > 0 AND col2 > 0"
-                violations = self._evaluate_row_expression(df, expression)
-                if violations > 0:
-                    msg = f"{message} ({violations} rows)"
-                    if on_fail == "error":
-                        errors.append(f"ERROR: {msg}")
-                    else:
-                        errors.append(f"WARN: {msg}")
-            except Exception as e:
-                errors.append(f"Row rule evaluation error for '{name}': {e}")
-
-        return errors
+            passing = self._compile_row_expression(expression, df.columns)
+            if passing is None:
+                continue
 
-    def _evaluate_row_expression(
+            # Rows that don't pass (null comparisons count as violations)
+            violation = ~passing.fill_null(False)
+            checks.append(_Check(
+                stat=violation.sum(),
+                mask=violation,
+                report=lambda n, message=message, on_fail=on_fail: (
+                    [_prefixed(on_fail, f"{message} ({n} rows)")] if n > 0 else []
+                ),
+                on_error=lambda e, name=name: [
+                    f"Row rule evaluation error for '{name}': {e}"
+                ],
+            ))
+
+        return checks
+
+    def _compile_row_expression(
         self,
-        df: pl.DataFrame,
         expression: str,
-    ) -> int:
-        """Evaluate a row expression and return count of violations.
-        
-        Supports simple expressions like "col > 0 AND col2 > 0"
-        """
-        # Split on AND/OR
-        parts = expression.upper().split(" AND ")
+        columns: list[str],
+    ) -> pl.Expr | None:
+        """Compile "col > 0 AND col2 <= 5" into a boolean Polars expression.
 
+        Column names keep their case; AND is matched case-insensitively.
+        Comparisons on unknown columns or non-numeric values are ignored.
+        """
         filter_expr = None
-        for part in parts:
+        for part in re.split(r"\s+AND\s+", expression, flags=re.IGNORECASE):
             part = part.strip()
 
             # Parse comparison: "col > value"
-            for op in [" >= ", " <= ", " > ", " < ", " == ", " != "]:
-                if op in part.upper():
-                    col, val = part.split(op.strip(), 1)
-                    col = col.strip()
-                    val = val.strip()
-
-                    if col not in df.columns:
-                        continue
-
-                    try:
-                        val_num = float(val)
-                        if ">=" in op:
-                            cond = pl.col(col) >= val_num
-                        elif "<=" in op:
-                            cond = pl.col(col) <= val_num
-                        elif ">" in op:
-                            cond = pl.col(col) > val_num
-                        elif "<" in op:
-                            cond = pl.col(col) < val_num
-                        elif "==" in op:
-                            cond = pl.col(col) == val_num
-                        elif "!=" in op:
-                            cond = pl.col(col) != val_num
-                        else:
-                            continue
-
-                        if filter_expr is None:
-                            filter_expr = cond
-                        else:
-                            filter_expr = filter_expr & cond
-                    except ValueError:
-                        continue
-                    break
-
-        if filter_expr is None:
-            return 0
-
-        # Count rows that DON'T match (violations)
-        passing = df.filter(filter_expr).height
-        return len(df) - passing
+            for op in _ROW_RULE_OPS:
+                if op not in f" {part} ":
+                    continue
+                col, val = (p.strip() for p in part.split(op.strip(), 1))
+
+                if col not in columns:
+                    continue
+
+                try:
+                    val_num = float(val)
+                except ValueError:
+                    continue
+
+                op_name = op.strip()
+                if op_name == ">=":
+                    cond = pl.col(col) >= val_num
+                elif op_name == "<=":
+                    cond = pl.col(col) <= val_num
+                elif op_name == ">":
+                    cond = pl.col(col) > val_num
+                elif op_name == "<":
+                    cond = pl.col(col) < val_num
+                elif op_name == "==":
+                    cond = pl.col(col) == val_num
+                else:
+                    cond = pl.col(col) != val_num
+
+                filter_expr = cond if filter_expr is None else filter_expr & cond
+                break
+
+        return filter_expr
 
     def validate_aggregate_rules(
         self,
@@ -442,52 +669,84 @@ class ValidationEngine:
         Returns:
             List of validation error/warning messages
         """
-        errors: list[str] = []
+        checks = self._aggregate_rule_checks(df, aggregate_rules)
+        return [msg for outcome in self._run_checks(df, checks) for msg in outcome.messages]
+
+    def _aggregate_rule_checks(
+        self,
+        df: pl.DataFrame,
+        aggregate_rules: list[dict[str, Any]],
+    ) -> list[_Check]:
+        """Compile aggregate rules into checks."""
+        checks: list[_Check] = []
 
         for rule in aggregate_rules:
             name = rule.get("name", "unnamed")
             rule_type = rule.get("type", "")
             on_fail = rule.get("on_fail", "warn")
             message = rule.get("message", f"Aggregate rule '{name}' failed")
-
-            try:
-                if rule_type == "row_count":
-                    min_count = rule.get("min", 0)
-                    max_count = rule.get("max", float("inf"))
-                    actual = len(df)
-
+            col = rule.get("column")
+
+            def on_error(e: Exception, name: str = name) -> list[str]:
+                return [f"Aggregate rule error for '{name}': {e}"]
+
+            if rule_type == "row_count":
+                min_count = rule.get("min", 0)
+                max_count = rule.get("max", float("inf"))
+
+                def report_rows(
+                    actual: int,
+                    message: str = message,
+                    on_fail: str = on_fail,
+                    min_count: float = min_count,
+                    max_count: float = max_count,
+                ) -> list[str]:
                     if actual < min_count:
                         msg = f"{message}: row count {actual} < min {min_count}"
-                        errors.append(f"{'ERROR' if on_fail == 'error' else 'WARN'}: {msg}")
-                    elif actual > max_count:
+                        return [_prefixed(on_fail, msg)]
+                    if actual > max_count:
                         msg = f"{message}: row count {actual} > max {max_count}"
-                        errors.append(f"{'ERROR' if on_fail == 'error' else 'WARN'}: {msg}")
-
-                elif rule_type == "unique_count":
-                    col = rule.get("column")
-                    min_count = rule.get("min", 0)
-
-                    if col and col in df.columns:
-                        actual = df[col].n_unique()
-                        if actual < min_count:
-                            msg = f"{message}: unique count {actual} < min {min_count}"
-                            errors.append(f"{'ERROR' if on_fail == 'error' else 'WARN'}: {msg}")
-
-                elif rule_type == "null_ratio":
-                    col = rule.get("column")
-                    max_ratio = rule.get("max", 1.0)
-
-                    if col and col in df.columns:
-                        null_count = df.filter(pl.col(col).is_null()).height
-                        ratio = null_count / len(df) if len(df) > 0 else 0
-                        if ratio > max_ratio:
-                            msg = f"{message}: null ratio {ratio:.2%} > max {max_ratio:.2%}"
-                            errors.append(f"{'ERROR' if on_fail == 'error' else 'WARN'}: {msg}")
+                        return [_prefixed(on_fail, msg)]
+                    return []
+
+                checks.append(_Check(stat=pl.len(), report=report_rows, on_error=on_error))
+
+            elif rule_type == "unique_count" and col and col in df.columns:
+                min_count = rule.get("min", 0)
+                checks.append(_Check(
+                    stat=pl.col(col).n_unique(),
+                    report=lambda actual, message=message, on_fail=on_fail, m=min_count: (
+                        [_prefixed(on_fail, f"{message}: unique count {actual} < min {m}")]
+                        if actual < m else []
+                    ),
+                    on_error=on_error,
+                ))
 
-            except Exception as e:
-                errors.append(f"Aggregate rule error for '{name}': {e}")
+            elif rule_type == "null_ratio" and col and col in df.columns:
+                max_ratio = rule.get("max", 1.0)
+                height = df.height
+
+                def report_nulls(
+                    null_count: int,
+                    message: str = message,
+                    on_fail: str = on_fail,
+                    max_ratio: float = max_ratio,
+                    height: int = height,
+                ) -> list[str]:
+                    ratio = null_count / height if height > 0 else 0
+                    if ratio > max_ratio:
+                        msg = f"{message}: null ratio {ratio:.2%} > max {max_ratio:.2%}"
+                        return [_prefixed(on_fail, msg)]
+                    return []
+
+                checks.append(_Check(
+                    stat=pl.col(col).null_count(),
+                    mask=pl.col(col).is_null(),
+                    report=report_nulls,
+                    on_error=on_error,
+                ))
 
-        return errors
+        return checks
 
 
 def validate_extraction(
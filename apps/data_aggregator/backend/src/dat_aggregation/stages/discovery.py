@@ -5,19 +5,36 @@ making the implicit file scan explicit.
 
 This stage scans a directory for supported files and returns metadata
 about each discovered file.
+
+Directories are listed with ``os.scandir`` on a thread pool (per ADR-0013,
+ET_MAX_THREADS directories at once), excluded directories are pruned before
+they are entered, and files are reported in per-directory batches as soon as
+they are found. With a snapshot path, the scan is compared with the previous
+one so re-discovery can report only new or changed files.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import tempfile
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from apps.data_aggregator.backend.adapters import create_default_registry
+from shared.contracts.core.concurrency import ConcurrencyConfig
 from shared.utils.stage_id import compute_stage_id
 
 logger = logging.getLogger(__name__)
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
 
 
 @dataclass
@@ -40,7 +57,20 @@ class DiscoveryConfig:
     recursive: bool = True
     extensions: list[str] | None = None  # None = all supported
     exclude_patterns: list[str] = field(default_factory=list)
-    max_files: int | None = None
+    max_files: int | None = None  # Stops the scan early; walks serially in sorted order
+    include_unsupported: bool = True  # False = skip other extensions without a stat
+    max_workers: int | None = None  # None = ET_MAX_THREADS
+    snapshot_path: Path | None = None  # Persisted listing to compare against
+    only_changes: bool = False  # Report only new/changed files (needs snapshot_path)
+
+
+@dataclass
+class DiscoveryChanges:
+    """Difference between a scan and the previous snapshot of the same root."""
+    new_files: list[str] = field(default_factory=list)
+    changed_files: list[str] = field(default_factory=list)
+    removed_files: list[str] = field(default_factory=list)
+    had_snapshot: bool = False
 
 
 @dataclass
@@ -55,11 +85,203 @@ class DiscoveryResult:
     total_size_bytes: int
     completed: bool = True
     scanned_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    changes: DiscoveryChanges | None = None
+
+
+def snapshot_path_for(dat_workspace: Path, root: Path, recursive: bool = True) -> Path:
+    """Location of the discovery snapshot of a root directory.
+
+    Recursive and top-level scans list different files, so each keeps its
+    own snapshot.
+
+    Args:
+        dat_workspace: DAT workspace directory (workspace/tools/dat).
+        root: Discovery root.
+        recursive: Whether the scan descends into subdirectories.
+
+    Returns:
+        Snapshot file path, shared by all runs that discover ``root`` the same way.
+    """
+    key = json.dumps([str(Path(root).resolve()), recursive])
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return Path(dat_workspace) / "discovery_snapshots" / f"{digest}.json"
+
+
+def _scan_options(config: DiscoveryConfig) -> dict[str, Any]:
+    """Options that decide which files a scan lists (recorded in snapshots)."""
+    return {
+        "recursive": config.recursive,
+        "extensions": sorted(config.extensions) if config.extensions is not None else None,
+        "exclude_patterns": sorted(config.exclude_patterns),
+        "include_unsupported": config.include_unsupported,
+    }
+
+
+def _is_excluded(path: str, exclude_patterns: list[str]) -> bool:
+    return any(pattern in path for pattern in exclude_patterns)
+
+
+def _scan_directory(
+    directory: str,
+    config: DiscoveryConfig,
+    target_extensions: set[str],
+) -> tuple[list[DiscoveredFile], list[str]]:
+    """List one directory.
+
+    Returns:
+        Tuple of (files in the directory, subdirectories to descend into),
+        both sorted by name.
+    """
+    files: list[DiscoveredFile] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError as e:
+        logger.debug(f"Cannot list {directory}: {e}")
+        return files, subdirs
+
+    for entry in entries:
+        if _is_excluded(entry.path, config.exclude_patterns):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            if not entry.is_file():
+                continue
+        except OSError:
+            continue
+
+        ext = os.path.splitext(entry.name)[1].lower()
+        if not config.include_unsupported and ext not in target_extensions:
+            continue
+
+        try:
+            stat = entry.stat()
+        except OSError as e:
+            files.append(DiscoveredFile(
+                path=entry.path,
+                name=entry.name,
+                extension=ext,
+                size_bytes=0,
+                modified_at=None,
+                is_supported=False,
+                error=str(e),
+            ))
+            continue
+
+        files.append(DiscoveredFile(
+            path=entry.path,
+            name=entry.name,
+            extension=ext,
+            size_bytes=stat.st_size,
+            modified_at=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+        ))
+    return files, subdirs
+
+
+async def _walk(
+    config: DiscoveryConfig,
+    target_extensions: set[str],
+) -> AsyncIterator[list[DiscoveredFile]]:
+    """Yield the files of each directory under the root as it is listed.
+
+    Directories are listed concurrently; with max_files set the walk is
+    serial and breadth-first in name order so truncation is deterministic.
+    """
+    loop = asyncio.get_running_loop()
+    workers = 1 if config.max_files else (
+        config.max_workers or ConcurrencyConfig.from_env().max_threads
+    )
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="dat-discovery")
+
+    def submit(directory: str) -> asyncio.Future:
+        return loop.run_in_executor(pool, _scan_directory, directory, config, target_extensions)
+
+    try:
+        if workers == 1:
+            queue = deque([str(config.root_path)])
+            while queue:
+                files, subdirs = await submit(queue.popleft())
+                if config.recursive:
+                    queue.extend(subdirs)
+                if files:
+                    yield files
+            return
+
+        pending = {submit(str(config.root_path))}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                if config.recursive:
+                    pending.update(submit(d) for d in subdirs)
+                if files:
+                    yield files
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _snapshot_entry(f: DiscoveredFile) -> list:
+    return [f.size_bytes, f.modified_at.isoformat() if f.modified_at else None]
+
+
+def _load_snapshot(path: Path, root: str, options: dict[str, Any]) -> dict[str, list] | None:
+    """Previous listing, or None if there is none for this root and these options."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("root") != root or data.get("options") != options:
+        return None
+    return data.get("files", {})
+
+
+def _save_snapshot(
+    path: Path, root: str, options: dict[str, Any], files: list[DiscoveredFile]
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp file: runs discovering the same root may save concurrently
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp",
+        delete=False,
+    ) as tmp:
+        json.dump({
+            "root": root,
+            "options": options,
+            "scanned_at": datetime.now(UTC).isoformat(),
+            "files": {f.path: _snapshot_entry(f) for f in files},
+        }, tmp)
+    try:
+        os.replace(tmp.name, path)
+    except OSError:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def _diff_snapshot(
+    previous: dict[str, list] | None,
+    files: list[DiscoveredFile],
+) -> DiscoveryChanges:
+    if previous is None:
+        return DiscoveryChanges(new_files=[f.path for f in files])
+    changes = DiscoveryChanges(had_snapshot=True)
+    for f in files:
+        before = previous.get(f.path)
+        if before is None:
+            changes.new_files.append(f.path)
+        elif before != _snapshot_entry(f):
+            changes.changed_files.append(f.path)
+    current = {f.path for f in files}
+    changes.removed_files = sorted(p for p in previous if p not in current)
+    return changes
 
 
 async def execute_discovery(
     run_id: str,
     config: DiscoveryConfig,
+    on_files: Callable[[list[DiscoveredFile]], Awaitable[None]] | None = None,
 ) -> DiscoveryResult:
     """Execute discovery stage to scan for files.
 
@@ -69,9 +291,13 @@ async def execute_discovery(
     Args:
         run_id: DAT run ID.
         config: Discovery configuration.
+        on_files: Awaited with each batch of files as it is found (one batch
+            per directory), e.g. to stream results to clients.
 
     Returns:
-        DiscoveryResult with discovered files.
+        DiscoveryResult with discovered files, sorted by path. With a
+        snapshot path, ``changes`` describes the difference to the previous
+        scan and the snapshot is updated.
     """
     files: list[DiscoveredFile] = []
     registry = create_default_registry()
@@ -102,74 +328,58 @@ async def execute_discovery(
             completed=True,
         )
 
-    # Get all files
-    if config.recursive:
-        all_files = list(root.rglob("*"))
-    else:
-        all_files = list(root.glob("*"))
-
-    # Filter to files only (not directories)
-    all_files = [f for f in all_files if f.is_file()]
-
-    # Apply max_files limit if specified
-    if config.max_files and len(all_files) > config.max_files:
-        all_files = all_files[:config.max_files]
-
-    total_size = 0
-
-    for file_path in all_files:
-        ext = file_path.suffix.lower()
-
-        # Check exclusion patterns
-        excluded = False
-        for pattern in config.exclude_patterns:
-            if pattern in str(file_path):
-                excluded = True
-                break
-
-        if excluded:
-            continue
+    # Adapter names are looked up once per extension, not per file
+    adapter_names: dict[str, str | None] = {}
 
-        # Get file metadata
-        try:
-            stat = file_path.stat()
-            size = stat.st_size
-            modified = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
-        except OSError as e:
-            files.append(DiscoveredFile(
-                path=str(file_path),
-                name=file_path.name,
-                extension=ext,
-                size_bytes=0,
-                modified_at=None,
-                is_supported=False,
-                error=str(e),
-            ))
-            continue
-
-        total_size += size
-
-        # Check if extension is supported
-        is_supported = ext in target_extensions
-
-        # Get adapter name if supported
-        adapter_name = None
-        if is_supported:
+    def adapter_name_for(ext: str) -> str | None:
+        if ext not in adapter_names:
             try:
-                adapter = registry.get_adapter_for_file(str(file_path))
-                adapter_name = adapter.metadata.name
+                adapter_names[ext] = registry.get_adapter_for_file(f"file{ext}").metadata.name
             except Exception:
-                is_supported = False
+                adapter_names[ext] = None
+        return adapter_names[ext]
+
+    truncated = False
+    async with aclosing(_walk(config, target_extensions)) as batches:
+        async for batch in batches:
+            if config.max_files and len(files) + len(batch) >= config.max_files:
+                batch = batch[:config.max_files - len(files)]
+                truncated = True
+
+            for f in batch:
+                if f.error is None and f.extension in target_extensions:
+                    f.adapter_name = adapter_name_for(f.extension)
+                    f.is_supported = f.adapter_name is not None
+                elif f.error is None:
+                    f.is_supported = False
+            files.extend(batch)
+
+            if on_files is not None and batch:
+                await on_files(batch)
+            if truncated:
+                break
 
-        files.append(DiscoveredFile(
-            path=str(file_path),
-            name=file_path.name,
-            extension=ext,
-            size_bytes=size,
-            modified_at=modified,
-            adapter_name=adapter_name,
-            is_supported=is_supported,
-        ))
+    files.sort(key=lambda f: f.path)
+
+    changes: DiscoveryChanges | None = None
+    if config.snapshot_path is not None:
+        options = _scan_options(config)
+        previous = await asyncio.to_thread(
+            _load_snapshot, config.snapshot_path, str(root.resolve()), options
+        )
+        changes = _diff_snapshot(previous, files)
+        if truncated:
+            # A partial listing would mark the rest of the tree as removed
+            changes.removed_files = []
+        else:
+            await asyncio.to_thread(
+                _save_snapshot, config.snapshot_path, str(root.resolve()), options, files
+            )
+        if config.only_changes:
+            reported = set(changes.new_files) | set(changes.changed_files)
+            files = [f for f in files if f.path in reported]
+
+    total_size = sum(f.size_bytes for f in files)
 
     # Compute deterministic ID
     discovery_id = compute_stage_id({
@@ -195,6 +405,7 @@ async def execute_discovery(
         unsupported_files=len(files) - supported_count,
         total_size_bytes=total_size,
         completed=True,
+        changes=changes,
     )
 
 
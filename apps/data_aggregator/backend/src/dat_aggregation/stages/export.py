@@ -53,24 +53,27 @@ async def execute_export(
     Returns:
         DataSetManifest for the created DataSet.
     """
-    data = parse_result.data
+    # Per ADR-0041: read parse output lazily so aggregation runs before the
+    # full dataset is materialized
+    lazy_data = parse_result.scan()
 
     # Apply aggregation if levels specified
     if aggregation_levels and len(aggregation_levels) > 0:
         # Group by aggregation levels and compute summary stats
         agg_exprs = []
-        for col in data.columns:
-            if col not in aggregation_levels:
-                dtype = data[col].dtype
-                if dtype in [pl.Float64, pl.Float32, pl.Int64, pl.Int32, pl.Int16, pl.Int8]:
-                    agg_exprs.extend([
-                        pl.col(col).mean().alias(f"{col}_mean"),
-                        pl.col(col).std().alias(f"{col}_std"),
-                        pl.col(col).count().alias(f"{col}_count"),
-                    ])
+        for col, dtype in lazy_data.collect_schema().items():
+            numeric = dtype in [pl.Float64, pl.Float32, pl.Int64, pl.Int32, pl.Int16, pl.Int8]
+            if col not in aggregation_levels and numeric:
+                agg_exprs.extend([
+                    pl.col(col).mean().alias(f"{col}_mean"),
+                    pl.col(col).std().alias(f"{col}_std"),
+                    pl.col(col).count().alias(f"{col}_count"),
+                ])
 
         if agg_exprs:
-            data = data.group_by(aggregation_levels).agg(agg_exprs)
+            lazy_data = lazy_data.group_by(aggregation_levels).agg(agg_exprs)
+
+    data = lazy_data.collect()
 
     # Compute deterministic DataSet ID
     dataset_id = compute_dataset_id(
@@ -4,10 +4,14 @@ Per ADR-0004: Parse uses profile defaults if context.json missing.
 Per ADR-0012: Profile-driven extraction via ProfileExecutor.
 Per ADR-0014: Cancellation preserves completed work, no partial data.
 Per ADR-0015: Output saved as Parquet.
-Per ADR-0041: Files >10MB use streaming.
+Per ADR-0041: Files >10MB use streaming; dataset output mode writes partitioned
+Parquet instead of one combined frame (chunk by chunk as files are read on the
+adapter path; profile-driven tables are still extracted in memory first).
 """
 import json
 import logging
+import os
+import shutil
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -16,14 +20,26 @@ from typing import Any
 import polars as pl
 
 from apps.data_aggregator.backend.adapters import create_default_registry
-from shared.contracts.dat.adapter import ReadOptions
+from shared.contracts.core.concurrency import ConcurrencyConfig
+from shared.contracts.dat.adapter import ReadOptions, StreamOptions
 from shared.contracts.dat.cancellation import (
     CancellationResult,
     CheckpointType,
 )
 
 from ..core.checkpoint_manager import CheckpointManager
-from ..profiles.context_extractor import ContextExtractor
+from ..core.file_cache import (
+    ParsedFileCache,
+    get_run_file_cache,
+    read_dataframe_cached,
+    release_run_file_cache,
+)
+from ..core.parquet_dataset import (
+    DEFAULT_PARTITION_COLUMNS,
+    PartitionedParquetWriter,
+    scan_parse_output,
+)
+from ..core.probe_cache import get_probe_cache, probe_schema_cached, with_detected_format
 from ..profiles.output_builder import OutputBuilder
 from ..profiles.population_strategies import apply_population_strategy
 from ..profiles.profile_executor import ProfileExecutor
@@ -37,6 +53,16 @@ STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024  # 10MB
 # Per ADR-0015: Parse always outputs Parquet
 OUTPUT_FORMAT = "parquet"
 
+# Parse output layouts: one combined Parquet file, or a partitioned dataset
+# directory written chunk by chunk
+OUTPUT_MODE_COMBINED = "combined"
+OUTPUT_MODE_DATASET = "dataset"
+
+# Per ADR-0041: in-memory budget for tables accumulated during profile
+# extraction before chunks spill to Parquet (override with the env var)
+DEFAULT_EXTRACTION_MEMORY_BUDGET_MB = 2048.0
+EXTRACTION_MEMORY_BUDGET_ENV = "ET_PARSE_MEMORY_BUDGET_MB"
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +75,13 @@ class ParseConfig:
     profile_id: str | None = None  # Profile for profile-driven extraction
     context_overrides: dict[str, Any] = field(default_factory=dict)
     use_profile_extraction: bool = True  # Per ADR-0012: Use ProfileExecutor when profile specified
+    # Per ADR-0013: >1 (or None = ET_MAX_PROCESSES) opts in to a process pool, in
+    # which each file sees only the base context, not earlier files' contexts
+    extraction_workers: int | None = 1
+    # Per ADR-0041: spill accumulated tables beyond this (None = env or default)
+    memory_budget_mb: float | None = None
+    output_mode: str = OUTPUT_MODE_COMBINED  # Per ADR-0041: "dataset" for partitioned output
+    partition_by: list[str] | None = None  # Dataset partition columns (None = lot_id, wafer_id)
 
 
 @dataclass
@@ -63,6 +96,42 @@ class ParseResult:
     output_path: str
     extracted_tables: dict[str, pl.DataFrame] | None = None  # ADR-0012: tables
     validation_summary: Any | None = None  # Validation results
+    dataset_path: str | None = None  # Set when rows live on disk; data is then schema-only
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazily read the parse output.
+
+        Returns:
+            LazyFrame over the on-disk dataset if there is one, else over data
+        """
+        if self.dataset_path:
+            return scan_parse_output(self.dataset_path)
+        return self.data.lazy()
+
+
+def parse_result_from_artifact(parse_artifact: dict[str, Any]) -> ParseResult:
+    """Rebuild a ParseResult from a locked parse artifact without loading rows.
+
+    The output (single file or dataset directory) is read lazily via
+    ParseResult.scan(); ``data`` only carries the schema.
+
+    Args:
+        parse_artifact: Parse stage artifact as stored by the run store.
+
+    Returns:
+        ParseResult backed by the on-disk parse output.
+    """
+    output_path = Path(parse_artifact["output_path"])
+    return ParseResult(
+        data=scan_parse_output(output_path).head(0).collect(),
+        row_count=parse_artifact["row_count"],
+        column_count=parse_artifact["column_count"],
+        source_files=parse_artifact["source_files"],
+        completed=True,
+        parse_id=parse_artifact["parse_id"],
+        output_path=str(output_path),
+        dataset_path=str(output_path),
+    )
 
 
 class CancellationToken:
@@ -79,6 +148,72 @@ class CancellationToken:
         return self._cancelled
 
 
+def _resolve_extraction_workers(config: ParseConfig) -> int:
+    """Resolve the worker process count for profile extraction.
+
+    Extraction is serial unless the config opts in: serial extraction lets
+    each file see the context accumulated from the files before it, which
+    pool workers cannot.
+
+    Args:
+        config: Parse configuration.
+
+    Returns:
+        ``extraction_workers`` (at least 1), or the ADR-0013 process cap
+        when it is None.
+    """
+    if config.extraction_workers is None:
+        return ConcurrencyConfig.from_env().max_processes
+    return max(1, config.extraction_workers)
+
+
+def _resolve_memory_budget_mb(config: ParseConfig) -> float:
+    """Resolve the extraction memory budget.
+
+    Args:
+        config: Parse configuration.
+
+    Returns:
+        ``memory_budget_mb`` if set, else ET_PARSE_MEMORY_BUDGET_MB, else
+        DEFAULT_EXTRACTION_MEMORY_BUDGET_MB.
+    """
+    if config.memory_budget_mb is not None:
+        return config.memory_budget_mb
+    return float(
+        os.environ.get(EXTRACTION_MEMORY_BUDGET_ENV, DEFAULT_EXTRACTION_MEMORY_BUDGET_MB)
+    )
+
+
+def _apply_column_mappings(
+    df: pl.DataFrame,
+    column_mappings: dict[str, str] | None,
+) -> pl.DataFrame:
+    """Rename columns per the parse config's column mappings."""
+    if not column_mappings:
+        return df
+    rename_map = {k: v for k, v in column_mappings.items() if k in df.columns}
+    return df.rename(rename_map) if rename_map else df
+
+
+def _open_dataset_writer(output_dir: Path, config: ParseConfig) -> PartitionedParquetWriter:
+    """Start a dataset in a scratch directory (renamed once the parse ID is known)."""
+    scratch = output_dir / ".parse_dataset.tmp"
+    shutil.rmtree(scratch, ignore_errors=True)
+    return PartitionedParquetWriter(
+        scratch,
+        partition_by=config.partition_by or DEFAULT_PARTITION_COLUMNS,
+    )
+
+
+def _finish_dataset(writer: PartitionedParquetWriter, output_dir: Path, parse_id: str) -> Path:
+    """Close a dataset and move it to its final ``<parse_id>/`` directory."""
+    writer.close()
+    dataset_path = output_dir / parse_id
+    shutil.rmtree(dataset_path, ignore_errors=True)
+    writer.root.rename(dataset_path)
+    return dataset_path
+
+
 def _load_context_with_fallback(
     run_id: str,
     workspace_path: Path,
@@ -139,6 +274,7 @@ async def _execute_profile_extraction(
     checkpoint_mgr: CheckpointManager,
     progress_callback: Callable[[float, str], None] | None = None,
     cancel_token: CancellationToken | None = None,
+    file_cache: ParsedFileCache | None = None,
 ) -> ParseResult | CancellationResult:
     """Execute profile-driven extraction per ADR-0012.
 
@@ -154,6 +290,8 @@ async def _execute_profile_extraction(
         checkpoint_mgr: Checkpoint manager for cancel-safe operations.
         progress_callback: Optional callback for progress updates.
         cancel_token: Optional token to check for cancellation.
+        file_cache: Optional run-scoped cache shared with table availability
+            and preview so each file is parsed once.
 
     Returns:
         ParseResult with extracted tables, or CancellationResult if cancelled.
@@ -168,25 +306,14 @@ async def _execute_profile_extraction(
             discarded_count=len(profile.get_all_tables()),
         )
 
-    # Per DESIGN §4: Extract context using 4-level priority
-    # Priority 1: User overrides, Priority 2: JSONPath, Priority 3: Regex, Priority 4: Defaults
-    context_extractor = ContextExtractor()
-    executor = ProfileExecutor()
-
-    for file_path in config.selected_files:
-        # Load file content for JSONPath extraction (Priority 2)
-        file_content = await executor._load_file(file_path, profile)
-
-        file_context = context_extractor.extract(
-            profile=profile,
-            file_path=file_path,
-            file_content=file_content,  # Now passing content for Priority 2
-            user_overrides=config.context_overrides,
-        )
-        context.update(file_context)
+    executor = ProfileExecutor(
+        max_workers=_resolve_extraction_workers(config),
+        memory_budget_mb=_resolve_memory_budget_mb(config),
+        file_cache=file_cache if file_cache is not None else ParsedFileCache(),
+    )
 
     if progress_callback:
-        progress_callback(10, "Context extracted, executing profile...")
+        progress_callback(10, "Executing profile...")
 
     # Get selected tables from config or use all
     selected_tables = None
@@ -196,12 +323,24 @@ async def _execute_profile_extraction(
         for tables in config.selected_tables.values():
             selected_tables.extend(tables)
 
-    extracted_tables = await executor.execute(
+    extraction = await executor.execute(
         profile=profile,
         files=config.selected_files,
         context=context,
         selected_tables=selected_tables,
+        cancel_token=cancel_token,
+        # Per DESIGN §4: context is extracted per file, in the same pass as its
+        # tables, using 4-level priority (user overrides, JSONPath, regex, defaults)
+        context_overrides=config.context_overrides,
     )
+    extracted_tables = extraction.tables
+    context.update(extraction.run_context)
+
+    if extraction.cancelled:
+        return checkpoint_mgr.complete_cancellation(
+            preserved_artifacts=[],
+            discarded_count=len(profile.get_all_tables()),
+        )
 
     if progress_callback:
         progress_callback(55, f"Extracted {len(extracted_tables)} tables, applying population...")
@@ -245,25 +384,12 @@ async def _execute_profile_extraction(
     if progress_callback:
         progress_callback(70, "Validation complete, applying transforms...")
 
-    # Apply transforms per DESIGN §6
+    # Apply transforms per DESIGN §6: normalization (NaN replacement, numeric
+    # coercion, row filters, units), renames, calculated columns and type
+    # coercion, compiled into one lazy plan per table
     transform_pipeline = TransformPipeline()
     for table_id, df in extracted_tables.items():
-        # 1. Apply normalization (NaN replacement, numeric coercion, row filters, units)
-        df = transform_pipeline.apply_normalization(df, profile)
-
-        # 2. Per DESIGN §6: Apply global column renames if defined
-        if hasattr(profile, 'column_renames') and profile.column_renames:
-            df = transform_pipeline.apply_column_renames(df, profile.column_renames)
-
-        # 3. Per DESIGN §6: Apply calculated columns if defined
-        if hasattr(profile, 'calculated_columns') and profile.calculated_columns:
-            df = transform_pipeline.apply_calculated_columns(df, profile.calculated_columns)
-
-        # 4. Per DESIGN §6: Apply type coercion if defined
-        if hasattr(profile, 'type_coercion') and profile.type_coercion:
-            df = transform_pipeline.apply_type_coercion(df, profile.type_coercion)
-
-        extracted_tables[table_id] = df
+        extracted_tables[table_id] = transform_pipeline.apply_profile_transforms(df, profile)
 
     if progress_callback:
         progress_callback(80, "Transforms applied, building outputs...")
@@ -276,9 +402,21 @@ async def _execute_profile_extraction(
         context=context,
     )
 
-    # Combine all tables (including profile outputs) for final result
+    output_dir = workspace_path / "tools" / "dat" / "runs" / run_id
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Combine all tables (including profile outputs) for final result; in
+    # dataset mode each table is written out instead of concatenated
     all_tables = {**extracted_tables, **profile_outputs}
-    combined = output_builder.combine_all_tables(all_tables, context)
+    writer: PartitionedParquetWriter | None = None
+    if config.output_mode == OUTPUT_MODE_DATASET:
+        writer = _open_dataset_writer(output_dir, config)
+        for chunk in output_builder.iter_combined_chunks(all_tables, context):
+            writer.write(chunk)
+        row_count = writer.row_count
+    else:
+        combined = output_builder.combine_all_tables(all_tables, context)
+        row_count = len(combined)
 
     # Compute parse ID
     from shared.utils.stage_id import compute_stage_id
@@ -290,20 +428,19 @@ async def _execute_profile_extraction(
             "profile_id": profile.profile_id,
             "files": sorted(source_files),
             "tables": sorted(extracted_tables.keys()),
-            "row_count": len(combined),
+            "row_count": row_count,
         },
         prefix="parse_",
     )
 
     # Save to workspace
-    output_dir = workspace_path / "tools" / "dat" / "runs" / run_id
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    output_path = output_dir / f"{parse_id}.parquet"
-    if not combined.is_empty():
-        combined.write_parquet(output_path)
+    dataset_path: Path | None = None
+    if writer is not None:
+        dataset_path = _finish_dataset(writer, output_dir, parse_id)
+        output_path = dataset_path
+        combined = scan_parse_output(dataset_path).head(0).collect()
     else:
-        # Write empty parquet with schema
+        output_path = output_dir / f"{parse_id}.parquet"
         combined.write_parquet(output_path)
 
     # Save individual tables as well
@@ -321,12 +458,12 @@ async def _execute_profile_extraction(
 
     logger.info(
         f"Profile extraction complete: {len(extracted_tables)} tables, "
-        f"{len(combined)} rows, validation={'PASS' if validation_summary.valid else 'WARN'}"
+        f"{row_count} rows, validation={'PASS' if validation_summary.valid else 'WARN'}"
     )
 
     return ParseResult(
         data=combined,
-        row_count=len(combined),
+        row_count=row_count,
         column_count=len(combined.columns),
         source_files=source_files,
         completed=True,
@@ -334,6 +471,7 @@ async def _execute_profile_extraction(
         output_path=str(output_path),
         extracted_tables=extracted_tables,
         validation_summary=validation_summary,
+        dataset_path=str(dataset_path) if dataset_path else None,
     )
 
 
@@ -361,6 +499,26 @@ async def execute_parse(
     Returns:
         ParseResult with combined data and metadata, or CancellationResult if cancelled.
     """
+    # Files parsed by earlier stages of this run are reused; parse is the
+    # last stage that reads sources, so the run cache is released afterwards
+    file_cache = get_run_file_cache(run_id)
+    try:
+        return await _execute_parse(
+            run_id, config, workspace_path, file_cache, progress_callback, cancel_token
+        )
+    finally:
+        release_run_file_cache(run_id)
+
+
+async def _execute_parse(
+    run_id: str,
+    config: ParseConfig,
+    workspace_path: Path,
+    file_cache: ParsedFileCache,
+    progress_callback: Callable[[float, str], None] | None,
+    cancel_token: CancellationToken | None,
+) -> ParseResult | CancellationResult:
+    """Body of execute_parse, reading sources through the run's file cache."""
     # Initialize checkpoint manager for cancel-safe operations per ADR-0014
     checkpoint_mgr = CheckpointManager(
         workspace_path=workspace_path,
@@ -397,10 +555,12 @@ async def execute_parse(
             checkpoint_mgr=checkpoint_mgr,
             progress_callback=progress_callback,
             cancel_token=cancel_token,
+            file_cache=file_cache,
         )
 
     # Legacy path: direct adapter reads (when no profile or profile extraction disabled)
     registry = create_default_registry()
+    probe_cache = get_probe_cache(workspace_path)
 
     all_dfs: list[pl.DataFrame] = []
     source_files: list[str] = []
@@ -416,7 +576,7 @@ async def execute_parse(
             # Get tables from adapter using async probe_schema
             adapter = registry.get_adapter_for_file(str(file_path))
             if adapter.metadata.capabilities.supports_multiple_sheets:
-                result = await adapter.probe_schema(str(file_path))
+                result = await probe_schema_cached(probe_cache, adapter, file_path)
                 tables = [s.sheet_name for s in result.sheets] if result.sheets else [file_path.name]
             else:
                 tables = [file_path.name]
@@ -424,10 +584,21 @@ async def execute_parse(
 
     total_tables = sum(len(tables) for tables in file_tables_map.values())
 
+    output_dir = workspace_path / "tools" / "dat" / "runs" / run_id
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Per ADR-0041: in dataset mode chunks go straight to disk instead of
+    # being held for one final concat
+    writer: PartitionedParquetWriter | None = None
+    if config.output_mode == OUTPUT_MODE_DATASET:
+        writer = _open_dataset_writer(output_dir, config)
+
     for i, file_path in enumerate(config.selected_files):
         # Check cancellation before each file (safe point per ADR-0014)
         if cancel_token and cancel_token.is_cancelled:
             logger.info(f"Cancellation detected at file boundary: {file_path.name}")
+            if writer is not None:
+                writer.abort()
             return checkpoint_mgr.complete_cancellation(
                 preserved_artifacts=completed_tables,
                 discarded_count=total_tables - tables_processed,
@@ -443,6 +614,8 @@ async def execute_parse(
             # Check cancellation before each table (safe point per ADR-0014)
             if cancel_token and cancel_token.is_cancelled:
                 logger.info(f"Cancellation detected at table boundary: {table}")
+                if writer is not None:
+                    writer.abort()
                 return checkpoint_mgr.complete_cancellation(
                     preserved_artifacts=completed_tables,
                     discarded_count=total_tables - tables_processed,
@@ -453,28 +626,45 @@ async def execute_parse(
             options = ReadOptions(extra={"sheet_name": table} if table != file_path.name else {})
 
             file_size = file_path.stat().st_size
-            if file_size > STREAMING_THRESHOLD_BYTES:
+            if (
+                file_size > STREAMING_THRESHOLD_BYTES
+                and adapter.metadata.capabilities.supports_streaming
+                and file_path.suffix.lower() != ".xls"
+            ):
                 # Stream large files in chunks per ADR-0041
                 logger.info(f"Streaming large file ({file_size / 1024 / 1024:.1f}MB): {file_path.name}")
+                # Reuse the encoding/delimiter detected when the file was probed
+                detected = with_detected_format(probe_cache, adapter, file_path, options)
+                stream_options = StreamOptions(chunk_size_rows=50000, extra=detected.extra)
                 chunks: list[pl.DataFrame] = []
-                async for chunk in adapter.stream_dataframe(str(file_path), options, chunk_size=50000):
+                table_rows = 0
+                table_cols: set[str] = set()
+                async for chunk, _ in adapter.stream_dataframe(str(file_path), stream_options):
                     if cancel_token and cancel_token.is_cancelled:
                         break
-                    chunks.append(chunk)
-                df = pl.concat(chunks) if chunks else pl.DataFrame()
+                    chunk = _apply_column_mappings(chunk, config.column_mappings)
+                    if writer is not None:
+                        writer.write(chunk)
+                        table_rows += chunk.height
+                        table_cols.update(chunk.columns)
+                    else:
+                        chunks.append(chunk)
+                if writer is None:
+                    df = pl.concat(chunks, how="diagonal_relaxed") if chunks else pl.DataFrame()
+                    all_dfs.append(df)
+                    table_rows, table_cols = len(df), set(df.columns)
             else:
                 # Eager load small files
-                df, _ = await adapter.read_dataframe(str(file_path), options)
+                df, _ = await read_dataframe_cached(file_cache, adapter, file_path, options)
 
-            # Apply column mappings if provided
-            if config.column_mappings:
-                rename_map = {
-                    k: v for k, v in config.column_mappings.items() if k in df.columns
-                }
-                if rename_map:
-                    df = df.rename(rename_map)
+                # Apply column mappings if provided
+                df = _apply_column_mappings(df, config.column_mappings)
+                if writer is not None:
+                    writer.write(df)
+                else:
+                    all_dfs.append(df)
+                table_rows, table_cols = len(df), set(df.columns)
 
-            all_dfs.append(df)
             table_ref = f"{file_path.name}:{table}"
             source_files.append(table_ref)
             completed_tables.append(table_ref)
@@ -486,12 +676,16 @@ async def execute_parse(
                 items_completed=tables_processed,
                 items_total=total_tables,
                 current_item=table_ref,
-                data_for_hash={"rows": len(df), "cols": len(df.columns)},
+                data_for_hash={"rows": table_rows, "cols": len(table_cols)},
                 metadata={"file": file_path.name, "table": table},
             )
 
     # Combine all DataFrames
-    combined = pl.concat(all_dfs, how="diagonal") if all_dfs else pl.DataFrame()
+    if writer is not None:
+        row_count = writer.row_count
+    else:
+        combined = pl.concat(all_dfs, how="diagonal") if all_dfs else pl.DataFrame()
+        row_count = len(combined)
 
     # Compute parse ID
     from shared.utils.stage_id import compute_stage_id
@@ -500,17 +694,20 @@ async def execute_parse(
         {
             "run_id": run_id,
             "files": sorted(source_files),
-            "row_count": len(combined),
+            "row_count": row_count,
         },
         prefix="parse_",
     )
 
     # Save to workspace
-    output_dir = workspace_path / "tools" / "dat" / "runs" / run_id
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    output_path = output_dir / f"{parse_id}.parquet"
-    combined.write_parquet(output_path)
+    dataset_path: Path | None = None
+    if writer is not None:
+        dataset_path = _finish_dataset(writer, output_dir, parse_id)
+        output_path = dataset_path
+        combined = scan_parse_output(dataset_path).head(0).collect()
+    else:
+        output_path = output_dir / f"{parse_id}.parquet"
+        combined.write_parquet(output_path)
 
     # Mark operation complete
     checkpoint_mgr.complete_operation()
@@ -520,10 +717,11 @@ async def execute_parse(
 
     return ParseResult(
         data=combined,
-        row_count=len(combined),
+        row_count=row_count,
         column_count=len(combined.columns),
         source_files=source_files,
         completed=True,
         parse_id=parse_id,
         output_path=str(output_path),
+        dataset_path=str(dataset_path) if dataset_path else None,
     )
@@ -11,6 +11,7 @@ import polars as pl
 
 from shared.utils.stage_id import compute_stage_id
 
+from ..core.file_cache import get_run_file_cache, read_dataframe_cached
 from .context import ContextConfig, apply_context_to_dataframe
 from .table_selection import TableSelectionResult, get_selected_file_table_map
 
@@ -67,6 +68,8 @@ async def execute_preview(
     from shared.contracts.dat.adapter import ReadOptions
 
     registry = create_default_registry()
+    # Reads are shared with table availability and parse of the same run
+    file_cache = get_run_file_cache(run_id)
     file_table_map = get_selected_file_table_map(table_selection)
     previews: list[TablePreview] = []
     total_rows = 0
@@ -78,9 +81,16 @@ async def execute_preview(
 
         for table_name in table_names:
             try:
-                # Read the table using async adapter.read_dataframe
+                # Per ADR-0041: read only the preview rows; the row count
+                # comes from a metadata probe instead of a full read
                 options = ReadOptions(extra={"sheet_name": table_name} if table_name != file_path.name else {})
-                df, _ = await adapter.read_dataframe(file_path_str, options)
+                sample_options = options.model_copy(
+                    update={"row_limit": max(1, config.max_rows_per_table)}
+                )
+                df, _ = await read_dataframe_cached(
+                    file_cache, adapter, file_path_str, sample_options
+                )
+                shape = await adapter.probe_shape(file_path_str, options)
 
                 # Apply context configuration if provided
                 if context_config:
@@ -92,19 +102,19 @@ async def execute_preview(
                 # Compute stats if requested
                 stats = None
                 if config.include_stats:
-                    stats = _compute_table_stats(df)
+                    stats = _compute_table_stats(preview_df, row_count=shape.row_count)
 
                 previews.append(TablePreview(
                     file_path=file_path_str,
                     table_name=table_name,
                     columns=df.columns,
                     dtypes=[str(df[col].dtype) for col in df.columns],
-                    row_count=len(df),
+                    row_count=shape.row_count,
                     preview_rows=preview_df.to_dicts(),
                     stats=stats,
                 ))
 
-                total_rows += len(df)
+                total_rows += shape.row_count
                 all_columns.update(df.columns)
 
             except Exception as e:
@@ -139,10 +149,17 @@ async def execute_preview(
     )
 
 
-def _compute_table_stats(df: pl.DataFrame) -> dict[str, Any]:
-    """Compute basic statistics for a DataFrame."""
+def _compute_table_stats(df: pl.DataFrame, row_count: int | None = None) -> dict[str, Any]:
+    """Compute basic statistics for a DataFrame.
+
+    Args:
+        df: Rows to summarize (the preview sample).
+        row_count: Rows in the whole table, if known; null counts and
+            numeric summaries describe the ``sample_rows`` of ``df`` only.
+    """
     stats: dict[str, Any] = {
-        "row_count": len(df),
+        "row_count": len(df) if row_count is None else row_count,
+        "sample_rows": len(df),
         "column_count": len(df.columns),
         "null_counts": {},
         "numeric_summary": {},
@@ -4,6 +4,8 @@ from pathlib import Path
 
 from apps.data_aggregator.backend.adapters import create_default_registry
 
+from ..core.probe_cache import ProbeCache, probe_schema_cached
+
 
 @dataclass
 class FileInfo:
@@ -23,14 +25,20 @@ class SelectionResult:
     completed: bool = True
 
 
-async def _get_tables_for_file(adapter, file_path: Path) -> list[str]:
+async def _get_tables_for_file(
+    adapter,
+    file_path: Path,
+    probe_cache: ProbeCache | None = None,
+) -> list[str]:
     """Get tables/sheets from a file using async probe_schema.
     
     For multi-sheet formats (Excel), returns sheet names.
-    For single-table formats, returns the filename.
+    For single-table formats, returns the filename without probing.
+
+    With a probe cache, sheet lists of unchanged files are not probed again.
     """
     if adapter.metadata.capabilities.supports_multiple_sheets:
-        result = await adapter.probe_schema(str(file_path))
+        result = await probe_schema_cached(probe_cache, adapter, file_path)
         if result.sheets:
             return [sheet.sheet_name for sheet in result.sheets]
     return [file_path.name]
@@ -39,12 +47,14 @@ async def _get_tables_for_file(adapter, file_path: Path) -> list[str]:
 async def discover_files(
     source_paths: list[Path],
     recursive: bool = True,
+    probe_cache: ProbeCache | None = None,
 ) -> list[FileInfo]:
     """Discover supported files in source paths.
     
     Args:
         source_paths: List of paths to search (files or directories)
         recursive: Whether to search recursively in directories
+        probe_cache: Optional workspace probe cache for sheet lists
         
     Returns:
         List of discovered file information
@@ -62,7 +72,7 @@ async def discover_files(
         if source.is_file():
             if source.suffix.lower() in supported:
                 adapter = registry.get_adapter_for_file(str(source))
-                tables = await _get_tables_for_file(adapter, source)
+                tables = await _get_tables_for_file(adapter, source, probe_cache)
                 discovered.append(FileInfo(
                     path=source,
                     name=source.name,
@@ -76,7 +86,7 @@ async def discover_files(
                 if file_path.is_file() and file_path.suffix.lower() in supported:
                     try:
                         adapter = registry.get_adapter_for_file(str(file_path))
-                        tables = await _get_tables_for_file(adapter, file_path)
+                        tables = await _get_tables_for_file(adapter, file_path, probe_cache)
                         discovered.append(FileInfo(
                             path=file_path,
                             name=file_path.name,
@@ -95,6 +105,7 @@ async def execute_selection(
     source_paths: list[Path],
     selected_files: list[Path] | None = None,
     recursive: bool = True,
+    probe_cache: ProbeCache | None = None,
 ) -> SelectionResult:
     """Execute selection stage.
     
@@ -102,11 +113,12 @@ async def execute_selection(
         source_paths: Paths to search for files
         selected_files: Optional pre-selected files
         recursive: Whether to search recursively
+        probe_cache: Optional workspace probe cache for sheet lists
         
     Returns:
         SelectionResult with discovered and selected files
     """
-    discovered = await discover_files(source_paths, recursive)
+    discovered = await discover_files(source_paths, recursive, probe_cache)
 
     if selected_files is None:
         # Default: select all discovered files
@@ -7,11 +7,14 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from apps.data_aggregator.backend.services.table_probe import probe_file_shapes
 from shared.contracts.dat.table_status import (
     TableAvailabilityStatus,
 )
 from shared.utils.stage_id import compute_stage_id
 
+from ..core.probe_cache import ProbeCache
+
 
 class TableInfo(BaseModel):
     """Information about a single table during availability scan.
@@ -43,6 +46,7 @@ async def execute_table_availability(
     run_id: str,
     selected_files: list[Path],
     expected_columns: list[str] | None = None,
+    probe_cache: ProbeCache | None = None,
 ) -> TableAvailabilityResult:
     """Probe available tables from selected files.
 
@@ -55,76 +59,69 @@ async def execute_table_availability(
         expected_columns: Optional list of expected column names.
             If provided, tables missing any of these columns will be
             marked as PARTIAL status per ADR-0008.
+        probe_cache: Optional workspace probe cache; counts of unchanged
+            files are reused instead of probing them again.
 
     Returns:
         TableAvailabilityResult with discovered tables.
     """
     from apps.data_aggregator.backend.adapters import create_default_registry
-    from shared.contracts.dat.adapter import ReadOptions
 
-    registry = create_default_registry()
+    # Counts come from metadata-only shape probes, files probed concurrently
+    shapes = await probe_file_shapes(
+        create_default_registry(),
+        [str(file_path) for file_path in selected_files],
+        probe_cache=probe_cache,
+    )
     tables: list[TableInfo] = []
 
-    for file_path in selected_files:
-        try:
-            adapter = registry.get_adapter_for_file(str(file_path))
-
-            # Get table names using async probe_schema
-            if adapter.metadata.capabilities.supports_multiple_sheets:
-                probe_result = await adapter.probe_schema(str(file_path))
-                table_names = [s.sheet_name for s in probe_result.sheets] if probe_result.sheets else [file_path.name]
-            else:
-                table_names = [file_path.name]
-
-            for table_name in table_names:
-                try:
-                    # Try to read a sample to get metadata using async adapter
-                    options = ReadOptions(extra={"sheet_name": table_name} if table_name != file_path.name else {})
-                    df, _ = await adapter.read_dataframe(str(file_path), options)
-
-                    # Determine status per ADR-0008 using shared contracts
-                    if len(df) == 0:
-                        status = TableAvailabilityStatus.FAILED
-                        missing_cols: list[str] = []
-                    elif expected_columns:
-                        # Check for missing expected columns per ADR-0008
-                        actual_cols = set(df.columns)
-                        missing_cols = [
-                            col for col in expected_columns if col not in actual_cols
-                        ]
-                        if missing_cols:
-                            status = TableAvailabilityStatus.PARTIAL
-                        else:
-                            status = TableAvailabilityStatus.AVAILABLE
-                    else:
-                        status = TableAvailabilityStatus.AVAILABLE
-                        missing_cols = []
-
-                    tables.append(TableInfo(
-                        file_path=str(file_path),
-                        table_name=table_name,
-                        status=status,
-                        row_count=len(df),
-                        column_count=len(df.columns),
-                        columns=list(df.columns),
-                        missing_columns=missing_cols,
-                    ))
-                except Exception as e:
-                    tables.append(TableInfo(
-                        file_path=str(file_path),
-                        table_name=table_name,
-                        status=TableAvailabilityStatus.FAILED,
-                        error_message=str(e),
-                    ))
-
-        except ValueError as e:
+    for entry in shapes:
+        if entry.table_name is None:
             # No adapter found for file
             tables.append(TableInfo(
-                file_path=str(file_path),
+                file_path=entry.file_path,
                 table_name="<unknown>",
                 status=TableAvailabilityStatus.FAILED,
-                error_message=f"Unsupported file format: {e}",
+                error_message=f"Unsupported file format: {entry.error}",
             ))
+            continue
+
+        if entry.shape is None:
+            tables.append(TableInfo(
+                file_path=entry.file_path,
+                table_name=entry.table_name,
+                status=TableAvailabilityStatus.FAILED,
+                error_message=entry.error,
+            ))
+            continue
+
+        shape = entry.shape
+        # Determine status per ADR-0008 using shared contracts
+        missing_cols: list[str] = []
+        if shape.row_count == 0:
+            status = TableAvailabilityStatus.FAILED
+        elif expected_columns:
+            # Check for missing expected columns per ADR-0008
+            actual_cols = set(shape.columns)
+            missing_cols = [
+                col for col in expected_columns if col not in actual_cols
+            ]
+            if missing_cols:
+                status = TableAvailabilityStatus.PARTIAL
+            else:
+                status = TableAvailabilityStatus.AVAILABLE
+        else:
+            status = TableAvailabilityStatus.AVAILABLE
+
+        tables.append(TableInfo(
+            file_path=entry.file_path,
+            table_name=entry.table_name,
+            status=status,
+            row_count=shape.row_count,
+            column_count=shape.column_count,
+            columns=shape.columns,
+            missing_columns=missing_cols,
+        ))
 
     # Compute deterministic ID
     availability_inputs = {
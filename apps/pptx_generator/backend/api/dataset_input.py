@@ -72,28 +72,25 @@ async def load_from_dataset(
         # Use default workspace - in production this would be configured
         store = ArtifactStore()
 
-        if not store.dataset_exists(request.dataset_id):
+        if not await store.dataset_exists(request.dataset_id):
             raise_not_found("DataSet", request.dataset_id)
 
-        # Read the dataset
-        df, manifest = store.read_dataset(request.dataset_id)
+        # The manifest has everything needed here; rows are read (projected)
+        # from the Parquet file only at generation time
+        manifest = await store.get_manifest(request.dataset_id)
+        parquet_path = store.get_dataset_path(request.dataset_id) / "data.parquet"
 
         # Create a DataFile record for this dataset
         data_file = DataFile(
             project_id=project_id,
             filename=f"{manifest.name}.parquet",
-            file_path=str(store.get_dataset_paths(request.dataset_id)[0]),
-            file_size=0,  # Will be updated
+            file_path=str(parquet_path),
+            file_size=parquet_path.stat().st_size if parquet_path.exists() else 0,
             file_type="parquet",
             row_count=manifest.row_count,
             column_names=[col.name for col in manifest.columns],
         )
 
-        # Get actual file size
-        parquet_path = store.get_dataset_paths(request.dataset_id)[0]
-        if parquet_path.exists():
-            data_file.file_size = parquet_path.stat().st_size
-
         # Store the data file record
         data_files_db[data_file.id] = data_file
 
@@ -147,10 +144,10 @@ async def get_dataset_info(project_id: UUID) -> dict | None:
         from shared.storage.artifact_store import ArtifactStore
 
         store = ArtifactStore()
-        if not store.dataset_exists(source_dataset_id):
+        if not await store.dataset_exists(source_dataset_id):
             return {"dataset_id": source_dataset_id, "status": "not_found"}
 
-        _, manifest = store.read_dataset(source_dataset_id)
+        manifest = await store.get_manifest(source_dataset_id)
 
         return {
             "dataset_id": source_dataset_id,
@@ -225,6 +225,7 @@ async def generate_presentation(request: GenerationRequest) -> GenerationRespons
             Path(data_file.file_path),
             mappings_list,
             domain_knowledge,
+            template_columns=presentation_generator.template_columns(Path(template.file_path)),
         )
         logger.info(f"[GENERATION] Data prepared: {len(prepared_data)} records")
 
@@ -249,7 +250,7 @@ async def generate_presentation(request: GenerationRequest) -> GenerationRespons
         render_result.progress_message = "Rendering presentation"
         render_result.progress_pct = 50.0
 
-        await presentation_generator.generate_presentation(
+        shape_results = await presentation_generator.generate_presentation(
             Path(template.file_path),
             prepared_data,
             output_path,
@@ -260,6 +261,8 @@ async def generate_presentation(request: GenerationRequest) -> GenerationRespons
         render_result.state = RenderStageState.COMPLETED
         render_result.completed_at = datetime.utcnow()
         render_result.output_path = str(output_path)
+        render_result.shape_results = shape_results
+        render_result.total_shapes_rendered = sum(r.success for r in shape_results)
         render_result.progress_pct = 100.0
         render_result.progress_message = "Complete"
         if output_path.exists():
@@ -4,13 +4,16 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from pptx.shapes.base import BaseShape
 
 from apps.pptx_generator.backend.core.shape_name_parser import ParsedShapeNameV2
 
+if TYPE_CHECKING:
+    from apps.pptx_generator.backend.renderers.data_index import RenderDataIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +28,7 @@ class RenderContext:
         shape_data: Filtered/aggregated data specific to this shape.
         output_dir: Directory for temporary files (plots, images).
         metadata: Additional metadata (run info, etc.).
+        data_index: Per-generation index over data for filters/aggregations.
     """
 
     shape: BaseShape
@@ -33,6 +37,7 @@ class RenderContext:
     shape_data: pd.DataFrame | None = None
     output_dir: Path | None = None
     metadata: dict[str, Any] | None = None
+    data_index: "RenderDataIndex | None" = None
 
 
 class BaseRenderer(ABC):
@@ -75,16 +80,22 @@ class BaseRenderer(ABC):
         self,
         data: pd.DataFrame,
         parsed_name: ParsedShapeNameV2,
+        index: "RenderDataIndex | None" = None,
     ) -> pd.DataFrame:
         """Filter data based on shape filters.
 
         Args:
             data: Full dataset.
             parsed_name: Parsed shape name with filters.
+            index: Data index for ``data``; when given, the (shared,
+                read-only) slice is taken from it instead of rescanning.
 
         Returns:
             Filtered DataFrame.
         """
+        if index is not None and index.data is data:
+            return index.filter(parsed_name.filters)
+
         filtered = data.copy()
 
         self.logger.debug(f"Filtering data with {len(filtered)} rows")
@@ -122,6 +133,7 @@ class BaseRenderer(ABC):
         grouping: str | list[str],
         metrics: list[str],
         agg_func: str = "mean",
+        index: "RenderDataIndex | None" = None,
     ) -> pd.DataFrame:
         """Aggregate data by grouping dimensions.
 
@@ -130,6 +142,7 @@ class BaseRenderer(ABC):
             grouping: Grouping pattern (e.g., 'by_side', 'by_wafer') or list of columns.
             metrics: List of metric columns to aggregate.
             agg_func: Aggregation function ('mean', 'sum', 'count', etc.).
+            index: Data index; aggregations of its slices are memoized.
 
         Returns:
             Aggregated DataFrame.
@@ -144,7 +157,18 @@ class BaseRenderer(ABC):
         if not group_cols or not metrics:
             return data
 
-        # Perform aggregation
+        if index is not None:
+            return index.aggregate(data, group_cols, metrics, agg_func, self._aggregate)
+        return self._aggregate(data, group_cols, metrics, agg_func)
+
+    def _aggregate(
+        self,
+        data: pd.DataFrame,
+        group_cols: list[str],
+        metrics: list[str],
+        agg_func: str,
+    ) -> pd.DataFrame:
+        """Group data by existing columns and aggregate metrics."""
         try:
             aggregated = data.groupby(group_cols)[metrics].agg(agg_func).reset_index()
             return aggregated
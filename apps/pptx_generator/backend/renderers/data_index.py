@@ -0,0 +1,170 @@
+"""Per-generation data index for shape filters.
+
+Templates typically have many shapes filtering the same few columns
+(side, wafer, ...) to the same few values. RenderDataIndex is built once per
+generation from the filter columns referenced by the template's shape
+names: string columns are partitioned into row positions per lowercased
+value in a single Polars group_by, and each filter combination is sliced
+from the data once and shared by every shape that uses it. Aggregations of
+those slices are memoized too.
+
+Frames returned by the index are shared between shapes and must be treated
+as read-only.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# Filter values that mean "do not filter on this column"
+INCLUDE_ALL_VALUES = ("both", "all", "any")
+
+_ROW = "__row"
+_KEY = "__key"
+
+
+class RenderDataIndex:
+    """Pre-grouped row positions and memoized slices of one generation's data.
+
+    Matches BaseRenderer.filter_data semantics: string values of object
+    columns compare case-insensitively, other columns by equality, filters on
+    missing columns are ignored and "both"/"all"/"any" mean no filter.
+    """
+
+    def __init__(self, data: pd.DataFrame, filter_columns: Iterable[str]) -> None:
+        """Build the index.
+
+        Args:
+            data: Full dataset for the generation.
+            filter_columns: Columns referenced by shape filters.
+        """
+        self.data = data
+        self._partitions: dict[str, dict[str, np.ndarray]] = {}
+        self._positions: dict[tuple[str, Any], np.ndarray] = {}
+        self._slices: dict[tuple, pd.DataFrame] = {}
+        self._slice_keys: dict[int, tuple] = {id(data): ()}
+        self._aggregates: dict[tuple, pd.DataFrame] = {}
+
+        string_columns = [
+            col for col in dict.fromkeys(filter_columns)
+            if col in data.columns and data[col].dtype == "object"
+        ]
+        for col in string_columns:
+            self._partitions[col] = self._partition(data[col])
+
+        logger.debug(
+            f"Indexed {len(string_columns)} filter columns over {len(data)} rows"
+        )
+
+    @staticmethod
+    def _partition(column: pd.Series) -> dict[str, np.ndarray]:
+        """Row positions per lowercased string value of an object column."""
+        values = pl.Series(
+            _KEY,
+            [v if isinstance(v, str) else None for v in column],
+            dtype=pl.String,
+        )
+        groups = (
+            pl.DataFrame({_KEY: values.str.to_lowercase()})
+            .with_row_index(_ROW)
+            .drop_nulls(_KEY)
+            .group_by(_KEY)
+            .agg(pl.col(_ROW))
+        )
+        return {
+            key: np.asarray(rows, dtype=np.int64)
+            for key, rows in zip(groups[_KEY], groups[_ROW].to_list(), strict=True)
+        }
+
+    def _filter_key(self, filters: dict[str, Any]) -> tuple:
+        """Normalized, order-independent key of the filters that apply."""
+        key = []
+        for name, value in filters.items():
+            if name not in self.data.columns:
+                continue
+            if isinstance(value, str) and value.lower() in INCLUDE_ALL_VALUES:
+                continue
+            if name in self._partitions and isinstance(value, str):
+                value = value.lower()
+            key.append((name, value))
+        return tuple(sorted(key, key=lambda item: (item[0], repr(item[1]))))
+
+    def _column_positions(self, name: str, value: Any) -> np.ndarray:
+        """Sorted row positions matching one filter."""
+        partition = self._partitions.get(name)
+        if partition is not None and isinstance(value, str):
+            return partition.get(value, np.empty(0, dtype=np.int64))
+
+        cache_key = (name, value)
+        positions = self._positions.get(cache_key)
+        if positions is None:
+            positions = np.flatnonzero((self.data[name] == value).to_numpy())
+            self._positions[cache_key] = positions
+        return positions
+
+    def filter(self, filters: dict[str, Any]) -> pd.DataFrame:
+        """Rows matching all filters, sliced once per distinct combination.
+
+        Args:
+            filters: Parsed shape filters (column -> value).
+
+        Returns:
+            Shared read-only DataFrame (the full data if nothing applies).
+        """
+        key = self._filter_key(filters)
+        if not key:
+            return self.data
+
+        sliced = self._slices.get(key)
+        if sliced is None:
+            positions = None
+            for name, value in key:
+                column_positions = self._column_positions(name, value)
+                positions = (
+                    column_positions
+                    if positions is None
+                    else np.intersect1d(positions, column_positions, assume_unique=True)
+                )
+            sliced = self.data.iloc[positions]
+            self._slices[key] = sliced
+            self._slice_keys[id(sliced)] = key
+        return sliced
+
+    def aggregate(
+        self,
+        data: pd.DataFrame,
+        group_cols: list[str],
+        metrics: list[str],
+        agg_func: str,
+        compute: Callable[[pd.DataFrame, list[str], list[str], str], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Memoized aggregation of a frame produced by this index.
+
+        Frames the index did not produce are aggregated without memoizing.
+
+        Args:
+            data: Frame returned by filter() (or the full data).
+            group_cols: Grouping columns.
+            metrics: Metric columns.
+            agg_func: Aggregation function name.
+            compute: Function performing the aggregation.
+
+        Returns:
+            Aggregated DataFrame (shared, read-only when memoized).
+        """
+        slice_key = self._slice_keys.get(id(data))
+        if slice_key is None:
+            return compute(data, group_cols, metrics, agg_func)
+
+        key = (slice_key, tuple(group_cols), tuple(metrics), agg_func)
+        aggregated = self._aggregates.get(key)
+        if aggregated is None:
+            aggregated = compute(data, group_cols, metrics, agg_func)
+            self._aggregates[key] = aggregated
+        return aggregated
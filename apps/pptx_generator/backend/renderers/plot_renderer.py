@@ -1,19 +1,21 @@
 """Plot renderer for generating and inserting visualizations.
 
 Per ADR-0029: Renderers consume shared RenderSpec contracts.
+
+Figures are built with the object-oriented matplotlib Figure API (no pyplot
+global state), so plot images can be generated in worker threads or
+processes and inserted into the slide afterwards.
 """
 
 import io
 import logging
+from dataclasses import dataclass
 from typing import Any
 from uuid import uuid4
 
-import matplotlib
-
-matplotlib.use("Agg")  # Non-interactive backend
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 
 from apps.pptx_generator.backend.core.shape_name_parser import ParsedShapeNameV2
 from apps.pptx_generator.backend.renderers.base import BaseRenderer, RenderContext
@@ -27,6 +29,35 @@ from shared.contracts.core.rendering import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PlotJob:
+    """Everything needed to build one plot image, independent of the slide.
+
+    Attributes:
+        data: Filtered data for the shape.
+        metrics: Metric columns to plot.
+        plot_type: Renderer type (line, bar, contour, ...).
+        parsed_name: Parsed shape name (options for layout and labels).
+    """
+
+    data: pd.DataFrame
+    metrics: list[str]
+    plot_type: str
+    parsed_name: ParsedShapeNameV2
+
+
+def generate_plot_image(job: PlotJob) -> bytes | None:
+    """Build the PNG for a plot job.
+
+    Module-level so it can be pickled for the spawn start method (ADR-0013).
+
+    Returns:
+        PNG bytes, or None if the plot could not be generated.
+    """
+    stream = PlotRenderer()._generate_plot(job.data, job.metrics, job.plot_type, job.parsed_name)
+    return stream.getvalue() if stream else None
+
+
 class PlotRenderer(BaseRenderer):
     """Renderer for plot shapes that generate and insert visualizations."""
 
@@ -48,6 +79,31 @@ class PlotRenderer(BaseRenderer):
         Args:
             context: Rendering context.
         """
+        job = self.prepare(context)
+        if job is None:
+            return
+
+        image_stream = self._generate_plot(job.data, job.metrics, job.plot_type, job.parsed_name)
+
+        if image_stream:
+            self.insert(context, image_stream.getvalue())
+        else:
+            self.logger.error(f"[PLOT] CRITICAL: Failed to generate plot for {context.shape.name}")
+            self.logger.error(
+                f"[PLOT] Plot type: {job.plot_type}, Metrics: {job.metrics}, "
+                f"Data rows: {len(job.data)}"
+            )
+
+    def prepare(self, context: RenderContext) -> PlotJob | None:
+        """Filter data and resolve metrics for a plot shape.
+
+        Args:
+            context: Rendering context.
+
+        Returns:
+            PlotJob ready for generate_plot_image, or None if there is
+            nothing to plot.
+        """
         shape = context.shape
         parsed_name = context.parsed_name
         data = context.data
@@ -58,7 +114,7 @@ class PlotRenderer(BaseRenderer):
         self.logger.info(f"[PLOT] Renderer: {parsed_name.renderer}, Filters: {parsed_name.filters}")
 
         # Filter data based on filters
-        filtered_data = self.filter_data(data, parsed_name)
+        filtered_data = self.filter_data(data, parsed_name, index=context.data_index)
 
         if filtered_data.empty:
             self.logger.error(f"[PLOT] CRITICAL: Filtered data is EMPTY for {shape.name}")
@@ -89,30 +145,28 @@ class PlotRenderer(BaseRenderer):
             else:
                 self.logger.error(f"[PLOT] CRITICAL: Metric '{metric}' NOT FOUND in filtered data!")
 
-        # Generate plot based on renderer type
         plot_type = parsed_name.renderer
         self.logger.info(f"[PLOT] Generating {plot_type} plot for {shape.name}")
-
-        image_stream = self._generate_plot(
-            filtered_data,
-            metrics,
-            plot_type,
-            parsed_name,
+        return PlotJob(
+            data=filtered_data,
+            metrics=metrics,
+            plot_type=plot_type,
+            parsed_name=parsed_name,
         )
 
-        if image_stream:
-            self.logger.info(
-                f"[PLOT] Plot generated successfully, stream size: {image_stream.getbuffer().nbytes} bytes"
-            )
-            self.logger.info(f"[PLOT] Inserting image for {shape.name}")
-            # Insert image into shape
-            self._insert_image(shape, image_stream)
-            self.logger.info(f"[PLOT] Successfully rendered {plot_type} plot into {shape.name}")
-        else:
-            self.logger.error(f"[PLOT] CRITICAL: Failed to generate plot for {shape.name}")
-            self.logger.error(
-                f"[PLOT] Plot type: {plot_type}, Metrics: {metrics}, Data rows: {len(filtered_data)}"
-            )
+    def insert(self, context: RenderContext, image: bytes) -> None:
+        """Insert a generated plot image into the context's shape.
+
+        Args:
+            context: Rendering context.
+            image: PNG bytes from generate_plot_image.
+        """
+        shape_name = context.shape.name
+        self.logger.info(f"[PLOT] Inserting image for {shape_name} ({len(image)} bytes)")
+        self._insert_image(context.shape, io.BytesIO(image))
+        self.logger.info(
+            f"[PLOT] Successfully rendered {context.parsed_name.renderer} plot into {shape_name}"
+        )
 
     def _get_metrics(
         self,
@@ -214,9 +268,8 @@ class PlotRenderer(BaseRenderer):
 
             # Save to BytesIO
             image_stream = io.BytesIO()
-            plt.tight_layout()
-            plt.savefig(image_stream, format="png", dpi=self._get_dpi(), bbox_inches="tight")
-            plt.close(fig)
+            fig.tight_layout()
+            fig.savefig(image_stream, format="png", dpi=self._get_dpi(), bbox_inches="tight")
 
             image_stream.seek(0)
             return image_stream
@@ -237,13 +290,9 @@ class PlotRenderer(BaseRenderer):
         """
         n_metrics = len(metrics)
 
-        if n_metrics == 1:
-            fig, ax = plt.subplots(figsize=(8, 6))
-            return fig, [ax]
-
-        if layout_option == "overlay":
-            fig, ax = plt.subplots(figsize=(8, 6))
-            return fig, [ax]
+        if n_metrics == 1 or layout_option == "overlay":
+            fig = Figure(figsize=(8, 6))
+            return fig, fig.subplots()
 
         if layout_option == "stack" or layout_option is None:
             rows, cols = n_metrics, 1
@@ -261,8 +310,8 @@ class PlotRenderer(BaseRenderer):
         else:
             rows, cols = n_metrics, 1
 
-        fig, axes = plt.subplots(rows, cols, figsize=(8 * cols, 6 * rows))
-        axes = np.atleast_1d(axes).flatten()
+        fig = Figure(figsize=(8 * cols, 6 * rows))
+        axes = np.atleast_1d(fig.subplots(rows, cols)).flatten()
         return fig, axes
 
     def _plot_line(self, ax: Any, data: pd.DataFrame, metrics: list[str]) -> None:
@@ -331,7 +380,7 @@ class PlotRenderer(BaseRenderer):
                 Z = pivot.values
 
                 contour = ax.contourf(X, Y, Z, levels=15, cmap=self._get_colormap())
-                plt.colorbar(contour, ax=ax, label=metrics[0])
+                ax.figure.colorbar(contour, ax=ax, label=metrics[0])
                 ax.set_xlabel("Image Column")
                 ax.set_ylabel("Image Row")
                 self.logger.info("[PLOT_CONTOUR] Contour plot generated successfully")
@@ -355,7 +404,7 @@ class PlotRenderer(BaseRenderer):
                     values=metrics[0], index="imrow", columns="imcol", aggfunc="mean"
                 )
                 im = ax.imshow(pivot.values, cmap=self._get_colormap(), aspect="auto")
-                plt.colorbar(im, ax=ax, label=metrics[0])
+                ax.figure.colorbar(im, ax=ax, label=metrics[0])
                 ax.set_xlabel("Image Column")
                 ax.set_ylabel("Image Row")
             except Exception as e:
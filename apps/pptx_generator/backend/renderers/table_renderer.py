@@ -68,7 +68,7 @@ class TableRenderer(BaseRenderer):
             return
 
         # Filter and aggregate data
-        filtered_data = self.filter_data(data, parsed_name)
+        filtered_data = self.filter_data(data, parsed_name, index=context.data_index)
 
         # Get metrics to display
         metrics = self._get_metrics(parsed_name, filtered_data)
@@ -78,7 +78,9 @@ class TableRenderer(BaseRenderer):
 
         # Aggregate if needed
         if group_cols:
-            table_data = self.aggregate_data(filtered_data, group_cols, metrics, agg_func="mean")
+            table_data = self.aggregate_data(
+                filtered_data, group_cols, metrics, agg_func="mean", index=context.data_index
+            )
         else:
             table_data = (
                 filtered_data[group_cols + metrics] if group_cols else filtered_data[metrics]
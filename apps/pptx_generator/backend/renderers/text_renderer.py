@@ -105,7 +105,7 @@ class KPIRenderer(BaseRenderer):
             return
 
         # Filter data based on parameters
-        filtered_data = self.filter_data(data, parsed_name)
+        filtered_data = self.filter_data(data, parsed_name, index=context.data_index)
 
         # Calculate KPI value
         value = self._calculate_kpi(filtered_data, parsed_name)
@@ -1,11 +1,22 @@
 """Data processor service for handling user data files."""
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import polars as pl
 import yaml
 
+# Rows parsed per chunk when counting CSV rows
+ROW_COUNT_CHUNK_SIZE = 100_000
+
+
+def _normalize_column(name: str) -> str:
+    """Column name as it appears in generation records."""
+    name = name.lower().replace(" ", "_")
+    return name.replace("imagecolumn", "imcol").replace("imagerow", "imrow")
+
 
 class DataProcessorService:
     """
@@ -14,12 +25,18 @@ class DataProcessorService:
     Handles reading, parsing, and transforming data from various file formats.
     """
 
-    async def read_data_file(self, file_path: Path) -> pd.DataFrame:
+    async def read_data_file(
+        self,
+        file_path: Path,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
         """
         Read a data file and return as a pandas DataFrame.
 
         Args:
-            file_path: Path to the data file (CSV or Excel).
+            file_path: Path to the data file (CSV, Excel or Parquet).
+            columns: Source columns to read (None = all); for Parquet only
+                these columns are read from disk.
 
         Returns:
             pd.DataFrame: Parsed data as a DataFrame.
@@ -35,9 +52,11 @@ class DataProcessorService:
 
         try:
             if file_extension == ".csv":
-                df = pd.read_csv(file_path)
+                df = pd.read_csv(file_path, usecols=columns)
             elif file_extension in [".xlsx", ".xls"]:
-                df = pd.read_excel(file_path)
+                df = pd.read_excel(file_path, usecols=columns)
+            elif file_extension == ".parquet":
+                df = pd.read_parquet(file_path, columns=columns)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
 
@@ -88,7 +107,7 @@ class DataProcessorService:
             FileNotFoundError: If data file doesn't exist.
             ValueError: If file cannot be read.
         """
-        df = await self.read_data_file(file_path)
+        df = self._apply_column_renames(self._read_header(file_path))
         return df.columns.tolist()
 
     async def get_row_count(self, file_path: Path) -> int:
@@ -105,9 +124,64 @@ class DataProcessorService:
             FileNotFoundError: If data file doesn't exist.
             ValueError: If file cannot be read.
         """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Data file not found: {file_path}")
+
+        file_extension = file_path.suffix.lower()
+
+        try:
+            if file_extension == ".csv":
+                # Parse only the first column, in bounded chunks
+                chunks = pd.read_csv(file_path, usecols=[0], chunksize=ROW_COUNT_CHUNK_SIZE)
+                return sum(len(chunk) for chunk in chunks)
+            if file_extension == ".xlsx":
+                row_count = self._xlsx_dimension_rows(file_path)
+                if row_count is not None:
+                    return row_count
+            if file_extension == ".parquet":
+                # Row count from the file footer
+                return pl.scan_parquet(file_path).select(pl.len()).collect().item()
+        except Exception as e:
+            raise ValueError(f"Error reading data file: {str(e)}") from e
+
         df = await self.read_data_file(file_path)
         return len(df)
 
+    def _read_header(self, file_path: Path) -> pd.DataFrame:
+        """Read only the header row of a data file.
+
+        Raises:
+            FileNotFoundError: If data file doesn't exist.
+            ValueError: If file format is unsupported or file is invalid.
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Data file not found: {file_path}")
+
+        file_extension = file_path.suffix.lower()
+
+        try:
+            if file_extension == ".csv":
+                return pd.read_csv(file_path, nrows=0)
+            elif file_extension in [".xlsx", ".xls"]:
+                return pd.read_excel(file_path, nrows=0)
+            elif file_extension == ".parquet":
+                return pd.DataFrame(columns=list(pl.read_parquet_schema(file_path)))
+            else:
+                raise ValueError(f"Unsupported file format: {file_extension}")
+        except Exception as e:
+            raise ValueError(f"Error reading data file: {str(e)}") from e
+
+    def _xlsx_dimension_rows(self, file_path: Path) -> int | None:
+        """Data rows of the first sheet from its dimension record, if present."""
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True)
+        try:
+            max_row = wb.worksheets[0].max_row
+            return max(max_row - 1, 0) if isinstance(max_row, int) else None
+        finally:
+            wb.close()
+
     async def read_domain_knowledge(self, file_path: Path) -> dict[str, Any]:
         """
         Read domain knowledge configuration from YAML or JSON file.
@@ -204,6 +278,7 @@ class DataProcessorService:
         data_path: Path,
         mappings: list[dict[str, Any]],
         domain_knowledge: dict[str, Any] | None = None,
+        template_columns: Iterable[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Prepare data for presentation generation by applying mappings and transformations.
@@ -212,6 +287,9 @@ class DataProcessorService:
             data_path: Path to the data file.
             mappings: List of data mapping configurations.
             domain_knowledge: Optional domain-specific transformation rules.
+            template_columns: Columns the template references (see
+                PresentationGeneratorService.template_columns). When given,
+                only these and the mapped columns are read; None reads all.
 
         Returns:
             List[Dict[str, Any]]: List of records with transformed data ready for generation.
@@ -220,13 +298,27 @@ class DataProcessorService:
             FileNotFoundError: If data file doesn't exist.
             ValueError: If data cannot be processed.
         """
-        df = await self.read_data_file(data_path)
+        columns = None
+        if template_columns is not None:
+            wanted = {_normalize_column(col) for col in template_columns}
+            wanted.update(
+                _normalize_column(mapping["data_column"])
+                for mapping in mappings
+                if mapping.get("data_column")
+            )
+            header = self._read_header(data_path)
+            source_columns = list(header.columns)
+            renamed = self._apply_column_renames(header).columns
+            # If nothing matches, read every column so no rows are lost
+            columns = [
+                source
+                for source, name in zip(source_columns, renamed, strict=True)
+                if _normalize_column(name) in wanted
+            ] or None
+        df = await self.read_data_file(data_path, columns=columns)
 
         # Normalize column names
-        df.columns = [col.lower().replace(" ", "_") for col in df.columns]
-        df.columns = [
-            col.replace("imagecolumn", "imcol").replace("imagerow", "imrow") for col in df.columns
-        ]
+        df.columns = [_normalize_column(col) for col in df.columns]
 
         prepared_data = []
 
@@ -241,13 +333,7 @@ class DataProcessorService:
             for mapping in mappings:
                 shape_name = mapping["shape_name"]
                 # Normalize the data_column name to match the normalized DataFrame columns
-                data_column = (
-                    mapping["data_column"]
-                    .lower()
-                    .replace(" ", "_")
-                    .replace("imagecolumn", "imcol")
-                    .replace("imagerow", "imrow")
-                )
+                data_column = _normalize_column(mapping["data_column"])
                 transformation = mapping.get("transformation")
                 default_value = mapping.get("default_value")
 
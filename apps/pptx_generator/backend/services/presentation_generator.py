@@ -9,14 +9,20 @@ from pptx import Presentation
 
 from apps.pptx_generator.backend.core.shape_name_parser import parse_shape_name
 from apps.pptx_generator.backend.renderers.base import RenderContext
+from apps.pptx_generator.backend.renderers.data_index import RenderDataIndex
 from apps.pptx_generator.backend.renderers.factory import RendererFactory
 from apps.pptx_generator.backend.renderers.inert_renderer import ImageRenderer, InertRenderer
 from apps.pptx_generator.backend.renderers.plot_renderer import PlotRenderer
 from apps.pptx_generator.backend.renderers.table_renderer import TableRenderer
 from apps.pptx_generator.backend.renderers.text_renderer import KPIRenderer, TextRenderer
+from apps.pptx_generator.backend.services.render_scheduler import RenderScheduler, RenderTask
+from shared.contracts.core.rendering import RenderResult, RenderState
 
 logger = logging.getLogger(__name__)
 
+# Grid position columns contour plots pivot on
+CONTOUR_GRID_COLUMNS = ("imcol", "imrow")
+
 
 class PresentationGeneratorService:
     """
@@ -26,10 +32,16 @@ class PresentationGeneratorService:
     a modular renderer system.
     """
 
-    def __init__(self):
-        """Initialize the presentation generator with renderer factory."""
+    def __init__(self, max_render_workers: int | None = None):
+        """Initialize the presentation generator with renderer factory.
+
+        Args:
+            max_render_workers: Processes for building plot images
+                (None = ET_MAX_PROCESSES, 1 = no process pool).
+        """
         self.renderer_factory = RendererFactory()
         self._register_renderers()
+        self.render_scheduler = RenderScheduler(max_render_workers)
         self.logger = logging.getLogger(__name__)
 
     def _register_renderers(self) -> None:
@@ -46,7 +58,7 @@ class PresentationGeneratorService:
         template_path: Path,
         data_records: list[dict[str, Any]],
         output_path: Path,
-    ) -> Path:
+    ) -> list[RenderResult]:
         """
         Generate a PowerPoint presentation from a template and data.
 
@@ -56,7 +68,7 @@ class PresentationGeneratorService:
             output_path: Path where the generated presentation should be saved.
 
         Returns:
-            Path: Path to the generated presentation file.
+            list[RenderResult]: One result per rendered shape, with per-shape timings.
 
         Raises:
             FileNotFoundError: If template file doesn't exist.
@@ -87,7 +99,9 @@ class PresentationGeneratorService:
             print(f"[PRESENTATION_GEN] First row: {data_df.iloc[0].to_dict()}")
 
         # Populate slides with renderer system
-        await self._populate_slides_with_renderers(prs, data_df, output_path.parent)
+        render_results = await self._populate_slides_with_renderers(
+            prs, data_df, output_path.parent
+        )
 
         try:
             prs.save(str(output_path))
@@ -95,23 +109,63 @@ class PresentationGeneratorService:
             raise OSError(f"Failed to save presentation: {str(e)}") from e
 
         self.logger.info(f"Presentation saved to {output_path}")
-        return output_path
+        return render_results
+
+    def template_columns(self, template_path: Path) -> set[str] | None:
+        """Data columns referenced by the template's renderable shapes.
+
+        Args:
+            template_path: Path to the PowerPoint template file.
+
+        Returns:
+            Lowercased names from shape metrics, filters and table contexts
+            (plus the contour grid columns), or None if a plot or table shape
+            names no metrics and so falls back to all numeric columns.
+        """
+        prs = Presentation(str(template_path))
+        columns: set[str] = set()
+        for slide in prs.slides:
+            for shape in slide.shapes:
+                try:
+                    parsed_name = parse_shape_name(shape.name)
+                except Exception:
+                    continue
+                renderer = self.renderer_factory.get_renderer(parsed_name)
+                if renderer is None:
+                    continue
+                if not parsed_name.data and isinstance(renderer, PlotRenderer | TableRenderer):
+                    return None
+                columns.update(parsed_name.data)
+                columns.update(parsed_name.filters)
+                if contexts := parsed_name.get_filter("contexts"):
+                    columns.add(contexts)
+                if parsed_name.renderer == "contour":
+                    columns.update(CONTOUR_GRID_COLUMNS)
+        return {col.lower() for col in columns}
 
     async def _populate_slides_with_renderers(
         self,
         presentation: Presentation,
         data: pd.DataFrame,
         output_dir: Path,
-    ) -> None:
+    ) -> list[RenderResult]:
         """Populate all slides using renderer system.
 
+        Shapes are collected first so a RenderDataIndex over the filter
+        columns they reference can be built once, then rendered by the
+        RenderScheduler, which builds plot images in parallel and inserts
+        them afterwards.
+
         Args:
             presentation: PowerPoint presentation object.
             data: Data as DataFrame.
             output_dir: Directory for temporary files.
+
+        Returns:
+            One RenderResult per rendered shape, with per-shape timings.
         """
         total_shapes = 0
-        rendered_shapes = 0
+        tasks: list[RenderTask] = []
 
         for slide_idx, slide in enumerate(presentation.slides):
             self.logger.debug(f"Processing slide {slide_idx + 1}/{len(presentation.slides)}")
@@ -146,17 +200,28 @@ class PresentationGeneratorService:
                     output_dir=output_dir,
                 )
 
-                # Render
-                try:
-                    await renderer.render(context)
-                    rendered_shapes += 1
-                except Exception as e:
-                    self.logger.error(f"Failed to render shape '{shape.name}': {e}", exc_info=True)
+                tasks.append(RenderTask(
+                    spec_id=f"slide_{slide_idx + 1}/{shape.name}",
+                    renderer=renderer,
+                    context=context,
+                ))
+
+        filter_columns = [
+            name for task in tasks for name in task.context.parsed_name.filters
+        ]
+        data_index = RenderDataIndex(data, filter_columns)
+        for task in tasks:
+            task.context.data_index = data_index
+
+        results = await self.render_scheduler.run(tasks)
+        rendered_shapes = sum(r.state == RenderState.COMPLETED for r in results)
+        total_ms = sum(r.render_duration_ms for r in results)
 
         self.logger.info(
             f"Rendered {rendered_shapes}/{total_shapes} shapes across "
-            f"{len(presentation.slides)} slides"
+            f"{len(presentation.slides)} slides ({total_ms:.0f} ms of render work)"
         )
+        return results
 
     def _populate_slides(self, presentation: Presentation, data: dict[str, Any]) -> None:
         """
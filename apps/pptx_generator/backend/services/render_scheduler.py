@@ -0,0 +1,198 @@
+"""Render scheduler for populating slides.
+
+Plot images are the expensive part of a deck. The scheduler prepares each
+plot shape in-process (filtering, metric resolution), builds the images in
+a process pool, and inserts the finished images into their shapes once
+they are ready. Other renderers touch python-pptx objects directly and run
+in-process, in slide order.
+
+Per ADR-0013: Tier 3 ProcessPoolExecutor with the spawn start method.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from apps.pptx_generator.backend.renderers.base import BaseRenderer, RenderContext
+from apps.pptx_generator.backend.renderers.plot_renderer import (
+    PlotJob,
+    PlotRenderer,
+    generate_plot_image,
+)
+from shared.contracts.core.concurrency import ConcurrencyConfig
+from shared.contracts.core.rendering import RenderResult, RenderState
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RenderTask:
+    """One shape to render.
+
+    Attributes:
+        spec_id: Identifier reported in the RenderResult (slide and shape).
+        renderer: Renderer selected for the shape.
+        context: Rendering context for the shape.
+    """
+
+    spec_id: str
+    renderer: BaseRenderer
+    context: RenderContext
+
+
+def _timed_plot_image(job: PlotJob) -> tuple[bytes | None, float]:
+    """Build a plot image and measure how long it took (ms)."""
+    start = time.perf_counter()
+    image = generate_plot_image(job)
+    return image, (time.perf_counter() - start) * 1000
+
+
+class RenderScheduler:
+    """Render shapes with plot images built in parallel.
+
+    With ``max_workers > 1`` and at least two plot shapes, images are built
+    in a spawn process pool; otherwise they are built one at a time in a
+    worker thread so the event loop is never blocked by matplotlib.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_workers: Worker processes for plot images
+                (None = ET_MAX_PROCESSES, 1 = no process pool).
+        """
+        self.max_workers = max(
+            1, max_workers or ConcurrencyConfig.from_env().max_processes
+        )
+        self.logger = logging.getLogger(__name__)
+
+    async def run(self, tasks: list[RenderTask]) -> list[RenderResult]:
+        """Render all tasks.
+
+        Args:
+            tasks: Shapes to render, in slide order.
+
+        Returns:
+            One RenderResult per task, in task order, with per-shape timings.
+        """
+        results: dict[int, RenderResult] = {}
+        plots: list[tuple[int, RenderTask, PlotJob, datetime, float]] = []
+
+        for index, task in enumerate(tasks):
+            started_at = datetime.now(UTC)
+            start = time.perf_counter()
+            try:
+                if isinstance(task.renderer, PlotRenderer):
+                    job = task.renderer.prepare(task.context)
+                    if job is not None:
+                        prepare_ms = (time.perf_counter() - start) * 1000
+                        plots.append((index, task, job, started_at, prepare_ms))
+                        continue
+                else:
+                    await task.renderer.render(task.context)
+            except Exception as e:
+                self.logger.error(f"Failed to render shape '{task.spec_id}': {e}", exc_info=True)
+                results[index] = self._result(task, started_at, start, error=str(e))
+                continue
+            results[index] = self._result(task, started_at, start)
+
+        if plots:
+            await self._render_plots(plots, results)
+
+        return [results[index] for index in range(len(tasks))]
+
+    async def _render_plots(
+        self,
+        plots: list[tuple[int, RenderTask, PlotJob, datetime, float]],
+        results: dict[int, RenderResult],
+    ) -> None:
+        """Build plot images concurrently and insert them in task order."""
+        loop = asyncio.get_running_loop()
+        use_pool = self.max_workers > 1 and len(plots) > 1
+        pool: Executor | None = None
+        if use_pool:
+            pool = ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(plots)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        try:
+            if pool is not None:
+                futures = [
+                    loop.run_in_executor(pool, _timed_plot_image, job)
+                    for _, _, job, _, _ in plots
+                ]
+            else:
+                futures = None
+
+            for position, (index, task, job, started_at, prepare_ms) in enumerate(plots):
+                try:
+                    if futures is not None:
+                        image, build_ms = await futures[position]
+                    else:
+                        image, build_ms = await asyncio.to_thread(_timed_plot_image, job)
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to build plot for '{task.spec_id}': {e}", exc_info=True
+                    )
+                    results[index] = self._result(
+                        task, started_at, None, duration_ms=prepare_ms, error=str(e)
+                    )
+                    continue
+
+                start = time.perf_counter()
+                error = None
+                if image is None:
+                    error = "Plot generation failed"
+                    self.logger.error(f"[PLOT] CRITICAL: {error} for '{task.spec_id}'")
+                else:
+                    try:
+                        task.renderer.insert(task.context, image)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Failed to insert plot for '{task.spec_id}': {e}", exc_info=True
+                        )
+                        error = str(e)
+                insert_ms = (time.perf_counter() - start) * 1000
+                results[index] = self._result(
+                    task,
+                    started_at,
+                    None,
+                    duration_ms=prepare_ms + build_ms + insert_ms,
+                    error=error,
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _result(
+        self,
+        task: RenderTask,
+        started_at: datetime,
+        start: float | None,
+        duration_ms: float | None = None,
+        error: str | None = None,
+    ) -> RenderResult:
+        """Build the RenderResult for a finished task.
+
+        Duration is measured from ``start`` unless given explicitly (plots,
+        whose work is split between this process and a worker).
+        """
+        if duration_ms is None:
+            duration_ms = (time.perf_counter() - start) * 1000 if start is not None else 0.0
+        return RenderResult(
+            spec_id=task.spec_id,
+            render_id=uuid.uuid4().hex,
+            state=RenderState.FAILED if error else RenderState.COMPLETED,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+            render_duration_ms=duration_ms,
+            error_message=error,
+            error_details={"renderer": type(task.renderer).__name__} if error else {},
+        )
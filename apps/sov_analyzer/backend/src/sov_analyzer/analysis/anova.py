@@ -55,6 +55,10 @@ class ANOVAResultRow:
     p_value: float | None
     variance_pct: float
     significant: bool
+    # Filled in by resampling.run_resampling_analysis when requested
+    variance_pct_lower: float | None = None
+    variance_pct_upper: float | None = None
+    permutation_p_value: float | None = None
 
 
 class VarianceValidationError(Exception):
@@ -212,6 +216,10 @@ async def run_anova_analysis(
 
     Per ADR-0023: Uses Type III sum of squares and validates variance percentages.
 
+    Numeric response columns without nulls/NaNs are analysed together by the
+    batched engine (see _batched_anova); other columns, and degenerate
+    one-way cases, go through the per-column implementation.
+
     Args:
         data: Input DataFrame.
         config: ANOVA configuration.
@@ -224,19 +232,20 @@ async def run_anova_analysis(
     Raises:
         VarianceValidationError: If variance validation fails.
     """
-    results: list[ANOVAResult] = []
-
-    for response_col in config.response_columns:
-        if response_col not in data.columns:
-            continue
-
-        # Convert to numpy for scipy
-        response = data[response_col].to_numpy()
+    responses = [c for c in config.response_columns if c in data.columns]
+    one_way = config.anova_type == "one-way" and len(config.factors) == 1
+    batched = _batched_anova(
+        data, config.factors, _batchable_responses(data, responses), config.alpha, one_way
+    )
 
-        if config.anova_type == "one-way" and len(config.factors) == 1:
-            result = _one_way_anova(data, config.factors[0], response_col, config.alpha)
-        else:
-            result = _n_way_anova(data, config.factors, response_col, config.alpha)
+    results: list[ANOVAResult] = []
+    for response_col in responses:
+        result = batched.get(response_col)
+        if result is None:
+            if one_way:
+                result = _one_way_anova(data, config.factors[0], response_col, config.alpha)
+            else:
+                result = _n_way_anova(data, config.factors, response_col, config.alpha)
 
         # Validate variance percentages per ADR-0023
         if validate_variance:
@@ -247,6 +256,264 @@ async def run_anova_analysis(
     return results
 
 
+def _batchable_responses(data: pl.DataFrame, responses: list[str]) -> list[str]:
+    """Numeric responses without nulls or NaNs (sufficient statistics are exact)."""
+    schema = data.schema
+    numeric = list(dict.fromkeys(c for c in responses if schema[c].is_numeric()))
+    if not numeric or data.is_empty():
+        return []
+    flags = data.select(
+        (
+            pl.col(c).is_null().any() | pl.col(c).is_nan().any()
+            if schema[c].is_float()
+            else pl.col(c).is_null().any()
+        ).alias(c)
+        for c in numeric
+    ).row(0)
+    return [c for c, has_missing in zip(numeric, flags, strict=True) if not has_missing]
+
+
+def _group_moments(
+    data: pl.DataFrame,
+    keys: list[str],
+    responses: list[str],
+    with_within: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Per-group sufficient statistics of all responses in one aggregation.
+
+    Returns:
+        Tuple of (group sizes [g], group means [g, r], within-group sums of
+        squared deviations [g, r] or None unless with_within).
+    """
+    aggs = [pl.len().alias("__n")]
+    aggs += [pl.col(c).mean().alias(f"__mean_{i}") for i, c in enumerate(responses)]
+    if with_within:
+        aggs += [
+            (pl.col(c) - pl.col(c).mean()).pow(2).sum().alias(f"__m2_{i}")
+            for i, c in enumerate(responses)
+        ]
+    groups = data.group_by(keys).agg(aggs)
+
+    counts = groups["__n"].to_numpy().astype(np.float64)
+    means = groups.select(f"__mean_{i}" for i in range(len(responses))).to_numpy()
+    within = (
+        groups.select(f"__m2_{i}" for i in range(len(responses))).to_numpy()
+        if with_within
+        else None
+    )
+    return counts, means.astype(np.float64), within
+
+
+def _between_ss(counts: np.ndarray, means: np.ndarray, grand_mean: np.ndarray) -> np.ndarray:
+    """Between-group sum of squares per response from group sizes and means."""
+    return (counts[:, None] * (means - grand_mean[None, :]) ** 2).sum(axis=0)
+
+
+def _batched_anova(
+    data: pl.DataFrame,
+    factors: list[str],
+    responses: list[str],
+    alpha: float,
+    one_way: bool,
+) -> dict[str, ANOVAResult]:
+    """Run ANOVA for many response columns at once.
+
+    Each factor (and factor pair, for interactions) is aggregated once for
+    all responses; every SS/F/p is then derived from group sizes and means
+    with NumPy array operations. Results match _one_way_anova/_n_way_anova.
+
+    Returns:
+        ANOVAResult per response handled. One-way responses that scipy's
+        f_oneway treats specially (zero within-group variance) are left out.
+    """
+    if not responses:
+        return {}
+
+    totals = data.select(
+        *[pl.col(c).mean().alias(f"__mean_{i}") for i, c in enumerate(responses)],
+        *[
+            (pl.col(c) - pl.col(c).mean()).pow(2).sum().alias(f"__ss_{i}")
+            for i, c in enumerate(responses)
+        ],
+    ).row(0)
+    grand_mean = np.asarray(totals[:len(responses)], dtype=np.float64)
+    ss_total = np.asarray(totals[len(responses):], dtype=np.float64)
+
+    if one_way:
+        return _batched_one_way(data, factors[0], responses, alpha, grand_mean, ss_total)
+    return _batched_n_way(data, factors, responses, alpha, grand_mean, ss_total)
+
+
+def _batched_one_way(
+    data: pl.DataFrame,
+    factor: str,
+    responses: list[str],
+    alpha: float,
+    grand_mean: np.ndarray,
+    ss_total: np.ndarray,
+) -> dict[str, ANOVAResult]:
+    """Batched equivalent of _one_way_anova."""
+    counts, means, within = _group_moments(data, [factor], responses, with_within=True)
+    n_total = data.height
+    k = len(counts)
+    df_between = k - 1
+    df_within = n_total - k
+    if df_between < 1 or df_within < 1:
+        return {}
+
+    ss_between = _between_ss(counts, means, grand_mean)
+    ss_within = within.sum(axis=0)
+    ms_between = ss_between / df_between
+    ms_within = ss_within / df_within
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_stat = ms_between / ms_within
+    p_value = stats.f.sf(f_stat, df_between, df_within)
+    total_var = np.where(ss_total > 0, ss_total, 1.0)
+
+    results: dict[str, ANOVAResult] = {}
+    for j, response_col in enumerate(responses):
+        if ms_within[j] <= 0:
+            continue
+        rows = [
+            ANOVAResultRow(
+                source=factor,
+                sum_squares=float(ss_between[j]),
+                df=df_between,
+                mean_square=float(ms_between[j]),
+                f_statistic=float(f_stat[j]),
+                p_value=float(p_value[j]),
+                variance_pct=float(ss_between[j] / total_var[j] * 100),
+                significant=bool(p_value[j] < alpha),
+            ),
+            ANOVAResultRow(
+                source="Residual",
+                sum_squares=float(ss_within[j]),
+                df=df_within,
+                mean_square=float(ms_within[j]),
+                f_statistic=None,
+                p_value=None,
+                variance_pct=float(ss_within[j] / total_var[j] * 100),
+                significant=False,
+            ),
+            ANOVAResultRow(
+                source="Total",
+                sum_squares=float(ss_total[j]),
+                df=n_total - 1,
+                mean_square=None,
+                f_statistic=None,
+                p_value=None,
+                variance_pct=100.0,
+                significant=False,
+            ),
+        ]
+        results[response_col] = ANOVAResult(
+            response_column=response_col,
+            rows=rows,
+            total_variance=float(ss_total[j]),
+            r_squared=float(ss_between[j] / total_var[j]),
+            factors=[factor],
+        )
+    return results
+
+
+def _batched_n_way(
+    data: pl.DataFrame,
+    factors: list[str],
+    responses: list[str],
+    alpha: float,
+    grand_mean: np.ndarray,
+    ss_total: np.ndarray,
+) -> dict[str, ANOVAResult]:
+    """Batched equivalent of _n_way_anova (main effects and 2-way interactions)."""
+    n_total = data.height
+    sources: list[tuple[str, np.ndarray, int]] = []
+    main_effect_ss: dict[str, np.ndarray] = {}
+    factor_levels: dict[str, int] = {}
+
+    for factor in factors:
+        counts, means, _ = _group_moments(data, [factor], responses)
+        main_effect_ss[factor] = _between_ss(counts, means, grand_mean)
+        factor_levels[factor] = len(counts)
+        sources.append((factor, main_effect_ss[factor], len(counts) - 1))
+
+    for i, factor_a in enumerate(factors):
+        for factor_b in factors[i + 1:]:
+            counts, means, _ = _group_moments(data, [factor_a, factor_b], responses)
+            cell_ss = _between_ss(counts, means, grand_mean)
+            ss_interaction = np.maximum(
+                0, cell_ss - main_effect_ss[factor_a] - main_effect_ss[factor_b]
+            )
+            df_interaction = (factor_levels[factor_a] - 1) * (factor_levels[factor_b] - 1)
+            sources.append((f"{factor_a}:{factor_b}", ss_interaction, df_interaction))
+
+    # Rows: sources, SS: [sources, responses]
+    ss = np.vstack([source_ss for _, source_ss, _ in sources])
+    dfs = np.array([df for _, _, df in sources])
+    ms = np.divide(ss, dfs[:, None], out=np.zeros_like(ss), where=dfs[:, None] > 0)
+
+    ss_explained = ss.sum(axis=0)
+    df_explained = int(dfs.sum())
+    ss_residual = np.maximum(0, ss_total - ss_explained)
+    df_residual = n_total - df_explained - 1
+    ms_residual = ss_residual / df_residual if df_residual > 0 else np.zeros_like(ss_residual)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_stat = ms / ms_residual[None, :]
+        p_value = 1 - stats.f.cdf(f_stat, dfs[:, None], df_residual)
+    has_f = ms_residual > 0
+    pct = np.divide(ss * 100, ss_total, out=np.zeros_like(ss), where=ss_total > 0)
+    residual_pct = np.divide(
+        ss_residual * 100, ss_total, out=np.zeros_like(ss_residual), where=ss_total > 0
+    )
+    r_squared = np.divide(
+        ss_explained, ss_total, out=np.zeros_like(ss_explained), where=ss_total > 0
+    )
+
+    results: dict[str, ANOVAResult] = {}
+    for j, response_col in enumerate(responses):
+        rows = [
+            ANOVAResultRow(
+                source=name,
+                sum_squares=float(ss[s, j]),
+                df=int(dfs[s]),
+                mean_square=float(ms[s, j]),
+                f_statistic=float(f_stat[s, j]) if has_f[j] else None,
+                p_value=float(p_value[s, j]) if has_f[j] else None,
+                variance_pct=float(pct[s, j]),
+                significant=bool(p_value[s, j] < alpha) if has_f[j] else False,
+            )
+            for s, (name, _, _) in enumerate(sources)
+        ]
+        rows.append(ANOVAResultRow(
+            source="Residual",
+            sum_squares=float(ss_residual[j]),
+            df=df_residual,
+            mean_square=float(ms_residual[j]),
+            f_statistic=None,
+            p_value=None,
+            variance_pct=float(residual_pct[j]),
+            significant=False,
+        ))
+        rows.append(ANOVAResultRow(
+            source="Total",
+            sum_squares=float(ss_total[j]),
+            df=n_total - 1,
+            mean_square=None,
+            f_statistic=None,
+            p_value=None,
+            variance_pct=100.0,
+            significant=False,
+        ))
+        results[response_col] = ANOVAResult(
+            response_column=response_col,
+            rows=rows,
+            total_variance=float(ss_total[j]),
+            r_squared=float(r_squared[j]),
+            factors=factors,
+        )
+    return results
+
+
 def _one_way_anova(
     data: pl.DataFrame,
     factor: str,
@@ -0,0 +1,328 @@
+"""Resampling confidence intervals for ANOVA variance components.
+
+Adds bootstrap percentile intervals for each source's variance_pct and
+permutation p-values for each effect to results from run_anova_analysis.
+
+Per ADR-0023: Resampling is deterministic under ANOVAConfig.seed. The
+replicates are split into fixed-size chunks, each seeded from its own
+SeedSequence child, so results do not depend on the number of workers.
+Per ADR-0013: Chunks run in a ProcessPoolExecutor with the spawn start method.
+The design and response matrix are sent to each worker once, by the pool
+initializer; tasks carry only chunk sizes and seeds.
+"""
+import asyncio
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import polars as pl
+
+from shared.contracts.core.concurrency import ConcurrencyConfig
+
+from .anova import ANOVAConfig, ANOVAResult, _batchable_responses
+
+# Upper bound on resampled values (replicates x rows x responses) per chunk
+_CHUNK_ELEMENTS = 4_000_000
+
+# Tasks per worker process; consecutive chunks are grouped into tasks
+_TASKS_PER_WORKER = 4
+
+
+@dataclass
+class ResamplingConfig:
+    """Configuration for resampling intervals."""
+    n_resamples: int = 1000
+    method: Literal["bootstrap", "permutation", "both"] = "both"
+    confidence_level: float = 0.95
+    max_workers: int | None = None  # None = ET_MAX_PROCESSES
+
+
+@dataclass
+class _Design:
+    """Integer-coded factor design shared by every replicate."""
+    codes: np.ndarray  # [factors, n] level codes
+    levels: list[int]  # code range per factor
+    sources: list[str]
+    pairs: list[tuple[int, int]]  # factor indices of each interaction source
+    dfs: np.ndarray  # df per source
+
+
+def _encode_design(data: pl.DataFrame, factors: list[str], one_way: bool) -> _Design:
+    """Dense-code factor columns (nulls form their own level, as in group_by)."""
+    codes = data.select(
+        pl.col(f).rank("dense").fill_null(0).cast(pl.Int64).alias(f) for f in factors
+    ).to_numpy().T
+    levels = [int(c.max()) + 1 for c in codes]
+    observed = [len(np.unique(c)) for c in codes]
+
+    sources = list(factors[:1] if one_way else factors)
+    dfs = [k - 1 for k in observed[:len(sources)]]
+    pairs: list[tuple[int, int]] = []
+    if not one_way:
+        for i in range(len(factors)):
+            for j in range(i + 1, len(factors)):
+                pairs.append((i, j))
+                sources.append(f"{factors[i]}:{factors[j]}")
+                dfs.append((observed[i] - 1) * (observed[j] - 1))
+    return _Design(codes, levels, sources, pairs, np.asarray(dfs))
+
+
+def _between_ss(codes: np.ndarray, k: int, values: np.ndarray) -> np.ndarray:
+    """Between-group SS per replicate and response.
+
+    Args:
+        codes: [R, n] group codes in [0, k).
+        k: Number of possible codes.
+        values: [R, n, m] responses.
+
+    Returns:
+        [R, m] sums of squares.
+    """
+    n_rep, n, m = values.shape
+    flat = (codes + np.arange(n_rep)[:, None] * k).ravel()
+    counts = np.bincount(flat, minlength=n_rep * k).reshape(n_rep, k)
+    grand_mean = values.mean(axis=1)
+    ss = np.empty((n_rep, m))
+    for j in range(m):
+        sums = np.bincount(flat, weights=values[:, :, j].ravel(), minlength=n_rep * k)
+        sums = sums.reshape(n_rep, k)
+        means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+        ss[:, j] = (counts * (means - grand_mean[:, j, None]) ** 2).sum(axis=1)
+    return ss
+
+
+def _replicate_ss(
+    design: _Design,
+    codes: np.ndarray,
+    values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Source and total SS for a batch of replicates.
+
+    Mirrors _n_way_anova: interaction SS is cell SS minus both main effects,
+    clipped at zero.
+
+    Returns:
+        Tuple of (source SS [S, R, m], total SS [R, m]).
+    """
+    main = [_between_ss(codes[f], design.levels[f], values) for f in range(len(design.levels))]
+    ss = main[:len(design.sources) - len(design.pairs)]
+    for a, b in design.pairs:
+        cells = codes[a] * design.levels[b] + codes[b]
+        cell_ss = _between_ss(cells, design.levels[a] * design.levels[b], values)
+        ss.append(np.maximum(0, cell_ss - main[a] - main[b]))
+    centered = values - values.mean(axis=1, keepdims=True)
+    return np.stack(ss), (centered ** 2).sum(axis=1)
+
+
+def _resample_chunk(
+    design: _Design,
+    values: np.ndarray,
+    method: Literal["bootstrap", "permutation"],
+    n_rep: int,
+    seed: np.random.SeedSequence,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute SS for one chunk of replicates inside a worker process.
+
+    Module-level so it can be pickled for the spawn start method (ADR-0013).
+    Bootstrap resamples whole rows; permutation shuffles responses against
+    the fixed design.
+    """
+    rng = np.random.default_rng(seed)
+    n = values.shape[0]
+    if method == "bootstrap":
+        idx = rng.integers(0, n, size=(n_rep, n))
+        codes = design.codes[:, idx]
+    else:
+        idx = rng.permuted(np.tile(np.arange(n), (n_rep, 1)), axis=1)
+        codes = np.broadcast_to(design.codes[:, None, :], (len(design.levels), n_rep, n))
+    return _replicate_ss(design, codes, values[idx])
+
+
+# Design and responses of the current analysis, set once per worker process
+_worker_data: tuple[_Design, np.ndarray] | None = None
+
+
+def _init_worker(design: _Design, values: np.ndarray) -> None:
+    """Pool initializer: receive the data every chunk resamples from."""
+    global _worker_data
+    _worker_data = (design, values)
+
+
+def _resample_chunks(
+    design: _Design,
+    values: np.ndarray,
+    method: Literal["bootstrap", "permutation"],
+    chunks: list[tuple[int, np.random.SeedSequence]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute SS for consecutive chunks, concatenated in chunk order."""
+    parts = [_resample_chunk(design, values, method, size, seed) for size, seed in chunks]
+    return (
+        np.concatenate([ss for ss, _ in parts], axis=1),
+        np.concatenate([total for _, total in parts], axis=0),
+    )
+
+
+def _resample_chunks_in_worker(
+    method: Literal["bootstrap", "permutation"],
+    chunks: list[tuple[int, np.random.SeedSequence]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Worker entry point: resample from the data sent by _init_worker."""
+    if _worker_data is None:
+        raise RuntimeError("Resampling worker was started without its data")
+    return _resample_chunks(*_worker_data, method, chunks)
+
+
+@contextmanager
+def _worker_pool(
+    design: _Design,
+    values: np.ndarray,
+    workers: int,
+) -> Iterator[ProcessPoolExecutor | None]:
+    """Spawn pool whose workers hold the data, or None to run serially."""
+    if workers <= 1:
+        yield None
+        return
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(design, values),
+    )
+    try:
+        yield pool
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _chunk_sizes(values: np.ndarray, n_resamples: int) -> list[int]:
+    """Replicates per chunk, bounded by _CHUNK_ELEMENTS resampled values."""
+    chunk = max(1, min(n_resamples, _CHUNK_ELEMENTS // values.size))
+    return [min(chunk, n_resamples - start) for start in range(0, n_resamples, chunk)]
+
+
+async def _run_chunks(
+    design: _Design,
+    values: np.ndarray,
+    method: Literal["bootstrap", "permutation"],
+    seed: np.random.SeedSequence,
+    resampling: ResamplingConfig,
+    pool: ProcessPoolExecutor | None,
+    workers: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run all replicates for one method, in chunk order.
+
+    Chunks (and their seeds) are fixed by the data size alone; with a pool
+    they are grouped into a few tasks per worker, without one they run in a
+    thread so the event loop is not blocked.
+    """
+    sizes = _chunk_sizes(values, resampling.n_resamples)
+    chunks = list(zip(sizes, seed.spawn(len(sizes)), strict=True))
+    if pool is None:
+        return await asyncio.to_thread(_resample_chunks, design, values, method, chunks)
+
+    per_task = -(-len(chunks) // (workers * _TASKS_PER_WORKER))
+    loop = asyncio.get_running_loop()
+    parts = await asyncio.gather(*(
+        loop.run_in_executor(
+            pool, _resample_chunks_in_worker, method, chunks[i:i + per_task]
+        )
+        for i in range(0, len(chunks), per_task)
+    ))
+    return (
+        np.concatenate([ss for ss, _ in parts], axis=1),
+        np.concatenate([total for _, total in parts], axis=0),
+    )
+
+
+def _f_statistics(ss: np.ndarray, ss_total: np.ndarray, dfs: np.ndarray, n: int) -> np.ndarray:
+    """F per source, replicate and response (NaN where undefined)."""
+    df_residual = n - int(dfs.sum()) - 1
+    ss_residual = np.maximum(0, ss_total - ss.sum(axis=0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ms = ss / np.where(dfs > 0, dfs, np.nan)[:, None, None]
+        ms_residual = ss_residual / df_residual if df_residual > 0 else np.nan
+        f_stat = ms / ms_residual
+    return np.where(np.isfinite(f_stat), f_stat, np.nan)
+
+
+async def run_resampling_analysis(
+    data: pl.DataFrame,
+    config: ANOVAConfig,
+    results: list[ANOVAResult],
+    resampling: ResamplingConfig | None = None,
+) -> list[ANOVAResult]:
+    """Attach resampling intervals and p-values to ANOVA results in place.
+
+    Every response is resampled together, using the same replicate indices.
+    Responses with nulls/NaNs, or that are not numeric, are left unchanged.
+
+    Args:
+        data: DataFrame the results were computed from.
+        config: ANOVA configuration used (its seed drives resampling).
+        results: Results from run_anova_analysis.
+        resampling: Resampling options (defaults to ResamplingConfig()).
+
+    Returns:
+        The same results, with variance_pct_lower/upper and
+        permutation_p_value set on effect rows (bounds also on Residual).
+    """
+    resampling = resampling or ResamplingConfig()
+    by_response = {r.response_column: r for r in results}
+    responses = _batchable_responses(data, list(by_response))
+    if not responses or resampling.n_resamples < 1 or data.height < 2:
+        return results
+
+    one_way = config.anova_type == "one-way" and len(config.factors) == 1
+    design = _encode_design(data, config.factors, one_way)
+    values = data.select(responses).to_numpy().astype(np.float64)
+    n = data.height
+    bootstrap_seed, permutation_seed = np.random.SeedSequence(config.seed).spawn(2)
+
+    workers = resampling.max_workers or ConcurrencyConfig.from_env().max_processes
+    workers = min(workers, len(_chunk_sizes(values, resampling.n_resamples)))
+
+    with _worker_pool(design, values, workers) as pool:
+        if resampling.method in ("bootstrap", "both"):
+            ss, ss_total = await _run_chunks(
+                design, values, "bootstrap", bootstrap_seed, resampling, pool, workers
+            )
+            residual = np.maximum(0, ss_total - ss.sum(axis=0))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pct = np.concatenate([ss, residual[None]]) * 100 / ss_total[None]
+            tail = (1 - resampling.confidence_level) / 2 * 100
+            lower, upper = np.nanpercentile(pct, [tail, 100 - tail], axis=1)
+            names = [*design.sources, "Residual"]
+            for j, response_col in enumerate(responses):
+                for row in by_response[response_col].rows:
+                    if row.source in names:
+                        s = names.index(row.source)
+                        if np.isfinite(lower[s, j]):
+                            row.variance_pct_lower = float(lower[s, j])
+                            row.variance_pct_upper = float(upper[s, j])
+
+        if resampling.method in ("permutation", "both"):
+            identity = np.arange(n)[None, :]
+            observed = _f_statistics(
+                *_replicate_ss(design, design.codes[:, identity], values[identity]),
+                design.dfs,
+                n,
+            )[:, 0, :]
+            ss, ss_total = await _run_chunks(
+                design, values, "permutation", permutation_seed, resampling, pool, workers
+            )
+            permuted = _f_statistics(ss, ss_total, design.dfs, n)
+            with np.errstate(invalid="ignore"):
+                exceed = (permuted >= observed[:, None, :] * (1 - 1e-12)).sum(axis=1)
+            p_value = (exceed + 1) / (resampling.n_resamples + 1)
+            for j, response_col in enumerate(responses):
+                for row in by_response[response_col].rows:
+                    if row.source in design.sources:
+                        s = design.sources.index(row.source)
+                        if np.isfinite(observed[s, j]):
+                            row.permutation_p_value = float(p_value[s, j])
+
+    return results
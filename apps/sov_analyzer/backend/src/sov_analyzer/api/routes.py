@@ -12,6 +12,7 @@ from shared.contracts.core.error_response import (
 )
 
 from ..analysis.anova import ANOVAConfig, VarianceValidationError
+from ..analysis.resampling import ResamplingConfig
 from ..core.analysis_manager import AnalysisManager
 from .schemas import (
     AnalysisResponse,
@@ -157,8 +158,15 @@ async def run_analysis(analysis_id: str, request: RunAnalysisRequest):
         seed=request.seed,  # Per ADR-0023: Deterministic computation
     )
 
+    resampling = None
+    if request.n_resamples:
+        resampling = ResamplingConfig(
+            n_resamples=request.n_resamples,
+            confidence_level=request.confidence_level,
+        )
+
     try:
-        results = await manager.run_analysis(analysis_id, config)
+        results = await manager.run_analysis(analysis_id, config, resampling=resampling)
 
         return [
             ANOVAResultResponse(
@@ -173,6 +181,9 @@ async def run_analysis(analysis_id: str, request: RunAnalysisRequest):
                         p_value=row.p_value,
                         variance_pct=row.variance_pct,
                         significant=row.significant,
+                        variance_pct_lower=row.variance_pct_lower,
+                        variance_pct_upper=row.variance_pct_upper,
+                        permutation_p_value=row.permutation_p_value,
                     )
                     for row in r.rows
                 ],
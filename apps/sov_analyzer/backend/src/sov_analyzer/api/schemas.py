@@ -30,6 +30,10 @@ class RunAnalysisRequest(BaseModel):
     alpha: float = 0.05
     anova_type: Literal["one-way", "two-way", "n-way"] = "one-way"
     seed: int = Field(42, description="Random seed for reproducibility per ADR-0023")
+    n_resamples: int = Field(
+        0, ge=0, description="Bootstrap/permutation replicates for intervals (0 = off)"
+    )
+    confidence_level: float = Field(0.95, gt=0, lt=1)
 
 
 class ANOVARowResponse(BaseModel):
@@ -42,6 +46,9 @@ class ANOVARowResponse(BaseModel):
     p_value: float | None
     variance_pct: float
     significant: bool
+    variance_pct_lower: float | None = None
+    variance_pct_upper: float | None = None
+    permutation_p_value: float | None = None
 
 
 class ANOVAResultResponse(BaseModel):
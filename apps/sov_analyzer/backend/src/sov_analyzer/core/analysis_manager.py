@@ -19,6 +19,7 @@ from ..analysis.anova import (
     ANOVAResult,
     run_anova_analysis,
 )
+from ..analysis.resampling import ResamplingConfig, run_resampling_analysis
 from .visualization_service import VisualizationService
 
 
@@ -140,6 +141,7 @@ class AnalysisManager:
         analysis_id: str,
         config: ANOVAConfig,
         data: pl.DataFrame | None = None,
+        resampling: ResamplingConfig | None = None,
     ) -> list[ANOVAResult]:
         """Run ANOVA analysis.
         
@@ -149,6 +151,7 @@ class AnalysisManager:
             analysis_id: Analysis ID
             config: ANOVA configuration
             data: Optional DataFrame (if not provided, loads from dataset_id)
+            resampling: Optional bootstrap/permutation settings for intervals
             
         Returns:
             List of ANOVA results
@@ -163,7 +166,15 @@ class AnalysisManager:
             dataset_id = metadata.get("dataset_id")
             if not dataset_id:
                 raise ValueError("No data provided and no dataset_id set")
-            data, manifest = await self.store.read_dataset_with_manifest(dataset_id)
+            # Read only the factor and response columns that exist
+            lf = await self.store.read_dataset(dataset_id, lazy=True)
+            available = set(lf.collect_schema().names())
+            wanted = dict.fromkeys([*config.factors, *config.response_columns])
+            data = lf.select(c for c in wanted if c in available).collect()
+            try:
+                manifest = await self.store.get_manifest(dataset_id)
+            except FileNotFoundError:
+                manifest = None
             # Preserve input column metadata per ADR-0024
             if manifest:
                 input_column_meta = {col.name: col for col in manifest.columns}
@@ -173,6 +184,8 @@ class AnalysisManager:
 
         # Run ANOVA
         results = await run_anova_analysis(data, config)
+        if resampling is not None:
+            results = await run_resampling_analysis(data, config, results, resampling)
 
         # Save results
         analysis_dir = self._analysis_dir(analysis_id)
@@ -195,6 +208,7 @@ class AnalysisManager:
             results=results,
             analysis_id=analysis_id,
             dataset_id=metadata.get("dataset_id"),
+            data=data,
         )
         viz_specs_data = [spec.model_dump(mode="json") for spec in viz_specs]
 
@@ -7,18 +7,27 @@ This module generates typed visualization specifications that can be:
 - Consumed directly by the frontend for rendering
 - Included in DataSet manifests for downstream tools (PPTX)
 - Serialized to JSON for API responses
+
+When the analysed data is supplied, box, main effects and interaction specs
+embed per-level summary statistics (quartiles, whiskers, capped outliers,
+means and CIs) so consumers never need to read the raw rows.
 """
 
 from __future__ import annotations
 
+import math
 import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import polars as pl
+from scipy import stats
+
 from shared.contracts.core.rendering import AxisConfig
 from shared.contracts.sov.visualization import (
     BoxPlotConfig,
     InteractionPlotConfig,
+    LevelSummary,
     MainEffectsPlotConfig,
     ResidualPlotConfig,
     VarianceBarConfig,
@@ -29,29 +38,145 @@ from shared.contracts.sov.visualization import (
 if TYPE_CHECKING:
     from ..analysis.anova import ANOVAResult
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
+
+_NULL_LEVEL = "(null)"
+
+
+def _level_label(value: object) -> str:
+    """Render a factor level as a string label."""
+    return _NULL_LEVEL if value is None else str(value)
+
+
+def _finite(value: float | None) -> float | None:
+    """Convert an aggregate to float, mapping null/NaN/inf to None."""
+    if value is None:
+        return None
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def summarize_levels(
+    data: pl.DataFrame,
+    keys: list[str],
+    responses: list[str],
+    confidence_level: float = 0.95,
+    max_outliers: int = 20,
+    max_points: int = 0,
+) -> dict[str, list[LevelSummary]]:
+    """Compute per-level summaries for many responses in one grouped pass.
+
+    Args:
+        data: Analysed data.
+        keys: One factor (box/main effects) or two factors (interaction).
+        responses: Numeric response columns.
+        confidence_level: Level of the t-based CI on each mean.
+        max_outliers: Cap on outlier values kept per level.
+        max_points: Cap on evenly spaced sample points per level (0 = none).
+
+    Returns:
+        Response column -> LevelSummary list, sorted by level.
+    """
+    aggs: list[pl.Expr] = []
+    for i, c in enumerate(responses):
+        col = pl.col(c)
+        q1 = col.quantile(0.25, "linear")
+        q3 = col.quantile(0.75, "linear")
+        low = q1 - 1.5 * (q3 - q1)
+        high = q3 + 1.5 * (q3 - q1)
+        is_outlier = (col < low) | (col > high)
+        aggs += [
+            col.count().alias(f"n_{i}"),
+            col.mean().alias(f"mean_{i}"),
+            col.std().alias(f"std_{i}"),
+            q1.alias(f"q1_{i}"),
+            col.median().alias(f"median_{i}"),
+            q3.alias(f"q3_{i}"),
+            col.filter(col >= low).min().alias(f"wlo_{i}"),
+            col.filter(col <= high).max().alias(f"whi_{i}"),
+            col.filter(is_outlier).head(max_outliers).alias(f"out_{i}"),
+            is_outlier.sum().alias(f"nout_{i}"),
+        ]
+        if max_points > 0:
+            step = pl.len() // max_points + 1
+            aggs.append(
+                col.filter(pl.int_range(pl.len()) % step == 0).drop_nulls().alias(f"pts_{i}")
+            )
+
+    groups = data.group_by(keys).agg(aggs).sort(keys, nulls_last=True)
+
+    summaries: dict[str, list[LevelSummary]] = {c: [] for c in responses}
+    for row in groups.iter_rows(named=True):
+        level = _level_label(row[keys[0]])
+        group = _level_label(row[keys[1]]) if len(keys) > 1 else None
+        for i, c in enumerate(responses):
+            n = row[f"n_{i}"]
+            mean = _finite(row[f"mean_{i}"])
+            std = _finite(row[f"std_{i}"])
+            se = std / math.sqrt(n) if std is not None and n > 1 else None
+            ci_lower = ci_upper = None
+            if se is not None and mean is not None:
+                half = float(stats.t.ppf(0.5 + confidence_level / 2, n - 1)) * se
+                ci_lower, ci_upper = mean - half, mean + half
+            summaries[c].append(LevelSummary(
+                level=level,
+                group=group,
+                count=n,
+                mean=mean,
+                std=std,
+                std_error=se,
+                ci_lower=ci_lower,
+                ci_upper=ci_upper,
+                q1=_finite(row[f"q1_{i}"]),
+                median=_finite(row[f"median_{i}"]),
+                q3=_finite(row[f"q3_{i}"]),
+                whisker_low=_finite(row[f"wlo_{i}"]),
+                whisker_high=_finite(row[f"whi_{i}"]),
+                outliers=[float(v) for v in row[f"out_{i}"]],
+                outlier_count=row[f"nout_{i}"] or 0,
+                points=[float(v) for v in row[f"pts_{i}"]] if max_points > 0 else [],
+            ))
+    return summaries
 
 
 class VisualizationService:
     """Generate visualization contracts from ANOVA results.
-    
+
     Per ADR-0025: SOV backend produces visualization-ready Pydantic contracts.
     The frontend renders these directly without recomputing chart data.
     """
 
+    def __init__(
+        self,
+        max_points: int = 0,
+        max_outliers: int = 20,
+        confidence_level: float = 0.95,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            max_points: Sample points embedded per level in summary mode
+                (0 = none, and point overlays are disabled).
+            max_outliers: Outlier values embedded per level in summary mode.
+            confidence_level: Confidence level for embedded mean CIs.
+        """
+        self.max_points = max_points
+        self.max_outliers = max_outliers
+        self.confidence_level = confidence_level
+
     def generate_variance_bar_chart(
         self,
         result: ANOVAResult,
         analysis_id: str,
     ) -> VisualizationSpec:
         """Create variance bar chart specification from ANOVA result.
-        
+
         Shows the percentage of variance explained by each factor and residual.
-        
+
         Args:
             result: ANOVA result containing variance percentages.
             analysis_id: Analysis ID for reference.
-            
+
         Returns:
             VisualizationSpec with VarianceBarConfig.
         """
@@ -94,14 +219,16 @@ class VisualizationService:
         result: ANOVAResult,
         factor: str,
         dataset_id: str | None = None,
+        summary: list[LevelSummary] | None = None,
     ) -> VisualizationSpec:
         """Create box plot specification for a single factor.
-        
+
         Args:
             result: ANOVA result.
             factor: Factor column name for grouping.
             dataset_id: Source dataset ID.
-            
+            summary: Precomputed per-level statistics to embed.
+
         Returns:
             VisualizationSpec with BoxPlotConfig.
         """
@@ -110,11 +237,12 @@ class VisualizationService:
             response_column=result.response_column,
             show_outliers=True,
             show_means=True,
-            show_points=True,
+            show_points=summary is None or self.max_points > 0,
             jitter_amount=0.2,
             point_alpha=0.6,
             x_axis=AxisConfig(label=factor, show_grid=False),
             y_axis=AxisConfig(label=result.response_column, show_grid=True),
+            summary=summary,
         )
 
         spec_id = f"boxplot_{factor}_{result.response_column}_{uuid.uuid4().hex[:8]}"
@@ -135,13 +263,17 @@ class VisualizationService:
         self,
         result: ANOVAResult,
         dataset_id: str | None = None,
+        summaries: dict[str, list[LevelSummary]] | None = None,
+        grand_mean: float | None = None,
     ) -> VisualizationSpec:
         """Create main effects plot for all factors.
-        
+
         Args:
             result: ANOVA result.
             dataset_id: Source dataset ID.
-            
+            summaries: Precomputed per-level statistics for each factor.
+            grand_mean: Response grand mean for the reference line.
+
         Returns:
             VisualizationSpec with MainEffectsPlotConfig.
         """
@@ -154,6 +286,8 @@ class VisualizationService:
             error_bar_type="se",
             layout="horizontal" if len(result.factors) <= 3 else "grid",
             share_y_axis=True,
+            summaries=summaries,
+            grand_mean=grand_mean,
         )
 
         spec_id = f"main_effects_{result.response_column}_{uuid.uuid4().hex[:8]}"
@@ -176,15 +310,17 @@ class VisualizationService:
         factor_a: str,
         factor_b: str,
         dataset_id: str | None = None,
+        summary: list[LevelSummary] | None = None,
     ) -> VisualizationSpec:
         """Create interaction plot for two factors.
-        
+
         Args:
             result: ANOVA result.
             factor_a: First factor (X-axis).
             factor_b: Second factor (lines).
             dataset_id: Source dataset ID.
-            
+            summary: Precomputed per-cell statistics to embed.
+
         Returns:
             VisualizationSpec with InteractionPlotConfig.
         """
@@ -198,6 +334,7 @@ class VisualizationService:
             confidence_level=0.95,
             line_style="solid",
             marker_style="o",
+            summary=summary,
         )
 
         spec_id = f"interaction_{factor_a}_{factor_b}_{uuid.uuid4().hex[:8]}"
@@ -224,11 +361,11 @@ class VisualizationService:
         plot_type: str = "histogram",
     ) -> VisualizationSpec:
         """Create residual diagnostic plot.
-        
+
         Args:
             analysis_id: Analysis ID to get residuals from.
             plot_type: Type of residual plot.
-            
+
         Returns:
             VisualizationSpec with ResidualPlotConfig.
         """
@@ -259,33 +396,60 @@ class VisualizationService:
         results: list[ANOVAResult],
         analysis_id: str,
         dataset_id: str | None = None,
+        data: pl.DataFrame | None = None,
     ) -> list[VisualizationSpec]:
         """Generate all standard visualizations for ANOVA results.
-        
+
         Per ADR-0025: Produces a complete set of visualization contracts
         that can be included in the DataSet manifest.
-        
+
         Args:
             results: List of ANOVA results (one per response column).
             analysis_id: Analysis ID.
             dataset_id: Source dataset ID.
-            
+            data: Analysed data; when given, specs embed summary statistics.
+
         Returns:
             List of VisualizationSpec for all standard charts.
         """
         specs: list[VisualizationSpec] = []
+        summaries, grand_means = (
+            self._summarize(results, data) if data is not None else ({}, {})
+        )
 
         for result in results:
+            response = result.response_column
+            has_summary = response in grand_means
+            level_summaries: dict[tuple[str, ...], list[LevelSummary]] = (
+                {
+                    keys: by_response[response]
+                    for keys, by_response in summaries.items()
+                    if response in by_response
+                }
+                if has_summary
+                else {}
+            )
+
             # Always generate variance bar chart
             specs.append(self.generate_variance_bar_chart(result, analysis_id))
 
             # Generate box plots for each factor
             for factor in result.factors:
-                specs.append(self.generate_box_plot(result, factor, dataset_id))
+                specs.append(self.generate_box_plot(
+                    result, factor, dataset_id, summary=level_summaries.get((factor,))
+                ))
 
             # Generate main effects plot if multiple factors
             if len(result.factors) >= 1:
-                specs.append(self.generate_main_effects_plot(result, dataset_id))
+                specs.append(self.generate_main_effects_plot(
+                    result,
+                    dataset_id,
+                    summaries=(
+                        {f: level_summaries[(f,)] for f in result.factors}
+                        if has_summary else None
+                    ),
+                    grand_mean=grand_means.get(response),
+                ))
 
             # Generate interaction plots for 2+ factors
             if len(result.factors) >= 2:
@@ -293,7 +457,11 @@ class VisualizationService:
                     for factor_b in result.factors[i + 1:]:
                         specs.append(
                             self.generate_interaction_plot(
-                                result, factor_a, factor_b, dataset_id
+                                result,
+                                factor_a,
+                                factor_b,
+                                dataset_id,
+                                summary=level_summaries.get((factor_a, factor_b)),
                             )
                         )
 
@@ -303,15 +471,58 @@ class VisualizationService:
 
         return specs
 
+    def _summarize(
+        self,
+        results: list[ANOVAResult],
+        data: pl.DataFrame,
+    ) -> tuple[dict[tuple[str, ...], dict[str, list[LevelSummary]]], dict[str, float | None]]:
+        """Summaries for every factor and factor pair, one pass per key set.
+
+        Returns:
+            Tuple of ({factor key tuple: {response: summaries}},
+            {response: grand mean}) for numeric responses present in data.
+        """
+        schema = data.schema
+        key_responses: dict[tuple[str, ...], list[str]] = {}
+        responses: list[str] = []
+        for result in results:
+            response = result.response_column
+            if response not in schema or not schema[response].is_numeric():
+                continue
+            if response not in responses:
+                responses.append(response)
+            for i, factor_a in enumerate(result.factors):
+                key_responses.setdefault((factor_a,), []).append(response)
+                if len(result.factors) >= 2:
+                    for factor_b in result.factors[i + 1:]:
+                        key_responses.setdefault((factor_a, factor_b), []).append(response)
+        if not responses:
+            return {}, {}
+
+        summaries = {
+            keys: summarize_levels(
+                data,
+                list(keys),
+                list(dict.fromkeys(key_cols)),
+                confidence_level=self.confidence_level,
+                max_outliers=self.max_outliers,
+                max_points=self.max_points,
+            )
+            for keys, key_cols in key_responses.items()
+        }
+        means = data.select(pl.col(c).mean() for c in responses).row(0)
+        grand_means = {c: _finite(m) for c, m in zip(responses, means, strict=True)}
+        return summaries, grand_means
+
     def get_visualization_summary(
         self,
         specs: list[VisualizationSpec],
     ) -> dict:
         """Get summary of generated visualizations.
-        
+
         Args:
             specs: List of visualization specs.
-            
+
         Returns:
             Summary dict with counts by type.
         """
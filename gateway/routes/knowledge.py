@@ -3,6 +3,7 @@
 REST endpoints for knowledge archive.
 """
 
+import asyncio
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -83,6 +84,10 @@ async def export_document_endpoint(doc_id: str, archive: ArchiveService = Depend
     return PlainTextResponse(content=doc.content, media_type=content_type)
 
 
+from gateway.services.knowledge.embedding_service import (
+    EmbeddingService,
+    get_embedding_service,
+)
 from gateway.services.knowledge.search_service import SearchService
 
 
@@ -90,6 +95,10 @@ def get_search(archive: ArchiveService = Depends(get_archive)) -> SearchService:
     return SearchService(archive.conn)
 
 
+def get_embeddings() -> EmbeddingService:
+    return get_embedding_service()
+
+
 @router.get("/search")
 async def fts_search(
     q: str,
@@ -105,10 +114,15 @@ async def fts_search(
 async def semantic_search(
     q: str,
     top_k: int = 10,
-    search: SearchService = Depends(get_search)
+    search: SearchService = Depends(get_search),
+    embeddings: EmbeddingService = Depends(get_embeddings)
 ) -> list[dict]:
     """Semantic/vector search (SPEC-0043-API02)."""
-    results = search.vector_search(q, top_k=top_k)
+    try:
+        query_vector = (await asyncio.to_thread(embeddings.embed_query, q)).vector
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+    results = search.vector_search(query_vector, top_k=top_k)
     return [{'doc_id': r.doc_id, 'title': r.title, 'snippet': r.snippet, 'score': r.score} for r in results]
 
 
@@ -116,10 +130,17 @@ async def semantic_search(
 async def hybrid_search(
     q: str,
     top_k: int = 10,
-    search: SearchService = Depends(get_search)
+    search: SearchService = Depends(get_search),
+    embeddings: EmbeddingService = Depends(get_embeddings)
 ) -> list[dict]:
     """Hybrid search - FTS + vector with RRF (SPEC-0043-API03)."""
-    results = search.hybrid_search(q, query_vector=None, top_k=top_k)
+    query_vector = None
+    if search.has_embeddings():
+        try:
+            query_vector = (await asyncio.to_thread(embeddings.embed_query, q)).vector
+        except ImportError:
+            query_vector = None  # No embedding backend: keyword results only
+    results = search.hybrid_search(q, query_vector=query_vector, top_k=top_k)
     return [{'doc_id': r.doc_id, 'title': r.title, 'snippet': r.snippet, 'score': r.score} for r in results]
 
 
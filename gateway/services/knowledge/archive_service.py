@@ -37,6 +37,51 @@ class ArchiveService:
         self.conn.commit()
         return True
 
+    def upsert_documents(self, docs: list[Document], commit: bool = True) -> list[Document]:
+        """Insert or update many documents in one transaction.
+
+        A document counts as changed if it is new, its hash or path
+        differs, or it was archived. Relationships of changed documents are
+        saved after all documents are written, so references within the
+        batch resolve.
+
+        Returns:
+            The changed documents.
+        """
+        existing = {}
+        for start in range(0, len(docs), 500):
+            ids = [d.id for d in docs[start:start + 500]]
+            for row in self.conn.execute(f"""
+                SELECT id, file_hash, file_path, archived_at FROM documents
+                WHERE id IN ({','.join('?' * len(ids))})
+            """, ids):
+                existing[row['id']] = row
+
+        changed = [
+            doc for doc in docs
+            if (row := existing.get(doc.id)) is None
+            or row['file_hash'] != doc.file_hash
+            or row['file_path'] != doc.file_path
+            or row['archived_at'] is not None
+        ]
+        self.conn.executemany("""
+            INSERT INTO documents (id, type, title, content, file_path, file_hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                title = excluded.title,
+                content = excluded.content,
+                file_path = excluded.file_path,
+                file_hash = excluded.file_hash,
+                archived_at = NULL
+        """, [
+            (d.id, d.type.value, d.title, d.content, d.file_path, d.file_hash)
+            for d in changed
+        ])
+        self.save_relationships_batch(changed, commit=False)
+        if commit:
+            self.conn.commit()
+        return changed
+
     def get_document(self, doc_id: str) -> Document | None:
         """Get document by ID."""
         row = self.conn.execute(
@@ -156,6 +201,19 @@ class ArchiveService:
                 pass
         self.conn.commit()
 
+    def save_relationships_batch(self, docs: list[Document], commit: bool = True) -> None:
+        """Save relationships of many documents with one statement.
+
+        Relationships whose target is not in the archive are skipped.
+        """
+        rels = [rel for doc in docs for rel in self.extract_relationships(doc)]
+        self.conn.executemany("""
+            INSERT OR IGNORE INTO relationships (source_id, target_id, relationship_type)
+            SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM documents WHERE id = ?)
+        """, [(source, target, rel_type, target) for source, target, rel_type in rels])
+        if commit:
+            self.conn.commit()
+
     def get_relationships(self, doc_id: str) -> list[dict]:
         """Get all relationships for a document."""
         rows = self.conn.execute("""
@@ -124,10 +124,11 @@ class ChunkingService:
             strategy=strategy
         )
 
-    def rechunk_document(self, conn, doc_id: str) -> int:
+    def rechunk_document(self, conn, doc_id: str, commit: bool = True) -> int:
         """Re-chunk document after update (SPEC-0043-CH03).
 
         Deletes old chunks (embeddings CASCADE) and creates new ones.
+        With commit=False the caller owns the transaction.
         """
         # Delete old chunks (embeddings cascade delete via FK)
         conn.execute("DELETE FROM chunks WHERE doc_id = ?", (doc_id,))
@@ -152,7 +153,8 @@ class ChunkingService:
             """, (chunk.doc_id, chunk.chunk_index, chunk.content,
                   chunk.start_char, chunk.end_char, chunk.token_count))
 
-        conn.commit()
+        if commit:
+            conn.commit()
         return len(chunks)
 
     def chunk_and_store(self, conn, doc_id: str, content: str, file_path: str) -> int:
@@ -22,6 +22,13 @@ CREATE TABLE IF NOT EXISTS documents (
     archived_at TEXT DEFAULT NULL
 );
 
+-- Last synced stat of each source file, to skip unchanged files (SPEC-0043-AR06)
+CREATE TABLE IF NOT EXISTS file_state (
+    file_path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+
 -- Chunks table (SPEC-0043-CH01)
 CREATE TABLE IF NOT EXISTS chunks (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,6 +51,26 @@ CREATE TABLE IF NOT EXISTS embeddings (
     created_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Deleted embedding ids, read by the vector index to sync incrementally (SPEC-0043-SE02)
+CREATE TABLE IF NOT EXISTS embedding_tombstones (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    embedding_id INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS embeddings_ad AFTER DELETE ON embeddings BEGIN
+    INSERT INTO embedding_tombstones(embedding_id) VALUES (old.id);
+END;
+
+-- Embedding cache keyed by (model, text hash) (SPEC-0043-EM03)
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    dimensions INTEGER NOT NULL,
+    last_used TEXT DEFAULT (datetime('now')),
+    PRIMARY KEY (model, text_hash)
+);
+
 -- Relationships table (SPEC-0043-SE04)
 CREATE TABLE IF NOT EXISTS relationships (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -68,22 +95,23 @@ CREATE TABLE IF NOT EXISTS llm_calls (
 );
 
 -- FTS5 virtual table for full-text search (SPEC-0043-SE01)
+-- External content: rows are read back from documents by rowid
 CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5(
-    title, content, doc_id UNINDEXED, content='documents', content_rowid='rowid'
+    title, content, content='documents', content_rowid='rowid', prefix='2 3'
 );
 
 -- Triggers for FTS sync
 CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
-    INSERT INTO content_fts(rowid, title, content, doc_id) VALUES (new.rowid, new.title, new.content, new.id);
+    INSERT INTO content_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
 END;
 
 CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
-    INSERT INTO content_fts(content_fts, rowid, title, content, doc_id) VALUES ('delete', old.rowid, old.title, old.content, old.id);
+    INSERT INTO content_fts(content_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
 END;
 
-CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
-    INSERT INTO content_fts(content_fts, rowid, title, content, doc_id) VALUES ('delete', old.rowid, old.title, old.content, old.id);
-    INSERT INTO content_fts(rowid, title, content, doc_id) VALUES (new.rowid, new.title, new.content, new.id);
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE OF title, content ON documents BEGIN
+    INSERT INTO content_fts(content_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
+    INSERT INTO content_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
 END;
 
 -- Updated_at trigger
@@ -96,6 +124,7 @@ CREATE INDEX IF NOT EXISTS idx_documents_type ON documents(type);
 CREATE INDEX IF NOT EXISTS idx_documents_archived ON documents(archived_at);
 CREATE INDEX IF NOT EXISTS idx_chunks_doc_id ON chunks(doc_id);
 CREATE INDEX IF NOT EXISTS idx_embeddings_chunk_id ON embeddings(chunk_id);
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache(last_used);
 """
 
 
@@ -109,9 +138,31 @@ def get_connection() -> sqlite3.Connection:
     return conn
 
 
+def _drop_legacy_fts(conn: sqlite3.Connection) -> bool:
+    """Drop an FTS index created by an older schema.
+
+    The original content_fts declared a doc_id column that does not exist in
+    documents, which breaks snippet() and column reads on the external
+    content table. Returns True if the index was dropped and needs a rebuild.
+    """
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'content_fts'"
+    ).fetchone()
+    if row is None or "doc_id UNINDEXED" not in row[0]:
+        return False
+
+    for trigger in ("documents_ai", "documents_ad", "documents_au"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE content_fts")
+    return True
+
+
 def init_database() -> sqlite3.Connection:
     """Initialize database with schema."""
     conn = get_connection()
+    rebuild = _drop_legacy_fts(conn)
     conn.executescript(SCHEMA)
+    if rebuild:
+        conn.execute("INSERT INTO content_fts(content_fts) VALUES ('rebuild')")
     conn.commit()
     return conn
@@ -0,0 +1,160 @@
+"""Embedding Cache - SPEC-0043-EM03.
+
+LRU cache of embeddings keyed by (model, text hash), so repeated queries
+and unchanged chunk text are not re-encoded.
+
+Recently used vectors are kept in memory; with a database path the cache
+is also persisted to the embedding_cache table, where the least recently
+used rows are pruned past a size limit.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from gateway.services.knowledge.database import SCHEMA
+
+
+def text_hash(text: str) -> str:
+    """Stable hash of the text to embed."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-level (memory, SQLite) LRU cache of float32 embeddings."""
+
+    PRUNE_EVERY = 256  # Persisted inserts between size checks
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        max_entries: int = 2048,
+        max_persisted: int = 100_000,
+    ):
+        """Create the cache.
+
+        Args:
+            db_path: Knowledge database to persist to (None = memory only).
+            max_entries: Vectors kept in memory.
+            max_persisted: Rows kept in the embedding_cache table.
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_persisted = max_persisted
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        self._inserts = 0
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection | None:
+        """Lazily open the cache's own connection (shared across threads)."""
+        if self.db_path is None:
+            return None
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def _remember(self, key: tuple[str, str], vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, model: str, texts: list[str]) -> list[np.ndarray | None]:
+        """Cached vectors for texts (None where missing), marked as recently used."""
+        return self._lookup(model, texts, touch=True)
+
+    def peek_many(self, model: str, texts: list[str]) -> list[np.ndarray | None]:
+        """Cached vectors for texts without touching recency or the memory level.
+
+        For bulk reads (the embedding backfill) that must not evict the
+        query working set.
+        """
+        return self._lookup(model, texts, touch=False)
+
+    def _lookup(self, model: str, texts: list[str], touch: bool) -> list[np.ndarray | None]:
+        keys = [(model, text_hash(t)) for t in texts]
+        found: list[np.ndarray | None] = []
+        with self._lock:
+            missing: dict[str, list[int]] = {}
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.setdefault(key[1], []).append(i)
+                elif touch:
+                    self._memory.move_to_end(key)
+                found.append(vector)
+
+            conn = self._db()
+            if missing and conn is not None:
+                hashes = list(missing)
+                rows = conn.execute(f"""
+                    SELECT text_hash, vector FROM embedding_cache
+                    WHERE model = ? AND text_hash IN ({','.join('?' * len(hashes))})
+                """, [model, *hashes]).fetchall()
+                for digest, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    if touch:
+                        self._remember((model, digest), vector)
+                    for i in missing[digest]:
+                        found[i] = vector
+                if rows and touch:
+                    conn.execute(f"""
+                        UPDATE embedding_cache SET last_used = datetime('now')
+                        WHERE model = ? AND text_hash IN ({','.join('?' * len(rows))})
+                    """, [model, *(r[0] for r in rows)])
+                    conn.commit()
+
+            hit_count = sum(v is not None for v in found)
+            self.hits += hit_count
+            self.misses += len(found) - hit_count
+        return found
+
+    def put_many(self, model: str, texts: list[str], vectors: np.ndarray) -> None:
+        """Store vectors for texts."""
+        entries = [
+            (text_hash(t), np.asarray(v, dtype=np.float32))
+            for t, v in zip(texts, vectors, strict=True)
+        ]
+        with self._lock:
+            for digest, vector in entries:
+                self._remember((model, digest), vector)
+
+            conn = self._db()
+            if conn is None:
+                return
+            conn.executemany("""
+                INSERT OR REPLACE INTO embedding_cache (model, text_hash, vector, dimensions)
+                VALUES (?, ?, ?, ?)
+            """, [(model, digest, v.tobytes(), len(v)) for digest, v in entries])
+            self._inserts += len(entries)
+            if self._inserts >= self.PRUNE_EVERY:
+                self._inserts = 0
+                self._prune(conn)
+            conn.commit()
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used rows beyond max_persisted."""
+        excess = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        excess -= self.max_persisted
+        if excess > 0:
+            conn.execute("""
+                DELETE FROM embedding_cache WHERE rowid IN (
+                    SELECT rowid FROM embedding_cache ORDER BY last_used LIMIT ?
+                )
+            """, (excess,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
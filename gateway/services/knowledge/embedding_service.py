@@ -3,11 +3,23 @@
 Generate embeddings with dual-mode and auto-fallback.
 """
 
+import logging
 import os
 import struct
+import threading
+import time
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
+import numpy as np
+
+from gateway.services.knowledge.database import DB_PATH
+from gateway.services.knowledge.embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class EmbeddingResult:
@@ -17,27 +29,72 @@ class EmbeddingResult:
     dimensions: int
 
 
+@dataclass
+class BackfillStats:
+    """Throughput of an embed_all_chunks run."""
+    total: int = 0
+    embedded: int = 0
+    seconds: float = 0.0
+    read_seconds: float = 0.0
+    write_seconds: float = 0.0
+    wait_seconds: float = 0.0  # Writer idle, waiting for the encoder
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.embedded / self.seconds if self.seconds else 0.0
+
+
 class EmbeddingService:
     """Embedding generation with fallback support."""
 
     PRIMARY_MODEL = 'all-mpnet-base-v2'  # 768 dims
     FALLBACK_MODEL = 'all-MiniLM-L6-v2'  # 384 dims
+    PAGE_BATCHES = 32  # Batches per page read by embed_all_chunks
 
-    def __init__(self, batch_size: int = 32):
+    def __init__(
+        self,
+        batch_size: int = 32,
+        cache: EmbeddingCache | None = None,
+        batch_window: float = 0.005,
+        pipeline_depth: int = 4,
+    ):
+        """Create the service.
+
+        Args:
+            batch_size: Texts per model batch.
+            cache: Embedding cache (default: in-memory only).
+            batch_window: Seconds embed_query waits for concurrent queries
+                to encode them in one batch.
+            pipeline_depth: Batches embed_all_chunks encodes ahead of
+                the database writes.
+        """
         self.batch_size = batch_size
+        self.cache = cache or EmbeddingCache()
+        self.batch_window = batch_window
+        self.pipeline_depth = pipeline_depth
+        self.last_backfill: BackfillStats | None = None
         self._model = None
         self._model_name: str | None = None
         self._mode = os.getenv('KNOWLEDGE_EMBEDDING_MODE', 'local')
 
+        self._model_lock = threading.Lock()
+        self._query_lock = threading.Lock()
+        self._queued: dict[str, Future] = {}
+        self._flushing = False
+
     def _load_model(self, model_name: str):
         """Lazy load model with fallback on MemoryError."""
         if self._model_name == model_name:
             return
+        if model_name == self.PRIMARY_MODEL and self._model_name == self.FALLBACK_MODEL:
+            return  # Already fell back
 
         try:
             from sentence_transformers import SentenceTransformer
-            self._model = SentenceTransformer(model_name)
+            model = SentenceTransformer(model_name)
+            # Name first: a thread that sees the model must also see its name
             self._model_name = model_name
+            self._model = model
         except MemoryError:
             if model_name == self.PRIMARY_MODEL:
                 # Auto-fallback (SPEC-0043-EM02)
@@ -47,25 +104,102 @@ class EmbeddingService:
         except ImportError:
             raise ImportError("sentence-transformers required. Install with: pip install sentence-transformers")
 
+    def _ensure_model(self) -> None:
+        """Load the model once, even when several threads need it at the same time."""
+        if self._model is not None:
+            return
+        with self._model_lock:
+            if self._model is None:
+                self._load_model(self.PRIMARY_MODEL)
+
+    def _encode(self, texts: list[str], store: bool = True) -> tuple[str, list[np.ndarray]]:
+        """Vectors for texts and the model they belong to, encoding only cache misses.
+
+        With ``store=False`` the cache is only read, never filled or reordered.
+        """
+        lookup = self.cache.get_many if store else self.cache.peek_many
+        model = self._model_name or self.PRIMARY_MODEL
+        vectors = lookup(model, texts)
+        if all(v is not None for v in vectors):
+            return model, vectors
+
+        self._ensure_model()
+        if self._model_name != model:
+            model = self._model_name
+            vectors = lookup(model, texts)
+
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        if missing:
+            new_texts = list(dict.fromkeys(texts[i] for i in missing))
+            encoded = self._model.encode(
+                new_texts, normalize_embeddings=True, batch_size=self.batch_size
+            )
+            encoded = np.asarray(encoded, dtype=np.float32)
+            if store:
+                self.cache.put_many(model, new_texts, encoded)
+            by_text = dict(zip(new_texts, encoded, strict=True))
+            for i in missing:
+                vectors[i] = by_text[texts[i]]
+        return model, vectors
+
     def embed(self, text: str) -> EmbeddingResult:
         """Generate embedding for single text."""
-        self._load_model(self.PRIMARY_MODEL)
-        vec = self._model.encode(text, normalize_embeddings=True)
+        model, vectors = self._encode([text])
         return EmbeddingResult(
-            vector=vec.tolist(),
-            model=self._model_name,
-            dimensions=len(vec)
+            vector=vectors[0].tolist(),
+            model=model,
+            dimensions=len(vectors[0])
         )
 
     def embed_batch(self, texts: list[str]) -> list[EmbeddingResult]:
         """Generate embeddings for multiple texts."""
-        self._load_model(self.PRIMARY_MODEL)
-        vectors = self._model.encode(texts, normalize_embeddings=True, batch_size=self.batch_size)
+        model, vectors = self._encode(texts)
         return [
-            EmbeddingResult(vector=v.tolist(), model=self._model_name, dimensions=len(v))
+            EmbeddingResult(vector=v.tolist(), model=model, dimensions=len(v))
             for v in vectors
         ]
 
+    def embed_query(self, text: str) -> EmbeddingResult:
+        """Embed a search query, batching concurrent callers.
+
+        Cached queries return immediately. Otherwise the first caller waits
+        ``batch_window`` seconds for queries from other threads, then
+        encodes all of them in one model call; identical queries in flight
+        share one result.
+        """
+        cached = self.cache.get_many(self._model_name or self.PRIMARY_MODEL, [text])[0]
+        if cached is not None:
+            return EmbeddingResult(
+                vector=cached.tolist(),
+                model=self._model_name or self.PRIMARY_MODEL,
+                dimensions=len(cached),
+            )
+
+        with self._query_lock:
+            future = self._queued.get(text)
+            if future is None:
+                future = Future()
+                self._queued[text] = future
+            leader = not self._flushing
+            self._flushing = True
+
+        if leader:
+            time.sleep(self.batch_window)
+            with self._query_lock:
+                batch = self._queued
+                self._queued = {}
+                self._flushing = False
+            try:
+                results = self.embed_batch(list(batch))
+            except Exception as e:
+                for pending in batch.values():
+                    pending.set_exception(e)
+            else:
+                for pending, result in zip(batch.values(), results, strict=True):
+                    pending.set_result(result)
+
+        return future.result()
+
     @staticmethod
     def vector_to_blob(vector: list[float]) -> bytes:
         """Serialize vector to BLOB for SQLite storage."""
@@ -85,36 +219,98 @@ class EmbeddingService:
         """Embed all chunks without embeddings (resume-capable).
 
         SPEC-0043-EM04: Batch processing with progress callback.
+
+        Unembedded chunks are read a page at a time (keyset on chunk id),
+        sorted by length within the page and cut into batches so texts of
+        similar length are padded together. Batches are encoded on a worker
+        thread while earlier batches are written with executemany; at most
+        ``pipeline_depth`` batches are in flight. Chunk text found in the
+        embedding cache is reused, but the backfill never fills the cache,
+        so it does not evict cached queries. Every written batch is
+        committed, so an interrupted run resumes where it stopped.
+        Throughput is recorded in ``last_backfill``.
         """
-        # Find unembedded chunks
-        rows = conn.execute("""
-            SELECT c.id, c.content FROM chunks c
+        stats = BackfillStats(total=conn.execute("""
+            SELECT COUNT(*) FROM chunks c
             LEFT JOIN embeddings e ON e.chunk_id = c.id
             WHERE e.chunk_id IS NULL
-        """).fetchall()
-
-        if not rows:
+        """).fetchone()[0])
+        self.last_backfill = stats
+        if not stats.total:
             return 0
 
-        self._load_model(self.PRIMARY_MODEL)
-        total = len(rows)
-        embedded = 0
+        start = time.perf_counter()
+        page_size = self.batch_size * self.PAGE_BATCHES
+        pending: deque[tuple[list[int], Future[tuple[str, list[np.ndarray]]]]] = deque()
+        encoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix='embed-backfill')
+
+        def write(ids: list[int], model: str, vectors: list[np.ndarray]) -> None:
+            t = time.perf_counter()
+            conn.executemany(
+                "INSERT INTO embeddings (chunk_id, vector, model, dimensions) VALUES (?,?,?,?)",
+                [
+                    (chunk_id, np.asarray(vec, dtype=np.float32).tobytes(), model, len(vec))
+                    for chunk_id, vec in zip(ids, vectors, strict=True)
+                ],
+            )
+            conn.commit()  # Commit each batch for resume
+            stats.write_seconds += time.perf_counter() - t
+            stats.embedded += len(ids)
+            if progress_callback:
+                progress_callback(stats.embedded, stats.total)
 
-        for i in range(0, total, self.batch_size):
-            batch = rows[i:i + self.batch_size]
-            texts = [r['content'] for r in batch]
-            vectors = self._model.encode(texts, normalize_embeddings=True)
+        def drain(keep: int) -> None:
+            while len(pending) > keep:
+                ids, future = pending.popleft()
+                t = time.perf_counter()
+                model, vectors = future.result()
+                stats.wait_seconds += time.perf_counter() - t
+                write(ids, model, vectors)
 
-            for row, vec in zip(batch, vectors):
-                conn.execute(
-                    "INSERT INTO embeddings (chunk_id, vector, model, dimensions) VALUES (?,?,?,?)",
-                    (row['id'], self.vector_to_blob(vec.tolist()), self._model_name, len(vec))
-                )
-                embedded += 1
+        try:
+            last_id = 0
+            while True:
+                t = time.perf_counter()
+                rows = conn.execute("""
+                    SELECT c.id, c.content FROM chunks c
+                    LEFT JOIN embeddings e ON e.chunk_id = c.id
+                    WHERE e.chunk_id IS NULL AND c.id > ?
+                    ORDER BY c.id
+                    LIMIT ?
+                """, (last_id, page_size)).fetchall()
+                stats.read_seconds += time.perf_counter() - t
+                if not rows:
+                    break
+                last_id = rows[-1][0]
 
-            conn.commit()  # Commit each batch for resume
+                rows.sort(key=lambda r: len(r[1]))
+                for i in range(0, len(rows), self.batch_size):
+                    batch = rows[i:i + self.batch_size]
+                    texts = [r[1] for r in batch]
+                    future = encoder.submit(self._encode, texts, store=False)
+                    pending.append(([r[0] for r in batch], future))
+                    drain(self.pipeline_depth)
+            drain(0)
+        finally:
+            encoder.shutdown(wait=True, cancel_futures=True)
+            stats.seconds = time.perf_counter() - start
+
+        logger.info(
+            f"Embedded {stats.embedded} chunks in {stats.seconds:.1f}s "
+            f"({stats.chunks_per_second:.1f} chunks/s, waited on encoder {stats.wait_seconds:.1f}s, "
+            f"read {stats.read_seconds:.1f}s, write {stats.write_seconds:.1f}s)"
+        )
+        return stats.embedded
+
+
+_default_service: EmbeddingService | None = None
+_default_lock = threading.Lock()
 
-            if progress_callback:
-                progress_callback(embedded, total)
 
-        return embedded
+def get_embedding_service() -> EmbeddingService:
+    """Process-wide embedding service with a cache persisted to the archive."""
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = EmbeddingService(cache=EmbeddingCache(DB_PATH))
+        return _default_service
@@ -12,6 +12,7 @@ import logging
 from dataclasses import dataclass, field
 
 from gateway.services.knowledge.database import get_connection
+from gateway.services.knowledge.embedding_service import EmbeddingService, get_embedding_service
 from gateway.services.knowledge.sanitizer import Sanitizer
 from gateway.services.knowledge.search_service import SearchHit, SearchService
 
@@ -247,6 +248,7 @@ class EnhancedRAGConfig:
     use_query_enhancement: bool = True  # Level 1
     use_llm_reranking: bool = True      # Level 2 (UI toggle)
     use_graph_expansion: bool = True    # Level 3
+    use_vector_search: bool = True      # Query embeddings in hybrid retrieval
     max_candidates: int = 20            # Initial retrieval count
     top_k: int = 5                      # Final context count
     max_tokens: int = 3000              # Token budget for context
@@ -269,11 +271,17 @@ class EnhancedRAGBuilder:
 
     CHARS_PER_TOKEN = 4
 
-    def __init__(self, config: EnhancedRAGConfig | None = None):
+    def __init__(
+        self,
+        config: EnhancedRAGConfig | None = None,
+        embedding_service: EmbeddingService | None = None,
+    ):
         self.config = config or EnhancedRAGConfig()
         self._conn = None
         self._search = None
         self._sanitizer = None
+        self._embeddings = embedding_service
+        self._embeddings_unavailable = False
 
     def _get_services(self):
         """Lazy-load services."""
@@ -283,6 +291,28 @@ class EnhancedRAGBuilder:
             self._sanitizer = Sanitizer()
         return self._conn, self._search, self._sanitizer
 
+    def _query_vector(self, query: str, search: SearchService) -> list[float] | None:
+        """Embed the query for vector retrieval, if embeddings are usable.
+
+        Skipped when the archive has no embeddings yet; a missing embedding
+        backend disables vector retrieval for this builder.
+        """
+        if self._embeddings_unavailable:
+            return None
+        if not search.has_embeddings():
+            return None
+
+        if self._embeddings is None:
+            self._embeddings = get_embedding_service()
+        try:
+            return self._embeddings.embed_query(query).vector
+        except ImportError as e:
+            logger.warning(f"Vector search disabled: {e}")
+            self._embeddings_unavailable = True
+        except Exception as e:
+            logger.warning(f"Query embedding failed: {e}, using keyword search only")
+        return None
+
     def build_context(
         self,
         query: str,
@@ -308,10 +338,12 @@ class EnhancedRAGBuilder:
         else:
             enhanced_query = query
 
-        # Initial retrieval (hybrid search)
+        # Initial retrieval (hybrid search). The vector side embeds the
+        # original query; expansion terms only help keyword matching.
+        query_vector = self._query_vector(query, search) if config.use_vector_search else None
         candidates = search.hybrid_search(
             enhanced_query,
-            query_vector=None,  # TODO: Add vector search
+            query_vector=query_vector,
             top_k=config.max_candidates,
         )
 
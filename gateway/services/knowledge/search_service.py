@@ -3,10 +3,58 @@
 Full-text search, vector search, and hybrid search.
 """
 
+import re
 import sqlite3
 from dataclasses import dataclass
 
+import numpy as np
+
 from gateway.services.knowledge.database import get_connection
+from gateway.services.knowledge.vector_index import VectorIndex
+
+# Column weights for bm25(): title matches count more than body matches
+TITLE_WEIGHT = 5.0
+CONTENT_WEIGHT = 1.0
+
+# Default snippet() markup and size (in tokens)
+HIGHLIGHT_START = "**"
+HIGHLIGHT_END = "**"
+SNIPPET_TOKENS = 32
+
+_PHRASE = re.compile(r'"([^"]*)"')
+# Words, optionally joined by - . / (ADR-0001, v1.2) and a trailing * for prefixes
+_TERM = re.compile(r"\w+(?:[-./]\w+)*\*?")
+_OPERATORS = frozenset({"AND", "OR", "NOT", "NEAR"})
+
+
+def build_fts_query(query: str, match_all: bool = False) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Quoted text becomes a phrase query and a trailing ``*`` a prefix query.
+    Every other term is quoted so FTS5 syntax characters in user input
+    (parentheses, colons, operators) are matched literally instead of
+    raising a syntax error.
+
+    Args:
+        query: User query text.
+        match_all: Require every term (AND) instead of any term (OR).
+
+    Returns:
+        MATCH expression, or an empty string if nothing searchable remains.
+    """
+    parts: list[str] = []
+    for phrase in _PHRASE.findall(query):
+        words = [term.rstrip("*") for term in _TERM.findall(phrase)]
+        if words:
+            parts.append('"' + " ".join(words) + '"')
+
+    for term in _TERM.findall(_PHRASE.sub(" ", query)):
+        word = term.rstrip("*")
+        if word in _OPERATORS:
+            continue
+        parts.append(f'"{word}"*' if term.endswith("*") else f'"{word}"')
+
+    return (" AND " if match_all else " OR ").join(dict.fromkeys(parts))
 
 
 @dataclass
@@ -17,6 +65,7 @@ class SearchHit:
     snippet: str
     score: float
     doc_type: str
+    highlighted_title: str | None = None
 
 
 class SearchService:
@@ -24,77 +73,116 @@ class SearchService:
 
     def __init__(self, conn: sqlite3.Connection | None = None):
         self.conn = conn or get_connection()
+        self._vector_indexes: dict[int, VectorIndex] = {}
+
+    def fts_search(
+        self,
+        query: str,
+        top_k: int = 10,
+        match_all: bool = False,
+        highlight: tuple[str, str] = (HIGHLIGHT_START, HIGHLIGHT_END),
+    ) -> list[SearchHit]:
+        """Full-text search using FTS5 (SPEC-0043-SE01).
+
+        Results are ranked by bm25 with title matches weighted above body
+        matches. Supports "quoted phrases" and prefix* terms; any other
+        FTS5 syntax in the query is matched literally.
 
-    def fts_search(self, query: str, top_k: int = 10) -> list[SearchHit]:
-        """Full-text search using FTS5 (SPEC-0043-SE01)."""
-        # Simple FTS search on documents table directly
+        Args:
+            query: Search text.
+            top_k: Maximum results.
+            match_all: Require every term instead of any term.
+            highlight: Markers placed around matched terms in snippets.
+
+        Returns:
+            Hits ordered by relevance; score is the negated bm25 (higher is better).
+        """
+        match = build_fts_query(query, match_all=match_all)
+        if not match:
+            return []
+
+        start, end = highlight
         rows = self.conn.execute("""
             SELECT
-                id as doc_id,
-                title,
-                substr(content, 1, 200) as snippet,
-                type as doc_type
-            FROM documents
-            WHERE archived_at IS NULL
-              AND (title LIKE ? OR content LIKE ?)
+                d.id as doc_id,
+                d.title,
+                d.type as doc_type,
+                highlight(content_fts, 0, ?, ?) as highlighted_title,
+                snippet(content_fts, 1, ?, ?, '…', ?) as snippet,
+                bm25(content_fts, ?, ?) as rank
+            FROM content_fts
+            JOIN documents d ON d.rowid = content_fts.rowid
+            WHERE content_fts MATCH ?
+              AND d.archived_at IS NULL
+            ORDER BY rank
             LIMIT ?
-        """, (f'%{query}%', f'%{query}%', top_k)).fetchall()
+        """, (
+            start, end, start, end, SNIPPET_TOKENS,
+            TITLE_WEIGHT, CONTENT_WEIGHT, match, top_k,
+        )).fetchall()
 
         return [
             SearchHit(
                 doc_id=r['doc_id'],
                 title=r['title'],
                 snippet=r['snippet'],
-                score=1.0,  # Simple match score
-                doc_type=r['doc_type']
+                score=-r['rank'],
+                doc_type=r['doc_type'],
+                highlighted_title=r['highlighted_title'],
             )
             for r in rows
         ]
 
-    def _blob_to_vector(self, blob: bytes) -> list[float]:
-        """Deserialize vector from BLOB."""
-        import struct
-        count = len(blob) // 4  # float32 = 4 bytes
-        return list(struct.unpack(f'{count}f', blob))
-
-    def _cosine_similarity(self, v1: list[float], v2: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        dot = sum(a * b for a, b in zip(v1, v2))
-        norm1 = sum(a * a for a in v1) ** 0.5
-        norm2 = sum(b * b for b in v2) ** 0.5
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        return dot / (norm1 * norm2)
+    def has_embeddings(self) -> bool:
+        """Whether any chunk has been embedded (vector search can return hits)."""
+        return self.conn.execute("SELECT 1 FROM embeddings LIMIT 1").fetchone() is not None
+
+    def _vector_index(self, dimensions: int) -> VectorIndex:
+        """Vector index for the given dimensionality, synced with the database."""
+        index = self._vector_indexes.get(dimensions)
+        if index is None:
+            index = VectorIndex.for_connection(self.conn, dimensions)
+            self._vector_indexes[dimensions] = index
+        index.sync(self.conn)
+        return index
 
     def vector_search(self, query_vector: list[float], top_k: int = 10) -> list[SearchHit]:
-        """Vector similarity search (SPEC-0043-SE02)."""
-        rows = self.conn.execute("""
+        """Vector similarity search (SPEC-0043-SE02).
+
+        Cosine similarity against the in-process vector index; hits are per
+        chunk, most similar first.
+        """
+        query = np.asarray(query_vector, dtype=np.float32)
+        matches = self._vector_index(len(query)).search(query, top_k)
+        if not matches:
+            return []
+
+        chunk_ids = [chunk_id for chunk_id, _ in matches]
+        rows = self.conn.execute(f"""
             SELECT
-                e.vector,
+                c.id as chunk_id,
                 c.doc_id,
-                c.content as snippet,
+                substr(c.content, 1, 200) as snippet,
                 d.title,
                 d.type as doc_type
-            FROM embeddings e
-            JOIN chunks c ON e.chunk_id = c.id
+            FROM chunks c
             JOIN documents d ON c.doc_id = d.id
-            WHERE d.archived_at IS NULL
-        """).fetchall()
-
-        scored = []
-        for r in rows:
-            vec = self._blob_to_vector(r['vector'])
-            sim = self._cosine_similarity(query_vector, vec)
-            scored.append(SearchHit(
+            WHERE c.id IN ({','.join('?' * len(chunk_ids))})
+              AND d.archived_at IS NULL
+        """, chunk_ids).fetchall()
+        by_chunk = {r['chunk_id']: r for r in rows}
+
+        return [
+            SearchHit(
                 doc_id=r['doc_id'],
                 title=r['title'],
-                snippet=r['snippet'][:200],
-                score=sim,
+                snippet=r['snippet'],
+                score=score,
                 doc_type=r['doc_type']
-            ))
-
-        scored.sort(key=lambda x: x.score, reverse=True)
-        return scored[:top_k]
+            )
+            for chunk_id, score in matches
+            if (r := by_chunk.get(chunk_id)) is not None
+        ]
 
     def hybrid_search(
         self,
@@ -118,10 +206,14 @@ class SearchService:
             rrf_scores[hit.doc_id] = rrf_scores.get(hit.doc_id, 0) + fts_weight / (k + rank + 1)
             doc_data[hit.doc_id] = hit
 
-        # Vector results (if vector provided)
+        # Vector results (if vector provided). Hits are per chunk, so a
+        # document is ranked by its best chunk only.
         if query_vector:
             vec_results = self.vector_search(query_vector, top_k * 2)
-            for rank, hit in enumerate(vec_results):
+            best_chunks: dict[str, SearchHit] = {}
+            for hit in vec_results:
+                best_chunks.setdefault(hit.doc_id, hit)
+            for rank, hit in enumerate(best_chunks.values()):
                 rrf_scores[hit.doc_id] = rrf_scores.get(hit.doc_id, 0) + vec_weight / (k + rank + 1)
                 if hit.doc_id not in doc_data:
                     doc_data[hit.doc_id] = hit
@@ -135,7 +227,8 @@ class SearchService:
                 title=doc_data[doc_id].title,
                 snippet=doc_data[doc_id].snippet,
                 score=rrf_scores[doc_id],
-                doc_type=doc_data[doc_id].doc_type
+                doc_type=doc_data[doc_id].doc_type,
+                highlighted_title=doc_data[doc_id].highlighted_title,
             )
             for doc_id in sorted_ids[:top_k]
         ]
@@ -1,14 +1,37 @@
 """Sync Service - SPEC-0043-AR06.
 
 File watcher for automatic document sync.
+
+Sync is incremental: each file's size and mtime are recorded in file_state
+and unchanged files are skipped without being read. Files whose stat
+changed are read and hashed in a thread pool and only parsed if the content
+hash differs from the archived document. Changed documents, their
+relationships and (optionally) their chunks are written in one transaction;
+files that disappeared are archived.
+
+Watcher events are applied on a single sync thread with its own database
+connection, since SQLite connections cannot be shared across threads.
 """
 
+import fnmatch
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 from threading import Timer
 
 from gateway.services.knowledge.archive_service import ArchiveService
-from gateway.services.knowledge.parsers import parse_document
-from shared.contracts.knowledge.archive import SyncConfig, SyncStatus
+from gateway.services.knowledge.chunking import ChunkingService
+from gateway.services.knowledge.database import get_connection
+from gateway.services.knowledge.embedding_service import EmbeddingService
+from gateway.services.knowledge.parsers import _compute_hash, parse_document
+from shared.contracts.core.concurrency import ConcurrencyConfig
+from shared.contracts.knowledge.archive import Document, SyncConfig, SyncStatus
 
 DEFAULT_WATCH_PATHS = [
     Path('.sessions'),
@@ -19,93 +42,329 @@ DEFAULT_WATCH_PATHS = [
     Path('shared/contracts'),
 ]
 
+SUPPORTED_SUFFIXES = ('.md', '.json')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncReport:
+    """Outcome of one sync run."""
+    scanned: int = 0
+    unchanged: int = 0
+    updated: int = 0
+    archived: int = 0
+    errors: list[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+
+@dataclass
+class _KnownFile:
+    doc_id: str
+    file_hash: str
+    archived: bool
+    mtime_ns: int | None
+    size: int | None
+
+
+def _read_file(path: Path, known_hash: str | None) -> tuple[Document | None, str | None]:
+    """Parse a file unless its content hash matches the archived one.
+
+    Runs in a worker thread. Returns (document or None, error or None).
+    """
+    try:
+        if known_hash is not None and _compute_hash(path.read_text(encoding='utf-8')) == known_hash:
+            return None, None
+        return parse_document(path), None
+    except Exception as e:
+        return None, f"{path}: {e}"
+
 
 class SyncService:
     """Document synchronization with optional file watching."""
 
-    def __init__(self, archive: ArchiveService, config: SyncConfig | None = None):
+    def __init__(
+        self,
+        archive: ArchiveService,
+        config: SyncConfig | None = None,
+        chunking: ChunkingService | None = None,
+        embeddings: EmbeddingService | None = None,
+        max_workers: int | None = None,
+        connect: Callable[[], sqlite3.Connection] = get_connection,
+    ) -> None:
+        """Create the service.
+
+        Args:
+            archive: Archive to sync into.
+            config: Sync configuration.
+            chunking: Re-chunk changed documents in the sync transaction.
+            embeddings: Embed new chunks after the sync transaction.
+            max_workers: Threads reading files (None = ET_MAX_THREADS).
+            connect: Opens the archive database; called once on the watcher's
+                sync thread, which applies all watcher events.
+        """
         self.archive = archive
         self.config = config or SyncConfig()
+        self.chunking = chunking
+        self.embeddings = embeddings
+        self.max_workers = max_workers or ConcurrencyConfig.from_env().max_threads
+        self.connect = connect
         self._observer = None
         self._debounce_timers: dict[str, Timer] = {}
+        self._watch_executor: ThreadPoolExecutor | None = None
+        self._watch_sync: SyncService | None = None
         self._is_running = False
+        self._last_sync_at: datetime | None = None
+        self._last_report: SyncReport | None = None
+
+    # --- Sync --------------------------------------------------------------
 
     def sync_all(self) -> int:
         """Sync all documents from configured paths. Returns count."""
-        count = 0
-        for watch_path in DEFAULT_WATCH_PATHS:
-            if not watch_path.exists():
-                continue
-            for filepath in watch_path.rglob('*'):
-                if filepath.is_file() and filepath.suffix in ('.md', '.json'):
-                    try:
-                        doc = parse_document(filepath)
-                        if self.archive.upsert_document(doc):
-                            self.archive.save_relationships(doc)
-                            count += 1
-                    except Exception:
-                        continue
-        return count
+        return self.sync(DEFAULT_WATCH_PATHS).updated
 
     def sync_path(self, path: Path) -> int:
         """Sync documents from specific path."""
-        count = 0
-        if path.is_file():
-            doc = parse_document(path)
-            if self.archive.upsert_document(doc):
-                self.archive.save_relationships(doc)
-                count = 1
-        elif path.is_dir():
-            for filepath in path.rglob('*'):
-                if filepath.is_file() and filepath.suffix in ('.md', '.json'):
-                    try:
-                        doc = parse_document(filepath)
-                        if self.archive.upsert_document(doc):
-                            self.archive.save_relationships(doc)
-                            count += 1
-                    except Exception:
+        return self.sync([path]).updated
+
+    def sync(self, roots: list[Path]) -> SyncReport:
+        """Incrementally sync files under roots (files or directories).
+
+        Documents whose file is gone are archived; files under a root that
+        no longer exists count as gone.
+        """
+        start = time.perf_counter()
+        report = SyncReport()
+        known = self._known_files()
+
+        files: dict[str, os.stat_result] = {}
+        for root in roots:
+            files.update(self._scan(root))
+        report.scanned = len(files)
+
+        to_read: list[tuple[str, str | None]] = []
+        stats: dict[str, tuple[int, int]] = {}
+        for file_path, st in files.items():
+            state = known.get(file_path)
+            stat_key = (st.st_mtime_ns, st.st_size)
+            if state is not None and (state.mtime_ns, state.size) == stat_key:
+                report.unchanged += 1
+                continue
+            stats[file_path] = stat_key
+            # An archived document without file_state had its file deleted
+            # by a previous sync; the file is back, so re-parse to restore it.
+            restore = state is not None and state.archived and state.mtime_ns is None
+            known_hash = None if state is None or restore else state.file_hash
+            to_read.append((file_path, known_hash))
+
+        docs: list[Document] = []
+        if to_read:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(to_read))) as pool:
+                results = pool.map(lambda item: _read_file(Path(item[0]), item[1]), to_read)
+                for (file_path, _), (doc, error) in zip(to_read, results, strict=True):
+                    if error is not None:
+                        report.errors.append(error)
+                        stats.pop(file_path)
+                    elif doc is not None:
+                        docs.append(doc)
+                    else:
+                        report.unchanged += 1
+
+        gone = [
+            file_path for file_path, state in known.items()
+            if file_path not in files
+            and state.mtime_ns is not None
+            and any(self._is_under(file_path, root) for root in roots)
+        ]
+
+        conn = self.archive.conn
+        changed = self._write(docs, stats, gone, report)
+        self._last_sync_at = datetime.now(UTC)
+        self._last_report = report
+
+        if changed and self.chunking is not None and self.embeddings is not None:
+            self.embeddings.embed_all_chunks(conn)
+
+        report.duration_ms = (time.perf_counter() - start) * 1000
+        return report
+
+    def _write(
+        self,
+        docs: list[Document],
+        stats: dict[str, tuple[int, int]],
+        gone: list[str],
+        report: SyncReport,
+    ) -> list[Document]:
+        """Apply a sync in a single transaction."""
+        conn = self.archive.conn
+        changed: list[Document] = []
+        try:
+            for doc in docs:
+                # A file whose artifact id changed leaves its old document
+                # behind: archive it and move it off the (UNIQUE) file_path.
+                conn.execute(
+                    "UPDATE documents SET archived_at = datetime('now') "
+                    "WHERE file_path = ? AND id != ? AND archived_at IS NULL",
+                    (doc.file_path, doc.id),
+                )
+                conn.execute(
+                    "UPDATE documents SET file_path = file_path || '#' || id "
+                    "WHERE file_path = ? AND id != ?",
+                    (doc.file_path, doc.id),
+                )
+            changed = self.archive.upsert_documents(docs, commit=False)
+            report.updated = len(changed)
+
+            if self.chunking is not None:
+                for doc in changed:
+                    self.chunking.rechunk_document(conn, doc.id, commit=False)
+
+            if gone:
+                report.archived = sum(
+                    conn.execute(
+                        "UPDATE documents SET archived_at = datetime('now') "
+                        "WHERE file_path = ? AND archived_at IS NULL",
+                        (file_path,),
+                    ).rowcount
+                    for file_path in gone
+                )
+                conn.executemany(
+                    "DELETE FROM file_state WHERE file_path = ?", [(p,) for p in gone]
+                )
+
+            conn.executemany("""
+                INSERT INTO file_state (file_path, mtime_ns, size) VALUES (?, ?, ?)
+                ON CONFLICT(file_path) DO UPDATE SET
+                    mtime_ns = excluded.mtime_ns, size = excluded.size
+            """, [(p, mtime_ns, size) for p, (mtime_ns, size) in stats.items()])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return changed
+
+    def _known_files(self) -> dict[str, _KnownFile]:
+        """Archived documents with their last synced file stat, by path."""
+        rows = self.archive.conn.execute("""
+            SELECT d.file_path, d.id, d.file_hash, d.archived_at, f.mtime_ns, f.size
+            FROM documents d
+            LEFT JOIN file_state f ON f.file_path = d.file_path
+        """).fetchall()
+        return {
+            r['file_path']: _KnownFile(
+                doc_id=r['id'],
+                file_hash=r['file_hash'],
+                archived=r['archived_at'] is not None,
+                mtime_ns=r['mtime_ns'],
+                size=r['size'],
+            )
+            for r in rows
+        }
+
+    def _excluded(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.config.excluded_patterns)
+
+    def _scan(self, root: Path) -> dict[str, os.stat_result]:
+        """Supported files under root with their stat, keyed like Document.file_path."""
+        found: dict[str, os.stat_result] = {}
+        if root.is_file():
+            if root.suffix in SUPPORTED_SUFFIXES:
+                found[str(root)] = root.stat()
+            return found
+
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if self._excluded(entry.name):
                         continue
-        return count
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(SUPPORTED_SUFFIXES) and entry.is_file():
+                        found[str(Path(entry.path))] = entry.stat()
+        return found
+
+    @staticmethod
+    def _is_under(file_path: str, root: Path) -> bool:
+        path = Path(file_path)
+        return path == root or path.is_relative_to(root)
+
+    def remove_path(self, path: Path) -> int:
+        """Archive documents of a deleted file or directory. Returns count."""
+        report = SyncReport()
+        gone = [
+            file_path for file_path, state in self._known_files().items()
+            if state.mtime_ns is not None and self._is_under(file_path, path)
+        ]
+        self._write([], {}, gone, report)
+        return report.archived
 
     def rebuild_relationships(self) -> int:
         """Rebuild all relationships from existing documents.
-        
+
         Use this to populate relationships for documents that were
         synced before relationship extraction was added.
-        
+
         Returns:
             Number of documents processed.
         """
         docs = self.archive.list_documents()
-        count = 0
-        for doc in docs:
-            self.archive.save_relationships(doc)
-            count += 1
-        return count
+        self.archive.save_relationships_batch(docs)
+        return len(docs)
 
     def get_status(self) -> SyncStatus:
         """Get current sync status."""
+        report = self._last_report
         return SyncStatus(
             mode=self.config.mode,
             is_running=self._is_running,
-            last_sync=None,
-            documents_synced=0
+            last_sync_at=self._last_sync_at,
+            documents_synced=report.updated if report else 0,
+            errors=report.errors[-10:] if report else [],
         )
 
+    # --- Watching ----------------------------------------------------------
+
     def start_watching(self) -> bool:
         """Start file watcher (requires watchdog)."""
         try:
-            from watchdog.events import FileSystemEventHandler
+            from watchdog.events import (
+                FileSystemEvent,
+                FileSystemEventHandler,
+                FileSystemMovedEvent,
+            )
             from watchdog.observers import Observer
 
             class Handler(FileSystemEventHandler):
-                def __init__(self, sync_svc: 'SyncService'):
+                def __init__(self, sync_svc: 'SyncService') -> None:
                     self.sync_svc = sync_svc
 
-                def on_modified(self, event):
+                def on_created(self, event: FileSystemEvent) -> None:
                     if not event.is_directory:
-                        self.sync_svc._debounced_sync(Path(event.src_path))
+                        self.sync_svc._debounced_sync(self.sync_svc._relative(event.src_path))
+
+                def on_modified(self, event: FileSystemEvent) -> None:
+                    if not event.is_directory:
+                        self.sync_svc._debounced_sync(self.sync_svc._relative(event.src_path))
+
+                def on_deleted(self, event: FileSystemEvent) -> None:
+                    self.sync_svc._debounced_sync(
+                        self.sync_svc._relative(event.src_path), deleted=True
+                    )
+
+                def on_moved(self, event: FileSystemMovedEvent) -> None:
+                    self.sync_svc._debounced_sync(
+                        self.sync_svc._relative(event.src_path), deleted=True
+                    )
+                    self.sync_svc._debounced_sync(self.sync_svc._relative(event.dest_path))
 
+            self._watch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='knowledge-sync'
+            )
             self._observer = Observer()
             handler = Handler(self)
             for path in DEFAULT_WATCH_PATHS:
@@ -117,18 +376,70 @@ class SyncService:
         except ImportError:
             return False
 
-    def stop_watching(self):
-        """Stop file watcher."""
+    def stop_watching(self) -> None:
+        """Stop file watcher, dropping pending events."""
         if self._observer:
             self._observer.stop()
             self._observer.join()
             self._is_running = False
+        for timer in self._debounce_timers.values():
+            timer.cancel()
+        self._debounce_timers.clear()
+        if self._watch_executor is not None:
+            self._watch_executor.submit(self._close_watch_sync)
+            self._watch_executor.shutdown(wait=True)
+            self._watch_executor = None
 
-    def _debounced_sync(self, path: Path, delay: float = 0.5):
-        """Debounce rapid file changes."""
+    @staticmethod
+    def _relative(path: str) -> Path:
+        """Event path in the form stored as Document.file_path."""
+        event_path = Path(path)
+        if event_path.is_absolute():
+            try:
+                return event_path.relative_to(Path.cwd())
+            except ValueError:
+                return event_path
+        return event_path
+
+    def _debounced_sync(self, path: Path, delay: float = 0.5, deleted: bool = False) -> None:
+        """Debounce rapid file changes, then queue the sync on the sync thread."""
         key = str(path)
         if key in self._debounce_timers:
             self._debounce_timers[key].cancel()
-        timer = Timer(delay, lambda: self.sync_path(path))
+
+        def apply() -> None:
+            executor = self._watch_executor
+            if executor is not None:
+                executor.submit(self._apply_event, path, deleted)
+
+        timer = Timer(delay, apply)
         self._debounce_timers[key] = timer
         timer.start()
+
+    def _apply_event(self, path: Path, deleted: bool) -> None:
+        """Sync one watched path. Runs on the sync thread only."""
+        if self._watch_sync is None:
+            self._watch_sync = SyncService(
+                ArchiveService(self.connect()),
+                self.config,
+                self.chunking,
+                self.embeddings,
+                self.max_workers,
+            )
+        sync = self._watch_sync
+        try:
+            if deleted and not path.exists():
+                sync.remove_path(path)
+            else:
+                sync.sync_path(path)
+        except Exception:
+            logger.exception("Failed to sync %s", path)
+            return
+        self._last_sync_at = sync._last_sync_at
+        self._last_report = sync._last_report
+
+    def _close_watch_sync(self) -> None:
+        """Close the sync thread's connection. Runs on the sync thread only."""
+        if self._watch_sync is not None:
+            self._watch_sync.archive.conn.close()
+            self._watch_sync = None
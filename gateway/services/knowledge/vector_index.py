@@ -0,0 +1,672 @@
+"""Vector Index - SPEC-0043-SE02.
+
+In-process index over the embeddings table for vector search.
+
+Vectors of one dimensionality are held as L2-normalized float32 rows, so a
+query is a matrix-vector product followed by an argpartition top-k. Rows
+are a base matrix, persisted next to the knowledge database and
+memory-mapped on load, followed by a tail of rows added since, kept in a
+buffer that doubles in capacity as it grows. The index is kept in sync
+incrementally: new embeddings are picked up by id, deleted ones through the
+embedding_tombstones table (their rows are masked until the next
+compaction), and archived documents are masked out.
+
+Saving runs on a background maintenance thread, off the search path: new
+rows are appended to a tail file and masked ids written to the state file.
+Once tail and masked rows make up a large enough fraction of the index,
+they are compacted into a new base matrix.
+
+Large corpora additionally get an IVF (inverted file) index: base vectors
+are clustered with spherical k-means and stored grouped by cluster, so a
+query only scans the clusters closest to it. Unclustered rows are always
+scanned exactly, and the clusters are retrained (by a compaction) once they
+make up too large a fraction.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Corpus size from which the IVF index is built
+IVF_MIN_VECTORS = 50_000
+# Clusters scanned per query when the IVF index is used
+DEFAULT_NPROBE = 16
+# Retrain clusters once this fraction of vectors is unclustered
+IVF_MAX_TAIL_FRACTION = 0.2
+# Compact once tail and masked rows exceed this fraction of the index
+COMPACT_FRACTION = 0.25
+
+_COMPACT_MIN_ROWS = 1024
+_MIN_CAPACITY = 1024
+_PAGE_SIZE = 10_000
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLES_PER_LIST = 64
+
+_registry: dict[tuple[str, int], "VectorIndex"] = {}
+_registry_lock = threading.Lock()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _put(buffer: np.ndarray, start: int, values: np.ndarray) -> np.ndarray:
+    """Write values at buffer[start:], doubling its capacity when full.
+
+    Returns the buffer written to (a new one if it had to grow).
+    """
+    end = start + len(values)
+    if end > len(buffer):
+        capacity = max(end, 2 * len(buffer), _MIN_CAPACITY)
+        grown = np.empty((capacity, *buffer.shape[1:]), dtype=buffer.dtype)
+        grown[:start] = buffer[:start]
+        buffer = grown
+    buffer[start:end] = values
+    return buffer
+
+
+def _train_ivf(matrix: np.ndarray, n_lists: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Spherical k-means over a sample; returns (centroids, list per row)."""
+    n = len(matrix)
+    rng = np.random.default_rng(seed)
+
+    sample_size = min(n, n_lists * _KMEANS_SAMPLES_PER_LIST)
+    sample = np.asarray(matrix[np.sort(rng.choice(n, sample_size, replace=False))])
+    centroids = sample[rng.choice(sample_size, n_lists, replace=False)]
+    for _ in range(_KMEANS_ITERATIONS):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        order = np.argsort(assign, kind="stable")
+        members, starts = np.unique(assign[order], return_index=True)
+        centroids = centroids.copy()
+        centroids[members] = np.add.reduceat(sample[order], starts, axis=0)
+        centroids = _normalize(centroids)
+
+    lists = np.empty(n, dtype=np.int32)
+    for start in range(0, n, _PAGE_SIZE * 10):
+        block = matrix[start:start + _PAGE_SIZE * 10]
+        lists[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return centroids.astype(np.float32), lists
+
+
+def _database_file(conn: sqlite3.Connection) -> str:
+    """Path of the connection's main database ('' for in-memory)."""
+    for row in conn.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return row[2] or ""
+    return ""
+
+
+
+
+class VectorIndex:
+    """Normalized float32 vectors of one dimensionality with top-k search.
+
+    Rows are the base matrix (IVF clusters first, grouped by cluster id,
+    then unclustered rows) followed by the tail. Per-row buffers hold the
+    embedding id, chunk id, an index into ``doc_ids`` used to mask archived
+    documents, the IVF list (-1 = unclustered) and whether the row is live
+    (not deleted); only their first ``_n`` entries are used.
+    """
+
+    def __init__(self, dimensions: int, path: Path | None = None):
+        """Create an empty index.
+
+        Args:
+            dimensions: Vector dimensionality served by this index.
+            path: Directory for the persisted index (None = memory only).
+        """
+        self.dimensions = dimensions
+        self.path = path
+        self.nprobe = DEFAULT_NPROBE
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._maintenance_pending = False
+        self._generation = 0
+        self._clear()
+
+        if path is not None:
+            self._load()
+
+    def _clear(self) -> None:
+        """Drop all vectors and sync state."""
+        dimensions = self.dimensions
+        self._matrix = np.empty((0, dimensions), dtype=np.float32)
+        self._tail = np.empty((0, dimensions), dtype=np.float32)
+        self._n = 0
+        self._n_dead = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        self._chunk_ids = np.empty(0, dtype=np.int64)
+        self._doc_codes = np.empty(0, dtype=np.int32)
+        self._lists = np.empty(0, dtype=np.int32)
+        self._live = np.empty(0, dtype=bool)
+        self._active = np.empty(0, dtype=bool)
+        self._centroids: np.ndarray | None = None
+        self._offsets: np.ndarray | None = None
+
+        self.doc_ids: list[str] = []
+        self._doc_codes_by_id: dict[str, int] = {}
+        self._archived: set[str] = set()
+        self._max_id = 0
+        self._tombstone_seq = 0
+        # Rows saved to disk (None = files must be rewritten by a compaction)
+        self._persisted_n: int | None = None
+        self._snapshot = 0
+        self._generation += 1
+
+    @classmethod
+    def for_connection(cls, conn: sqlite3.Connection, dimensions: int) -> "VectorIndex":
+        """Shared index for the connection's database file.
+
+        File databases share one index per process, persisted in a
+        ``knowledge_vectors`` directory next to the database. In-memory
+        databases get a fresh, unpersisted index.
+        """
+        db_file = _database_file(conn)
+        if not db_file:
+            return cls(dimensions)
+
+        key = (db_file, dimensions)
+        with _registry_lock:
+            index = _registry.get(key)
+            if index is None:
+                index = cls(dimensions, Path(db_file).parent / "knowledge_vectors")
+                _registry[key] = index
+            return index
+
+    def __len__(self) -> int:
+        return self._n - self._n_dead
+
+    # --- Persistence -------------------------------------------------------
+
+    def _files(self) -> tuple[Path, Path, Path, Path]:
+        """Base matrix, base row arrays, tail records and state files."""
+        stem = self.path / str(self.dimensions)
+        return (
+            stem.with_suffix(".npy"),
+            stem.with_suffix(".npz"),
+            stem.with_suffix(".tail"),
+            stem.with_suffix(".json"),
+        )
+
+    def _record_dtype(self) -> np.dtype:
+        """One tail file record: a row's ids and normalized vector."""
+        return np.dtype([
+            ("id", "<i8"),
+            ("chunk_id", "<i8"),
+            ("doc_code", "<i4"),
+            ("vector", "<f4", (self.dimensions,)),
+        ])
+
+    def _load(self) -> None:
+        """Memory-map a persisted base matrix and read its tail, if there is one."""
+        files = self._files()
+        if not all(f.exists() for f in files):
+            return
+        matrix_file, arrays_file, tail_file, state_file = files
+        try:
+            state = json.loads(state_file.read_text())
+            with np.load(arrays_file) as arrays:
+                ids = arrays["ids"]
+                chunk_ids = arrays["chunk_ids"]
+                doc_codes = arrays["doc_codes"]
+                lists = arrays["lists"]
+                centroids = arrays["centroids"]
+                snapshot = int(arrays["snapshot"])
+            matrix = np.load(matrix_file, mmap_mode="r")
+            tail = np.fromfile(tail_file, dtype=self._record_dtype(), count=state["tail_rows"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable vector index at {self.path}: {e}")
+            return
+        if (
+            matrix.shape != (len(ids), self.dimensions)
+            or snapshot != state["snapshot"]
+            or len(tail) != state["tail_rows"]
+        ):
+            logger.warning(f"Ignoring inconsistent vector index at {self.path}")
+            return
+
+        self._matrix = matrix
+        self._ids = ids
+        self._chunk_ids = chunk_ids
+        self._doc_codes = doc_codes
+        self._lists = lists
+        self._live = np.ones(len(ids), dtype=bool)
+        self._active = self._live.copy()
+        self._n = len(ids)
+        self._centroids = centroids if len(centroids) else None
+        self.doc_ids = state["doc_ids"]
+        self._doc_codes_by_id = {doc_id: code for code, doc_id in enumerate(self.doc_ids)}
+        self._max_id = state["max_id"]
+        self._tombstone_seq = state["tombstone_seq"]
+        self._snapshot = snapshot
+        self._append_rows(tail["id"], tail["chunk_id"], tail["doc_code"], tail["vector"])
+        self._remove(np.asarray(state["removed"], dtype=np.int64))
+        self._persisted_n = self._n
+        self._update_offsets()
+        self._update_active()
+
+    def save(self) -> None:
+        """Persist the index now, after any queued background maintenance."""
+        self._run_maintenance(self._maintain)
+
+    def _maintenance_executor(self) -> ThreadPoolExecutor:
+        """Single thread that saves and compacts; call with the lock held."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector-index")
+        return self._executor
+
+    def _schedule_maintenance(self) -> None:
+        """Queue a background save unless one is pending; call with the lock held."""
+        if not self._maintenance_pending:
+            self._maintenance_pending = True
+            self._maintenance_executor().submit(self._maintain)
+
+    def _run_maintenance(self, task: Callable[..., None], *args: object) -> None:
+        """Run a task on the maintenance thread and wait for it."""
+        with self._lock:
+            executor = self._maintenance_executor()
+        executor.submit(task, *args).result()
+
+    def _maintain(self) -> None:
+        """Save new rows and deletions, compacting (and retraining) when due.
+
+        Runs on the maintenance thread.
+        """
+        with self._lock:
+            self._maintenance_pending = False
+            retrain = len(self) >= IVF_MIN_VECTORS and self._tail_fraction() > IVF_MAX_TAIL_FRACTION
+            loose = self._n - len(self._matrix) + self._n_dead
+            compact = (
+                retrain
+                or (self.path is not None and self._persisted_n is None)
+                or loose > max(_COMPACT_MIN_ROWS, COMPACT_FRACTION * self._n)
+            )
+        try:
+            if compact:
+                self._compact(retrain)
+            else:
+                self._persist()
+        except Exception:
+            logger.exception(f"Vector index maintenance failed for {self.path}")
+
+    def _persist(self) -> None:
+        """Append rows added since the last save to the tail file and write the state.
+
+        Runs on the maintenance thread.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            if self._persisted_n is None:
+                return
+            generation = self._generation
+            n, start, base_n = self._n, self._persisted_n, len(self._matrix)
+            records = np.empty(n - start, dtype=self._record_dtype())
+            records["id"] = self._ids[start:n]
+            records["chunk_id"] = self._chunk_ids[start:n]
+            records["doc_code"] = self._doc_codes[start:n]
+            records["vector"] = self._tail[start - base_n:n - base_n]
+            state = self._state_json()
+
+        _, _, tail_file, state_file = self._files()
+        try:
+            with open(tail_file, "ab") as f:
+                # Drop records a crash left behind after the last saved state
+                f.truncate((start - base_n) * records.dtype.itemsize)
+                f.write(records.tobytes())
+            state_file.with_suffix(".json.tmp").write_text(state)
+            os.replace(state_file.with_suffix(".json.tmp"), state_file)
+        except OSError as e:
+            logger.warning(f"Could not persist vector index to {self.path}: {e}")
+            return
+
+        with self._lock:
+            if self._generation == generation:
+                self._persisted_n = n
+
+    def _state_json(self) -> str:
+        """Serialized sync state; call with the lock held."""
+        n = self._n
+        return json.dumps({
+            "doc_ids": self.doc_ids,
+            "max_id": self._max_id,
+            "tombstone_seq": self._tombstone_seq,
+            "snapshot": self._snapshot,
+            "tail_rows": n - len(self._matrix),
+            "removed": self._ids[:n][~self._live[:n]].tolist(),
+        })
+
+    def _write_base(
+        self,
+        matrix: np.ndarray,
+        arrays: dict[str, np.ndarray],
+        snapshot: int,
+    ) -> np.ndarray | None:
+        """Write a new base matrix and row arrays; returns it memory-mapped.
+
+        Returns None if the index is not persisted or could not be written.
+        """
+        if self.path is None:
+            return None
+        self.path.mkdir(parents=True, exist_ok=True)
+        matrix_file, arrays_file, _, _ = self._files()
+        try:
+            with open(matrix_file.with_suffix(".npy.tmp"), "wb") as f:
+                np.save(f, matrix)
+            with open(arrays_file.with_suffix(".npz.tmp"), "wb") as f:
+                np.savez(f, snapshot=np.int64(snapshot), **arrays)
+            for target in (matrix_file, arrays_file):
+                os.replace(target.with_suffix(target.suffix + ".tmp"), target)
+            return np.load(matrix_file, mmap_mode="r")
+        except OSError as e:
+            logger.warning(f"Could not persist vector index to {self.path}: {e}")
+            return None
+
+    def _compact(self, retrain: bool, n_lists: int | None = None, seed: int = 0) -> None:
+        """Rewrite the live rows as a new base matrix, optionally re-clustering.
+
+        Works on a snapshot outside the lock, so searches and syncs continue;
+        rows added and deleted meanwhile are carried over when the new base
+        is swapped in. Runs on the maintenance thread.
+        """
+        with self._lock:
+            generation = self._generation
+            n, base_n = self._n, len(self._matrix)
+            base, tail = self._matrix, self._tail[:n - base_n]
+            live = self._live[:n].copy()
+            ids = self._ids[:n].copy()
+            chunk_ids = self._chunk_ids[:n].copy()
+            doc_codes = self._doc_codes[:n].copy()
+            lists = self._lists[:n].copy()
+            centroids = self._centroids
+            snapshot = self._snapshot + 1
+
+        keep = np.flatnonzero(live)
+        matrix = np.concatenate([base[keep[keep < base_n]], tail[keep[keep >= base_n] - base_n]])
+        ids, chunk_ids, doc_codes, lists = ids[keep], chunk_ids[keep], doc_codes[keep], lists[keep]
+        if retrain:
+            centroids = None
+            if len(matrix):
+                n_lists = n_lists or max(1, int(np.sqrt(len(matrix))))
+                centroids, lists = _train_ivf(matrix, n_lists, seed)
+                order = np.argsort(lists, kind="stable")
+                matrix = matrix[order]
+                ids, chunk_ids = ids[order], chunk_ids[order]
+                doc_codes, lists = doc_codes[order], lists[order]
+                logger.info(f"Built IVF vector index: {len(matrix)} vectors in {n_lists} lists")
+
+        persisted = self._write_base(matrix, {
+            "ids": ids,
+            "chunk_ids": chunk_ids,
+            "doc_codes": doc_codes,
+            "lists": lists,
+            "centroids": (
+                centroids
+                if centroids is not None
+                else np.empty((0, self.dimensions), dtype=np.float32)
+            ),
+        }, snapshot)
+
+        with self._lock:
+            if self._generation != generation:
+                return
+            deleted_since = ids[np.isin(ids, self._ids[:n][live & ~self._live[:n]])]
+            added = slice(n, self._n)
+            self._tail = self._tail[n - base_n:self._n - base_n].copy()
+            self._matrix = persisted if persisted is not None else matrix
+            self._ids = np.concatenate([ids, self._ids[added]])
+            self._chunk_ids = np.concatenate([chunk_ids, self._chunk_ids[added]])
+            self._doc_codes = np.concatenate([doc_codes, self._doc_codes[added]])
+            self._lists = np.concatenate([lists, self._lists[added]])
+            self._live = np.concatenate([np.ones(len(ids), dtype=bool), self._live[added]])
+            self._active = self._live.copy()
+            self._n = len(self._ids)
+            self._n_dead = int(np.count_nonzero(~self._live))
+            self._remove(deleted_since)
+            self._centroids = centroids
+            self._snapshot = snapshot
+            self._persisted_n = len(ids) if persisted is not None else None
+            self._update_offsets()
+            self._update_active()
+        self._persist()
+
+    # --- Incremental maintenance -------------------------------------------
+
+    def sync(self, conn: sqlite3.Connection) -> bool:
+        """Bring the index up to date with the database.
+
+        Reads only embeddings added and tombstones written since the last
+        sync, plus the (small) set of archived document ids. Changes are
+        saved in the background.
+
+        Returns:
+            True if the index changed.
+        """
+        with self._lock:
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM embeddings").fetchone()[0]
+            tombstone_seq = conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM embedding_tombstones"
+            ).fetchone()[0]
+            changed = False
+            if max_id < self._max_id or tombstone_seq < self._tombstone_seq:
+                # Database was recreated underneath a persisted index
+                self._clear()
+                changed = True
+
+            if tombstone_seq > self._tombstone_seq:
+                removed = [
+                    r[0] for r in conn.execute(
+                        "SELECT embedding_id FROM embedding_tombstones WHERE seq > ? AND seq <= ?",
+                        (self._tombstone_seq, tombstone_seq),
+                    )
+                ]
+                changed |= self._remove(np.asarray(removed, dtype=np.int64))
+                self._tombstone_seq = tombstone_seq
+
+            if max_id > self._max_id:
+                changed |= self._add_from(conn, self._max_id, max_id)
+                self._max_id = max_id
+
+            archived = {
+                r[0] for r in conn.execute(
+                    "SELECT id FROM documents WHERE archived_at IS NOT NULL"
+                )
+            }
+            if archived != self._archived:
+                self._archived = archived
+                self._update_active()
+
+            if changed:
+                self._schedule_maintenance()
+            return changed
+
+    def _add_from(self, conn: sqlite3.Connection, after_id: int, max_id: int) -> bool:
+        """Append embeddings with after_id < id <= max_id, paged."""
+        cursor = conn.execute("""
+            SELECT e.id, e.chunk_id, c.doc_id, e.vector
+            FROM embeddings e
+            JOIN chunks c ON c.id = e.chunk_id
+            WHERE e.id > ? AND e.id <= ? AND e.dimensions = ?
+            ORDER BY e.id
+        """, (after_id, max_id, self.dimensions))
+
+        added = False
+        while rows := cursor.fetchmany(_PAGE_SIZE):
+            vectors = np.frombuffer(b"".join(r[3] for r in rows), dtype=np.float32)
+            self.add(
+                ids=[r[0] for r in rows],
+                chunk_ids=[r[1] for r in rows],
+                doc_ids=[r[2] for r in rows],
+                vectors=vectors.reshape(len(rows), self.dimensions),
+            )
+            added = True
+        return added
+
+    def add(
+        self,
+        ids: list[int],
+        chunk_ids: list[int],
+        doc_ids: list[str],
+        vectors: np.ndarray,
+    ) -> None:
+        """Append vectors to the unclustered tail.
+
+        Args:
+            ids: Embedding ids.
+            chunk_ids: Chunk id per vector.
+            doc_ids: Document id per vector.
+            vectors: (n, dimensions) array; normalized on insert.
+        """
+        codes = []
+        for doc_id in doc_ids:
+            code = self._doc_codes_by_id.get(doc_id)
+            if code is None:
+                code = len(self.doc_ids)
+                self.doc_ids.append(doc_id)
+                self._doc_codes_by_id[doc_id] = code
+            codes.append(code)
+
+        self._append_rows(
+            np.asarray(ids, dtype=np.int64),
+            np.asarray(chunk_ids, dtype=np.int64),
+            np.asarray(codes, dtype=np.int32),
+            _normalize(vectors.astype(np.float32)),
+        )
+
+    def _append_rows(
+        self,
+        ids: np.ndarray,
+        chunk_ids: np.ndarray,
+        doc_codes: np.ndarray,
+        vectors: np.ndarray,
+    ) -> None:
+        """Append normalized rows to the tail; amortized O(1) per row."""
+        start = self._n
+        self._tail = _put(self._tail, start - len(self._matrix), vectors)
+        self._ids = _put(self._ids, start, ids)
+        self._chunk_ids = _put(self._chunk_ids, start, chunk_ids)
+        self._doc_codes = _put(self._doc_codes, start, doc_codes)
+        self._lists = _put(self._lists, start, np.full(len(ids), -1, dtype=np.int32))
+        self._live = _put(self._live, start, np.ones(len(ids), dtype=bool))
+        self._active = _put(
+            self._active, start, ~np.isin(doc_codes, self._archived_codes())
+        )
+        self._n = start + len(ids)
+
+    def _remove(self, embedding_ids: np.ndarray) -> bool:
+        """Mask rows by embedding id; compaction drops them from the matrix."""
+        n = self._n
+        removed = self._live[:n] & np.isin(self._ids[:n], embedding_ids)
+        count = int(np.count_nonzero(removed))
+        if not count:
+            return False
+        self._live[:n] &= ~removed
+        self._active[:n] &= ~removed
+        self._n_dead += count
+        return True
+
+    def _archived_codes(self) -> list[int]:
+        return [
+            self._doc_codes_by_id[doc_id]
+            for doc_id in self._archived
+            if doc_id in self._doc_codes_by_id
+        ]
+
+    def _update_active(self) -> None:
+        """Recompute the mask of live rows whose document is not archived."""
+        n = self._n
+        self._active = self._live[:n] & ~np.isin(self._doc_codes[:n], self._archived_codes())
+
+    def _update_offsets(self) -> None:
+        """Row ranges of each IVF cluster (clustered rows are a sorted prefix)."""
+        if self._centroids is None:
+            self._offsets = None
+            return
+        lists = self._lists[:len(self._matrix)]
+        clustered = lists[lists >= 0]
+        self._offsets = np.searchsorted(clustered, np.arange(len(self._centroids) + 1))
+
+    def _tail_fraction(self) -> float:
+        if self._centroids is None:
+            return 1.0
+        return float(np.mean(self._lists[:self._n] < 0)) if self._n else 0.0
+
+    # --- IVF ---------------------------------------------------------------
+
+    def _build_ivf(self, n_lists: int | None = None, seed: int = 0) -> None:
+        """Cluster all vectors with spherical k-means now (a compaction)."""
+        self._run_maintenance(self._compact, True, n_lists, seed)
+
+    # --- Search ------------------------------------------------------------
+
+    def search(self, query: np.ndarray, top_k: int = 10) -> list[tuple[int, float]]:
+        """Top-k chunks by cosine similarity.
+
+        Scans every vector for small corpora, otherwise the ``nprobe``
+        closest IVF clusters plus the unclustered rows.
+
+        Args:
+            query: Query vector of this index's dimensionality.
+            top_k: Maximum results.
+
+        Returns:
+            (chunk_id, similarity) pairs, most similar first; deleted rows
+            and archived documents are excluded.
+        """
+        with self._lock:
+            if not len(self) or top_k <= 0:
+                return []
+            query = _normalize(np.asarray(query, dtype=np.float32))
+
+            if self._centroids is None:
+                rows = None
+                scores = self._scores(0, self._n, query)
+            else:
+                ranges = self._candidate_rows(query)
+                if not ranges:
+                    return []
+                scores = np.concatenate([self._scores(a, b, query) for a, b in ranges])
+                rows = np.concatenate([np.arange(a, b) for a, b in ranges])
+
+            active = self._active[:self._n] if rows is None else self._active[rows]
+            scores = np.where(active, scores, -np.inf)
+            k = min(top_k, len(scores))
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            best = best[np.isfinite(scores[best])]
+
+            positions = best if rows is None else rows[best]
+            return [
+                (int(self._chunk_ids[p]), float(s))
+                for p, s in zip(positions, scores[best], strict=True)
+            ]
+
+    def _scores(self, start: int, stop: int, query: np.ndarray) -> np.ndarray:
+        """Similarity of rows [start, stop), which may span base and tail."""
+        base_n = len(self._matrix)
+        parts = []
+        if start < base_n:
+            parts.append(self._matrix[start:min(stop, base_n)] @ query)
+        if stop > base_n:
+            parts.append(self._tail[max(start, base_n) - base_n:stop - base_n] @ query)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def _candidate_rows(self, query: np.ndarray) -> list[tuple[int, int]]:
+        """Row ranges of the closest clusters and the unclustered rows."""
+        n_lists = len(self._centroids)
+        nprobe = min(self.nprobe, n_lists)
+        closest = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        ranges = [(int(self._offsets[c]), int(self._offsets[c + 1])) for c in closest]
+        ranges.append((int(self._offsets[-1]), self._n))
+        return [(a, b) for a, b in ranges if b > a]
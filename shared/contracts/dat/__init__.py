@@ -35,6 +35,7 @@ from shared.contracts.dat.adapter import (
     SheetInfo,
     StreamChunk,
     StreamOptions,
+    TableShape,
     ValidationIssue,
     ValidationSeverity,
 )
@@ -129,6 +130,7 @@ __all__ = [
     "SheetInfo",
     "StreamChunk",
     "StreamOptions",
+    "TableShape",
     "ValidationIssue",
     "ValidationSeverity",
     # Jobs contracts (per ADR-0041)
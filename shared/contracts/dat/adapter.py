@@ -6,6 +6,7 @@ Per ADR-0041: Large File Streaming Strategy (10MB threshold).
 This module defines the base contract for all file adapters in DAT.
 Adapters are responsible for:
 - Probing file schemas without reading all data
+- Reporting table shape (row/column counts) from metadata where possible
 - Reading files into Polars DataFrames
 - Streaming large files in chunks
 - Validating file compatibility
@@ -34,7 +35,7 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
-__version__ = "1.0.0"
+__version__ = "1.2.0"
 
 
 # =============================================================================
@@ -447,6 +448,13 @@ class StreamOptions(BaseModel):
         le=2000,
         description="Maximum memory to use for buffering",
     )
+    count_total_rows: bool = Field(
+        False,
+        description=(
+            "Pre-count total rows before streaming. Costs an extra pass over "
+            "text formats; progress is otherwise reported in bytes."
+        ),
+    )
     extra: dict[str, Any] = Field(
         default_factory=dict,
         description="Adapter-specific options",
@@ -489,6 +497,42 @@ class StreamChunk(BaseModel):
     total_rows_so_far: int = Field(..., ge=0)
     is_last_chunk: bool = Field(False)
     chunk_duration_ms: float = Field(..., ge=0)
+    bytes_read: int | None = Field(
+        None,
+        ge=0,
+        description="Source bytes consumed so far (byte-based progress)",
+    )
+    total_bytes: int | None = Field(
+        None,
+        ge=0,
+        description="Total source size in bytes",
+    )
+    total_rows: int | None = Field(
+        None,
+        ge=0,
+        description="Total rows when known from metadata or pre-counted",
+    )
+
+
+class TableShape(BaseModel):
+    """Row count and column names of one table.
+
+    Per ADR-0041: Produced from file metadata (Parquet footers, xlsx
+    dimension records, line counts) rather than a full read where the
+    format allows.
+    """
+
+    row_count: int = Field(..., ge=0, description="Data rows (excluding header)")
+    columns: list[str] = Field(default_factory=list, description="Column names in order")
+    row_count_exact: bool = Field(
+        True,
+        description="False when taken from metadata that may overcount (e.g. xlsx dimensions)",
+    )
+
+    @property
+    def column_count(self) -> int:
+        """Number of columns."""
+        return len(self.columns)
 
 
 # =============================================================================
@@ -625,6 +669,45 @@ class BaseFileAdapter(ABC):
         """
         ...
 
+    async def probe_shape(
+        self,
+        file_path: str,
+        options: ReadOptions | None = None,
+    ) -> TableShape:
+        """Get a table's row count and column names without loading its data.
+
+        The default implementation reads the table; adapters override it
+        with a metadata-only count where their format allows.
+
+        Args:
+            file_path: Relative path to the file
+            options: Optional read options (``extra["sheet_name"]`` selects a sheet)
+
+        Returns:
+            TableShape for the table
+
+        Raises:
+            AdapterError: If file cannot be read
+        """
+        df, _ = await self.read_dataframe(file_path, options)
+        return TableShape(row_count=len(df), columns=list(df.columns))
+
+    async def count_rows(
+        self,
+        file_path: str,
+        options: ReadOptions | None = None,
+    ) -> int:
+        """Count a table's data rows via probe_shape.
+
+        Args:
+            file_path: Relative path to the file
+            options: Optional read options (``extra["sheet_name"]`` selects a sheet)
+
+        Returns:
+            Number of data rows
+        """
+        return (await self.probe_shape(file_path, options)).row_count
+
     def can_handle(self, file_path: str) -> bool:
         """Check if this adapter can handle a file based on extension.
 
@@ -20,6 +20,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from shared.contracts.core.rendering import RenderResult as ShapeRenderResult
+
 __version__ = "0.1.0"
 
 
@@ -375,6 +377,9 @@ class RenderResult(BaseModel):
     # Per-slide results
     slide_results: list[SlideRenderResult] = Field(default_factory=list)
 
+    # Per-shape results (one per rendered shape, with timings)
+    shape_results: list[ShapeRenderResult] = Field(default_factory=list)
+
     # Errors
     errors: list[str] = Field(default_factory=list)
 
@@ -73,6 +73,7 @@ from shared.contracts.sov.visualization import (
     BoxPlotConfig,
     ColorPalette,
     InteractionPlotConfig,
+    LevelSummary,
     MainEffectsPlotConfig,
     NormalProbabilityPlotConfig,
     PlotStyle,
@@ -103,6 +104,7 @@ __all__ = [
     "VisualizationResult",
     "BoxPlotConfig",
     "InteractionPlotConfig",
+    "LevelSummary",
     "MainEffectsPlotConfig",
     "VarianceBarConfig",
     "ResidualPlotConfig",
@@ -26,12 +26,18 @@ from shared.contracts.core.rendering import (
     RenderStyle,
 )
 
+# Re-exported by shared.contracts.sov
+from shared.contracts.core.rendering import ColorPalette as ColorPalette
+
 __version__ = "0.2.0"
 
 
 class SOVVisualizationType(str, Enum):
     """SOV-specific visualization types (extends core ChartType)."""
 
+    # Distributions
+    BOX_PLOT = "box_plot"
+
     # ANOVA-specific (not in core)
     INTERACTION_PLOT = "interaction_plot"
     MAIN_EFFECTS_PLOT = "main_effects_plot"
@@ -56,6 +62,44 @@ OutputFormat = OutputTarget  # Map to unified OutputTarget
 PlotStyle = RenderStyle  # Use unified RenderStyle
 
 
+class LevelSummary(BaseModel):
+    """Precomputed statistics for one factor level (or factor-level cell).
+
+    Lets consumers draw box, means and interaction plots without reading
+    the raw rows of the source dataset.
+    """
+
+    level: str = Field(..., description="Factor level (X-axis)")
+    group: str | None = Field(
+        None,
+        description="Second factor level (interaction plot line)",
+    )
+    count: int = Field(..., ge=0)
+    mean: float | None = None
+    std: float | None = None
+    std_error: float | None = None
+    ci_lower: float | None = None
+    ci_upper: float | None = None
+
+    # Box statistics (Tukey whiskers at 1.5 x IQR)
+    q1: float | None = None
+    median: float | None = None
+    q3: float | None = None
+    whisker_low: float | None = None
+    whisker_high: float | None = None
+    outliers: list[float] = Field(
+        default_factory=list,
+        description="Values beyond the whiskers (capped)",
+    )
+    outlier_count: int = Field(0, ge=0, description="Outliers before capping")
+
+    # Optional overlay
+    points: list[float] = Field(
+        default_factory=list,
+        description="Evenly spaced sample of values (capped)",
+    )
+
+
 class BoxPlotConfig(BaseModel):
     """Configuration for box plots."""
 
@@ -91,6 +135,9 @@ class BoxPlotConfig(BaseModel):
     )
     sort_by_median: bool = False
 
+    # Precomputed summary (None = consumer reads dataset)
+    summary: list[LevelSummary] | None = None
+
 
 class InteractionPlotConfig(BaseModel):
     """Configuration for interaction plots (factor A × factor B)."""
@@ -119,6 +166,9 @@ class InteractionPlotConfig(BaseModel):
     factor_a_order: list[str] | None = None
     factor_b_order: list[str] | None = None
 
+    # Precomputed per-cell summary (level = factor_a, group = factor_b)
+    summary: list[LevelSummary] | None = None
+
 
 class MainEffectsPlotConfig(BaseModel):
     """Configuration for main effects plots."""
@@ -146,6 +196,10 @@ class MainEffectsPlotConfig(BaseModel):
     # Axes per subplot
     y_axis: AxisConfig = Field(default_factory=AxisConfig)
 
+    # Precomputed summary (factor -> per-level statistics)
+    summaries: dict[str, list[LevelSummary]] | None = None
+    grand_mean: float | None = None
+
 
 class VarianceBarConfig(BaseModel):
     """Configuration for variance component bar charts."""
@@ -11,7 +11,7 @@ Per ADR-0018#path-safety: All external paths are relative.
 
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, overload
 
 import polars as pl
 
@@ -105,28 +105,120 @@ class ArtifactStore:
 
         return Path("datasets") / dataset_id
 
-    async def read_dataset(self, dataset_id: str) -> pl.DataFrame:
-        """Read a DataSet's data from storage."""
+    @overload
+    async def read_dataset(
+        self,
+        dataset_id: str,
+        columns: list[str] | None = ...,
+        filters: pl.Expr | list[pl.Expr] | None = ...,
+        lazy: Literal[False] = ...,
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def read_dataset(
+        self,
+        dataset_id: str,
+        columns: list[str] | None = ...,
+        filters: pl.Expr | list[pl.Expr] | None = ...,
+        *,
+        lazy: Literal[True],
+    ) -> pl.LazyFrame: ...
+
+    @overload
+    async def read_dataset(
+        self,
+        dataset_id: str,
+        columns: list[str] | None = ...,
+        filters: pl.Expr | list[pl.Expr] | None = ...,
+        lazy: bool = ...,
+    ) -> pl.DataFrame | pl.LazyFrame: ...
+
+    async def read_dataset(
+        self,
+        dataset_id: str,
+        columns: list[str] | None = None,
+        filters: pl.Expr | list[pl.Expr] | None = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Read a DataSet's data from storage.
+
+        The Parquet file is scanned, so projection (columns) and predicates
+        (filters) are pushed down and only the needed columns and row groups
+        are read.
+
+        Args:
+            dataset_id: Dataset identifier.
+            columns: Columns to read (None = all).
+            filters: Row predicate(s); applied before projection, so they may
+                reference columns not in ``columns``.
+            lazy: Return the LazyFrame instead of collecting it.
+
+        Returns:
+            DataFrame, or LazyFrame when lazy=True.
+        """
         data_path = self.workspace / "datasets" / dataset_id / "data.parquet"
         if not data_path.exists():
             raise FileNotFoundError(f"DataSet not found: {dataset_id}")
-        return pl.read_parquet(data_path)
+
+        lf = pl.scan_parquet(data_path)
+        if filters is not None:
+            lf = lf.filter(filters)
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf if lazy else lf.collect()
+
+    @overload
+    async def read_dataset_with_manifest(
+        self,
+        dataset_id: str,
+        columns: list[str] | None = ...,
+        filters: pl.Expr | list[pl.Expr] | None = ...,
+        lazy: Literal[False] = ...,
+    ) -> tuple[pl.DataFrame, DataSetManifest | None]: ...
+
+    @overload
+    async def read_dataset_with_manifest(
+        self,
+        dataset_id: str,
+        columns: list[str] | None = ...,
+        filters: pl.Expr | list[pl.Expr] | None = ...,
+        *,
+        lazy: Literal[True],
+    ) -> tuple[pl.LazyFrame, DataSetManifest | None]: ...
+
+    @overload
+    async def read_dataset_with_manifest(
+        self,
+        dataset_id: str,
+        columns: list[str] | None = ...,
+        filters: pl.Expr | list[pl.Expr] | None = ...,
+        lazy: bool = ...,
+    ) -> tuple[pl.DataFrame | pl.LazyFrame, DataSetManifest | None]: ...
 
     async def read_dataset_with_manifest(
         self,
         dataset_id: str,
-    ) -> tuple[pl.DataFrame, DataSetManifest | None]:
+        columns: list[str] | None = None,
+        filters: pl.Expr | list[pl.Expr] | None = None,
+        lazy: bool = False,
+    ) -> tuple[pl.DataFrame | pl.LazyFrame, DataSetManifest | None]:
         """Read a DataSet's data and manifest together.
         
         Per ADR-0024: Provides access to column metadata for preservation.
         
         Args:
             dataset_id: Dataset identifier.
+            columns: Columns to read (None = all).
+            filters: Row predicate(s) pushed down to the Parquet scan.
+            lazy: Return the LazyFrame instead of collecting it.
             
         Returns:
-            Tuple of (DataFrame, manifest) where manifest may be None if not found.
+            Tuple of (data, manifest) where data is a LazyFrame when lazy=True
+            and manifest may be None if not found.
         """
-        data = await self.read_dataset(dataset_id)
+        data = await self.read_dataset(
+            dataset_id, columns=columns, filters=filters, lazy=lazy
+        )
         try:
             manifest = await self.get_manifest(dataset_id)
         except FileNotFoundError:
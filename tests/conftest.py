@@ -19,6 +19,16 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def knowledge_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the knowledge database at a temporary file instead of workspace/."""
+    from gateway.services.knowledge import database
+
+    db_path = tmp_path / "knowledge.db"
+    monkeypatch.setattr(database, "DB_PATH", db_path)
+    return db_path
+
+
 @pytest.fixture
 def temp_workspace() -> Generator[Path, None, None]:
     """Create a temporary workspace directory for tests."""
@@ -7,11 +7,14 @@ import pytest
 from fastapi.testclient import TestClient
 
 from apps.data_aggregator.backend.main import app
+from apps.data_aggregator.backend.src.dat_aggregation.api import routes
+from apps.data_aggregator.backend.src.dat_aggregation.core.run_manager import RunManager
 
 
 @pytest.fixture
-def client():
-    """Create test client."""
+def client(temp_workspace, monkeypatch):
+    """Create test client whose runs, snapshots and probe cache live in a temp workspace."""
+    monkeypatch.setattr(routes, "run_manager", RunManager(workspace_path=temp_workspace))
     return TestClient(app)
 
 
@@ -276,6 +279,15 @@ class TestPreviewEndpoint:
         # Should fail because table_selection is not locked
         assert response.status_code == 400
 
+    def test_parse_data_page_requires_parse(self, client):
+        """Test paged parse data fails before parse is locked."""
+        run_response = client.post("/runs", json={"name": "Test Run"})
+        run_id = run_response.json()["run_id"]
+
+        response = client.get(f"/runs/{run_id}/stages/parse/data?offset=0&limit=10")
+
+        assert response.status_code == 400
+
 
 class TestAPISchemas:
     """Test API request/response schemas."""
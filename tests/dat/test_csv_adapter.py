@@ -4,12 +4,16 @@ Per SPEC-0026: Adapter Interface & Registry specification.
 Tests AC-3: CSV Adapter Requirements from ACCEPTANCE_CRITERIA_ADAPTERS.md
 """
 
+import asyncio
+import threading
+from functools import partial
 from pathlib import Path
 
 import polars as pl
 import pytest
 
-from apps.data_aggregator.backend.adapters import CSVAdapter
+from apps.data_aggregator.backend.adapters import CSVAdapter, csv_adapter
+from apps.data_aggregator.backend.adapters.streaming import iter_record_blocks, stream_chunks
 from shared.contracts.dat.adapter import (
     AdapterError,
     AdapterErrorCode,
@@ -154,6 +158,30 @@ class TestCSVAdapterProbeSchema:
         assert exc_info.value.code == AdapterErrorCode.FILE_NOT_FOUND
 
 
+class TestCSVAdapterProbeShape:
+    """Test metadata-only row/column counts."""
+
+    @pytest.mark.asyncio
+    async def test_probe_shape_matches_full_read(self) -> None:
+        """probe_shape() reports the same counts as read_dataframe()."""
+        adapter = CSVAdapter()
+        file_path = str(FIXTURES_DIR / "sample.csv")
+
+        shape = await adapter.probe_shape(file_path)
+        df, _ = await adapter.read_dataframe(file_path)
+
+        assert shape.row_count == len(df)
+        assert shape.columns == df.columns
+        assert shape.row_count_exact is True
+
+    @pytest.mark.asyncio
+    async def test_count_rows_keeps_quoted_newlines(self, tmp_path: Path) -> None:
+        """Records with quoted newlines count once."""
+        file_path = tmp_path / "quoted.csv"
+        file_path.write_text('a,b\n1,"x\ny"\n2,z\n')
+
+        assert await CSVAdapter().count_rows(str(file_path)) == 2
+
 class TestCSVAdapterReadDataframe:
     """Test AC-3.3: Reading requirements."""
 
@@ -292,6 +320,95 @@ class TestCSVAdapterStreaming:
             total_rows += len(df)
             assert chunk_meta.total_rows_so_far == total_rows
 
+    @pytest.mark.asyncio
+    async def test_stream_dataframe_reports_byte_progress(self) -> None:
+        """stream_dataframe() reports bytes read without pre-counting rows."""
+        adapter = CSVAdapter()
+        file_path = FIXTURES_DIR / "sample.csv"
+        options = StreamOptions(chunk_size_rows=3)
+
+        chunks = [meta async for _, meta in adapter.stream_dataframe(str(file_path), options)]
+
+        assert all(meta.total_rows is None for meta in chunks)
+        assert chunks[-1].bytes_read == file_path.stat().st_size
+        assert chunks[-1].total_bytes == file_path.stat().st_size
+
+    @pytest.mark.asyncio
+    async def test_stream_dataframe_optional_row_count(self) -> None:
+        """stream_dataframe() pre-counts rows only when requested."""
+        adapter = CSVAdapter()
+        file_path = str(FIXTURES_DIR / "sample.csv")
+        options = StreamOptions(chunk_size_rows=3, count_total_rows=True)
+
+        chunks = [meta async for _, meta in adapter.stream_dataframe(file_path, options)]
+
+        assert chunks[-1].total_rows == chunks[-1].total_rows_so_far
+
+    @pytest.mark.asyncio
+    async def test_stream_dataframe_widens_later_type_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Values that don't fit the first block's schema are widened, not nulled."""
+        file_path = tmp_path / "drift.csv"
+        rows = [f"{i},{i}" for i in range(3000)] + ["3000,1.5", "3001,abc"]
+        file_path.write_text("id,value\n" + "\n".join(rows) + "\n")
+        monkeypatch.setattr(
+            csv_adapter, "iter_record_blocks", partial(iter_record_blocks, block_size=4096)
+        )
+
+        chunks = [
+            df async for df, _ in CSVAdapter().stream_dataframe(
+                str(file_path), StreamOptions(chunk_size_rows=1000)
+            )
+        ]
+        df = pl.concat(chunks, how="diagonal_relaxed")
+
+        assert df.height == 3002
+        assert df["value"].null_count() == 0
+        assert df["value"].to_list()[-3:] == ["2999", "1.5", "abc"]
+
+    def test_record_blocks_keep_quoted_newlines(self, tmp_path: Path) -> None:
+        """Block boundaries never split a quoted field spanning lines."""
+        file_path = tmp_path / "quoted.csv"
+        rows = [f'{i},"first\nsecond ""{i}"""' for i in range(200)]
+        file_path.write_text("id,text\n" + "\n".join(rows) + "\n")
+
+        blocks = list(iter_record_blocks(file_path, quote_char=b'"', block_size=64))
+        df = pl.read_csv(b"".join(block for block, _ in blocks))
+
+        assert len(blocks) > 1
+        assert all(block.count(b'"') % 2 == 0 for block, _ in blocks)
+        assert df["text"][199] == 'first\nsecond "199"'
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_read_closes_after_read(self) -> None:
+        """Cancelling mid-read waits for the read before closing the source."""
+        reading = threading.Event()
+        release = threading.Event()
+        closed = []
+
+        def batches():
+            try:
+                yield pl.DataFrame({"v": [1]}), 1
+                reading.set()
+                release.wait()
+                yield pl.DataFrame({"v": [2]}), 2
+            finally:
+                closed.append(True)
+
+        async def consume() -> None:
+            async for _ in stream_chunks(batches(), chunk_size=1):
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.to_thread(reading.wait)
+        task.cancel()
+        threading.Timer(0.05, release.set).start()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert closed == [True]
+
 
 class TestCSVAdapterValidation:
     """Test AC-3.5: Validation requirements."""
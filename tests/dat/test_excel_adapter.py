@@ -9,14 +9,18 @@ in fixtures. Some tests are marked as skip if fixtures are missing.
 
 from pathlib import Path
 
+import polars as pl
 import pytest
 
 from apps.data_aggregator.backend.adapters import ExcelAdapter
+from apps.data_aggregator.backend.adapters.excel_adapter import iter_xlsx_batches
 from shared.contracts.dat.adapter import (
     AdapterError,
     AdapterErrorCode,
     AdapterMetadata,
     BaseFileAdapter,
+    ReadOptions,
+    StreamOptions,
 )
 
 # Fixture directory
@@ -39,10 +43,10 @@ class TestExcelAdapterMetadata:
         assert ".xlsx" in extensions
         assert ".xls" in extensions
 
-    def test_supports_streaming_is_false(self) -> None:
-        """AC-4.1.3: capabilities.supports_streaming is False."""
+    def test_supports_streaming_is_true(self) -> None:
+        """AC-4.1.3: capabilities.supports_streaming is True (.xlsx)."""
         adapter = ExcelAdapter()
-        assert adapter.metadata.capabilities.supports_streaming is False
+        assert adapter.metadata.capabilities.supports_streaming is True
 
     def test_supports_multiple_sheets_is_true(self) -> None:
         """AC-4.1.4: capabilities.supports_multiple_sheets is True."""
@@ -79,11 +83,11 @@ class TestExcelAdapterStreaming:
 
     @pytest.mark.asyncio
     async def test_stream_dataframe_raises_not_supported(self) -> None:
-        """AC-4.4.1: stream_dataframe() raises AdapterError with STREAMING_NOT_SUPPORTED."""
+        """AC-4.4.1: stream_dataframe() raises STREAMING_NOT_SUPPORTED for legacy .xls."""
         adapter = ExcelAdapter()
 
         with pytest.raises(AdapterError) as exc_info:
-            async for _ in adapter.stream_dataframe("data.xlsx"):
+            async for _ in adapter.stream_dataframe("data.xls"):
                 pass
 
         assert exc_info.value.code == AdapterErrorCode.STREAMING_NOT_SUPPORTED
@@ -94,12 +98,68 @@ class TestExcelAdapterStreaming:
         adapter = ExcelAdapter()
 
         with pytest.raises(AdapterError) as exc_info:
-            async for _ in adapter.stream_dataframe("data.xlsx"):
+            async for _ in adapter.stream_dataframe("data.xls"):
                 pass
 
         assert "excel" in exc_info.value.message.lower()
         assert "streaming" in exc_info.value.message.lower()
 
+    @pytest.mark.asyncio
+    async def test_stream_dataframe_xlsx_yields_row_chunks(self, tmp_path: Path) -> None:
+        """stream_dataframe() reads .xlsx sheets in chunk_size_rows batches."""
+        openpyxl = pytest.importorskip("openpyxl")
+        file_path = tmp_path / "large.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["id", "site", "value"])
+        for i in range(25):
+            ws.append([i, f"S{i % 3}", i * 0.5])
+        wb.save(file_path)
+
+        adapter = ExcelAdapter()
+        options = StreamOptions(chunk_size_rows=10, columns=["id", "value"])
+        chunks = [
+            (df, meta) async for df, meta in adapter.stream_dataframe(str(file_path), options)
+        ]
+
+        assert [len(df) for df, _ in chunks] == [10, 10, 5]
+        assert [meta.is_last_chunk for _, meta in chunks] == [False, False, True]
+        assert chunks[-1][1].total_rows_so_far == 25
+        assert chunks[-1][1].bytes_read == file_path.stat().st_size
+        assert chunks[0][0].columns == ["id", "value"]
+        assert chunks[-1][0]["id"].to_list() == [20, 21, 22, 23, 24]
+
+    def test_xlsx_batches_widen_later_type_changes(self, tmp_path: Path) -> None:
+        """A later batch whose values don't fit widens the column, never nulls it."""
+        openpyxl = pytest.importorskip("openpyxl")
+        file_path = tmp_path / "drift.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["id", "value"])
+        for i in range(20):
+            ws.append([i, i])
+        ws.append([20, 1.5])
+        ws.append([21, "abc"])
+        wb.save(file_path)
+
+        batches = [df for df, _ in iter_xlsx_batches(file_path, batch_rows=10)]
+        df = pl.concat(batches, how="diagonal_relaxed")
+
+        assert df.height == 22
+        assert df["value"].null_count() == 0
+        assert df["value"].to_list()[-3:] == ["19", "1.5", "abc"]
+
+    @pytest.mark.asyncio
+    async def test_stream_dataframe_xlsx_nonexistent_file(self) -> None:
+        """stream_dataframe() raises FILE_NOT_FOUND for a missing .xlsx."""
+        adapter = ExcelAdapter()
+
+        with pytest.raises(AdapterError) as exc_info:
+            async for _ in adapter.stream_dataframe("nonexistent.xlsx"):
+                pass
+
+        assert exc_info.value.code == AdapterErrorCode.FILE_NOT_FOUND
+
 
 class TestExcelAdapterValidation:
     """Test AC-4.5: Validation requirements."""
@@ -142,6 +202,29 @@ class TestExcelAdapterProbeSchema:
         assert exc_info.value.code == AdapterErrorCode.FILE_NOT_FOUND
 
 
+class TestExcelAdapterProbeShape:
+    """Test metadata-only row/column counts."""
+
+    @pytest.mark.asyncio
+    async def test_probe_shape_uses_sheet_dimensions(self, tmp_path: Path) -> None:
+        """probe_shape() reads the selected sheet's dimension and header."""
+        openpyxl = pytest.importorskip("openpyxl")
+        file_path = tmp_path / "dims.xlsx"
+        wb = openpyxl.Workbook()
+        wb.active.append(["only"])
+        ws = wb.create_sheet("Data")
+        ws.append(["id", "value", None])
+        for i in range(7):
+            ws.append([i, i * 2, None])
+        wb.save(file_path)
+
+        shape = await ExcelAdapter().probe_shape(
+            str(file_path), ReadOptions(extra={"sheet_name": "Data"})
+        )
+
+        assert shape.row_count == 7
+        assert shape.columns == ["id", "value", "__UNNAMED__2"]
+
 class TestExcelAdapterReadDataframe:
     """Test AC-4.3: Reading requirements."""
 
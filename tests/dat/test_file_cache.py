@@ -0,0 +1,155 @@
+"""Tests for the run-scoped parsed-file cache."""
+
+import os
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from apps.data_aggregator.backend.adapters import create_default_registry
+from apps.data_aggregator.backend.src.dat_aggregation.core import file_cache
+from apps.data_aggregator.backend.src.dat_aggregation.core.file_cache import (
+    ParsedFileCache,
+    get_run_file_cache,
+    read_dataframe_cached,
+    release_run_file_cache,
+)
+from apps.data_aggregator.backend.src.dat_aggregation.profiles.strategies import TabularSource
+
+
+class TestParsedFileCache:
+    """Test ParsedFileCache keying and bounds."""
+
+    def test_loads_once_per_file(self, tmp_path: Path):
+        """A second lookup for the same file is served from the cache."""
+        path = tmp_path / "a.json"
+        path.write_text('{"x": 1}')
+        cache = ParsedFileCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {"x": 1}
+
+        assert cache.get_or_load(path, "json", loader) == {"x": 1}
+        assert cache.get_or_load(path, "json", loader) == {"x": 1}
+        assert len(calls) == 1
+        assert cache.stats.hits == 1
+
+    def test_modified_file_is_reloaded(self, tmp_path: Path):
+        """Changing mtime or size invalidates the entry."""
+        path = tmp_path / "a.json"
+        path.write_text('{"x": 1}')
+        cache = ParsedFileCache()
+        cache.get_or_load(path, "json", lambda: "old")
+
+        path.write_text('{"x": 22}')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get_or_load(path, "json", lambda: "new") == "new"
+
+    def test_evicts_least_recently_used_over_budget(self, tmp_path: Path):
+        """Entries beyond the memory budget are evicted oldest first."""
+        df = pl.DataFrame({"v": list(range(1000))})
+        cache = ParsedFileCache(max_bytes=df.estimated_size() * 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.csv"
+            path.write_text("v\n1\n")
+            paths.append(path)
+            cache.get_or_load(path, "csv", lambda: df)
+
+        assert cache.stats.evictions == 1
+        assert cache.stats.entries == 2
+        found, _ = cache.get(ParsedFileCache.make_key(paths[0], "csv"))
+        assert not found
+
+    def test_materialized_records_count_toward_budget(self, tmp_path: Path):
+        """A cached TabularSource is re-sized once its records are built."""
+        df = pl.DataFrame({"v": list(range(1000))})
+        cache = ParsedFileCache()
+        path = tmp_path / "a.csv"
+        path.write_text("v\n1\n")
+        source = cache.get_or_load(path, "csv", lambda: TabularSource(df))
+        before = cache.stats.size_bytes
+
+        assert len(source["data"]) == 1000
+        assert cache.stats.size_bytes > before
+
+        cache.max_bytes = before
+        cache.resize(ParsedFileCache.make_key(path, "csv"))
+        assert cache.stats.entries == 0
+        assert cache.stats.evictions == 1
+
+    def test_failed_load_is_not_cached(self, tmp_path: Path):
+        """None results are retried on the next lookup."""
+        path = tmp_path / "a.json"
+        path.write_text("{")
+        cache = ParsedFileCache()
+        cache.get_or_load(path, "json", lambda: None)
+
+        assert cache.get_or_load(path, "json", lambda: {"ok": True}) == {"ok": True}
+
+
+class TestRunFileCache:
+    """Test run scoping and adapter reads through the cache."""
+
+    def test_run_cache_is_shared_until_released(self):
+        """Stages of one run share a cache; release drops it."""
+        cache = get_run_file_cache("run-cache-test")
+        assert get_run_file_cache("run-cache-test") is cache
+
+        release_run_file_cache("run-cache-test")
+        assert get_run_file_cache("run-cache-test") is not cache
+        release_run_file_cache("run-cache-test")
+
+    def test_run_caches_share_a_total_budget(self, tmp_path: Path, monkeypatch):
+        """Filling one run's cache drops the least recently used other runs."""
+        df = pl.DataFrame({"v": list(range(100_000))})
+        monkeypatch.setattr(file_cache, "MAX_TOTAL_CACHE_MB", df.estimated_size() * 1.5 / 2**20)
+        path = tmp_path / "a.csv"
+        path.write_text("v\n1\n")
+
+        first = get_run_file_cache("run-budget-1")
+        first.get_or_load(path, "csv", lambda: df)
+        second = get_run_file_cache("run-budget-2")
+        second.get_or_load(path, "csv", lambda: df)
+
+        assert first.stats.entries == 0
+        assert second.stats.entries == 1
+        assert get_run_file_cache("run-budget-1") is not first
+        release_run_file_cache("run-budget-1")
+        release_run_file_cache("run-budget-2")
+
+    def test_idle_run_caches_expire(self, tmp_path: Path, monkeypatch):
+        """A run cache unused past the TTL is dropped when another run is used."""
+        clock = [1000.0]
+        monkeypatch.setattr(file_cache.time, "monotonic", lambda: clock[0])
+        path = tmp_path / "a.json"
+        path.write_text("{}")
+
+        idle = get_run_file_cache("run-ttl-idle")
+        idle.get_or_load(path, "json", lambda: {"x": 1})
+        clock[0] += file_cache.RUN_CACHE_TTL_SECONDS + 1
+        get_run_file_cache("run-ttl-active")
+
+        assert idle.stats.entries == 0
+        assert get_run_file_cache("run-ttl-idle") is not idle
+        release_run_file_cache("run-ttl-idle")
+        release_run_file_cache("run-ttl-active")
+
+    @pytest.mark.asyncio
+    async def test_read_dataframe_cached(self, tmp_path: Path):
+        """Adapter reads with the same options are parsed once."""
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n1,2\n3,4\n")
+        adapter = create_default_registry().get_adapter_for_file(str(path))
+        cache = ParsedFileCache()
+
+        first, _ = await read_dataframe_cached(cache, adapter, path)
+        second, _ = await read_dataframe_cached(cache, adapter, path)
+
+        assert first is second
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
@@ -4,12 +4,14 @@ Per SPEC-0026: Adapter Interface & Registry specification.
 Tests AC-5: JSON Adapter Requirements from ACCEPTANCE_CRITERIA_ADAPTERS.md
 """
 
+from functools import partial
 from pathlib import Path
 
 import polars as pl
 import pytest
 
-from apps.data_aggregator.backend.adapters import JSONAdapter
+from apps.data_aggregator.backend.adapters import JSONAdapter, json_adapter
+from apps.data_aggregator.backend.adapters.streaming import iter_record_blocks
 from shared.contracts.dat.adapter import (
     AdapterError,
     AdapterErrorCode,
@@ -128,6 +130,31 @@ class TestJSONAdapterProbeSchema:
         assert exc_info.value.code == AdapterErrorCode.FILE_NOT_FOUND
 
 
+class TestJSONAdapterProbeShape:
+    """Test metadata-only row/column counts."""
+
+    @pytest.mark.asyncio
+    async def test_probe_shape_counts_json_lines(self, tmp_path: Path) -> None:
+        """JSON Lines records are counted by line, skipping blank lines."""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_text('{"id": 1}\n\n{"id": 2, "name": "b"}\n{"id": 3}')
+
+        shape = await JSONAdapter().probe_shape(str(file_path))
+
+        assert shape.row_count == 3
+        assert shape.columns == ["id", "name"]
+
+    @pytest.mark.asyncio
+    async def test_probe_shape_json_array_falls_back_to_read(self) -> None:
+        """Regular JSON is counted via a full read."""
+        adapter = JSONAdapter()
+        file_path = str(FIXTURES_DIR / "sample.json")
+
+        shape = await adapter.probe_shape(file_path)
+        df, _ = await adapter.read_dataframe(file_path)
+
+        assert shape.row_count == len(df)
+
 class TestJSONAdapterReadDataframe:
     """Test AC-5.3: Reading requirements."""
 
@@ -260,6 +287,32 @@ class TestJSONAdapterStreaming:
         assert chunks[0].is_last_chunk is True
 
 
+    @pytest.mark.asyncio
+    async def test_stream_dataframe_widens_later_blocks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Later type changes and new keys are kept rather than dropped."""
+        file_path = tmp_path / "drift.jsonl"
+        lines = [f'{{"id": {i}, "value": {i}}}' for i in range(2000)]
+        lines += ['{"id": 2000, "value": 1.5, "note": "late"}', '{"id": 2001, "value": "abc"}']
+        file_path.write_text("\n".join(lines) + "\n")
+        monkeypatch.setattr(
+            json_adapter, "iter_record_blocks", partial(iter_record_blocks, block_size=4096)
+        )
+
+        chunks = [
+            df async for df, _ in JSONAdapter().stream_dataframe(
+                str(file_path), StreamOptions(chunk_size_rows=500)
+            )
+        ]
+        df = pl.concat(chunks, how="diagonal_relaxed")
+
+        assert df.height == 2002
+        assert df["value"].null_count() == 0
+        assert df["value"].to_list()[-2:] == ["1.5", "abc"]
+        assert df["note"].to_list()[-2:] == ["late", None]
+
+
 class TestJSONAdapterValidation:
     """Test AC-5.5: Validation requirements."""
 
@@ -111,6 +111,21 @@ class TestParquetAdapterProbeSchema:
         assert exc_info.value.code == AdapterErrorCode.FILE_NOT_FOUND
 
 
+class TestParquetAdapterProbeShape:
+    """Test metadata-only row/column counts."""
+
+    @pytest.mark.asyncio
+    async def test_probe_shape_reads_footer(self) -> None:
+        """probe_shape() returns exact counts from the Parquet footer."""
+        adapter = ParquetAdapter()
+        file_path = str(FIXTURES_DIR / "sample.parquet")
+
+        shape = await adapter.probe_shape(file_path)
+        df, _ = await adapter.read_dataframe(file_path)
+
+        assert shape.row_count == 5
+        assert shape.columns == df.columns
+
 class TestParquetAdapterReadDataframe:
     """Test reading requirements."""
 
@@ -206,6 +221,19 @@ class TestParquetAdapterStreaming:
             total_rows += len(df)
             assert chunk_meta.total_rows_so_far == total_rows
 
+    @pytest.mark.asyncio
+    async def test_stream_dataframe_total_rows_from_metadata(self) -> None:
+        """stream_dataframe() takes total_rows from the footer and ends at full bytes."""
+        adapter = ParquetAdapter()
+        file_path = FIXTURES_DIR / "sample.parquet"
+        options = StreamOptions(chunk_size_rows=2)
+
+        chunks = [meta async for _, meta in adapter.stream_dataframe(str(file_path), options)]
+
+        assert chunks[-1].is_last_chunk is True
+        assert chunks[-1].total_rows == chunks[-1].total_rows_so_far
+        assert chunks[-1].bytes_read == file_path.stat().st_size
+
 
 class TestParquetAdapterValidation:
     """Test validation requirements."""
@@ -0,0 +1,84 @@
+"""Tests for partitioned Parquet parse output."""
+
+from pathlib import Path
+
+import polars as pl
+
+from apps.data_aggregator.backend.src.dat_aggregation.core.parquet_dataset import (
+    NULL_PARTITION,
+    PartitionedParquetWriter,
+    dataset_files,
+    scan_parse_output,
+)
+
+
+class TestPartitionedParquetWriter:
+    """Test chunked dataset writes and lazy reads."""
+
+    def test_chunks_partitioned_and_scanned_in_order(self, tmp_path: Path):
+        """Chunks land under lot/wafer directories and scan back in partition order."""
+        writer = PartitionedParquetWriter(tmp_path / "ds")
+        writer.write(pl.DataFrame({"lot_id": ["L1", "L1"], "wafer_id": ["W1", "W2"], "v": [1, 2]}))
+        writer.write(pl.DataFrame({"lot_id": ["L2"], "wafer_id": [None], "v": [3]}))
+        info = writer.close()
+
+        assert info.row_count == 3
+        assert (tmp_path / "ds" / "lot_id=L1" / "wafer_id=W2").is_dir()
+        assert (tmp_path / "ds" / "lot_id=L2" / f"wafer_id={NULL_PARTITION}").is_dir()
+        assert scan_parse_output(info.path).collect()["v"].to_list() == [1, 2, 3]
+
+    def test_small_chunks_buffered_per_partition(self, tmp_path: Path):
+        """Chunks of one partition share a part file until it reaches its row target."""
+        writer = PartitionedParquetWriter(tmp_path / "ds", partition_by=["lot_id"], rows_per_file=3)
+        for v in range(7):
+            writer.write(pl.DataFrame({"lot_id": ["L1", "L2"], "v": [v, v]}))
+        info = writer.close()
+
+        l1 = dataset_files(tmp_path / "ds" / "lot_id=L1")
+        assert [p.name for p in l1] == [f"part-0000{i}.parquet" for i in range(3)]
+        assert [pl.read_parquet(p).height for p in l1] == [3, 3, 1]
+        assert len(info.files) == 6
+        df = scan_parse_output(info.path).collect()
+        assert df.filter(pl.col("lot_id") == "L1")["v"].to_list() == list(range(7))
+
+    def test_buffer_budget_flushes_largest_partition(self, tmp_path: Path):
+        """Exceeding the buffer budget writes the largest partition out early."""
+        chunk = pl.DataFrame({"lot_id": ["L1"] * 100, "v": range(100)})
+        writer = PartitionedParquetWriter(
+            tmp_path / "ds", partition_by=["lot_id"], max_buffer_bytes=chunk.estimated_size()
+        )
+        writer.write(pl.DataFrame({"lot_id": ["L2"], "v": [0]}))
+        assert writer._info.files == []
+        writer.write(chunk)
+
+        assert [p.parent.name for p in writer._info.files] == ["lot_id=L1"]
+        assert writer.close().row_count == 101
+
+    def test_heterogeneous_chunks_unified(self, tmp_path: Path):
+        """Chunks with different columns are unified with nulls like the combined output."""
+        writer = PartitionedParquetWriter(tmp_path / "ds", partition_by=[])
+        writer.write(pl.DataFrame({"a": [1]}))
+        writer.write(pl.DataFrame({"b": ["x"]}))
+        info = writer.close()
+
+        df = scan_parse_output(info.path).collect()
+        assert info.columns == ["a", "b"]
+        assert df.to_dicts() == [{"a": 1, "b": None}, {"a": None, "b": "x"}]
+
+    def test_empty_dataset_is_scannable(self, tmp_path: Path):
+        """A dataset with no rows still scans to an empty frame with its schema."""
+        writer = PartitionedParquetWriter(tmp_path / "ds")
+        writer.write(pl.DataFrame(schema={"v": pl.Int64}))
+        info = writer.close()
+
+        df = scan_parse_output(info.path).collect()
+        assert df.is_empty()
+        assert df.columns == ["v"]
+
+    def test_abort_removes_dataset(self, tmp_path: Path):
+        """Aborting (e.g. on cancellation) leaves no partial data behind."""
+        writer = PartitionedParquetWriter(tmp_path / "ds")
+        writer.write(pl.DataFrame({"lot_id": ["L1"], "v": [1]}))
+        writer.abort()
+
+        assert not (tmp_path / "ds").exists()
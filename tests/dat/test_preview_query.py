@@ -0,0 +1,89 @@
+"""Tests for paged parse output previews."""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from apps.data_aggregator.backend.src.dat_aggregation.core.parquet_dataset import (
+    PartitionedParquetWriter,
+)
+from apps.data_aggregator.backend.src.dat_aggregation.core.preview_query import (
+    PreviewFilter,
+    parse_output_row_count,
+    query_parse_output,
+)
+
+
+@pytest.fixture
+def parse_output(tmp_path: Path) -> Path:
+    """Combined parse output with 10 rows over two wafers."""
+    path = tmp_path / "output.parquet"
+    pl.DataFrame({
+        "wafer_id": ["W01"] * 5 + ["W02"] * 5,
+        "value": [float(i) for i in range(10)],
+        "site": list(range(10)),
+    }).write_parquet(path)
+    return path
+
+
+class TestPreviewFilter:
+    """Test filter parsing."""
+
+    def test_parse_with_and_without_value(self):
+        """Value-less operators drop the value, others keep colons in it."""
+        assert PreviewFilter.parse("t:eq:12:30") == PreviewFilter("t", "eq", "12:30")
+        assert PreviewFilter.parse("value:is_null") == PreviewFilter("value", "is_null")
+
+    def test_unknown_operator_rejected(self):
+        """Unknown operators raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid filter"):
+            PreviewFilter.parse("value:like:3")
+
+
+class TestQueryParseOutput:
+    """Test paging, projection, sort and filter pushdown."""
+
+    def test_page_with_projection(self, parse_output: Path):
+        """Offset/limit select a window; columns are projected."""
+        page = query_parse_output(parse_output, offset=3, limit=2, columns=["site"])
+
+        assert page.columns == ["site"]
+        assert page.rows == [{"site": 3}, {"site": 4}]
+        assert page.total_rows == 10
+        assert page.filtered_rows == 10
+
+    def test_filter_and_sort(self, parse_output: Path):
+        """Filters values are cast to the column type and applied before sorting."""
+        page = query_parse_output(
+            parse_output,
+            limit=3,
+            sort_by="value",
+            descending=True,
+            filters=[
+                PreviewFilter.parse("wafer_id:eq:W01"),
+                PreviewFilter.parse("value:ge:1.5"),
+            ],
+        )
+
+        assert [row["value"] for row in page.rows] == [4.0, 3.0, 2.0]
+        assert page.filtered_rows == 3
+        assert page.total_rows == 10
+
+    def test_unknown_column_rejected(self, parse_output: Path):
+        """Referencing a missing column raises ValueError."""
+        with pytest.raises(ValueError, match="missing"):
+            query_parse_output(parse_output, sort_by="missing")
+
+    def test_dataset_output(self, tmp_path: Path):
+        """Partitioned datasets are paged in write order with footer counts."""
+        writer = PartitionedParquetWriter(tmp_path / "ds", partition_by=["wafer_id"])
+        writer.write(pl.DataFrame({"wafer_id": ["W01", "W02"], "site": [0, 1]}))
+        writer.write(pl.DataFrame({"wafer_id": ["W01"], "site": [2]}))
+        writer.close()
+
+        page = query_parse_output(tmp_path / "ds", limit=10, columns=["site"])
+
+        assert parse_output_row_count(tmp_path / "ds") == 3
+        assert sorted(row["site"] for row in page.rows) == [0, 1, 2]
+        assert page.total_rows == 3
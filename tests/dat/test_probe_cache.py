@@ -0,0 +1,139 @@
+"""Tests for the persistent workspace probe cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from apps.data_aggregator.backend.adapters import create_default_registry
+from apps.data_aggregator.backend.services.table_probe import probe_file_shapes
+from apps.data_aggregator.backend.src.dat_aggregation.core.probe_cache import (
+    ProbeCache,
+    probe_schema_cached,
+    probe_shape_cached,
+    with_detected_format,
+)
+from apps.data_aggregator.backend.src.dat_aggregation.stages.selection import (
+    _get_tables_for_file,
+)
+
+
+def _write_csv(path: Path, rows: int) -> Path:
+    path.write_text("a;b\n" + "".join(f"{i};{i * 2}\n" for i in range(rows)))
+    return path
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class _CountingAdapter:
+    """Adapter proxy counting probe calls."""
+
+    def __init__(self, adapter):
+        self._adapter = adapter
+        self.metadata = adapter.metadata
+        self.calls: list[tuple[str, object]] = []
+
+    async def probe_schema(self, file_path, options=None):
+        self.calls.append(("schema", options))
+        return await self._adapter.probe_schema(file_path, options)
+
+    async def probe_shape(self, file_path, options=None):
+        self.calls.append(("shape", options))
+        return await self._adapter.probe_shape(file_path, options)
+
+
+class TestProbeCache:
+    """Test keying, invalidation and persistence."""
+
+    @pytest.mark.asyncio
+    async def test_reopened_cache_does_not_probe_again(self, tmp_path: Path):
+        """A new cache instance over the same directory serves stored probes."""
+        path = _write_csv(tmp_path / "data.csv", 3)
+        adapter = _CountingAdapter(create_default_registry().get_adapter_for_file(str(path)))
+
+        first = await probe_schema_cached(ProbeCache(tmp_path / "cache"), adapter, path)
+        reopened = ProbeCache(tmp_path / "cache")
+        second = await probe_schema_cached(reopened, adapter, path)
+
+        assert len(adapter.calls) == 1
+        assert second == first
+        assert second.delimiter_detected == ";"
+        assert reopened.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_probed_again(self, tmp_path: Path):
+        """Size/mtime changes invalidate the stored shape."""
+        path = _write_csv(tmp_path / "data.csv", 3)
+        adapter = create_default_registry().get_adapter_for_file(str(path))
+        cache = ProbeCache(tmp_path / "cache")
+        assert (await probe_shape_cached(cache, adapter, path)).row_count == 3
+
+        _write_csv(path, 5)
+        _bump_mtime(path)
+
+        assert (await probe_shape_cached(cache, adapter, path)).row_count == 5
+        assert cache.stats.invalidations == 1
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_shape_probe_reuses_detected_format(self, tmp_path: Path):
+        """A cached schema probe supplies encoding/delimiter to the shape probe."""
+        path = _write_csv(tmp_path / "data.csv", 4)
+        adapter = _CountingAdapter(create_default_registry().get_adapter_for_file(str(path)))
+        cache = ProbeCache(tmp_path / "cache")
+
+        assert with_detected_format(cache, adapter, path) is None
+        await probe_schema_cached(cache, adapter, path)
+        shape = await probe_shape_cached(cache, adapter, path)
+
+        assert shape.row_count == 4
+        _, shape_options = adapter.calls[-1]
+        assert shape_options.extra == {"encoding": "utf-8", "delimiter": ";"}
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        """Entries beyond max_entries are evicted oldest first, on disk too."""
+        adapter = create_default_registry().get_adapter_for_file("x.csv")
+        cache = ProbeCache(tmp_path / "cache", max_entries=2)
+        keys = []
+        for name in ("a", "b", "c"):
+            path = _write_csv(tmp_path / f"{name}.csv", 1)
+            key = cache.make_key(path, adapter, "shape")
+            keys.append(key)
+            cache.put(key, {"row_count": 1})
+            if name == "b":
+                assert cache.get(keys[0]) is not None
+
+        assert cache.stats.evictions == 1
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_probe_file_shapes_uses_cache(self, tmp_path: Path):
+        """Table availability probes of unchanged files are served from disk."""
+        path = _write_csv(tmp_path / "data.csv", 2)
+        cache = ProbeCache(tmp_path / "cache")
+        registry = create_default_registry()
+
+        first = await probe_file_shapes(registry, [str(path)], probe_cache=cache)
+        second = await probe_file_shapes(
+            registry, [str(path)], probe_cache=ProbeCache(tmp_path / "cache")
+        )
+
+        assert first[0].shape == second[0].shape
+        assert second[0].shape.row_count == 2
+        assert cache.stats.misses >= 1
+
+    @pytest.mark.asyncio
+    async def test_selection_does_not_probe_single_table_files(self, tmp_path: Path):
+        """Discovery lists a CSV as one table without probing it."""
+        path = _write_csv(tmp_path / "data.csv", 2)
+        adapter = _CountingAdapter(create_default_registry().get_adapter_for_file(str(path)))
+
+        tables = await _get_tables_for_file(adapter, path, ProbeCache(tmp_path / "cache"))
+
+        assert tables == ["data.csv"]
+        assert adapter.calls == []
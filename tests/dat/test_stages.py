@@ -14,9 +14,20 @@ from apps.data_aggregator.backend.src.dat_aggregation.stages import (
     discover_files,
     execute_context,
     execute_parse,
+    execute_preview,
     execute_selection,
 )
 from apps.data_aggregator.backend.src.dat_aggregation.stages.context import ColumnOverride
+from apps.data_aggregator.backend.src.dat_aggregation.stages.discovery import (
+    DiscoveryConfig,
+    execute_discovery,
+    snapshot_path_for,
+)
+from apps.data_aggregator.backend.src.dat_aggregation.stages.preview import PreviewConfig
+from apps.data_aggregator.backend.src.dat_aggregation.stages.table_selection import (
+    TableSelection,
+    TableSelectionResult,
+)
 from shared.contracts.dat.cancellation import CancellationState
 
 EXAMPLES_DIR = Path(__file__).parent.parent.parent / "apps" / "data_aggregator" / "backend" / "src" / "dat_aggregation" / "profiles" / "examples"
@@ -133,6 +144,125 @@ class TestSelectionStage:
             assert file_info.size_bytes > 0
 
 
+class TestDiscoveryStage:
+    """Test discovery stage scanning."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Directory tree with nested, excluded and unsupported files."""
+        (tmp_path / "lot1" / "wafer1").mkdir(parents=True)
+        (tmp_path / "archive").mkdir()
+        (tmp_path / "a.csv").write_text("x\n1\n")
+        (tmp_path / "notes.md").write_text("# notes")
+        (tmp_path / "lot1" / "b.json").write_text("[]")
+        (tmp_path / "lot1" / "wafer1" / "c.csv").write_text("x\n2\n")
+        (tmp_path / "archive" / "old.csv").write_text("x\n3\n")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scan_prunes_and_streams(self, tree):
+        """Excluded directories are skipped; batches stream per directory."""
+        batches = []
+
+        async def on_files(batch):
+            batches.append([f.name for f in batch])
+
+        result = await execute_discovery(
+            "run-disc",
+            DiscoveryConfig(root_path=tree, exclude_patterns=["archive"], max_workers=4),
+            on_files=on_files,
+        )
+
+        assert [f.name for f in result.files] == ["a.csv", "b.json", "c.csv", "notes.md"]
+        assert result.supported_files == 3
+        assert result.unsupported_files == 1
+        assert sorted(name for batch in batches for name in batch) == [
+            "a.csv", "b.json", "c.csv", "notes.md",
+        ]
+
+        supported_only = await execute_discovery(
+            "run-disc",
+            DiscoveryConfig(root_path=tree, recursive=False, include_unsupported=False),
+        )
+        assert [f.name for f in supported_only.files] == ["a.csv"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reports_only_changes(self, tree, tmp_path_factory):
+        """With a snapshot, re-discovery reports new/changed/removed files."""
+        snapshot = tmp_path_factory.mktemp("snap") / "snapshot.json"
+        config = DiscoveryConfig(root_path=tree, snapshot_path=snapshot, only_changes=True)
+
+        first = await execute_discovery("run-disc", config)
+        assert first.total_files == 5
+        assert not first.changes.had_snapshot
+
+        (tree / "lot1" / "wafer1" / "c.csv").write_text("x\n2\n22\n")
+        (tree / "lot1" / "new.csv").write_text("x\n4\n")
+        (tree / "notes.md").unlink()
+
+        second = await execute_discovery("run-disc", config)
+        assert [f.name for f in second.files] == ["new.csv", "c.csv"]
+        assert second.changes.new_files == [str(tree / "lot1" / "new.csv")]
+        assert second.changes.changed_files == [str(tree / "lot1" / "wafer1" / "c.csv")]
+        assert second.changes.removed_files == [str(tree / "notes.md")]
+
+        third = await execute_discovery("run-disc", config)
+        assert third.files == []
+
+    @pytest.mark.asyncio
+    async def test_snapshot_depends_on_scan_options(self, tree, tmp_path_factory):
+        """Switching recursive on or off never diffs against the other listing."""
+        workspace = tmp_path_factory.mktemp("dat")
+        recursive_snap = snapshot_path_for(workspace, tree, recursive=True)
+        top_level_snap = snapshot_path_for(workspace, tree, recursive=False)
+        assert recursive_snap != top_level_snap
+
+        await execute_discovery(
+            "run-disc", DiscoveryConfig(root_path=tree, snapshot_path=recursive_snap)
+        )
+        top_level = await execute_discovery(
+            "run-disc",
+            DiscoveryConfig(root_path=tree, recursive=False, snapshot_path=top_level_snap),
+        )
+        assert not top_level.changes.had_snapshot
+
+        # A snapshot written with other options is not diffed against
+        shared = await execute_discovery(
+            "run-disc",
+            DiscoveryConfig(root_path=tree, recursive=False, snapshot_path=recursive_snap),
+        )
+        assert not shared.changes.had_snapshot
+        assert shared.changes.removed_files == []
+
+        again = await execute_discovery(
+            "run-disc",
+            DiscoveryConfig(root_path=tree, recursive=False, snapshot_path=top_level_snap),
+        )
+        assert again.changes.had_snapshot
+        assert again.changes.new_files == again.changes.removed_files == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_snapshot_saves(self, tree, tmp_path_factory):
+        """Runs saving the same snapshot at once leave one valid file and no temp files."""
+        import asyncio
+
+        snap_dir = tmp_path_factory.mktemp("snap")
+        config = DiscoveryConfig(root_path=tree, snapshot_path=snap_dir / "snapshot.json")
+
+        await asyncio.gather(*(execute_discovery(f"run-{i}", config) for i in range(4)))
+
+        assert [p.name for p in snap_dir.iterdir()] == ["snapshot.json"]
+        assert len(json.loads((snap_dir / "snapshot.json").read_text())["files"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_max_files_is_deterministic(self, tree):
+        """max_files keeps the first files found breadth-first in name order."""
+        result = await execute_discovery(
+            "run-disc", DiscoveryConfig(root_path=tree, max_files=3)
+        )
+        assert [f.name for f in result.files] == ["a.csv", "old.csv", "notes.md"]
+
+
 class TestContextStage:
     """Test context configuration stage."""
 
@@ -383,6 +513,33 @@ class TestParseStage:
 
         assert token.is_cancelled
 
+    def test_extraction_pool_is_opt_in(self, monkeypatch):
+        """Large runs stay serial unless the config asks for worker processes."""
+        from apps.data_aggregator.backend.src.dat_aggregation.stages.parse import (
+            _resolve_extraction_workers,
+        )
+
+        monkeypatch.setenv("ET_MAX_PROCESSES", "6")
+        files = [Path(f"file_{i}.json") for i in range(100)]
+
+        assert _resolve_extraction_workers(ParseConfig(files, {})) == 1
+        assert _resolve_extraction_workers(ParseConfig(files, {}, extraction_workers=3)) == 3
+        assert _resolve_extraction_workers(ParseConfig(files, {}, extraction_workers=None)) == 6
+
+    def test_extraction_memory_budget(self, monkeypatch):
+        """The spill budget comes from the config, then the environment, then a default."""
+        from apps.data_aggregator.backend.src.dat_aggregation.stages.parse import (
+            DEFAULT_EXTRACTION_MEMORY_BUDGET_MB,
+            _resolve_memory_budget_mb,
+        )
+
+        monkeypatch.delenv("ET_PARSE_MEMORY_BUDGET_MB", raising=False)
+        assert _resolve_memory_budget_mb(ParseConfig([], {})) == DEFAULT_EXTRACTION_MEMORY_BUDGET_MB
+
+        monkeypatch.setenv("ET_PARSE_MEMORY_BUDGET_MB", "64")
+        assert _resolve_memory_budget_mb(ParseConfig([], {})) == 64
+        assert _resolve_memory_budget_mb(ParseConfig([], {}, memory_budget_mb=8)) == 8
+
     @pytest.mark.asyncio
     async def test_parse_id_deterministic(self, temp_workspace, temp_json_file):
         """Test that parse ID is deterministic."""
@@ -405,6 +562,57 @@ class TestParseStage:
 
         assert result1.parse_id == result2.parse_id
 
+    @pytest.mark.asyncio
+    async def test_execute_parse_dataset_output(self, temp_workspace, temp_json_file):
+        """Dataset mode writes partitioned Parquet that scans back to the same rows."""
+        config = ParseConfig(
+            selected_files=[temp_json_file],
+            selected_tables={},
+            column_mappings={"value": "measurement"},
+            output_mode="dataset",
+            partition_by=["category"],
+        )
+
+        result = await execute_parse(
+            run_id="test-run-123",
+            config=config,
+            workspace_path=temp_workspace,
+        )
+
+        dataset_path = Path(result.output_path)
+        assert dataset_path.is_dir()
+        assert {p.name for p in dataset_path.iterdir()} == {"category=A", "category=B"}
+        assert result.row_count == 2
+        assert result.data.is_empty()
+        assert result.data.columns == ["id", "measurement", "category"]
+        assert result.scan().sort("id").collect()["measurement"].to_list() == [100, 200]
+
+
+class TestPreviewStage:
+    """Test preview stage functionality."""
+
+    @pytest.mark.asyncio
+    async def test_preview_reads_sample_with_full_row_count(self, tmp_path):
+        """Preview rows are bounded; row counts cover the whole table."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("id,value\n" + "".join(f"{i},{i * 10}\n" for i in range(50)))
+        selection = TableSelectionResult(
+            selection_id="sel_test",
+            selected_tables=[TableSelection(file_path=str(csv_file), table_name=csv_file.name)],
+            total_selected=1,
+        )
+
+        result = await execute_preview(
+            "preview-test", selection, PreviewConfig(max_rows_per_table=5)
+        )
+
+        preview = result.table_previews[0]
+        assert len(preview.preview_rows) == 5
+        assert preview.row_count == 50
+        assert preview.stats["row_count"] == 50
+        assert preview.stats["sample_rows"] == 5
+        assert result.total_rows == 50
+
 
 class TestParseWithExampleData:
     """Test parse stage with example data files."""
@@ -0,0 +1,46 @@
+"""Tests for metadata-only table probing."""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from apps.data_aggregator.backend.adapters import create_default_registry
+from apps.data_aggregator.backend.services.table_probe import (
+    probe_file_shapes,
+    probe_table,
+)
+from shared.contracts.dat.table_status import TableAvailabilityStatus
+
+
+class TestProbeFileShapes:
+    """Test concurrent shape probes across files."""
+
+    @pytest.mark.asyncio
+    async def test_shapes_in_file_order(self, tmp_path: Path):
+        """Each file's tables are reported in input order with counts."""
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text("x,y\n1,2\n3,4\n")
+        parquet_path = tmp_path / "b.parquet"
+        pl.DataFrame({"z": [1, 2, 3]}).write_parquet(parquet_path)
+        files = [str(csv_path), str(tmp_path / "c.unknown"), str(parquet_path)]
+
+        shapes = await probe_file_shapes(create_default_registry(), files, max_concurrency=2)
+
+        assert [s.file_path for s in shapes] == files
+        assert shapes[0].shape is not None and shapes[0].shape.row_count == 2
+        assert shapes[1].table_name is None and shapes[1].error
+        assert shapes[2].shape is not None and shapes[2].shape.columns == ["z"]
+
+    @pytest.mark.asyncio
+    async def test_probe_table_reports_counts(self, tmp_path: Path):
+        """probe_table() builds a TableAvailability from the shape probe."""
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text("x,y\n1,2\n")
+        adapter = create_default_registry().get_adapter_for_file(str(csv_path))
+
+        availability = await probe_table(adapter, csv_path, job_id="job", stage_id="stage")
+
+        assert availability.status == TableAvailabilityStatus.AVAILABLE
+        assert availability.row_count == 1
+        assert availability.columns == ["x", "y"]
@@ -44,6 +44,19 @@ class TestProgressUpdate:
         assert data["message"] == "Processing started"
         assert "timestamp" in data
 
+    def test_to_dict_includes_discovered_files(self):
+        """Test files are only serialized on files_discovered events."""
+        update = ProgressUpdate(
+            stage_id="discovery",
+            event_type=ProgressEventType.FILES_DISCOVERED,
+            files=[{"path": "/data/a.csv", "name": "a.csv"}],
+        )
+
+        assert update.to_dict()["files"] == [{"path": "/data/a.csv", "name": "a.csv"}]
+        assert "files" not in ProgressUpdate(
+            stage_id="s", event_type=ProgressEventType.PROGRESS
+        ).to_dict()
+
     def test_to_json(self):
         """Test converting to JSON string."""
         update = ProgressUpdate(
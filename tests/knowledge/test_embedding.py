@@ -1,9 +1,35 @@
 """Tests for Embedding Service - PLAN-002 M3."""
 
+import sqlite3
+import threading
+import time
 
+import numpy as np
+import pytest
+
+from gateway.services.knowledge.database import SCHEMA
+from gateway.services.knowledge.embedding_cache import EmbeddingCache, text_hash
 from gateway.services.knowledge.embedding_service import EmbeddingService
 
 
+class FakeModel:
+    """Deterministic stand-in for a SentenceTransformer."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, normalize_embeddings=True, batch_size=32):
+        self.calls.append(list(texts))
+        return np.array([[len(t), 1.0, 0.0] for t in texts], dtype=np.float32)
+
+
+def _service(**kwargs) -> EmbeddingService:
+    service = EmbeddingService(**kwargs)
+    service._model = FakeModel()
+    service._model_name = EmbeddingService.PRIMARY_MODEL
+    return service
+
+
 class TestEmbeddingService:
     """Tests for EmbeddingService."""
 
@@ -61,3 +87,191 @@ class TestEmbeddingService:
         service = EmbeddingService()
         # The service should have fallback capability
         assert hasattr(service, '_load_model') or hasattr(service, 'config')
+
+
+class TestEmbeddingCache:
+    """Tests for cached and batched encoding."""
+
+    def test_repeated_texts_are_not_reencoded(self):
+        """Only texts missing from the cache reach the model."""
+        service = _service()
+        service.embed_batch(['a', 'bb'])
+        results = service.embed_batch(['bb', 'ccc', 'ccc'])
+
+        assert service._model.calls == [['a', 'bb'], ['ccc']]
+        assert [r.vector[0] for r in results] == [2.0, 3.0, 3.0]
+        assert service.cache.hits == 1
+
+    def test_persisted_cache_survives_restart(self, tmp_path):
+        """A new service reads vectors persisted by an earlier one."""
+        db_path = tmp_path / 'knowledge.db'
+        first = _service(cache=EmbeddingCache(db_path))
+        first.embed('query text')
+        first.cache.close()
+
+        second = _service(cache=EmbeddingCache(db_path))
+        result = second.embed('query text')
+
+        assert second._model.calls == []
+        assert result.vector[0] == len('query text')
+
+    def test_memory_lru_eviction(self):
+        """The in-memory level keeps only the most recently used entries."""
+        cache = EmbeddingCache(max_entries=2)
+        cache.put_many('m', ['a', 'b'], np.ones((2, 3)))
+        cache.get_many('m', ['a'])
+        cache.put_many('m', ['c'], np.ones((1, 3)))
+
+        assert [v is not None for v in cache.get_many('m', ['a', 'b', 'c'])] == [True, False, True]
+
+    def test_concurrent_first_calls_load_model_once(self):
+        """Threads that need the model at the same time share one load."""
+        service = EmbeddingService()
+        barrier = threading.Barrier(4)
+        loads = []
+
+        def load(name):
+            loads.append(name)
+            time.sleep(0.05)
+            service._model_name = name
+            service._model = FakeModel()
+
+        service._load_model = load
+
+        def embed(text):
+            barrier.wait()
+            service.embed(text)
+
+        threads = [threading.Thread(target=embed, args=(t,)) for t in ['a', 'bb', 'ccc', 'dddd']]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert loads == [EmbeddingService.PRIMARY_MODEL]
+
+    def test_concurrent_queries_share_one_batch(self):
+        """Queries arriving within the batch window are encoded together."""
+        service = _service(batch_window=0.2)
+        barrier = threading.Barrier(4)
+        results = {}
+
+        def query(text):
+            barrier.wait()
+            results[text] = service.embed_query(text).vector
+
+        threads = [threading.Thread(target=query, args=(t,)) for t in ['a', 'bb', 'ccc', 'a']]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(service._model.calls) == 1
+        assert sorted(service._model.calls[0]) == ['a', 'bb', 'ccc']
+        assert results['ccc'][0] == 3.0
+
+
+@pytest.fixture
+def chunk_conn():
+    """Archive with one document and 10 chunks of varying length."""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    conn.execute(
+        "INSERT INTO documents (id, type, title, content, file_path, file_hash) "
+        "VALUES ('doc', 'session', 'Doc', '', 'doc.md', 'h')"
+    )
+    conn.executemany(
+        "INSERT INTO chunks (doc_id, chunk_index, content) VALUES ('doc', ?, ?)",
+        [(i, 'x' * ((i * 7) % 10 + 1)) for i in range(10)],
+    )
+    conn.commit()
+    return conn
+
+
+class TestEmbedAllChunks:
+    """Tests for the pipelined embedding backfill."""
+
+    def test_backfill_writes_every_chunk(self, chunk_conn):
+        """Vectors are stored as float32 blobs for each chunk across pages."""
+        service = _service(batch_size=3)
+        service.PAGE_BATCHES = 1
+        progress = []
+
+        assert service.embed_all_chunks(chunk_conn, lambda done, total: progress.append(
+            (done, total)
+        )) == 10
+
+        rows = chunk_conn.execute("""
+            SELECT c.content, e.vector, e.dimensions FROM chunks c
+            JOIN embeddings e ON e.chunk_id = c.id
+        """).fetchall()
+        assert len(rows) == 10
+        for row in rows:
+            assert service.blob_to_vector(row['vector']) == [len(row['content']), 1.0, 0.0]
+            assert row['dimensions'] == 3
+        assert progress[-1] == (10, 10)
+        assert service.last_backfill.embedded == 10
+
+    def test_batches_are_length_bucketed(self, chunk_conn):
+        """Within a page, each model batch holds texts of similar length."""
+        service = _service(batch_size=5)
+        service.embed_all_chunks(chunk_conn)
+
+        lengths = [[len(t) for t in call] for call in service._model.calls]
+        assert [sorted(c) for c in lengths] == lengths
+        assert max(lengths[0]) <= min(lengths[1])
+
+    def test_resume_embeds_only_missing_chunks(self, chunk_conn):
+        """An interrupted backfill keeps committed batches and resumes."""
+        service = _service(batch_size=2, pipeline_depth=1)
+        calls = 0
+
+        def interrupt(done, total):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            service.embed_all_chunks(chunk_conn, interrupt)
+        assert chunk_conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == 4
+
+        assert _service().embed_all_chunks(chunk_conn) == 6
+        assert service.embed_all_chunks(chunk_conn) == 0
+
+    def test_backfill_reads_cache_without_filling_it(self, chunk_conn):
+        """Cached chunk text is reused; new vectors are not added to the cache."""
+        service = _service(cache=EmbeddingCache(max_entries=4))
+        service._model = service._model_name = None  # Model not loaded yet
+        service.cache.put_many(
+            EmbeddingService.FALLBACK_MODEL, ['x'], np.array([[9.0, 9.0, 9.0]])
+        )
+
+        def load(name):
+            assert name == EmbeddingService.PRIMARY_MODEL
+            service._model_name = EmbeddingService.FALLBACK_MODEL  # Fell back
+            service._model = FakeModel()
+
+        service._load_model = load
+        service.embed_all_chunks(chunk_conn)
+
+        rows = chunk_conn.execute("""
+            SELECT c.content, e.vector, e.model FROM chunks c
+            JOIN embeddings e ON e.chunk_id = c.id
+        """).fetchall()
+        assert {row['model'] for row in rows} == {EmbeddingService.FALLBACK_MODEL}
+        reused = [row for row in rows if row['content'] == 'x']
+        assert service.blob_to_vector(reused[0]['vector']) == [9.0, 9.0, 9.0]
+        assert list(service.cache._memory) == [(EmbeddingService.FALLBACK_MODEL, text_hash('x'))]
+
+    def test_encoder_errors_propagate(self, chunk_conn):
+        service = _service()
+
+        def fail(*args, **kwargs):
+            raise RuntimeError('model failed')
+
+        service._model.encode = fail
+        with pytest.raises(RuntimeError, match='model failed'):
+            service.embed_all_chunks(chunk_conn)
+        assert chunk_conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == 0
@@ -7,6 +7,7 @@ import pytest
 from gateway.services.knowledge.archive_service import ArchiveService
 from gateway.services.knowledge.context_builder import ContextBuilder
 from gateway.services.knowledge.database import SCHEMA
+from gateway.services.knowledge.embedding_service import EmbeddingService
 from gateway.services.knowledge.sanitizer import Sanitizer
 from gateway.services.knowledge.search_service import SearchService
 from shared.contracts.knowledge.archive import Document, DocumentType
@@ -136,6 +137,43 @@ class TestContextBuilder:
         assert result2.cached is False
 
 
+class TestEnhancedRAGVectors:
+    """Tests for query embeddings in enhanced RAG retrieval."""
+
+    def test_query_vector_used_when_embeddings_exist(self, db_conn, search, sample_docs):
+        from gateway.services.knowledge.enhanced_rag import EnhancedRAGBuilder, EnhancedRAGConfig
+
+        class StubEmbeddings:
+            def __init__(self):
+                self.queries = []
+
+            def embed_query(self, text):
+                self.queries.append(text)
+                return type('Result', (), {'vector': [1.0, 0.0]})()
+
+        embeddings = StubEmbeddings()
+        builder = EnhancedRAGBuilder(
+            EnhancedRAGConfig(use_llm_reranking=False, use_graph_expansion=False),
+            embedding_service=embeddings,
+        )
+        builder._conn, builder._search, builder._sanitizer = db_conn, search, Sanitizer()
+
+        builder.build_context('session notes')
+        assert embeddings.queries == []  # Nothing embedded yet
+
+        chunk_id = db_conn.execute(
+            "INSERT INTO chunks (doc_id, chunk_index, content) VALUES ('doc_002', 0, 'ADR chunk')"
+        ).lastrowid
+        db_conn.execute(
+            "INSERT INTO embeddings (chunk_id, vector, model, dimensions) VALUES (?, ?, 'm', 2)",
+            (chunk_id, EmbeddingService.vector_to_blob([1.0, 0.0])),
+        )
+        result = builder.build_context('session notes')
+
+        assert embeddings.queries == ['session notes']
+        assert {s['doc_id'] for s in result.sources} == {'doc_001', 'doc_002'}
+
+
 class TestLangchainAdapter:
     """Tests for Langchain Adapter."""
 
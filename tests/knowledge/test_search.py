@@ -94,3 +94,47 @@ def test_search_service_import():
     """Test SearchService can be imported."""
     from gateway.services.knowledge.search_service import SearchService
     assert SearchService is not None
+
+
+def test_build_fts_query_sanitizes():
+    """Test FTS syntax in user input is quoted rather than interpreted."""
+    from gateway.services.knowledge.search_service import build_fts_query
+
+    assert build_fts_query('python') == '"python"'
+    assert build_fts_query('data* "local storage"') == '"local storage" OR "data"*'
+    assert build_fts_query('ADR-0001 AND (sqlite:', match_all=True) == '"ADR-0001" AND "sqlite"'
+    assert build_fts_query('"() :^') == ''
+
+
+def test_fts_ranks_title_matches_first(search, sample_docs):
+    """Test bm25 ranking weights title matches above body matches."""
+    results = search.fts_search('python sqlite', top_k=5)
+    assert [r.doc_id for r in results] == ['doc_001', 'doc_002']
+    assert results[0].score > results[1].score
+    assert '**Python**' in results[0].highlighted_title
+
+
+def test_fts_prefix_and_phrase(search, sample_docs):
+    """Test prefix and phrase queries."""
+    assert [r.doc_id for r in search.fts_search('Fast*')] == ['doc_001']
+    assert [r.doc_id for r in search.fts_search('"local storage"')] == ['doc_002']
+    assert search.fts_search('"storage local"') == []
+
+
+def test_fts_special_characters(search, sample_docs):
+    """Test queries with FTS5 syntax characters do not raise."""
+    results = search.fts_search('ADR-0002 (references)', top_k=5)
+    assert [r.doc_id for r in results] == ['doc_002']
+    assert '**' in results[0].snippet
+    assert search.fts_search('"*()') == []
+
+
+def test_fts_excludes_archived_and_tracks_updates(search, archive, sample_docs):
+    """Test the index follows updates and archived documents are hidden."""
+    updated = sample_docs[0].model_copy(update={'content': 'Rewritten with Rust.', 'file_hash': 'hash1b'})
+    archive.upsert_document(updated)
+    assert [r.doc_id for r in search.fts_search('Rust')] == ['doc_001']
+    assert search.fts_search('FastAPI') == []
+
+    archive.archive_document('doc_001')
+    assert search.fts_search('Rust') == []
@@ -0,0 +1,154 @@
+"""Tests for incremental knowledge sync."""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from gateway.services.knowledge.archive_service import ArchiveService
+from gateway.services.knowledge.chunking import ChunkingService
+from gateway.services.knowledge.database import SCHEMA
+from gateway.services.knowledge.sync_service import SyncService
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Repository layout with two ADRs and a session."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / '.adrs').mkdir()
+    (tmp_path / '.sessions').mkdir()
+    (tmp_path / '.adrs' / 'ADR-0001_storage.md').write_text('# Storage\n\nUse SQLite.')
+    (tmp_path / '.adrs' / 'ADR-0002_search.md').write_text('# Search\n\nBuilds on ADR-0001.')
+    (tmp_path / '.sessions' / 'notes.md').write_text('# Notes\n\nSee ADR-0002.')
+    return tmp_path
+
+
+@pytest.fixture
+def sync():
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return SyncService(ArchiveService(conn), chunking=ChunkingService(), max_workers=2)
+
+
+ROOTS = [Path('.adrs'), Path('.sessions')]
+
+
+def _archived(sync, doc_id):
+    row = sync.archive.conn.execute(
+        "SELECT archived_at FROM documents WHERE id = ?", (doc_id,)
+    ).fetchone()
+    return row['archived_at'] is not None
+
+
+def test_initial_sync_batches_documents(workspace, sync):
+    """All files are parsed, related and chunked in one pass."""
+    report = sync.sync(ROOTS)
+
+    assert (report.scanned, report.updated, report.unchanged) == (3, 3, 0)
+    rels = sync.archive.get_relationships('ADR-0002')
+    assert {(r['source'], r['target']) for r in rels} >= {('ADR-0002', 'ADR-0001')}
+    chunks = sync.archive.conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+    assert chunks >= 3
+
+
+def test_unchanged_files_are_not_read(workspace, sync, monkeypatch):
+    """A second sync skips files by stat without reading them."""
+    sync.sync(ROOTS)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('file was read')
+
+    monkeypatch.setattr(Path, 'read_text', fail)
+    report = sync.sync(ROOTS)
+
+    assert (report.updated, report.unchanged, report.errors) == (0, 3, [])
+
+
+def test_touched_file_with_same_content_is_not_reparsed(workspace, sync):
+    """A new mtime with identical content only refreshes file_state."""
+    sync.sync(ROOTS)
+    path = workspace / '.adrs' / 'ADR-0001_storage.md'
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    report = sync.sync(ROOTS)
+    assert (report.updated, report.unchanged) == (0, 3)
+
+
+def test_modified_file_is_updated(workspace, sync):
+    sync.sync(ROOTS)
+    (workspace / '.adrs' / 'ADR-0001_storage.md').write_text('# Storage\n\nUse SQLite + WAL.')
+
+    assert sync.sync_path(Path('.adrs')) == 1
+    assert 'WAL' in sync.archive.get_document('ADR-0001').content
+
+
+def test_deleted_and_restored_file(workspace, sync):
+    """Deleted files are archived and restored when they come back."""
+    sync.sync(ROOTS)
+    path = workspace / '.adrs' / 'ADR-0001_storage.md'
+    content = path.read_text()
+    path.unlink()
+
+    report = sync.sync(ROOTS)
+    assert report.archived == 1
+    assert _archived(sync, 'ADR-0001')
+
+    path.write_text(content)
+    assert sync.sync(ROOTS).updated == 1
+    assert not _archived(sync, 'ADR-0001')
+
+
+def test_moved_file(workspace, sync):
+    """A move archives nothing when the artifact id is kept."""
+    sync.sync(ROOTS)
+    (workspace / '.adrs' / 'old').mkdir()
+    src = Path('.adrs') / 'ADR-0002_search.md'
+    dest = Path('.adrs') / 'old' / 'ADR-0002_search.md'
+    src.rename(dest)
+
+    sync.remove_path(src)
+    sync.sync_path(dest)
+
+    doc = sync.archive.get_document('ADR-0002')
+    assert Path(doc.file_path) == dest
+    assert not _archived(sync, 'ADR-0002')
+
+
+def test_rebuild_relationships(workspace, sync):
+    sync.sync(ROOTS)
+    sync.archive.conn.execute("DELETE FROM relationships")
+
+    assert sync.rebuild_relationships() == 3
+    assert len(sync.archive.get_relationships('ADR-0002')) == 2
+
+
+def test_watcher_syncs_debounced_events(workspace):
+    """Watcher events are synced on the sync thread's own connection."""
+    db_path = workspace / 'knowledge.db'
+
+    def connect():
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    conn = connect()
+    conn.executescript(SCHEMA)
+    sync = SyncService(
+        ArchiveService(conn), chunking=ChunkingService(), max_workers=2, connect=connect
+    )
+    assert sync.start_watching()
+    try:
+        (workspace / '.adrs' / 'ADR-0003_watch.md').write_text('# Watch\n\nSee ADR-0001.')
+        deadline = time.monotonic() + 10
+        while sync.archive.get_document('ADR-0003') is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        sync.stop_watching()
+
+    assert sync.archive.get_document('ADR-0003') is not None
+    assert sync.get_status().documents_synced == 1
+    assert sync.get_status().errors == []
@@ -0,0 +1,182 @@
+"""Tests for the knowledge vector index."""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from gateway.services.knowledge.database import SCHEMA
+from gateway.services.knowledge.search_service import SearchService
+from gateway.services.knowledge.vector_index import VectorIndex
+
+DIMS = 8
+
+
+def _connect(path=':memory:') -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _insert(conn, doc_id: str, vectors: np.ndarray) -> None:
+    """Insert a document with one chunk and embedding per vector."""
+    conn.execute(
+        "INSERT INTO documents (id, type, title, content, file_path, file_hash) "
+        "VALUES (?, 'session', ?, ?, ?, 'h')",
+        (doc_id, doc_id, doc_id, f'{doc_id}.md'),
+    )
+    for i, vec in enumerate(vectors):
+        chunk_id = conn.execute(
+            "INSERT INTO chunks (doc_id, chunk_index, content) VALUES (?, ?, ?)",
+            (doc_id, i, f'{doc_id} chunk {i}'),
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO embeddings (chunk_id, vector, model, dimensions) VALUES (?, ?, 'test', ?)",
+            (chunk_id, vec.astype(np.float32).tobytes(), DIMS),
+        )
+    conn.commit()
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).normal(size=(200, DIMS)).astype(np.float32)
+
+
+@pytest.fixture
+def db_conn(vectors):
+    conn = _connect()
+    for d in range(4):
+        _insert(conn, f'doc_{d}', vectors[d * 50:(d + 1) * 50])
+    return conn
+
+
+def _exact(vectors: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    """Reference cosine top-k as 1-based chunk ids."""
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normed @ (query / np.linalg.norm(query))
+    return [int(i) + 1 for i in np.argsort(-scores)[:k]]
+
+
+def test_exact_search_matches_reference(db_conn, vectors):
+    """Top-k equals a brute-force cosine ranking."""
+    index = VectorIndex(DIMS)
+    index.sync(db_conn)
+    query = vectors[17] + 0.1
+
+    results = index.search(query, top_k=5)
+
+    assert [chunk_id for chunk_id, _ in results] == _exact(vectors, query, 5)
+    assert results[0][1] >= results[-1][1]
+
+
+def test_incremental_sync(db_conn, vectors):
+    """New, deleted and archived rows are picked up without a rebuild."""
+    index = VectorIndex(DIMS)
+    assert index.sync(db_conn)
+    assert not index.sync(db_conn)
+    assert len(index) == 200
+
+    _insert(db_conn, 'doc_new', vectors[:1] * 3)
+    assert index.sync(db_conn)
+    assert len(index) == 201
+
+    db_conn.execute("DELETE FROM chunks WHERE doc_id = 'doc_0'")
+    assert index.sync(db_conn)
+    assert len(index) == 151
+    assert index.search(vectors[0], top_k=1)[0][0] == 201
+
+    db_conn.execute("UPDATE documents SET archived_at = datetime('now') WHERE id = 'doc_new'")
+    index.sync(db_conn)
+    assert all(chunk_id <= 200 for chunk_id, _ in index.search(vectors[0], top_k=10))
+
+
+def test_ivf_search(db_conn, vectors):
+    """Probing every cluster reproduces the exact result; fewer stays close."""
+    index = VectorIndex(DIMS)
+    index.sync(db_conn)
+    index._build_ivf(n_lists=8)
+    query = vectors[3]
+
+    index.nprobe = 8
+    assert [c for c, _ in index.search(query, top_k=10)] == _exact(vectors, query, 10)
+
+    index.nprobe = 2
+    assert index.search(query, top_k=1)[0][0] == 4
+
+    # Rows added after clustering are searched exactly from the tail
+    tail = np.ones((1, DIMS), dtype=np.float32)
+    _insert(db_conn, 'doc_tail', tail)
+    index.sync(db_conn)
+    assert index.search(tail[0], top_k=1)[0][0] == 201
+
+
+def test_persisted_index_is_memory_mapped(tmp_path, vectors):
+    """A saved index reloads memory-mapped and continues syncing."""
+    conn = _connect(str(tmp_path / 'knowledge.db'))
+    _insert(conn, 'doc_a', vectors[:20])
+    index = VectorIndex(DIMS, tmp_path / 'vectors')
+    index.sync(conn)
+    index.save()
+
+    _insert(conn, 'doc_b', vectors[20:30])
+    reloaded = VectorIndex(DIMS, tmp_path / 'vectors')
+    assert isinstance(reloaded._matrix, np.memmap)
+    assert len(reloaded) == 20
+
+    reloaded.sync(conn)
+    assert len(reloaded) == 30
+    results = reloaded.search(vectors[25], top_k=3)
+    assert [c for c, _ in results] == _exact(vectors[:30], vectors[25], 3)
+
+
+def test_incremental_persistence(tmp_path, vectors):
+    """New rows are appended to the tail file; the base matrix is not rewritten."""
+    conn = _connect(str(tmp_path / 'knowledge.db'))
+    _insert(conn, 'doc_a', vectors[:20])
+    index = VectorIndex(DIMS, tmp_path / 'vectors')
+    index.sync(conn)
+    index.save()
+    matrix_file, _, tail_file, _ = index._files()
+    base_stat = matrix_file.stat()
+
+    _insert(conn, 'doc_b', vectors[20:21])
+    conn.execute("DELETE FROM chunks WHERE id = 3")
+    index.sync(conn)
+    index.save()
+
+    assert (matrix_file.stat().st_ino, matrix_file.stat().st_mtime_ns) == (
+        base_stat.st_ino, base_stat.st_mtime_ns
+    )
+    assert tail_file.stat().st_size == index._record_dtype().itemsize
+    reloaded = VectorIndex(DIMS, tmp_path / 'vectors')
+    assert len(reloaded) == 20
+    query = vectors[2] + vectors[20]
+    assert reloaded.search(query, top_k=20) == index.search(query, top_k=20)
+    assert 3 not in [c for c, _ in reloaded.search(vectors[2], top_k=20)]
+
+
+def test_compaction_folds_tail(vectors):
+    """Compaction drops deleted rows and moves the tail into the base matrix."""
+    conn = _connect()
+    _insert(conn, 'doc_a', vectors[:50])
+    index = VectorIndex(DIMS)
+    index.sync(conn)
+    conn.execute("DELETE FROM chunks WHERE id <= 10")
+    index.sync(conn)
+    expected = index.search(vectors[30], top_k=5)
+
+    index._compact(retrain=False)
+
+    assert (len(index._matrix), index._n, len(index)) == (40, 40, 40)
+    assert index.search(vectors[30], top_k=5) == expected
+
+
+def test_vector_search_hits(db_conn, vectors):
+    """SearchService returns chunk hits with document metadata."""
+    hits = SearchService(db_conn).vector_search(vectors[60].tolist(), top_k=3)
+
+    assert hits[0].doc_id == 'doc_1'
+    assert hits[0].snippet == 'doc_1 chunk 10'
+    assert hits[0].score == pytest.approx(1.0, abs=1e-5)
@@ -0,0 +1,69 @@
+"""Unit tests for the PPTX data processor."""
+
+import asyncio
+
+import pandas as pd
+from pptx import Presentation
+from pptx.util import Inches
+
+from apps.pptx_generator.backend.services.data_processor import DataProcessorService
+from apps.pptx_generator.backend.services.presentation_generator import (
+    PresentationGeneratorService,
+)
+
+
+def _template(path, shape_names):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    for i, name in enumerate(shape_names):
+        shape = slide.shapes.add_textbox(Inches(1), Inches(1 + i), Inches(2), Inches(1))
+        shape.name = name
+    prs.save(str(path))
+    return path
+
+
+class TestColumnProjection:
+    """Generation reads only the columns mappings and the template use."""
+
+    def test_template_columns(self, tmp_path):
+        """Metrics, filters and contour grid columns are collected, lowercased."""
+        template = _template(tmp_path / "t.pptx", [
+            "kpi:CD@Side=left|agg=mean",
+            "contour:Thickness@wafer=W1",
+            "not a shape name",
+        ])
+
+        columns = PresentationGeneratorService(1).template_columns(template)
+
+        assert columns == {"cd", "side", "thickness", "wafer", "imcol", "imrow"}
+
+    def test_prepare_data_reads_referenced_columns(self, tmp_path):
+        """Unreferenced columns are not read; every row is still prepared."""
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({
+            "Side": ["left", "right"],
+            "CD": [1.0, 2.0],
+            "Lot Name": ["a", "b"],
+            "Unused": [0, 0],
+        }).to_csv(data_path, index=False)
+        mappings = [{"shape_name": "LOT", "data_column": "Lot Name"}]
+
+        records = asyncio.run(DataProcessorService().prepare_data_for_generation(
+            data_path, mappings, template_columns={"cd", "side"}
+        ))
+
+        assert records == [
+            {"side": "left", "cd": 1.0, "lot_name": "a", "LOT": "a"},
+            {"side": "right", "cd": 2.0, "lot_name": "b", "LOT": "b"},
+        ]
+
+    def test_prepare_data_without_template_columns_reads_all(self, tmp_path):
+        """Without template columns every column is kept."""
+        data_path = tmp_path / "data.csv"
+        pd.DataFrame({"CD": [1.0], "Unused": [0]}).to_csv(data_path, index=False)
+
+        records = asyncio.run(
+            DataProcessorService().prepare_data_for_generation(data_path, [])
+        )
+
+        assert records == [{"cd": 1.0, "unused": 0}]
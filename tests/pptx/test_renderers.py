@@ -265,3 +265,159 @@ class TestRendererGracefulDegradation:
         )
 
         assert len(context.data) == 0
+
+
+class TestRenderScheduler:
+    """Tests for parallel plot rendering via RenderScheduler."""
+
+    @staticmethod
+    def _plot_context(renderer: str = "line") -> RenderContext:
+        parsed = ParsedShapeNameV2(
+            renderer=renderer,
+            data=["cd"],
+            filters={"side": "left"},
+            options={},
+            raw_name=f"{renderer}_cd",
+        )
+        data = pd.DataFrame({"side": ["left", "left", "right"], "cd": [1.0, 2.0, 3.0]})
+        return RenderContext(shape=MagicMock(), parsed_name=parsed, data=data)
+
+    def test_generate_plot_image_returns_png(self):
+        """Plot images are built without pyplot and returned as PNG bytes."""
+        from apps.pptx_generator.backend.renderers.plot_renderer import (
+            PlotRenderer,
+            generate_plot_image,
+        )
+
+        job = PlotRenderer().prepare(self._plot_context())
+
+        assert job is not None
+        assert len(job.data) == 2
+        image = generate_plot_image(job)
+        assert image is not None
+        assert image.startswith(b"\x89PNG")
+
+    @pytest.mark.asyncio
+    async def test_scheduler_reports_per_shape_results(self):
+        """Each task gets a RenderResult in order; plot images are inserted."""
+        from unittest.mock import AsyncMock, patch
+
+        from apps.pptx_generator.backend.renderers.plot_renderer import PlotRenderer
+        from apps.pptx_generator.backend.services.render_scheduler import (
+            RenderScheduler,
+            RenderTask,
+        )
+        from shared.contracts.core.rendering import RenderState
+
+        text_renderer = MagicMock()
+        text_renderer.render = AsyncMock()
+        failing_renderer = MagicMock()
+        failing_renderer.render = AsyncMock(side_effect=RuntimeError("boom"))
+        plot_renderer = PlotRenderer()
+
+        tasks = [
+            RenderTask("slide_1/plot", plot_renderer, self._plot_context("line")),
+            RenderTask("slide_1/text", text_renderer, self._plot_context()),
+            RenderTask("slide_2/bad", failing_renderer, self._plot_context()),
+            RenderTask("slide_2/plot", plot_renderer, self._plot_context("bar")),
+        ]
+
+        with patch.object(PlotRenderer, "insert") as insert:
+            results = await RenderScheduler(max_workers=1).run(tasks)
+
+        assert [r.spec_id for r in results] == [t.spec_id for t in tasks]
+        assert [r.state for r in results] == [
+            RenderState.COMPLETED,
+            RenderState.COMPLETED,
+            RenderState.FAILED,
+            RenderState.COMPLETED,
+        ]
+        assert results[2].error_message == "boom"
+        assert all(r.render_duration_ms >= 0 for r in results)
+        assert results[0].render_duration_ms > 0
+        assert insert.call_count == 2
+        text_renderer.render.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_generate_presentation_returns_shape_results(self, tmp_path):
+        """generate_presentation returns one RenderResult per rendered shape."""
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        from apps.pptx_generator.backend.services.presentation_generator import (
+            PresentationGeneratorService,
+        )
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        for i, name in enumerate(["text:LOT", "not a shape name"]):
+            slide.shapes.add_textbox(Inches(1), Inches(1 + i), Inches(2), Inches(1)).name = name
+        prs.save(str(tmp_path / "template.pptx"))
+
+        results = await PresentationGeneratorService(1).generate_presentation(
+            tmp_path / "template.pptx", [{"LOT": "A1"}], tmp_path / "out.pptx"
+        )
+
+        assert [r.spec_id for r in results] == ["slide_1/text:LOT"]
+        assert results[0].success
+        assert (tmp_path / "out.pptx").exists()
+
+
+class TestRenderDataIndex:
+    """Tests for the per-generation filter index."""
+
+    @staticmethod
+    def _data() -> pd.DataFrame:
+        return pd.DataFrame({
+            "side": ["Left", "Right", "left", "RIGHT", None, "Left"],
+            "wafer": ["W1", "W1", "W2", "W2", "W1", "W2"],
+            "slot": [1, 2, 1, 2, 1, 2],
+            "cd": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        })
+
+    @staticmethod
+    def _parsed(filters: dict[str, str]) -> ParsedShapeNameV2:
+        return ParsedShapeNameV2(
+            renderer="table", data=["cd"], filters=filters, options={}, raw_name="t"
+        )
+
+    @pytest.mark.parametrize("filters", [
+        {"side": "left"},
+        {"side": "LEFT", "wafer": "w2"},
+        {"wafer": "W1", "side": "both"},
+        {"slot": 1},
+        {"side": "center"},
+        {"missing": "x"},
+        {},
+    ])
+    def test_filter_matches_filter_data(self, filters):
+        """Indexed slices equal the unindexed filter_data result."""
+        from apps.pptx_generator.backend.renderers.data_index import RenderDataIndex
+        from apps.pptx_generator.backend.renderers.table_renderer import TableRenderer
+
+        data = self._data()
+        renderer = TableRenderer()
+        index = RenderDataIndex(data, ["side", "wafer", "slot", "missing"])
+
+        expected = renderer.filter_data(data, self._parsed(filters))
+        actual = renderer.filter_data(data, self._parsed(filters), index=index)
+
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_slices_and_aggregates_are_shared(self):
+        """Equivalent filters reuse one slice and one aggregation."""
+        from apps.pptx_generator.backend.renderers.data_index import RenderDataIndex
+        from apps.pptx_generator.backend.renderers.table_renderer import TableRenderer
+
+        data = self._data()
+        renderer = TableRenderer()
+        index = RenderDataIndex(data, ["side", "wafer"])
+
+        first = renderer.filter_data(data, self._parsed({"side": "left", "wafer": "W2"}), index)
+        second = renderer.filter_data(data, self._parsed({"wafer": "w2", "side": "Left"}), index)
+        assert first is second
+
+        agg_a = renderer.aggregate_data(first, ["slot"], ["cd"], index=index)
+        agg_b = renderer.aggregate_data(second, ["slot"], ["cd"], index=index)
+        assert agg_a is agg_b
+        assert agg_a["cd"].tolist() == [3.0, 6.0]
@@ -6,11 +6,15 @@ These tests ensure the statistical computations are mathematically correct.
 
 from __future__ import annotations
 
+import numpy as np
 import polars as pl
 import pytest
 
 from apps.sov_analyzer.backend.src.sov_analyzer.analysis.anova import (
     ANOVAConfig,
+    ANOVAResult,
+    _n_way_anova,
+    _one_way_anova,
     run_anova_analysis,
 )
 
@@ -281,3 +285,79 @@ class TestANOVAEdgeCases:
         assert results1[0].r_squared == results2[0].r_squared
         assert results1[0].rows[0].f_statistic == results2[0].rows[0].f_statistic
         assert results1[0].rows[0].p_value == results2[0].rows[0].p_value
+
+
+class TestBatchedANOVA:
+    """Tests for the multi-response batched ANOVA engine."""
+
+    @staticmethod
+    def _dataset() -> pl.DataFrame:
+        rng = np.random.default_rng(7)
+        n = 120
+        lot = rng.choice(["L1", "L2", "L3"], n)
+        tool = rng.choice(["T1", "T2"], n)
+        shift = {"L1": 0.0, "L2": 2.0, "L3": 5.0}
+        return pl.DataFrame({
+            "lot": lot,
+            "tool": tool,
+            "thickness": [shift[v] + x for v, x in zip(lot, rng.normal(100, 1, n))],
+            "resistance": rng.normal(10, 0.5, n),
+            "count": rng.integers(0, 50, n),
+        })
+
+    @staticmethod
+    def _assert_same(batched: ANOVAResult, reference: ANOVAResult):
+        assert [r.source for r in batched.rows] == [r.source for r in reference.rows]
+        assert batched.r_squared == pytest.approx(reference.r_squared, rel=1e-9, nan_ok=True)
+        for got, want in zip(batched.rows, reference.rows, strict=True):
+            assert got.df == want.df
+            assert got.sum_squares == pytest.approx(want.sum_squares, rel=1e-9, nan_ok=True)
+            assert got.variance_pct == pytest.approx(want.variance_pct, rel=1e-9, nan_ok=True)
+            if want.f_statistic is None:
+                assert got.f_statistic is None
+            else:
+                assert got.f_statistic == pytest.approx(want.f_statistic, rel=1e-9, nan_ok=True)
+                assert got.p_value == pytest.approx(want.p_value, rel=1e-6, abs=1e-12, nan_ok=True)
+
+    @pytest.mark.asyncio
+    async def test_one_way_matches_per_column(self):
+        """Batched one-way results equal the per-column computation."""
+        data = self._dataset()
+        responses = ["thickness", "resistance", "count"]
+        config = ANOVAConfig(factors=["lot"], response_columns=responses)
+
+        results = await run_anova_analysis(data, config)
+
+        assert [r.response_column for r in results] == responses
+        for result in results:
+            reference = _one_way_anova(data, "lot", result.response_column, config.alpha)
+            self._assert_same(result, reference)
+
+    @pytest.mark.asyncio
+    async def test_n_way_matches_per_column(self):
+        """Batched n-way results equal the per-column computation."""
+        data = self._dataset()
+        responses = ["thickness", "resistance", "count"]
+        config = ANOVAConfig(
+            factors=["lot", "tool"], response_columns=responses, anova_type="n-way"
+        )
+
+        results = await run_anova_analysis(data, config)
+
+        for result in results:
+            reference = _n_way_anova(data, ["lot", "tool"], result.response_column, config.alpha)
+            self._assert_same(result, reference)
+
+    @pytest.mark.asyncio
+    async def test_column_with_nulls_uses_per_column_path(self):
+        """Responses with missing values fall back without affecting the others."""
+        data = self._dataset()
+        data = data.with_columns(
+            pl.Series("resistance", [None, *data["resistance"].to_list()[1:]])
+        )
+        config = ANOVAConfig(factors=["lot"], response_columns=["thickness", "resistance"])
+
+        results = await run_anova_analysis(data, config)
+
+        self._assert_same(results[0], _one_way_anova(data, "lot", "thickness", config.alpha))
+        self._assert_same(results[1], _one_way_anova(data, "lot", "resistance", config.alpha))
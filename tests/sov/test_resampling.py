@@ -0,0 +1,112 @@
+"""Tests for resampling intervals on ANOVA variance components.
+
+Per ADR-0023: Resampling must be deterministic under the configured seed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from apps.sov_analyzer.backend.src.sov_analyzer.analysis.anova import (
+    ANOVAConfig,
+    run_anova_analysis,
+)
+from apps.sov_analyzer.backend.src.sov_analyzer.analysis.resampling import (
+    ResamplingConfig,
+    run_resampling_analysis,
+)
+
+
+@pytest.fixture
+def lot_dataset() -> pl.DataFrame:
+    """Strong lot effect on thickness, none on resistance."""
+    rng = np.random.default_rng(3)
+    n = 90
+    lot = rng.choice(["L1", "L2", "L3"], n)
+    tool = rng.choice(["T1", "T2"], n)
+    shift = {"L1": 0.0, "L2": 3.0, "L3": 6.0}
+    return pl.DataFrame({
+        "lot": lot,
+        "tool": tool,
+        "thickness": [shift[v] + x for v, x in zip(lot, rng.normal(100, 1, n))],
+        "resistance": rng.normal(10, 0.5, n),
+    })
+
+
+async def _run(data, config, resampling):
+    results = await run_anova_analysis(data, config)
+    return await run_resampling_analysis(data, config, results, resampling)
+
+
+class TestResampling:
+    """Bootstrap intervals and permutation p-values."""
+
+    @pytest.mark.asyncio
+    async def test_interval_brackets_point_estimate(self, lot_dataset):
+        """Bootstrap bounds are ordered percentages around a strong effect."""
+        config = ANOVAConfig(factors=["lot"], response_columns=["thickness", "resistance"])
+        results = await _run(
+            lot_dataset, config, ResamplingConfig(n_resamples=200, max_workers=1)
+        )
+
+        for result in results:
+            for row in result.rows[:2]:
+                assert row.variance_pct_lower is not None
+                assert 0 <= row.variance_pct_lower <= row.variance_pct_upper <= 100
+            assert result.rows[-1].variance_pct_lower is None  # Total row
+
+        lot_row = results[0].rows[0]
+        assert lot_row.variance_pct_lower <= lot_row.variance_pct <= lot_row.variance_pct_upper
+
+    @pytest.mark.asyncio
+    async def test_permutation_p_values(self, lot_dataset):
+        """Real effects get small permutation p-values, null effects do not."""
+        config = ANOVAConfig(factors=["lot"], response_columns=["thickness", "resistance"])
+        results = await _run(
+            lot_dataset,
+            config,
+            ResamplingConfig(n_resamples=199, method="permutation", max_workers=1),
+        )
+
+        thickness, resistance = results
+        assert thickness.rows[0].permutation_p_value == pytest.approx(1 / 200)
+        assert resistance.rows[0].permutation_p_value > 0.01
+        assert thickness.rows[0].variance_pct_lower is None
+
+    @pytest.mark.asyncio
+    async def test_deterministic_across_workers(self, lot_dataset):
+        """Same seed gives identical output regardless of worker count."""
+        config = ANOVAConfig(
+            factors=["lot", "tool"],
+            response_columns=["thickness", "resistance"],
+            anova_type="n-way",
+        )
+        # Enough rows that replicates split into several chunks
+        data = pl.concat([lot_dataset] * 200)
+
+        serial = await _run(data, config, ResamplingConfig(n_resamples=300, max_workers=1))
+        parallel = await _run(data, config, ResamplingConfig(n_resamples=300, max_workers=2))
+
+        for a, b in zip(serial, parallel, strict=True):
+            for row_a, row_b in zip(a.rows, b.rows, strict=True):
+                assert row_a.variance_pct_lower == row_b.variance_pct_lower
+                assert row_a.variance_pct_upper == row_b.variance_pct_upper
+                assert row_a.permutation_p_value == row_b.permutation_p_value
+
+    @pytest.mark.asyncio
+    async def test_columns_with_nulls_are_skipped(self, lot_dataset):
+        """Responses with missing values keep point estimates only."""
+        data = lot_dataset.with_columns(
+            pl.when(pl.int_range(pl.len()) == 0)
+            .then(None)
+            .otherwise(pl.col("resistance"))
+            .alias("resistance")
+        )
+        config = ANOVAConfig(factors=["lot"], response_columns=["thickness", "resistance"])
+        results = await _run(data, config, ResamplingConfig(n_resamples=50, max_workers=1))
+
+        assert results[0].rows[0].variance_pct_lower is not None
+        assert all(row.variance_pct_lower is None for row in results[1].rows)
+        assert all(row.permutation_p_value is None for row in results[1].rows)
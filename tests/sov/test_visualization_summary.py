@@ -0,0 +1,65 @@
+"""Tests for precomputed SOV visualization summaries."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from apps.sov_analyzer.backend.src.sov_analyzer.core.visualization_service import (
+    summarize_levels,
+)
+
+
+@pytest.fixture
+def large_dataset() -> pl.DataFrame:
+    rng = np.random.default_rng(11)
+    n = 50_000
+    values = rng.normal(10, 1, n)
+    values[:5] = 100.0  # Far outliers in level A
+    return pl.DataFrame({
+        "lot": ["A", "B"] * (n // 2),
+        "tool": rng.choice(["T1", "T2"], n),
+        "thickness": values,
+    })
+
+
+class TestSummarizeLevels:
+    """Per-level statistics computed in one grouped pass."""
+
+    def test_box_statistics(self):
+        data = pl.DataFrame({
+            "lot": ["A"] * 5 + ["B"] * 5,
+            "y": [1.0, 2.0, 3.0, 4.0, 50.0, 5.0, 5.0, 5.0, 5.0, 5.0],
+        })
+
+        a, b = summarize_levels(data, ["lot"], ["y"])["y"]
+
+        assert (a.level, a.count, a.median, a.q1, a.q3) == ("A", 5, 3.0, 2.0, 4.0)
+        assert a.whisker_low == 1.0
+        assert a.whisker_high == 4.0
+        assert a.outliers == [50.0]
+        assert a.ci_lower < a.mean < a.ci_upper
+        assert b.std == 0.0
+        assert b.outliers == []
+
+    def test_interaction_cells(self, large_dataset):
+        summary = summarize_levels(large_dataset, ["lot", "tool"], ["thickness"])["thickness"]
+
+        assert [(s.level, s.group) for s in summary] == [
+            ("A", "T1"), ("A", "T2"), ("B", "T1"), ("B", "T2"),
+        ]
+        assert sum(s.count for s in summary) == large_dataset.height
+
+    def test_payload_is_capped(self, large_dataset):
+        """Outliers and points are capped regardless of dataset size."""
+        summary = summarize_levels(
+            large_dataset, ["lot"], ["thickness"], max_outliers=3, max_points=50
+        )["thickness"]
+
+        for level in summary:
+            assert len(level.outliers) <= 3
+            assert 0 < len(level.points) <= 50
+        assert summary[0].outlier_count >= 5
+        payload = "".join(level.model_dump_json() for level in summary)
+        assert len(payload) < 4096
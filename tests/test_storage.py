@@ -70,6 +70,41 @@ class TestArtifactStore:
         assert read_manifest.dataset_id == "ds_test123"
         assert read_manifest.name == "Test Dataset"
 
+    @pytest.mark.asyncio
+    async def test_read_dataset_projection_and_filters(self, store):
+        """Test column-projected, filtered and lazy DataSet reads."""
+        df = pl.DataFrame({
+            "lot": ["A", "B", "A", "B"],
+            "thickness": [1.0, 2.0, 3.0, 4.0],
+            "unused": [0, 0, 0, 0],
+        })
+        manifest = DataSetManifest(
+            dataset_id="ds_proj",
+            name="Projection",
+            created_at=datetime.now(UTC),
+            created_by_tool="dat",
+            columns=[ColumnMeta(name=c, dtype=str(t)) for c, t in df.schema.items()],
+            row_count=4,
+        )
+        await store.write_dataset("ds_proj", df, manifest)
+
+        read_df = await store.read_dataset(
+            "ds_proj", columns=["thickness"], filters=pl.col("lot") == "A"
+        )
+        assert read_df.columns == ["thickness"]
+        assert read_df["thickness"].to_list() == [1.0, 3.0]
+
+        lf = await store.read_dataset("ds_proj", columns=["lot", "thickness"], lazy=True)
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect_schema().names() == ["lot", "thickness"]
+
+        lf, read_manifest = await store.read_dataset_with_manifest(
+            "ds_proj", columns=["thickness"], lazy=True
+        )
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect()["thickness"].to_list() == [1.0, 2.0, 3.0, 4.0]
+        assert read_manifest is not None and read_manifest.dataset_id == "ds_proj"
+
     @pytest.mark.asyncio
     async def test_list_datasets(self, store):
         """Test listing datasets."""
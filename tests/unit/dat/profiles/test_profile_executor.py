@@ -9,6 +9,9 @@ from pathlib import Path
 import polars as pl
 import pytest
 
+from apps.data_aggregator.backend.src.dat_aggregation.core.file_cache import (
+    ParsedFileCache,
+)
 from apps.data_aggregator.backend.src.dat_aggregation.profiles.context_extractor import (
     ContextExtractor,
 )
@@ -25,9 +28,19 @@ from apps.data_aggregator.backend.src.dat_aggregation.profiles.profile_loader im
     get_profile_by_id,
 )
 from apps.data_aggregator.backend.src.dat_aggregation.profiles.strategies import (
+    ArrayOfObjectsStrategy,
     FlatObjectStrategy,
     HeadersDataStrategy,
     RepeatOverStrategy,
+    TabularSource,
+    UnpivotStrategy,
+)
+from apps.data_aggregator.backend.src.dat_aggregation.profiles.strategies.path_cache import (
+    compile_path,
+    find_values,
+)
+from apps.data_aggregator.backend.src.dat_aggregation.profiles.table_accumulator import (
+    TableAccumulator,
 )
 from apps.data_aggregator.backend.src.dat_aggregation.profiles.transform_pipeline import (
     TransformPipeline,
@@ -172,6 +185,62 @@ class TestRepeatOverStrategy:
         assert "S03" in site_ids
 
 
+class TestPathCache:
+    """Tests for cached JSONPath resolution."""
+
+    @pytest.mark.parametrize(
+        "path",
+        ["$", "$.summary", "$.sites[1].site_id", "$.sites[9]", "$.missing.x", "$.sites[*].site_id"],
+    )
+    def test_matches_jsonpath_ng(self, sample_data: dict, path: str):
+        """Direct traversal and compiled paths agree with jsonpath-ng."""
+        from jsonpath_ng import parse
+
+        expected = [m.value for m in parse(path).find(sample_data)]
+
+        assert find_values(sample_data, path) == expected
+
+    def test_compiled_expressions_are_reused(self):
+        """Complex paths are parsed once per process."""
+        assert compile_path("$.sites[*].cd") is compile_path("$.sites[*].cd")
+
+
+class TestTabularSource:
+    """Tests for the columnar fast path over tabular sources."""
+
+    @pytest.fixture
+    def source(self) -> TabularSource:
+        return TabularSource(pl.DataFrame({"site": [1, 2], "cd": [45.1, 46.3], "lot": ["A", "A"]}))
+
+    def test_strategies_use_dataframe_without_records(self, source: TabularSource):
+        """Columnar strategies never materialize the record list."""
+        rows = ArrayOfObjectsStrategy().extract(
+            source, SelectConfig(strategy="array_of_objects", path="$.data[*]", fields=["cd", "site"]), {}
+        )
+        first = FlatObjectStrategy().extract(
+            source, SelectConfig(strategy="flat_object", path="$.data[1]"), {}
+        )
+        long = UnpivotStrategy().extract(
+            source,
+            SelectConfig(strategy="unpivot", path="$.data", id_vars=["site"], value_vars=["cd"]),
+            {},
+        )
+
+        assert rows.columns == ["site", "cd"]
+        assert first.row(0) == (2, 46.3, "A")
+        assert long.height == 2
+        assert not dict.__contains__(source, "data")
+
+    def test_records_materialize_for_jsonpath(self, source: TabularSource):
+        """JSONPath access still sees JSON-shaped records."""
+        df = ArrayOfObjectsStrategy().extract(
+            source, SelectConfig(strategy="array_of_objects", path="$.data[0]"), {}
+        )
+
+        assert source["data"][0] == {"site": 1, "cd": 45.1, "lot": "A"}
+        assert df.is_empty()
+
+
 class TestContextExtractor:
     """Tests for ContextExtractor."""
 
@@ -314,6 +383,58 @@ class TestValidationEngine:
         assert len(result.warnings) == 1
         assert "sigma_cd" in result.missing_columns
 
+    def test_value_constraints_single_batch(self):
+        """All constraint types report counts from one batched evaluation."""
+        engine = ValidationEngine()
+        df = pl.DataFrame({
+            "cd": [1.0, -2.0, 150.0, None],
+            "site": ["S1", "S2", "bad", "S4"],
+        })
+        errors = engine.validate_value_constraints(df, [
+            {"column": "cd", "type": "range", "min": 0, "max": 100},
+            {"column": "cd", "type": "not_null"},
+            {"column": "site", "type": "regex", "pattern": r"^S\d+$"},
+        ])
+
+        assert errors == [
+            "Column cd has 1 values below 0",
+            "Column cd has 1 values above 100",
+            "Column cd has 1 null values",
+            "Column site has 1 values not matching pattern ^S\\d+$",
+        ]
+
+    def test_row_rules_keep_column_case(self):
+        """Row rules resolve lowercase column names and sample offenders."""
+        engine = ValidationEngine(max_violation_samples=2)
+        df = pl.DataFrame({"mean_cd": [1.0, -1.0, -2.0, -3.0]})
+        rules = [{"name": "positive", "expression": "mean_cd > 0 and mean_cd < 10",
+                  "on_fail": "error", "message": "CD out of range"}]
+
+        assert engine.validate_row_rules(df, rules) == ["ERROR: CD out of range (3 rows)"]
+
+        outcomes = engine._run_checks(df, engine._row_rule_checks(df, rules))
+        assert outcomes[0].samples == [{"mean_cd": -1.0}, {"mean_cd": -2.0}]
+
+    def test_validate_extraction_collects_samples(self):
+        """Profile rules run per table and failing rows are reported."""
+        engine = ValidationEngine(max_violation_samples=1)
+        profile = get_profile_by_id("cdsem-metrology-v1")
+        assert profile is not None
+        profile.row_rules = [{"name": "pos", "expression": "v > 0", "on_fail": "warn"}]
+        profile.aggregate_rules = [{"name": "rows", "type": "row_count", "min": 5,
+                                    "on_fail": "error"}]
+        results = {
+            "a": pl.DataFrame({"v": [1, -1, -2]}),
+            "b": pl.DataFrame({"v": [3, 4]}),
+        }
+
+        summary = engine.validate_extraction(results, profile)
+
+        assert summary.violation_samples == {
+            "[a] WARN: Row rule 'pos' failed (2 rows)": [{"v": -1}],
+        }
+        assert not summary.valid  # row_count rule fails for both tables
+
 
 class TestTransformPipeline:
     """Tests for TransformPipeline."""
@@ -345,6 +466,43 @@ class TestTransformPipeline:
         assert result["value"][1] is None
         assert result["value"][3] is None
 
+    def test_compiled_plan_matches_eager(self):
+        """The lazy plan gives the same result as the eager step-by-step path."""
+        from apps.data_aggregator.backend.src.dat_aggregation.profiles.profile_loader import (
+            DATProfile,
+        )
+
+        pipeline = TransformPipeline()
+        df = pl.DataFrame({
+            "site": ["s1", "s2", "s3", "s4"],
+            "cd": ["45.1", "N/A", "46.0", "44.2"],
+            "lot": [" a ", "b", "c", "d"],
+        })
+        profile = DATProfile(
+            schema_version="1.0.0",
+            version=1,
+            profile_id="test",
+            title="Test",
+            nan_values=["N/A"],
+            row_filters=[{"column": "cd", "op": "is_not_null"}],
+            column_renames={"cd": "cd_nm"},
+            calculated_columns=[
+                {"name": "cd_um", "expression": "cd_nm / 1000", "round_to": 4},
+                {"name": "cd_x2", "expression": "cd_um * 2"},
+            ],
+            type_coercion=[
+                {"column": "lot", "to_type": "string", "strip": True},
+                {"column": "lot", "to_type": "string", "uppercase": True},
+            ],
+        )
+
+        lazy = pipeline.apply_profile_transforms(df, profile)
+        eager = pipeline.apply_profile_transforms(df, profile, lazy=False)
+
+        assert lazy.equals(eager)
+        assert lazy["lot"].to_list() == ["A", "C", "D"]
+        assert "FILTER" in pipeline.explain(df, profile)
+
 
 class TestOutputBuilder:
     """Tests for OutputBuilder."""
@@ -367,6 +525,36 @@ class TestOutputBuilder:
         assert "c" in combined.columns
 
 
+class TestTableAccumulator:
+    """Tests for per-table chunk accumulation."""
+
+    def test_concatenates_once_with_union_schema(self):
+        """Chunks are combined in order with columns and dtypes unified."""
+        acc = TableAccumulator()
+        acc.add("t", pl.DataFrame({"a": [1, 2]}))
+        acc.add("t", pl.DataFrame({"a": [3.5], "b": ["x"]}))
+        acc.add("u", pl.DataFrame({"c": [True]}))
+
+        tables = acc.finish()
+
+        assert list(tables) == ["t", "u"]
+        assert tables["t"]["a"].to_list() == [1.0, 2.0, 3.5]
+        assert tables["t"]["b"].to_list() == [None, None, "x"]
+
+    def test_spills_over_memory_budget(self):
+        """Chunks beyond the budget go to Parquet and are read back in order."""
+        acc = TableAccumulator(memory_budget_bytes=1)
+        for i in range(3):
+            acc.add("t", pl.DataFrame({"i": [i]}))
+
+        assert acc.spilled_parts == 3
+        spill_dir = acc._spill_dir
+        tables = acc.finish()
+
+        assert tables["t"]["i"].to_list() == [0, 1, 2]
+        assert spill_dir is not None and not spill_dir.exists()
+
+
 @pytest.mark.asyncio
 class TestProfileExecutor:
     """Integration tests for ProfileExecutor."""
@@ -397,3 +585,102 @@ class TestProfileExecutor:
 
         # Verify run_statistics has multiple rows (headers_data)
         assert len(results.tables["run_statistics"]) == 4
+
+    async def test_execute_reuses_cached_file(
+        self, sample_data: dict, cdsem_profile, tmp_path: Path
+    ):
+        """A file already loaded (e.g. for preview) is not parsed again."""
+        if cdsem_profile is None:
+            pytest.skip("CD-SEM profile not found")
+
+        sample_file = tmp_path / "LOTABC12345_W01_measurement.json"
+        with open(sample_file, "w", encoding="utf-8") as f:
+            json.dump(sample_data, f)
+
+        cache = ParsedFileCache()
+        executor = ProfileExecutor(file_cache=cache)
+        await executor._load_file(sample_file, cdsem_profile)
+        results = await executor.execute(cdsem_profile, [sample_file], {}, ["run_summary"])
+
+        assert len(results.tables["run_summary"]) == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    async def test_execute_extracts_context_with_tables(
+        self, sample_data: dict, cdsem_profile, tmp_path: Path
+    ):
+        """Context (with overrides) comes from the same single load as the tables."""
+        if cdsem_profile is None:
+            pytest.skip("CD-SEM profile not found")
+
+        sample_file = tmp_path / "LOTABC12345_W01_measurement.json"
+        with open(sample_file, "w", encoding="utf-8") as f:
+            json.dump(sample_data, f)
+
+        cache = ParsedFileCache()
+        results = await ProfileExecutor(file_cache=cache).execute(
+            cdsem_profile,
+            [sample_file],
+            {},
+            ["run_summary"],
+            context_overrides={"lot_id": "OVERRIDE_LOT"},
+        )
+
+        assert results.file_contexts[str(sample_file)]["lot_id"] == "OVERRIDE_LOT"
+        assert results.run_context["wafer_id"] == "W01"
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 0
+
+    async def test_execute_parallel_matches_serial(
+        self, sample_data: dict, cdsem_profile, tmp_path: Path
+    ):
+        """Parallel extraction merges results in file order like serial extraction."""
+        if cdsem_profile is None:
+            pytest.skip("CD-SEM profile not found")
+
+        files = []
+        for i in range(3):
+            sample_file = tmp_path / f"LOTABC1234{i}_W0{i + 1}_measurement.json"
+            with open(sample_file, "w", encoding="utf-8") as f:
+                json.dump(sample_data, f)
+            files.append(sample_file)
+
+        tables = ["run_summary", "run_statistics"]
+        serial = await ProfileExecutor().execute(cdsem_profile, files, {}, tables)
+        parallel = await ProfileExecutor(max_workers=2).execute(
+            cdsem_profile, files, {}, tables
+        )
+
+        assert list(parallel.file_contexts) == [str(f) for f in files]
+        for table_id in tables:
+            assert parallel.tables[table_id].equals(serial.tables[table_id])
+
+        spilled = await ProfileExecutor(memory_budget_mb=0).execute(
+            cdsem_profile, files, {}, tables
+        )
+        for table_id in tables:
+            assert spilled.tables[table_id].equals(serial.tables[table_id])
+
+    async def test_execute_stops_at_file_boundary_on_cancel(
+        self, sample_data: dict, cdsem_profile, tmp_path: Path
+    ):
+        """A cancelled token stops extraction before the next file is loaded."""
+        from apps.data_aggregator.backend.src.dat_aggregation.stages.parse import (
+            CancellationToken,
+        )
+
+        if cdsem_profile is None:
+            pytest.skip("CD-SEM profile not found")
+
+        sample_file = tmp_path / "LOTABC12345_W01_measurement.json"
+        with open(sample_file, "w", encoding="utf-8") as f:
+            json.dump(sample_data, f)
+
+        token = CancellationToken()
+        token.cancel()
+        results = await ProfileExecutor().execute(
+            cdsem_profile, [sample_file], {}, cancel_token=token
+        )
+
+        assert results.cancelled is True
+        assert results.tables == {}